@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from backend.list_serializers import ValuesListSerializer
 from .models import AuditLog
 from accounts.models import User
 
@@ -30,3 +31,12 @@ class AuditLogSerializer(serializers.ModelSerializer):
             return obj.user_id.username
         return 'System'
 
+
+class AuditLogListValues(ValuesListSerializer):
+    """감사 로그 목록 빠른 직렬화 (AuditLogSerializer와 같은 출력)"""
+    
+    serializer_class = AuditLogSerializer
+    sources = {
+        # 사용자가 없으면(삭제/시스템 작업) 'System'
+        'username': ('user_id__username', lambda username: 'System' if username is None else username),
+    }
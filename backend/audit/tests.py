@@ -1,3 +1,28 @@
-from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from accounts.models import User
+from .models import AuditLog
+from .serializers import AuditLogSerializer
+
+
+class AuditLogListTest(APITestCase):
+    """감사 로그 목록 빠른 직렬화"""
+
+    def setUp(self):
+        self.admin = User.objects.create(username='auditor', name='관리자', role_level=2, status='active')
+        AuditLog.objects.create(user_id=self.admin, action='LOGIN_SUCCESS', details='로그인', ip_address='127.0.0.1')
+        AuditLog.objects.create(user_id=None, action='BACKUP_CREATE', target_id=3, details='자동 백업')
+        AuditLog.objects.create(user_id=self.admin, action='NOT_IN_CHOICES', details='')
+
+    def test_same_json_as_model_serializer(self):
+        """사용자 없는 로그는 'System', choices에 없는 작업은 코드 그대로"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get('/api/audit/logs/')
+        self.assertEqual(response.status_code, 200)
+
+        expected = AuditLogSerializer(AuditLog.objects.order_by('-created_at'), many=True).data
+        self.assertEqual(JSONRenderer().render(response.data['results']), JSONRenderer().render(expected))
+        self.assertEqual(
+            {row['username'] for row in response.data['results']}, {'auditor', 'System'}
+        )
@@ -4,7 +4,8 @@ from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from django_filters import rest_framework as django_filters
 from .models import AuditLog
-from .serializers import AuditLogSerializer
+from backend.list_serializers import ValuesListMixin
+from .serializers import AuditLogSerializer, AuditLogListValues
 
 
 class AuditLogPagination(PageNumberPagination):
@@ -27,7 +28,7 @@ class AuditLogFilter(django_filters.FilterSet):
         fields = ['action', 'username', 'date_from', 'date_to']
 
 
-class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
+class AuditLogViewSet(ValuesListMixin, viewsets.ReadOnlyModelViewSet):
     """
     감사 로그 조회 API
     - 읽기 전용 (생성/수정/삭제 불가)
@@ -37,6 +38,7 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     
     queryset = AuditLog.objects.all().select_related('user_id')
     serializer_class = AuditLogSerializer
+    values_serializer_class = AuditLogListValues
     permission_classes = [IsAuthenticated]
     pagination_class = AuditLogPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
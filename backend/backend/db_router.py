@@ -0,0 +1,82 @@
+"""
+SQLite 읽기/쓰기 연결 분리
+
+같은 DB 파일에 대해 쓰기용 'default'와 읽기 전용 'read'(PRAGMA query_only) 연결을
+따로 두고, 읽기 쿼리는 'read'로 보낸다. WAL 모드의 읽기는 쓰기 트랜잭션을 기다리지
+않으므로 대시보드 집계 등 무거운 조회가 Excel 가져오기 같은 긴 쓰기와 같은
+연결/트랜잭션에 묶이지 않는다.
+
+다음 경우에는 읽기도 'default'로 보낸다 (자신이 쓴 내용을 바로 읽도록).
+- 현재 요청에서 이미 쓰기를 한 뒤 (sticky-after-write)
+- 'default'에서 트랜잭션(atomic)이 진행 중일 때
+
+인메모리 DB(테스트)는 연결마다 별도 DB이거나 트랜잭션 격리로 쓴 내용이 보이지 않으므로
+분리하지 않고 모두 'default'를 사용한다.
+
+요청 단위 상태는 ReadWriteRouterMiddleware가 요청 시작/끝에 초기화한다.
+"""
+from asgiref.local import Local
+from django.db import DEFAULT_DB_ALIAS, connections
+
+READ_DB_ALIAS = 'read'
+
+# 요청 단위 상태 (Django DB 연결과 같은 방식: sync_to_async로 옮겨 간 스레드에서도 유지)
+_state = Local()
+
+
+def reset_sticky():
+    """쓰기 고정 상태 초기화"""
+    _state.wrote = False
+
+
+def pin_to_default():
+    """이후 읽기를 쓰기 연결로 고정 (현재 요청)"""
+    _state.wrote = True
+
+
+def is_pinned():
+    return getattr(_state, 'wrote', False)
+
+
+def read_split_enabled():
+    """읽기 전용 연결을 쓸 수 있는지 ('read' 별칭이 있고 파일 DB일 때)"""
+    if READ_DB_ALIAS not in connections.settings:
+        return False
+    connection = connections[DEFAULT_DB_ALIAS]
+    return not (connection.vendor == 'sqlite' and connection.is_in_memory_db())
+
+
+class ReadWriteRouter:
+    """읽기는 'read', 쓰기와 쓰기 이후 읽기는 'default'"""
+
+    def db_for_read(self, model, **hints):
+        if not read_split_enabled():
+            return DEFAULT_DB_ALIAS
+        if is_pinned() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return READ_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        pin_to_default()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 두 연결 모두 같은 DB 파일
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReadWriteRouterMiddleware:
+    """요청마다 쓰기 고정 상태 초기화"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        reset_sticky()
+        try:
+            return self.get_response(request)
+        finally:
+            reset_sticky()
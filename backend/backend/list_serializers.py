@@ -0,0 +1,235 @@
+"""
+목록 API용 values() 기반 빠른 직렬화
+
+ModelSerializer는 행마다 모델 인스턴스를 만들고 필드마다 get_attribute()/to_representation()을
+거치므로 페이지 크기가 100~1000건이면 직렬화가 응답 시간의 대부분을 차지한다.
+ValuesListSerializer는 같은 시리얼라이저 정의를 한 번만 분석해서
+- 필요한 컬럼만 values_list()로 조회하고 (관계 필드는 JOIN 컬럼으로)
+- 행(튜플) → dict 변환 규칙을 미리 만들어 두며 (문자열/정수는 변환 없이 그대로)
+- get_FOO_display 표시값은 choices로 만든 조회 테이블로 바꾼다.
+출력 JSON(키 순서 포함)은 원래 ModelSerializer와 같다.
+
+날짜/Decimal 등 형식이 있는 필드는 DRF 필드의 to_representation을 그대로 사용하므로
+DATE_FORMAT, COERCE_DECIMAL_TO_STRING 등 설정을 따른다. 다만 ISO 8601 날짜시간과 문자열
+Decimal은 현재 시간대/decimal 컨텍스트를 행마다 구하지 않고 호출마다 한 번만 구해서
+변환한다 (결과는 DRF와 같음).
+SerializerMethodField나 모델 메서드를 source로 쓰는 필드는 sources에 직접 지정해야 한다.
+
+    class PerformanceListValues(ValuesListSerializer):
+        serializer_class = PerformanceListSerializer
+        sources = {
+            # 출력 필드: 조회 경로 또는 (조회 경로, 변환 함수)
+            'weekday': ('weekday_code', lambda code: PerformanceRecord.WEEKDAY_KOREAN.get(code, '')),
+        }
+"""
+import decimal
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import ISO_8601, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from monitoring.timing import measure_serialization
+
+# 값을 그대로 내보내도 되는 필드 (DB 값이 이미 JSON 출력 형식)
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.JSONField,
+    serializers.PrimaryKeyRelatedField,
+    serializers.ReadOnlyField,
+)
+
+
+def _skip_none(convert):
+    """DRF와 같이 None은 변환하지 않음"""
+    def wrapper(value):
+        return None if value is None else convert(value)
+    return wrapper
+
+
+class _BoundConverter:
+    """to_representation() 호출마다 한 번 bind()해서 쓰는 변환 (요청별 설정 반영)"""
+
+    def __init__(self, field):
+        self.field = field
+
+    def bind(self):
+        raise NotImplementedError
+
+
+class _LocalDateTime(_BoundConverter):
+    """ISO 8601 DateTimeField: 현재 시간대를 한 번만 조회"""
+
+    @staticmethod
+    def supports(field):
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        return (
+            isinstance(field, serializers.DateTimeField)
+            and isinstance(output_format, str) and output_format.lower() == ISO_8601
+            and not hasattr(field, 'timezone')
+        )
+
+    def bind(self):
+        fallback = _skip_none(self.field.to_representation)
+        tz = self.field.default_timezone()
+        if tz is None:
+            return fallback
+
+        def convert(value):
+            if value is None or value.utcoffset() is None:
+                return fallback(value)
+            text = value.astimezone(tz).isoformat()
+            return text[:-6] + 'Z' if text.endswith('+00:00') else text
+        return convert
+
+
+class _DecimalString(_BoundConverter):
+    """문자열로 내보내는 DecimalField: 자릿수/decimal 컨텍스트를 한 번만 계산"""
+
+    @staticmethod
+    def supports(field):
+        return (
+            isinstance(field, serializers.DecimalField)
+            and getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+            and field.decimal_places is not None
+            and not field.localize and not field.normalize_output
+        )
+
+    def bind(self):
+        field = self.field
+        fallback = _skip_none(field.to_representation)
+        exponent = decimal.Decimal('.1') ** field.decimal_places
+        context = decimal.getcontext().copy()
+        if field.max_digits is not None:
+            context.prec = field.max_digits
+        rounding = field.rounding
+
+        def convert(value):
+            if not isinstance(value, decimal.Decimal):
+                return fallback(value)
+            return f'{value.quantize(exponent, rounding=rounding, context=context):f}'
+        return convert
+
+
+def _display_table(model, path):
+    """'cause_code__category' 같은 경로의 choices → {값: 표시값}"""
+    *relations, name = path.split('__')
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    field = model._meta.get_field(name)
+    if not field.choices:
+        raise ImproperlyConfigured(f"{model.__name__}.{name}에 choices가 없습니다.")
+    return {value: str(label) for value, label in field.flatchoices}
+
+
+class ValuesListSerializer:
+    """ModelSerializer 정의로부터 values_list() 조회 + 행 변환기를 만드는 읽기 전용 직렬화"""
+
+    serializer_class = None
+    # 출력 필드명 → 조회 경로(str) 또는 (조회 경로, 변환 함수). 변환 함수는 None에도 호출된다.
+    sources = {}
+
+    # 클래스별로 한 번만 분석: (조회 경로 목록, [(출력 필드명, 경로 위치, 변환 함수 또는 None)])
+    _compiled = None
+
+    @classmethod
+    def compile(cls):
+        if cls.__dict__.get('_compiled') is not None:
+            return cls._compiled
+
+        model = cls.serializer_class.Meta.model
+        paths = []
+        entries = []
+
+        def index_of(path):
+            if path not in paths:
+                paths.append(path)
+            return paths.index(path)
+
+        for name, field in cls.serializer_class().fields.items():
+            if field.write_only:
+                continue
+
+            if name in cls.sources:
+                source = cls.sources[name]
+                path, convert = source if isinstance(source, tuple) else (source, None)
+                entries.append((name, index_of(path), convert))
+                continue
+
+            if isinstance(field, serializers.SerializerMethodField):
+                raise ImproperlyConfigured(
+                    f"{cls.__name__}: SerializerMethodField '{name}'는 sources에 지정해야 합니다."
+                )
+
+            *relations, attr = field.source.split('.')
+            if attr.startswith('get_') and attr.endswith('_display'):
+                # get_FOO_display → FOO 컬럼 + choices 조회 테이블 (없는 값은 원래 값)
+                path = '__'.join(relations + [attr[len('get_'):-len('_display')]])
+                table = _display_table(model, path)
+                entries.append((name, index_of(path), lambda value, table=table: table.get(value, value)))
+                continue
+
+            path = '__'.join(relations + [attr])
+            if isinstance(field, IDENTITY_FIELDS):
+                convert = None
+            elif _LocalDateTime.supports(field):
+                convert = _LocalDateTime(field)
+            elif _DecimalString.supports(field):
+                convert = _DecimalString(field)
+            else:
+                convert = _skip_none(field.to_representation)
+            entries.append((name, index_of(path), convert))
+
+        cls._compiled = (tuple(paths), tuple(entries))
+        return cls._compiled
+
+    @classmethod
+    def project(cls, queryset):
+        """필요한 컬럼만 조회하는 values_list() 쿼리셋"""
+        paths, _ = cls.compile()
+        return queryset.values_list(*paths)
+
+    @classmethod
+    def to_representation(cls, rows):
+        """project() 결과 행 목록 → 시리얼라이저 출력과 같은 dict 목록"""
+        _, entries = cls.compile()
+        entries = [
+            (name, index, convert.bind() if isinstance(convert, _BoundConverter) else convert)
+            for name, index, convert in entries
+        ]
+        return [
+            {
+                name: row[index] if convert is None else convert(row[index])
+                for name, index, convert in entries
+            }
+            for row in rows
+        ]
+
+
+class ValuesListMixin:
+    """
+    ListAPIView/ReadOnlyModelViewSet용: values_serializer_class가 있으면 목록 조회를
+    ValuesListSerializer로 처리 (필터/검색/정렬/페이지네이션은 그대로)
+
+    행 → dict 변환 시간은 Server-Timing의 serialize 항목으로 기록된다.
+    """
+
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        values_serializer = self.values_serializer_class
+        if values_serializer is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = values_serializer.project(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        rows = list(queryset) if page is None else page
+        with measure_serialization():
+            data = values_serializer.to_representation(rows)
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
@@ -0,0 +1,51 @@
+"""
+PostgreSQL 전용 마이그레이션 작업
+
+BRIN, GIN 트라이그램 인덱스처럼 PostgreSQL에만 있는 기능은 SQLite에서 실행하면 오류가
+나므로, 연결된 DB가 PostgreSQL일 때만 SQL을 실행하고 그 밖에는 아무것도 하지 않는다.
+(django.contrib.postgres는 psycopg가 없으면 import할 수 없어 사용하지 않음)
+"""
+from django.db import migrations
+
+
+class PostgresRunSQL(migrations.RunSQL):
+    """PostgreSQL에서만 실행하는 RunSQL"""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return f"{super().describe()} (PostgreSQL 전용)"
+
+
+def trigram_index_sql(table, column, name):
+    """대소문자 무시 부분 일치 검색(icontains)용 GIN 트라이그램 인덱스 (생성, 삭제) SQL
+
+    Django의 icontains는 UPPER("col"::text) LIKE UPPER(...)로 변환되므로 같은 식에 만든다.
+    """
+    return (
+        f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" '
+        f'USING gin (UPPER("{column}"::text) gin_trgm_ops)',
+        f'DROP INDEX IF EXISTS "{name}"',
+    )
+
+
+def brin_index_sql(table, column, name):
+    """날짜 범위 조회용 BRIN 인덱스 (생성, 삭제) SQL
+
+    날짜 순서로 쌓이는 테이블에서 B-tree보다 훨씬 작고 범위 조회에 충분하다.
+    """
+    return (
+        f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING brin ("{column}")',
+        f'DROP INDEX IF EXISTS "{name}"',
+    )
+
+
+def create_trigram_extension():
+    """pg_trgm 확장 설치 작업 (PostgreSQL 13+에서는 DB 소유자가 설치할 수 있는 trusted 확장)"""
+    return PostgresRunSQL('CREATE EXTENSION IF NOT EXISTS pg_trgm', reverse_sql=migrations.RunSQL.noop)
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 from decouple import config, Csv
+from django.core.exceptions import ImproperlyConfigured
 import os
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -59,15 +60,18 @@ INSTALLED_APPS = [
     'dashboard',
     'sticky_notes',
     'backup_management',
+    'monitoring',
 ]
 
 MIDDLEWARE = [
+    'monitoring.middleware.RequestTimingMiddleware',  # 요청별 쿼리/시간 계측 (Server-Timing)
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Static 파일 서빙
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
+    'backend.db_router.ReadWriteRouterMiddleware',  # 요청별 쓰기 후 읽기 고정 초기화
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -97,12 +101,106 @@ ASGI_APPLICATION = 'backend.asgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / config('DATABASE_NAME', default='db.sqlite3'),
+# 지속 연결 유지 시간(초): Uvicorn(ASGI)은 요청마다 새 스레드에서 실행되어 연결을
+# 재사용하지 못하므로 0, 스케줄러 등 오래 실행되는 프로세스는 값을 주면 재사용
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=0, cast=int)
+
+# 데이터베이스 종류: sqlite(기본) 또는 postgresql (동시 쓰기가 많은 환경)
+# SQLite → PostgreSQL 이전: manage.py sqlite_to_postgres
+DB_ENGINE = config('DB_ENGINE', default='sqlite')
+
+if DB_ENGINE == 'postgresql':
+    # psycopg 연결 풀: 요청마다 새 스레드에서 연결하는 Uvicorn에서 연결 비용 절감 (psycopg[pool] 필요)
+    POSTGRES_POOL = config('POSTGRES_POOL', default=True, cast=bool)
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': config('POSTGRES_DB', default='qms'),
+            'USER': config('POSTGRES_USER', default='qms'),
+            'PASSWORD': config('POSTGRES_PASSWORD', default=''),
+            'HOST': config('POSTGRES_HOST', default='localhost'),
+            'PORT': config('POSTGRES_PORT', default='5432'),
+            # 연결 풀과 지속 연결(CONN_MAX_AGE)은 함께 쓸 수 없음
+            'CONN_MAX_AGE': 0 if POSTGRES_POOL else DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {'pool': POSTGRES_POOL},
+        }
     }
-}
+elif DB_ENGINE == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / config('DATABASE_NAME', default='db.sqlite3'),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            # 지속 연결 재사용 전 연결 상태 확인
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                # 쓰기 트랜잭션을 시작 시점에 잠가 읽기→쓰기 전환 중 SQLITE_BUSY 방지
+                'transaction_mode': 'IMMEDIATE',
+            },
+        }
+    }
+
+    # 읽기 전용 연결 분리: GET 조회/집계는 같은 파일의 query_only 연결('read')로 보내고
+    # 쓰기와 같은 요청 안의 쓰기 이후 읽기는 'default' 사용 (backend/db_router.py)
+    DB_READ_SPLIT = config('DB_READ_SPLIT', default=True, cast=bool)
+
+    if DB_READ_SPLIT:
+        DATABASES['read'] = {
+            **DATABASES['default'],
+            'OPTIONS': {
+                # 실수로 쓰기 쿼리가 들어오면 SQLite가 거부
+                'init_command': 'PRAGMA query_only=ON',
+            },
+            'TEST': {'MIRROR': 'default'},
+        }
+        DATABASE_ROUTERS = ['backend.db_router.ReadWriteRouter']
+else:
+    raise ImproperlyConfigured(f"DB_ENGINE은 sqlite 또는 postgresql이어야 합니다: {DB_ENGINE}")
+
+# 대시보드 API의 독립 집계 쿼리 동시 실행 스레드 수 (프로세스당, 1 이하면 차례로 실행)
+# SQLite 쿼리는 CPU를 쓰므로 코어가 하나뿐이면 동시 실행 이득이 없음
+DASHBOARD_QUERY_WORKERS = config('DASHBOARD_QUERY_WORKERS', default=min(4, os.cpu_count() or 1), cast=int)
+
+# SQLite 연결별 PRAGMA (새 연결마다 적용, SQLITE_TUNING=False이면 적용 안 함)
+SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    # 잠금 대기 시간(ms)
+    'busy_timeout': config('SQLITE_BUSY_TIMEOUT', default=5000, cast=int),
+    # 연결별 페이지 캐시 (음수는 KiB 단위): 새 연결마다 캐시 메모리를 다시 할당하므로
+    # 요청마다 연결하는 경우 큰 캐시는 오히려 느림 → 지속 연결일 때만 64MB
+    'cache_size': config('SQLITE_CACHE_SIZE', default=-64000 if DB_CONN_MAX_AGE else -2000, cast=int),
+    'temp_store': 'memory',
+    # 메모리 매핑 읽기 크기(바이트): OS 페이지 캐시를 연결 간에 공유
+    'mmap_size': config('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int),
+} if config('SQLITE_TUNING', default=True, cast=bool) else {}
+
+# 요청 계측 (monitoring/middleware.py): 쿼리 수/DB/직렬화/Python 시간
+REQUEST_TIMING = config('REQUEST_TIMING', default=True, cast=bool)
+# 응답에 Server-Timing 헤더 포함 여부
+SERVER_TIMING_HEADER = config('SERVER_TIMING_HEADER', default=True, cast=bool)
+# 이 시간(ms) 이상 걸린 요청은 반복 쿼리 목록과 함께 경고 로그
+SLOW_REQUEST_MS = config('SLOW_REQUEST_MS', default=1000, cast=int)
+# 엔드포인트별 응답 시간 히스토그램 보관 기간(초)
+REQUEST_STATS_WINDOW = config('REQUEST_STATS_WINDOW', default=900, cast=int)
+
+# 느린 쿼리 로그 (monitoring/slow_queries.py): 이 시간(ms) 이상 걸린 쿼리를 실행 계획과 함께 기록 (0이면 끔)
+SLOW_QUERY_MS = config('SLOW_QUERY_MS', default=200, cast=int)
+# 로그 위치(날짜별 JSONL), 보관 일수, 하루 파일 크기 상한(바이트)
+SLOW_QUERY_LOG_DIR = BASE_DIR / 'logs'
+SLOW_QUERY_LOG_DAYS = config('SLOW_QUERY_LOG_DAYS', default=14, cast=int)
+SLOW_QUERY_LOG_MAX_BYTES = config('SLOW_QUERY_LOG_MAX_BYTES', default=20 * 1024 * 1024, cast=int)
+
+# Prometheus 메트릭 (GET /metrics): Uvicorn 워커 여러 개의 값을 합산하는 공유 디렉토리
+# (서버 시작 전에 비워야 함, 지정하지 않으면 응답한 워커의 값만 보임). prometheus_client를 import하기 전에
+# 환경 변수로 지정되어야 하므로 .env 값도 여기서 환경 변수로 옮긴다.
+PROMETHEUS_MULTIPROC_DIR = config('PROMETHEUS_MULTIPROC_DIR', default='')
+if PROMETHEUS_MULTIPROC_DIR:
+    os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', PROMETHEUS_MULTIPROC_DIR)
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+# /metrics 스크랩 허용 주소 (Nginx를 거친 요청은 항상 거부)
+METRICS_ALLOWED_IPS = config('METRICS_ALLOWED_IPS', default='127.0.0.1,::1', cast=Csv())
 
 
 # Password validation
@@ -231,13 +329,34 @@ SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https') if not DEBUG else
 # 백업 관리 설정
 BACKUP_DIR = BASE_DIR / 'backups'
 MAX_BACKUP_FILES = config('MAX_BACKUP_FILES', default=10, cast=int)
+# 온라인 백업: 한 번에 복사할 페이지 수와 단계 사이 대기 시간(초)
+BACKUP_STEP_PAGES = config('BACKUP_STEP_PAGES', default=256, cast=int)
+BACKUP_STEP_SLEEP = config('BACKUP_STEP_SLEEP', default=0.005, cast=float)
+# 업로드 백업 파일 PRAGMA quick_check 제한 시간(초)
+BACKUP_QUICK_CHECK_TIMEOUT = config('BACKUP_QUICK_CHECK_TIMEOUT', default=300, cast=int)
+# 데이터 아카이빙: 내보낸 파일 위치, 배치당 행 수와 배치 사이 대기 시간(초)
+DATA_ARCHIVE_DIR = BACKUP_DIR / 'archive'
+ARCHIVE_BATCH_SIZE = config('ARCHIVE_BATCH_SIZE', default=1000, cast=int)
+ARCHIVE_BATCH_SLEEP = config('ARCHIVE_BATCH_SLEEP', default=0.05, cast=float)
+# 증분 백업: 전체 스냅샷 사이 증분 수와 보관할 체인 수
+INCREMENTAL_FULL_EVERY = config('INCREMENTAL_FULL_EVERY', default=24, cast=int)
+INCREMENTAL_KEEP_CHAINS = config('INCREMENTAL_KEEP_CHAINS', default=7, cast=int)
+# PostgreSQL 사용 시 pg_dump/pg_restore 위치 (비우면 PATH에서 찾음)
+PG_BIN_DIR = config('PG_BIN_DIR', default='')
 
 # AWS S3 백업 설정 (선택사항)
 AWS_S3_BACKUP_BUCKET = config('AWS_S3_BACKUP_BUCKET', default='')
 AWS_ACCESS_KEY_ID = config('AWS_ACCESS_KEY_ID', default='')
 AWS_SECRET_ACCESS_KEY = config('AWS_SECRET_ACCESS_KEY', default='')
 AWS_DEFAULT_REGION = config('AWS_DEFAULT_REGION', default='ap-northeast-2')
+# S3 호환 스토리지(MinIO 등) 사용 시 엔드포인트
+AWS_S3_ENDPOINT_URL = config('AWS_S3_ENDPOINT_URL', default='')
+# 멀티파트 전송: 파트 크기(바이트, 최소 5MB)와 동시 전송 수
+AWS_S3_MULTIPART_CHUNK_SIZE = config('AWS_S3_MULTIPART_CHUNK_SIZE', default=8 * 1024 * 1024, cast=int)
+AWS_S3_MAX_CONCURRENCY = config('AWS_S3_MAX_CONCURRENCY', default=4, cast=int)
 
 # APScheduler 설정
+# run_scheduler 리더 선출용 잠금 파일 (여러 프로세스 중 하나만 작업 실행)
+SCHEDULER_LOCK_FILE = config('SCHEDULER_LOCK_FILE', default=str(BASE_DIR / 'scheduler.lock'))
 APSCHEDULER_DATETIME_FORMAT = "N j, Y, f:s a"
 APSCHEDULER_RUN_NOW_TIMEOUT = 25  # 초
@@ -17,6 +17,8 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from monitoring.views import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('accounts.urls')),
@@ -29,4 +31,6 @@ urlpatterns = [
     path('api/audit/', include('audit.urls')),
     path('api/', include('sticky_notes.urls')),
     path('api/backup/', include('backup_management.urls')),
+    path('api/monitoring/', include('monitoring.urls')),
+    path('metrics', metrics_view, name='metrics'),
 ]
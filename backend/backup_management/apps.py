@@ -6,26 +6,15 @@ class BackupManagementConfig(AppConfig):
     name = 'backup_management'
     verbose_name = '백업 관리'
     
+    # 백업 동기화와 스케줄러는 `manage.py run_scheduler` 프로세스 하나에서만 실행
+    # (웹 워커/관리 명령/테스트 시작 시에는 DB 조회나 스레드 생성 없음)
+    
     def ready(self):
-        """앱 시작 시 스케줄러 자동 실행 및 백업 동기화"""
-        import os
-        import logging
-        logger = logging.getLogger(__name__)
+        from django.db.backends.signals import connection_created
+        from .sqlite_tuning import apply_sqlite_pragmas
+        
+        # 복원 세대 확인 (요청 시작/연결 생성 시 stat() 한 번, DB 조회 없음)
+        from . import signals  # noqa: F401
         
-        # 마이그레이션 실행 시나 테스트 환경에서는 스케줄러 시작하지 않음
-        if os.environ.get('RUN_MAIN', None) == 'true' or os.environ.get('DJANGO_SETTINGS_MODULE'):
-            try:
-                # 백업 파일과 DB 레코드 동기화
-                from .sync_utils import sync_backup_records
-                logger.info("백업 파일 동기화 시작...")
-                stats = sync_backup_records()
-                logger.info(f"백업 동기화 완료: {stats}")
-            except Exception as e:
-                logger.warning(f"백업 동기화 실패: {e}")
-            
-            try:
-                # 스케줄러 시작
-                from . import scheduler
-                scheduler.start()
-            except Exception as e:
-                logger.warning(f"스케줄러 시작 실패: {e}")
+        # 새 DB 연결마다 SQLite PRAGMA 프로필 적용 (settings.SQLITE_PRAGMAS)
+        connection_created.connect(apply_sqlite_pragmas, dispatch_uid='sqlite_pragmas')
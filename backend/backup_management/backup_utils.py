@@ -2,14 +2,39 @@
 백업 파일 생성 및 복원 유틸리티
 """
 import os
-import shutil
+import gzip
+import json
+import hashlib
+import sqlite3
 import logging
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait as futures_wait
+from contextlib import contextmanager
 from datetime import datetime
 from django.conf import settings
 from pathlib import Path
 
+from .pg_backup import check_pg_backup, create_pg_backup, is_pg_dump, is_postgres, restore_pg_backup
+
 logger = logging.getLogger(__name__)
 
+# 백업 압축 파일 확장자 (gzip으로 압축한 SQLite 파일)
+ARCHIVE_SUFFIX = '.sqlite3.gz'
+
+# 백업 파일 패턴 (압축 이전 형식, PostgreSQL pg_dump 형식 포함)
+BACKUP_FILE_PATTERNS = ['*.sqlite3', '*.sqlite3.gz', '*.pgdump']
+
+# 스트리밍 압축/해제 단위 (메모리 사용량 상한)
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# 백업/업로드 최대 크기 (압축 해제 기준 1GB)
+MAX_BACKUP_SIZE = 1 * 1024 * 1024 * 1024
+
+# 업로드 파일 quick_check 작업 스레드
+_quick_check_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='backup-quick-check')
+
 
 def get_backup_dir():
     """백업 디렉토리 경로 반환"""
@@ -32,17 +57,247 @@ def get_database_path():
     return Path(db_settings['NAME'])
 
 
+def is_archive(file_path):
+    """gzip 압축 백업 파일 여부"""
+    return str(file_path).lower().endswith('.gz')
+
+
+def iter_backup_files(backup_dir):
+    """백업 디렉토리의 백업 파일 목록 (임시 파일 제외)"""
+    files = []
+    for pattern in BACKUP_FILE_PATTERNS:
+        for file_path in Path(backup_dir).glob(pattern):
+            name = file_path.name.lower()
+            if 'temp' in name or 'tmp' in name:
+                continue
+            files.append(file_path)
+    return files
+
+
+def get_manifest_path(backup_file_path):
+    """백업 파일의 매니페스트(JSON) 경로 (db_backup_YYYYMMDD_HHMMSS.json)"""
+    backup_file_path = Path(backup_file_path)
+    name = backup_file_path.name
+    for suffix in (ARCHIVE_SUFFIX, '.sqlite3', '.pgdump'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    return backup_file_path.with_name(f"{name}.json")
+
+
+def read_manifest(backup_file_path):
+    """백업 매니페스트 읽기 (없거나 손상된 경우 None)"""
+    manifest_path = get_manifest_path(backup_file_path)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(backup_file_path, manifest):
+    """백업 매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+    manifest_path = get_manifest_path(backup_file_path)
+    temp_path = manifest_path.with_name(f"temp_{manifest_path.name}")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, manifest_path)
+    return manifest_path
+
+
+def file_sha256(file_path):
+    """파일 SHA-256 (스트리밍 계산)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _HashingWriter:
+    """쓰는 바이트의 SHA-256과 크기를 함께 계산하는 파일 래퍼"""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.digest.update(data)
+        self.size += len(data)
+        return self.fileobj.write(data)
+
+    def flush(self):
+        self.fileobj.flush()
+
+
+def compress_file(source_path, archive_path, compresslevel=6):
+    """
+    파일을 gzip으로 스트리밍 압축
+
+    Returns:
+        dict: sha256/size(압축 파일), original_sha256/original_size(원본)
+    """
+    original_digest = hashlib.sha256()
+    original_size = 0
+
+    with open(source_path, 'rb') as source, open(archive_path, 'wb') as raw:
+        writer = _HashingWriter(raw)
+        with gzip.GzipFile(fileobj=writer, mode='wb', compresslevel=compresslevel, mtime=0) as archive:
+            for chunk in iter(lambda: source.read(STREAM_CHUNK_SIZE), b''):
+                original_digest.update(chunk)
+                original_size += len(chunk)
+                archive.write(chunk)
+        raw.flush()
+        os.fsync(raw.fileno())
+
+    return {
+        'sha256': writer.digest.hexdigest(),
+        'size': writer.size,
+        'original_sha256': original_digest.hexdigest(),
+        'original_size': original_size,
+    }
+
+
+def iter_decompressed(chunks, max_size=MAX_BACKUP_SIZE):
+    """
+    gzip 바이트 청크를 스트리밍 해제 (압축 폭탄 방지를 위해 max_size 초과 시 중단)
+
+    Args:
+        chunks: gzip 데이터 청크 iterable (업로드 파일 chunks(), 파일 읽기 등)
+    """
+    decompressor = zlib.decompressobj(wbits=31)
+    total = 0
+    for chunk in chunks:
+        data = decompressor.decompress(chunk, STREAM_CHUNK_SIZE)
+        while True:
+            if data:
+                total += len(data)
+                if max_size and total > max_size:
+                    raise ValueError(f"압축 해제 크기가 최대 {max_size} bytes를 초과합니다.")
+                yield data
+            if not decompressor.unconsumed_tail:
+                break
+            data = decompressor.decompress(decompressor.unconsumed_tail, STREAM_CHUNK_SIZE)
+        if decompressor.eof:
+            break
+
+    if not decompressor.eof:
+        raise ValueError("gzip 데이터가 완전하지 않습니다.")
+    tail = decompressor.flush()
+    if tail:
+        yield tail
+
+
+def iter_file_chunks(file_path):
+    """파일을 STREAM_CHUNK_SIZE 단위로 읽기"""
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+            yield chunk
+
+
+def decompress_to_file(chunks, dest_path, max_size=MAX_BACKUP_SIZE):
+    """
+    gzip 청크를 스트리밍 해제하여 파일로 저장
+
+    Returns:
+        int: 해제된 크기 (bytes)
+    """
+    size = 0
+    try:
+        with open(dest_path, 'wb') as dest:
+            for data in iter_decompressed(chunks, max_size=max_size):
+                dest.write(data)
+                size += len(data)
+    except Exception:
+        Path(dest_path).unlink(missing_ok=True)
+        raise
+    return size
+
+
+def verify_checksum(backup_file_path, expected_sha256=None):
+    """
+    백업 파일 체크섬 검증 (기대값이 없으면 매니페스트 값 사용)
+
+    Returns:
+        tuple: (is_valid, error_message) - 기대값을 알 수 없으면 (True, None)
+    """
+    if not expected_sha256:
+        manifest = read_manifest(backup_file_path)
+        expected_sha256 = manifest.get('sha256') if manifest else None
+    if not expected_sha256:
+        return True, None
+
+    actual = file_sha256(backup_file_path)
+    if actual != expected_sha256:
+        return False, f"체크섬이 일치하지 않습니다 (기대값 {expected_sha256[:12]}…, 실제 {actual[:12]}…)."
+    return True, None
+
+
+def copy_database(db_path, dest_path, step_pages=None, step_sleep=None):
+    """
+    SQLite 온라인 백업 API로 운영 중인 DB를 복사
+
+    shutil.copy2는 -wal 파일에만 있는 커밋을 빠뜨리거나 쓰기 도중의 파일을
+    복사할 수 있으므로, sqlite3 backup()으로 step_pages 페이지씩 나누어 복사하고
+    단계 사이에 step_sleep초 쉬어 디스크 I/O를 양보한다.
+
+    WAL 모드에서는 원본 연결에 읽기 트랜잭션을 열어 둔 채 복사하므로 모든 단계가
+    같은 스냅샷을 읽는다 (도중에 다른 연결이 써도 백업이 처음부터 다시 시작되지
+    않음). WAL 모드의 읽기는 쓰기를 막지 않으므로 복사 중에도 쓰기는 대기하지 않는다.
+
+    Args:
+        db_path: 원본 DB 경로
+        dest_path: 백업 파일 경로 (새 파일)
+        step_pages: 단계별 복사 페이지 수 (기본값: settings.BACKUP_STEP_PAGES)
+        step_sleep: 단계 사이 대기 시간(초) (기본값: settings.BACKUP_STEP_SLEEP)
+    """
+    if step_pages is None:
+        step_pages = getattr(settings, 'BACKUP_STEP_PAGES', 256)
+    if step_sleep is None:
+        step_sleep = getattr(settings, 'BACKUP_STEP_SLEEP', 0.005)
+
+    def throttle(status, remaining, total):
+        if remaining and step_sleep > 0:
+            time.sleep(step_sleep)
+
+    source = sqlite3.connect(str(db_path), isolation_level=None, timeout=30)
+    dest = sqlite3.connect(str(dest_path))
+    try:
+        is_wal = source.execute('PRAGMA journal_mode').fetchone()[0].lower() == 'wal'
+        if is_wal:
+            # 스냅샷 고정 (읽기 트랜잭션 시작)
+            source.execute('BEGIN')
+            source.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+
+        source.backup(dest, pages=step_pages, progress=throttle)
+
+        if is_wal:
+            source.execute('COMMIT')
+
+        # 백업 파일은 -wal 없이 단독으로 열리도록 롤백 저널 모드로 전환
+        dest.execute('PRAGMA journal_mode=DELETE')
+    finally:
+        dest.close()
+        source.close()
+
+
 def create_backup(backup_type='manual', created_by=None):
     """
-    데이터베이스 백업 파일 생성
+    데이터베이스 백업 파일 생성 (gzip 압축 + 매니페스트, PostgreSQL은 pg_dump)
     
     Args:
         backup_type: 백업 유형 ('auto' 또는 'manual')
         created_by: 생성자 (User 객체 또는 None)
     
     Returns:
-        tuple: (backup_file_path, file_size)
+        tuple: (backup_file_path, file_size, manifest)
+            file_size는 압축 파일 크기, manifest에 sha256/original_size 포함
     """
+    if is_postgres():
+        return create_pg_backup(backup_type=backup_type, created_by=created_by)
+    
+    temp_path = temp_archive = None
     try:
         # 데이터베이스 파일 경로
         db_path = get_database_path()
@@ -55,165 +310,288 @@ def create_backup(backup_type='manual', created_by=None):
         
         # 백업 파일명 생성
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_filename = f"db_backup_{timestamp}.sqlite3"
-        backup_path = Path(backup_dir) / backup_filename
+        backup_path = Path(backup_dir) / f"db_backup_{timestamp}{ARCHIVE_SUFFIX}"
+        
+        # 임시 파일에 복사/압축한 뒤 완료되면 이름 변경 (중간 상태 파일이 백업 목록에 보이지 않도록)
+        temp_path = Path(backup_dir) / f"temp_db_backup_{timestamp}.sqlite3"
+        temp_archive = Path(backup_dir) / f"temp_{backup_path.name}"
+        started = time.monotonic()
+        copy_database(db_path, temp_path)
         
-        # 파일 복사
-        shutil.copy2(db_path, backup_path)
+        checksums = compress_file(temp_path, temp_archive)
+        os.replace(temp_archive, backup_path)
+        temp_path.unlink()
+        
+        manifest = {
+            'format': 'sqlite3+gzip',
+            'file_name': backup_path.name,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'backup_type': backup_type,
+            'created_by': getattr(created_by, 'username', None),
+            'sha256': checksums['sha256'],
+            'size': checksums['size'],
+            'original_sha256': checksums['original_sha256'],
+            'original_size': checksums['original_size'],
+            'sqlite_version': sqlite3.sqlite_version,
+        }
+        write_manifest(backup_path, manifest)
         
         # 파일 크기
         file_size = backup_path.stat().st_size
         
-        logger.info(f"백업 파일 생성 완료: {backup_path} ({file_size} bytes)")
+        from .catalog import backup_catalog
+        backup_catalog.record_added(backup_path, manifest)
+        
+        logger.info(
+            f"백업 파일 생성 완료: {backup_path} ({checksums['original_size']} → {file_size} bytes, "
+            f"{time.monotonic() - started:.2f}초)"
+        )
         
-        return str(backup_path), file_size
+        return str(backup_path), file_size, manifest
     
     except Exception as e:
         logger.error(f"백업 파일 생성 실패: {str(e)}")
+        for leftover in (temp_path, temp_archive):
+            if leftover is not None and leftover.exists():
+                try:
+                    leftover.unlink()
+                except OSError:
+                    pass
         raise
 
 
-def restore_backup(backup_file_path):
+@contextmanager
+def extracted_backup(backup_file_path, expected_sha256=None):
+    """
+    백업 파일을 SQLite 파일 경로로 제공 (체크섬 검증 후 압축 파일은 임시 파일로 해제)
+    
+    with 블록이 끝나면 해제한 임시 파일은 삭제된다.
+    """
+    backup_file_path = Path(backup_file_path)
+    is_valid, error_message = verify_checksum(backup_file_path, expected_sha256)
+    if not is_valid:
+        raise ValueError(error_message)
+    
+    if not is_archive(backup_file_path):
+        yield backup_file_path
+        return
+    
+    temp_path = Path(get_backup_dir()) / f"temp_extract_{threading.get_ident()}_{backup_file_path.name[:-3]}"
+    try:
+        decompress_to_file(iter_file_chunks(backup_file_path), temp_path)
+        yield temp_path
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def check_backup_integrity(backup_file_path, expected_sha256=None):
+    """
+    백업 파일 무결성 검사 (체크섬 + PRAGMA integrity_check)
+    
+    Returns:
+        tuple: (is_ok, message)
+    """
+    if is_pg_dump(backup_file_path):
+        return check_pg_backup(backup_file_path, expected_sha256)
+    
+    with extracted_backup(backup_file_path, expected_sha256) as db_file:
+        conn = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
+        try:
+            rows = [row[0] for row in conn.execute('PRAGMA integrity_check')]
+        finally:
+            conn.close()
+    
+    if rows == ['ok']:
+        return True, 'ok'
+    return False, '\n'.join(rows[:20])
+
+
+def quick_check(db_file, timeout=None):
+    """
+    PRAGMA quick_check를 작업 스레드에서 실행 (업로드 파일 복원 전 구조 검사)
+    
+    요청 스레드는 결과만 기다리며, timeout(초)을 넘기면 검사를 중단(interrupt)한다.
+    
+    Returns:
+        tuple: (is_ok, message)
+    """
+    if timeout is None:
+        timeout = getattr(settings, 'BACKUP_QUICK_CHECK_TIMEOUT', 300)
+    
+    conn = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True, check_same_thread=False)
+    try:
+        future = _quick_check_executor.submit(
+            lambda: [row[0] for row in conn.execute('PRAGMA quick_check')]
+        )
+        try:
+            rows = future.result(timeout=timeout or None)
+        except FutureTimeoutError:
+            conn.interrupt()
+            futures_wait([future])
+            return False, f"quick_check가 {timeout}초 안에 끝나지 않았습니다."
+        except sqlite3.DatabaseError as e:
+            return False, f"quick_check 실행 실패: {str(e)}"
+    finally:
+        conn.close()
+    
+    if rows == ['ok']:
+        return True, 'ok'
+    return False, '\n'.join(rows[:20])
+
+
+def verify_backup_record(record_id):
+    """
+    백업 이력의 파일 무결성을 검사하고 결과를 기록
+    
+    Returns:
+        str: 검사 결과 상태 ('ok' 또는 'failed')
+    """
+    from django.db import connection
+    from django.utils import timezone
+    from .models import BackupRecord
+    
+    try:
+        record = BackupRecord.objects.get(id=record_id)
+        try:
+            is_ok, message = check_backup_integrity(record.file_path, record.checksum or None)
+        except Exception as e:
+            is_ok, message = False, f'무결성 검사 실행 실패: {str(e)}'
+        
+        result = 'ok' if is_ok else 'failed'
+        BackupRecord.objects.filter(id=record_id).update(
+            integrity_status=result,
+            integrity_message='' if is_ok else message,
+            verified_at=timezone.now(),
+        )
+        
+        if is_ok:
+            logger.info(f"백업 무결성 검사 통과: {record.file_path}")
+        else:
+            logger.error(f"백업 무결성 검사 실패: {record.file_path} - {message}")
+        return result
+    
+    finally:
+        # 백그라운드 스레드에서 연 DB 연결 정리
+        connection.close()
+
+
+def start_integrity_check(backup_record):
+    """백업 이력의 무결성 검사를 백그라운드 스레드로 실행 (요청/작업을 기다리게 하지 않음)"""
+    thread = threading.Thread(
+        target=verify_backup_record,
+        args=(backup_record.id,),
+        name=f'backup-integrity-{backup_record.id}',
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def restore_backup(backup_file_path, expected_sha256=None):
     """
     백업 파일로부터 데이터베이스 복원
     
+    압축 백업은 체크섬을 검증한 뒤 임시 파일로 스트리밍 해제하여 복원한다.
+    
     Args:
-        backup_file_path: 복원할 백업 파일 경로
+        backup_file_path: 복원할 백업 파일 경로 (.sqlite3, .sqlite3.gz 또는 PostgreSQL .pgdump)
+        expected_sha256: 기대 체크섬 (없으면 매니페스트 값 사용)
     
     Returns:
         bool: 성공 여부
     """
-    import sqlite3
-    import time
-    from django.db import connections
+    if is_pg_dump(backup_file_path) != is_postgres():
+        raise ValueError("백업 파일 형식이 현재 데이터베이스 종류와 맞지 않습니다.")
+    if is_pg_dump(backup_file_path):
+        return restore_pg_backup(backup_file_path, expected_sha256)
     
+    with extracted_backup(backup_file_path, expected_sha256) as db_file:
+        return _restore_database_file(db_file)
+
+
+def _page_size(db_file):
+    conn = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
     try:
-        backup_path = Path(backup_file_path)
-        
-        if not backup_path.exists():
-            raise FileNotFoundError(f"백업 파일을 찾을 수 없습니다: {backup_path}")
-        
-        # 현재 데이터베이스 파일 경로
-        db_path = get_database_path()
-        
-        # 모든 데이터베이스 연결 닫기
-        connections.close_all()
-        
-        # 연결이 완전히 닫힐 때까지 대기
-        time.sleep(1)
-        
-        # 현재 DB를 임시로 백업 (복원 실패 시 롤백용)
-        temp_backup = db_path.parent / f"{db_path.name}.temp_backup"
-        
-        # WAL 파일도 함께 백업
-        wal_file = Path(str(db_path) + '-wal')
-        shm_file = Path(str(db_path) + '-shm')
-        
-        temp_wal = db_path.parent / f"{db_path.name}.temp_backup-wal"
-        temp_shm = db_path.parent / f"{db_path.name}.temp_backup-shm"
+        return conn.execute('PRAGMA page_size').fetchone()[0]
+    finally:
+        conn.close()
+
+
+def prepare_restore(backup_file_path, db_path):
+    """
+    운영 DB 옆에 복원할 DB 준비 (<db>.restore_staging)
+    
+    백업 파일을 복사한 뒤 페이지 크기를 운영 DB에 맞추고(WAL 모드 DB에는 페이지
+    크기가 다른 DB를 백업 API로 복사할 수 없음) quick_check로 검사한다.
+    
+    Returns:
+        Path: 스테이징 DB 경로
+    """
+    staging = db_path.with_name(f"{db_path.name}.restore_staging")
+    staging.unlink(missing_ok=True)
+    try:
+        copy_database(backup_file_path, staging, step_pages=-1, step_sleep=0)
         
-        try:
-            # WAL 모드 체크포인트 실행 (기존 데이터베이스)
+        live_page_size = _page_size(db_path)
+        if _page_size(staging) != live_page_size:
+            conn = sqlite3.connect(str(staging), isolation_level=None)
             try:
-                conn = sqlite3.connect(str(db_path))
-                conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                conn.execute(f'PRAGMA page_size={int(live_page_size)}')
+                conn.execute('VACUUM')
+            finally:
                 conn.close()
-                time.sleep(0.5)  # 파일 시스템 동기화 대기
-            except Exception as checkpoint_error:
-                logger.warning(f"초기 WAL checkpoint 실패 (무시 가능): {checkpoint_error}")
-            
-            # 현재 DB 파일들 백업 (재시도 로직 포함)
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    shutil.copy2(db_path, temp_backup)
-                    if wal_file.exists():
-                        shutil.copy2(wal_file, temp_wal)
-                    if shm_file.exists():
-                        shutil.copy2(shm_file, temp_shm)
-                    break
-                except (PermissionError, OSError) as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"백업 시도 {attempt + 1}/{max_retries} 실패: {e}, 재시도 중...")
-                        time.sleep(2)
-                    else:
-                        raise
-            
-            # 기존 WAL/SHM 파일 삭제 (재시도 로직 포함)
-            for attempt in range(max_retries):
-                try:
-                    if wal_file.exists():
-                        wal_file.unlink()
-                    if shm_file.exists():
-                        shm_file.unlink()
-                    break
-                except (PermissionError, OSError) as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"WAL/SHM 파일 삭제 시도 {attempt + 1}/{max_retries} 실패: {e}, 재시도 중...")
-                        time.sleep(2)
-                    else:
-                        # WAL/SHM 파일 삭제 실패는 경고만 하고 계속 진행
-                        logger.warning(f"WAL/SHM 파일 삭제 실패 (무시하고 계속): {e}")
-                        break
-            
-            # 백업 파일로 교체 (재시도 로직 포함)
-            for attempt in range(max_retries):
-                try:
-                    shutil.copy2(backup_path, db_path)
-                    break
-                except (PermissionError, OSError) as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"복원 시도 {attempt + 1}/{max_retries} 실패: {e}, 재시도 중...")
-                        time.sleep(2)
-                    else:
-                        raise
-            
-            # SQLite 체크포인트 실행하여 WAL 파일 동기화
-            try:
-                conn = sqlite3.connect(str(db_path))
-                conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
-                conn.close()
-            except Exception as checkpoint_error:
-                logger.warning(f"최종 WAL checkpoint 실패 (무시 가능): {checkpoint_error}")
-            
-            # 임시 백업 삭제
-            try:
-                if temp_backup.exists():
-                    temp_backup.unlink()
-                if temp_wal.exists():
-                    temp_wal.unlink()
-                if temp_shm.exists():
-                    temp_shm.unlink()
-            except Exception as cleanup_error:
-                logger.warning(f"임시 파일 정리 실패 (무시 가능): {cleanup_error}")
-            
-            logger.info(f"데이터베이스 복원 완료: {backup_path}")
-            return True
         
-        except Exception as e:
-            # 복원 실패 시 롤백
-            logger.error(f"데이터베이스 복원 실패, 롤백 중: {str(e)}")
-            
-            try:
-                if temp_backup.exists():
-                    shutil.copy2(temp_backup, db_path)
-                    temp_backup.unlink()
-                
-                if temp_wal.exists() and wal_file.parent.exists():
-                    shutil.copy2(temp_wal, wal_file)
-                    temp_wal.unlink()
-                
-                if temp_shm.exists() and shm_file.parent.exists():
-                    shutil.copy2(temp_shm, shm_file)
-                    temp_shm.unlink()
-            except Exception as rollback_error:
-                logger.error(f"롤백 중 오류 발생: {rollback_error}")
-            
-            raise
+        is_ok, message = quick_check(staging)
+        if not is_ok:
+            raise ValueError(f"복원할 DB 검사 실패: {message}")
+    except Exception:
+        staging.unlink(missing_ok=True)
+        raise
+    return staging
+
+
+def _restore_database_file(backup_file_path):
+    """
+    SQLite 백업 파일로 현재 데이터베이스 교체 (무중단)
     
+    1. 운영 DB 옆에 복원할 DB를 준비 (prepare_restore)
+    2. SQLite 온라인 백업 API로 준비한 DB 전체를 운영 DB에 한 번의 쓰기 트랜잭션으로
+       복사 - 다른 프로세스의 연결도 SQLite 잠금에 따라 복원 전/후 상태만 보며,
+       도중에 실패하면 운영 DB는 그대로 남는다 (파일 교체와 달리 열린 핸들/WAL이
+       이전 파일을 가리키는 문제가 없음)
+    3. 세대 번호를 올려 모든 워커가 DB 연결을 다시 열고 캐시를 비우게 함
+    """
+    from .signals import notify_database_restored
+    
+    backup_path = Path(backup_file_path)
+    if not backup_path.exists():
+        raise FileNotFoundError(f"백업 파일을 찾을 수 없습니다: {backup_path}")
+    
+    db_path = get_database_path()
+    started = time.monotonic()
+    staging = prepare_restore(backup_path, db_path)
+    
+    try:
+        source = sqlite3.connect(f"file:{staging}?mode=ro", uri=True)
+        dest = sqlite3.connect(str(db_path), timeout=30)
+        try:
+            # 쓰기 잠금을 얻을 때까지 재시도, 이후 한 단계로 전체 복사
+            source.backup(dest, pages=-1)
+        finally:
+            dest.close()
+            source.close()
     except Exception as e:
-        logger.error(f"백업 복원 실패: {str(e)}")
+        logger.error(f"백업 복원 실패 (운영 DB는 변경되지 않음): {str(e)}")
         raise
+    finally:
+        staging.unlink(missing_ok=True)
+    
+    generation = notify_database_restored()
+    logger.info(
+        f"데이터베이스 복원 완료: {backup_path} "
+        f"({time.monotonic() - started:.2f}초, 세대 {generation})"
+    )
+    return True
 
 
 def delete_old_backups(keep_count=10):
@@ -228,15 +606,18 @@ def delete_old_backups(keep_count=10):
         
         # 백업 파일 목록 (생성일시 기준 정렬)
         backup_files = sorted(
-            [f for f in Path(backup_dir).glob('db_backup_*.sqlite3')],
+            [f for f in iter_backup_files(backup_dir) if f.name.startswith('db_backup_')],
             key=lambda x: x.stat().st_mtime,
             reverse=True
         )
         
-        # keep_count 개수를 초과하는 오래된 파일 삭제
+        # keep_count 개수를 초과하는 오래된 파일 삭제 (매니페스트 포함)
+        from .catalog import backup_catalog
         for old_file in backup_files[keep_count:]:
             try:
                 old_file.unlink()
+                get_manifest_path(old_file).unlink(missing_ok=True)
+                backup_catalog.record_removed(old_file)
                 logger.info(f"오래된 백업 파일 삭제: {old_file}")
             except Exception as e:
                 logger.error(f"백업 파일 삭제 실패 ({old_file}): {str(e)}")
@@ -300,12 +681,16 @@ def cleanup_temp_files():
         return deleted_count
 
 
-def validate_backup_file(file_path):
+def validate_backup_file(file_path, expected_sha256=None):
     """
     백업 파일 유효성 검증
     
+    체크섬 기대값(인자 또는 매니페스트)이 있으면 SHA-256을 비교하고,
+    압축 파일은 앞부분을 해제하여 SQLite 시그니처를 확인한다.
+    
     Args:
-        file_path: 검증할 파일 경로
+        file_path: 검증할 파일 경로 (.sqlite3 또는 .sqlite3.gz)
+        expected_sha256: 기대 체크섬
     
     Returns:
         tuple: (is_valid, error_message)
@@ -318,22 +703,30 @@ def validate_backup_file(file_path):
             return False, "파일이 존재하지 않습니다."
         
         # 파일 확장자 확인
-        if file_path.suffix.lower() != '.sqlite3':
-            return False, "SQLite3 파일만 업로드 가능합니다."
+        name = file_path.name.lower()
+        if not (name.endswith('.sqlite3') or name.endswith(ARCHIVE_SUFFIX)):
+            return False, "SQLite3 파일(.sqlite3) 또는 압축 백업(.sqlite3.gz)만 업로드 가능합니다."
         
         # 파일 크기 확인 (최대 1GB)
-        max_size = 1 * 1024 * 1024 * 1024  # 1GB
-        if file_path.stat().st_size > max_size:
+        if file_path.stat().st_size > MAX_BACKUP_SIZE:
             return False, "파일 크기가 너무 큽니다 (최대 1GB)."
         
+        # 체크섬 확인
+        is_valid, error_message = verify_checksum(file_path, expected_sha256)
+        if not is_valid:
+            return False, error_message
+        
         # SQLite 파일 시그니처 확인
-        with open(file_path, 'rb') as f:
-            header = f.read(16)
-            if not header.startswith(b'SQLite format 3'):
-                return False, "유효한 SQLite3 파일이 아닙니다."
+        if is_archive(file_path):
+            with gzip.open(file_path, 'rb') as f:
+                header = f.read(16)
+        else:
+            with open(file_path, 'rb') as f:
+                header = f.read(16)
+        if not header.startswith(b'SQLite format 3'):
+            return False, "유효한 SQLite3 파일이 아닙니다."
         
         return True, None
     
     except Exception as e:
         return False, f"파일 검증 중 오류 발생: {str(e)}"
-
@@ -0,0 +1,212 @@
+"""
+백업 파일 카탈로그
+
+백업 디렉토리의 파일 목록을 추가 전용 카탈로그(BACKUP_DIR/catalog.jsonl)와
+프로세스 메모리의 인벤토리로 관리한다.
+
+- 백업 생성/삭제 시 add/remove 이벤트를 한 줄씩 추가
+- 다른 프로세스가 추가한 이벤트는 마지막으로 읽은 위치부터 이어서 읽음
+- 디렉토리 mtime이 바뀐 경우에만 디렉토리를 다시 스캔하여 카탈로그 밖에서
+  추가/삭제된 파일을 이벤트로 보정 (파일 생성/삭제/이름 변경 시에만 바뀜)
+- 이벤트가 살아있는 항목보다 충분히 많아지면 현재 상태로 카탈로그 압축
+
+변경이 없으면 파일 수/총 크기 조회는 stat() 두 번으로 끝난다.
+"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from .backup_utils import get_backup_dir, iter_backup_files, read_manifest
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILE = 'catalog.jsonl'
+
+# 압축 기준: 이벤트 수가 max(최소값, 항목 수 × 2)를 넘으면 압축
+COMPACT_MIN_EVENTS = 100
+
+
+def _added_event(file_path, stat=None, manifest=None):
+    """파일 추가 이벤트 (매니페스트가 있으면 유형/체크섬 포함)"""
+    file_path = Path(file_path)
+    stat = stat or file_path.stat()
+    manifest = manifest if manifest is not None else (read_manifest(file_path) or {})
+    return {
+        'op': 'add',
+        'file': file_path.name,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'backup_type': manifest.get('backup_type', 'auto'),
+        'sha256': manifest.get('sha256', ''),
+        'original_size': manifest.get('original_size'),
+        'created_at': manifest.get('created_at')
+            or datetime.fromtimestamp(stat.st_mtime).isoformat(timespec='seconds'),
+    }
+
+
+class BackupCatalog:
+    """
+    프로세스별 백업 파일 인벤토리
+
+    카탈로그 파일이 교체(압축)되면 inode가 바뀌므로 처음부터 다시 읽는다.
+    압축 도중 다른 프로세스가 추가한 이벤트는 유실될 수 있지만, 해당 파일
+    생성/삭제로 디렉토리 mtime이 바뀌어 다음 스캔에서 다시 보정된다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._backup_dir = None
+        self.reset()
+
+    def reset(self):
+        """인벤토리 초기화 (다음 조회 시 카탈로그를 처음부터 읽고 디렉토리 스캔)"""
+        self._entries = {}      # 파일명 → 항목
+        self._total_size = 0
+        self._paths = None      # 전체 경로 집합 캐시
+        self._offset = 0        # 카탈로그에서 읽은 위치
+        self._inode = None
+        self._events = 0
+        self._dir_mtime = None
+
+    def _catalog_path(self):
+        return self._backup_dir / CATALOG_FILE
+
+    def _apply(self, event):
+        """이벤트 하나를 인벤토리에 반영"""
+        name = event['file']
+        previous = self._entries.pop(name, None)
+        if previous is not None:
+            self._total_size -= previous['size']
+        if event['op'] == 'add':
+            entry = {key: value for key, value in event.items() if key != 'op'}
+            self._entries[name] = entry
+            self._total_size += entry['size']
+        self._events += 1
+        self._paths = None
+
+    def _read_new_events(self):
+        """마지막으로 읽은 위치 이후 추가된 이벤트 반영"""
+        try:
+            stat = self._catalog_path().stat()
+        except FileNotFoundError:
+            if self._inode is not None:
+                self.reset()
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self.reset()
+            self._inode = stat.st_ino
+        if stat.st_size == self._offset:
+            return
+
+        with open(self._catalog_path(), 'rb') as f:
+            f.seek(self._offset)
+            data = f.read(stat.st_size - self._offset)
+
+        # 쓰는 중인 마지막 줄은 다음에 읽음
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError) as e:
+                logger.warning(f"백업 카탈로그 항목 무시: {e}")
+        self._offset += end
+
+    def _append(self, events):
+        """이벤트 추가 (한 번의 write로 기록한 뒤 다시 읽어 반영)"""
+        data = ''.join(json.dumps(event, ensure_ascii=False) + '\n' for event in events)
+        with open(self._catalog_path(), 'ab') as f:
+            f.write(data.encode('utf-8'))
+        self._read_new_events()
+
+    def _compact(self):
+        """현재 인벤토리로 카탈로그 다시 쓰기"""
+        path = self._catalog_path()
+        temp_path = path.with_name(f"temp_{path.name}")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for entry in self._entries.values():
+                f.write(json.dumps({'op': 'add', **entry}, ensure_ascii=False) + '\n')
+        os.replace(temp_path, path)
+        self.reset()
+        self._read_new_events()
+        logger.info(f"백업 카탈로그 압축: {len(self._entries)}건")
+
+    def _reconcile(self):
+        """디렉토리 mtime이 바뀌었으면 스캔하여 카탈로그와 실제 파일 차이 보정"""
+        dir_mtime = self._backup_dir.stat().st_mtime_ns
+        if dir_mtime == self._dir_mtime:
+            return
+
+        files = {path.name: path for path in iter_backup_files(self._backup_dir)}
+        events = [{'op': 'remove', 'file': name} for name in self._entries.keys() - files.keys()]
+        for name, path in files.items():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entry = self._entries.get(name)
+            if entry is None or entry['size'] != stat.st_size or entry['mtime_ns'] != stat.st_mtime_ns:
+                events.append(_added_event(path, stat))
+
+        if events:
+            logger.info(f"백업 카탈로그 보정: {len(events)}건")
+            self._append(events)
+
+        # 스캔 전에 읽은 mtime을 기록하여 스캔 도중 변경분은 다음에 다시 확인
+        self._dir_mtime = dir_mtime
+        if self._events > max(COMPACT_MIN_EVENTS, len(self._entries) * 2):
+            self._compact()
+
+    def _read_catalog(self):
+        """현재 백업 디렉토리의 카탈로그 반영 (BACKUP_DIR이 바뀌면 초기화)"""
+        backup_dir = Path(get_backup_dir())
+        if backup_dir != self._backup_dir:
+            self.reset()
+            self._backup_dir = backup_dir
+        self._read_new_events()
+
+    def _refresh(self):
+        self._read_catalog()
+        self._reconcile()
+
+    def entries(self):
+        """파일명 → 항목 (size, backup_type, sha256, created_at 등)"""
+        with self._lock:
+            self._refresh()
+            return dict(self._entries)
+
+    def paths(self):
+        """백업 파일 전체 경로(str) 집합"""
+        with self._lock:
+            self._refresh()
+            if self._paths is None:
+                self._paths = frozenset(str(self._backup_dir / name) for name in self._entries)
+            return self._paths
+
+    def totals(self):
+        """(파일 수, 총 크기)"""
+        with self._lock:
+            self._refresh()
+            return len(self._entries), self._total_size
+
+    def record_added(self, file_path, manifest=None):
+        """백업 파일 생성 기록 (다음 스캔 시 같은 파일이면 이벤트를 추가하지 않음)"""
+        with self._lock:
+            self._read_catalog()
+            self._append([_added_event(file_path, manifest=manifest)])
+
+    def record_removed(self, file_path):
+        """백업 파일 삭제 기록"""
+        with self._lock:
+            self._read_catalog()
+            if Path(file_path).name in self._entries:
+                self._append([{'op': 'remove', 'file': Path(file_path).name}])
+
+
+# 프로세스 전역 카탈로그
+backup_catalog = BackupCatalog()
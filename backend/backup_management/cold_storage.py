@@ -0,0 +1,372 @@
+"""
+연도별 아카이브 DB (콜드 스토리지)
+
+보존 기간이 지나 운영 DB에서 삭제하는 행을 연도별 SQLite 파일
+(DATA_ARCHIVE_DIR/archive_YYYY.sqlite3)의 같은 이름 테이블로 옮겨 두고,
+필요할 때만 운영 DB 연결에 ATTACH하여 조회한다.
+
+- 운영 테이블은 최근 데이터만 유지 (대시보드 집계 대상 축소)
+- 목록/내보내기 API는 ArchivedQuerySet으로 운영 DB와 아카이브 DB를
+  UNION ALL 하여 과거 연도까지 한 번에 조회
+- 아카이브 테이블 스키마는 운영 DB의 DDL을 복사 (외래키 제약만 제외),
+  이후 운영 테이블에 추가된 컬럼은 연결 시 ALTER TABLE로 보충
+"""
+import logging
+import re
+from contextlib import contextmanager
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import prefetch_related_objects
+from django.db.models.sql.datastructures import BaseTable
+
+logger = logging.getLogger(__name__)
+
+# 동시에 연결할 아카이브 DB 수 (SQLite 기본 ATTACH 한도 10 이내)
+MAX_ATTACHED = 8
+
+# 한 번의 INSERT/DELETE에 넣을 ID 수 (SQLite 변수 개수 제한)
+ID_CHUNK_SIZE = 500
+
+# DDL에서 제거할 외래키 제약 (참조 테이블이 아카이브 DB에 없음)
+REFERENCES_PATTERN = re.compile(
+    r'\s+REFERENCES\s+"[^"]+"\s*\("[^"]+"\)(\s+DEFERRABLE INITIALLY DEFERRED)?',
+    re.IGNORECASE,
+)
+
+
+def get_archive_db_path(year):
+    """연도별 아카이브 DB 경로"""
+    from .data_archiver import get_archive_dir
+
+    return get_archive_dir() / f"archive_{year}.sqlite3"
+
+
+def archives_supported(using=DEFAULT_DB_ALIAS):
+    """아카이브 DB 조회 가능 여부 (SQLite ATTACH 필요)"""
+    return connections[using].vendor == 'sqlite'
+
+
+def archive_years(using=DEFAULT_DB_ALIAS):
+    """
+    아카이브 DB가 있는 연도 목록 (오름차순)
+
+    아카이브 DB는 SQLite ATTACH로만 조회할 수 있으므로 운영 DB가 SQLite가 아니면
+    (sqlite_to_postgres로 옮긴 뒤 남은 파일이 있어도) 빈 목록.
+    """
+    from .data_archiver import get_archive_dir
+
+    if not archives_supported(using):
+        return []
+
+    years = []
+    for path in get_archive_dir().glob('archive_*.sqlite3'):
+        suffix = path.name[len('archive_'):-len('.sqlite3')]
+        if suffix.isdigit():
+            years.append(int(suffix))
+    return sorted(years)
+
+
+def _schema_name(year):
+    return f"archive_{int(year)}"
+
+
+def _table_columns(cursor, schema, table):
+    """테이블 컬럼 {이름: 타입} (테이블이 없으면 빈 dict)"""
+    cursor.execute(f'PRAGMA "{schema}".table_info("{table}")')
+    return {row[1]: row[2] for row in cursor.fetchall()}
+
+
+def ensure_archive_table(cursor, schema, table):
+    """아카이브 DB에 운영 테이블과 같은 구조의 테이블/인덱스 생성, 빠진 컬럼 보충"""
+    archived = _table_columns(cursor, schema, table)
+
+    if not archived:
+        cursor.execute(
+            "SELECT type, sql FROM main.sqlite_master "
+            "WHERE tbl_name = %s AND sql IS NOT NULL ORDER BY type DESC",
+            [table],
+        )
+        for object_type, sql in cursor.fetchall():
+            if object_type == 'table':
+                sql = REFERENCES_PATTERN.sub('', sql)
+                sql = re.sub(r'^CREATE TABLE\s+', f'CREATE TABLE IF NOT EXISTS "{schema}".', sql, count=1)
+            elif object_type == 'index':
+                sql = re.sub(
+                    r'^CREATE (UNIQUE )?INDEX\s+',
+                    lambda match: f'CREATE {match.group(1) or ""}INDEX IF NOT EXISTS "{schema}".',
+                    sql, count=1,
+                )
+            else:
+                continue
+            cursor.execute(sql)
+        return
+
+    for column, column_type in _table_columns(cursor, 'main', table).items():
+        if column not in archived:
+            cursor.execute(f'ALTER TABLE "{schema}"."{table}" ADD COLUMN "{column}" {column_type}')
+
+
+@contextmanager
+def attached_archives(years, tables=(), using='default'):
+    """
+    아카이브 DB를 운영 DB 연결에 ATTACH (블록이 끝나면 DETACH)
+
+    ATTACH/DETACH는 트랜잭션 밖에서만 가능하므로 atomic 블록 안에서는 사용할 수 없다.
+    없는 연도 파일은 새로 만들어지므로 조회 시에는 archive_years()로 거른 값을 넘긴다.
+
+    Args:
+        years: 연결할 연도 목록 (최대 MAX_ATTACHED개)
+        tables: 연결 직후 구조를 맞출 테이블 이름 목록
+
+    Yields:
+        dict: {연도: 스키마 이름}
+    """
+    years = sorted(set(years))
+    if len(years) > MAX_ATTACHED:
+        raise ValueError(f"아카이브 DB는 한 번에 {MAX_ATTACHED}개 연도까지 조회할 수 있습니다.")
+
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        raise NotImplementedError('아카이브 DB 연결은 SQLite에서만 지원합니다.')
+    if connection.in_atomic_block:
+        raise RuntimeError('트랜잭션 안에서는 아카이브 DB를 연결할 수 없습니다.')
+
+    schemas = {}
+    try:
+        with connection.cursor() as cursor:
+            for year in years:
+                schema = _schema_name(year)
+                cursor.execute(f'ATTACH DATABASE %s AS "{schema}"', [str(get_archive_db_path(year))])
+                schemas[year] = schema
+                for table in tables:
+                    ensure_archive_table(cursor, schema, table)
+        yield schemas
+    finally:
+        with connection.cursor() as cursor:
+            for schema in schemas.values():
+                cursor.execute(f'DETACH DATABASE "{schema}"')
+
+
+def move_to_archive(model, ids_by_year, using='default'):
+    """
+    운영 DB의 행을 연도별 아카이브 DB로 옮김
+
+    연도별로 INSERT ... SELECT로 복사한 뒤 같은 트랜잭션에서 운영 DB 행을 삭제한다
+    (ORM delete이므로 CASCADE와 삭제 시그널도 동작). WAL 모드에서는 여러 DB에 걸친
+    커밋이 원자적이지 않아 중단 시 같은 행이 양쪽에 남을 수 있지만, 다시 실행하면
+    INSERT OR REPLACE로 덮어쓰고 삭제한다.
+
+    Args:
+        model: 대상 모델
+        ids_by_year: {연도: [pk, ...]}
+    """
+    table = model._meta.db_table
+    pk_column = model._meta.pk.column
+    years = sorted(ids_by_year)
+
+    for start in range(0, len(years), MAX_ATTACHED):
+        group = years[start:start + MAX_ATTACHED]
+        with attached_archives(group, tables=[table], using=using) as schemas:
+            with transaction.atomic(using=using):
+                with connections[using].cursor() as cursor:
+                    columns = ', '.join(f'"{column}"' for column in _table_columns(cursor, 'main', table))
+                    for year in group:
+                        ids = ids_by_year[year]
+                        for offset in range(0, len(ids), ID_CHUNK_SIZE):
+                            chunk = ids[offset:offset + ID_CHUNK_SIZE]
+                            placeholders = ', '.join(['%s'] * len(chunk))
+                            cursor.execute(
+                                f'INSERT OR REPLACE INTO "{schemas[year]}"."{table}" ({columns}) '
+                                f'SELECT {columns} FROM main."{table}" WHERE "{pk_column}" IN ({placeholders})',
+                                chunk,
+                            )
+
+                for year in group:
+                    ids = ids_by_year[year]
+                    for offset in range(0, len(ids), ID_CHUNK_SIZE):
+                        model.objects.using(using).filter(pk__in=ids[offset:offset + ID_CHUNK_SIZE]).delete()
+
+
+class ArchivedQuerySet:
+    """
+    운영 DB 쿼리셋 + 연도별 아카이브 DB 조회 결과
+
+    쿼리셋의 WHERE 조건을 그대로 각 아카이브 테이블에 적용하여 UNION ALL 하고
+    (바깥 FROM의 기준 테이블만 아카이브 테이블로 바꾸고 JOIN/서브쿼리는 운영 DB 그대로),
+    정렬/LIMIT/OFFSET은 바깥 쿼리에서 처리한다. count()와 슬라이싱을 지원하므로
+    Django Paginator(DRF 페이지네이션)에 그대로 넘길 수 있다. 평가할 때마다
+    아카이브 DB를 연결했다가 해제하며, select_related 대상은 prefetch로 불러온다.
+
+    조회할 아카이브 연도가 없으면(운영 DB가 SQLite가 아닌 경우 포함) 원래 쿼리셋을
+    그대로 사용한다.
+    """
+
+    def __init__(self, queryset, years=None):
+        self.queryset = queryset
+        self.model = queryset.model
+        available = archive_years()
+        self.years = available if years is None else [year for year in years if year in available]
+        if len(self.years) > MAX_ATTACHED:
+            raise ValueError(f"아카이브 DB는 한 번에 {MAX_ATTACHED}개 연도까지 조회할 수 있습니다.")
+        self._count = None
+        # ATTACH 후 테이블 구조를 맞추므로(CREATE/ALTER) 읽기 전용 연결이 아닌 운영 연결 사용
+        self.db = DEFAULT_DB_ALIAS
+        self.passthrough = not self.years or not archives_supported(self.db)
+
+    def _order_by(self):
+        """바깥 쿼리 ORDER BY (모델 필드 정렬만 지원, pk로 순서 고정)"""
+        opts = self.model._meta
+        ordering = self.queryset.query.order_by or opts.ordering
+        terms = []
+        seen = set()
+        for name in ordering:
+            if not isinstance(name, str):
+                continue
+            descending = name.startswith('-')
+            name = name.lstrip('-+')
+            try:
+                field = opts.pk if name == 'pk' else opts.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if not getattr(field, 'column', None) or field.column in seen:
+                continue
+            seen.add(field.column)
+            terms.append(f'"{field.column}" {"DESC" if descending else "ASC"}')
+        if opts.pk.column not in seen:
+            terms.append(f'"{opts.pk.column}" ASC')
+        return ', '.join(terms)
+
+    def _union_sql(self, schemas):
+        """운영 DB + 아카이브 DB UNION ALL SQL"""
+        base = self.queryset.order_by()
+        base.query.select_related = False
+        sql, params = base.query.sql_with_params()
+
+        parts = [sql]
+        all_params = list(params)
+        for schema in schemas.values():
+            # 기준 테이블 별칭은 그대로 두고 실제 테이블만 "archive_YYYY"."table"로 교체
+            # (컬럼 참조/OuterRef는 별칭을 쓰므로 아카이브 행을 가리키고, JOIN과 서브쿼리는 운영 DB 테이블)
+            query = base.query.clone()
+            alias = query.get_initial_alias()
+            table = query.alias_map[alias].table_name
+            query.alias_map[alias] = BaseTable(f'"{schema}"."{table}"', alias)
+            archive_sql, archive_params = query.sql_with_params()
+            parts.append(archive_sql)
+            all_params.extend(archive_params)
+        return ' UNION ALL '.join(parts), all_params
+
+    def _select_related_names(self):
+        select_related = self.queryset.query.select_related
+        return list(select_related) if isinstance(select_related, dict) else []
+
+    def _fetch(self, limit=None, offset=0):
+        table = self.model._meta.db_table
+        with attached_archives(self.years, tables=[table], using=self.db) as schemas:
+            union_sql, params = self._union_sql(schemas)
+            sql = f'SELECT * FROM ({union_sql}) ORDER BY {self._order_by()}'
+            if limit is not None:
+                sql += ' LIMIT %s OFFSET %s'
+                params += [limit, offset]
+            objects = list(self.model.objects.db_manager(self.db).raw(sql, params))
+
+        related = self._select_related_names()
+        if objects and related:
+            prefetch_related_objects(objects, *related)
+        return objects
+
+    def count(self):
+        if self.passthrough:
+            return self.queryset.count()
+        if self._count is None:
+            table = self.model._meta.db_table
+            with attached_archives(self.years, tables=[table], using=self.db) as schemas:
+                union_sql, params = self._union_sql(schemas)
+                with connections[self.db].cursor() as cursor:
+                    cursor.execute(f'SELECT COUNT(*) FROM ({union_sql})', params)
+                    self._count = cursor.fetchone()[0]
+        return self._count
+
+    def exists(self):
+        if self.passthrough:
+            return self.queryset.exists()
+        return self.count() > 0
+
+    def __len__(self):
+        return self.count()
+
+    def __iter__(self):
+        if self.passthrough:
+            return iter(self.queryset)
+        return iter(self._fetch())
+
+    def __getitem__(self, key):
+        if self.passthrough:
+            return self.queryset[key]
+        if isinstance(key, slice):
+            if key.step not in (None, 1):
+                raise ValueError('step이 있는 슬라이스는 지원하지 않습니다.')
+            start = key.start or 0
+            if key.stop is None:
+                return self._fetch(offset=start, limit=-1)
+            return self._fetch(limit=max(key.stop - start, 0), offset=start)
+        objects = self._fetch(limit=1, offset=key)
+        if not objects:
+            raise IndexError(key)
+        return objects[0]
+
+
+def requested_archive_years(request):
+    """
+    요청 파라미터로 조회할 아카이브 연도 결정
+
+    - include_archive=true: 아카이브 DB가 있는 모든 연도
+    - archive_years=2017,2018: 지정한 연도만
+
+    Returns:
+        list | None: 연도 목록, 아카이브 조회를 요청하지 않았으면 None
+    """
+    years = request.query_params.get('archive_years')
+    if years:
+        try:
+            return [int(year) for year in years.split(',') if year.strip()]
+        except ValueError:
+            raise ValueError('archive_years는 쉼표로 구분한 연도여야 합니다.')
+    if request.query_params.get('include_archive', '').lower() in ('1', 'true', 'yes'):
+        return archive_years()
+    return None
+
+
+class ArchiveListMixin:
+    """
+    ListAPIView용: include_archive/archive_years 파라미터가 있으면 아카이브 DB도 함께 조회
+
+    필터/검색/정렬은 기존 filter_queryset() 결과를 그대로 사용한다.
+    """
+
+    def list(self, request, *args, **kwargs):
+        from rest_framework import status
+        from rest_framework.response import Response
+
+        try:
+            years = requested_archive_years(request)
+            if years is None:
+                return super().list(request, *args, **kwargs)
+            queryset = ArchivedQuerySet(self.filter_queryset(self.get_queryset()), years)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if queryset.passthrough:
+            # 조회할 아카이브가 없음 (SQLite가 아닌 DB 포함): 일반 목록과 같음
+            return super().list(request, *args, **kwargs)
+
+        from monitoring.timing import measure_serialization
+
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(list(queryset) if page is None else page, many=True)
+        with measure_serialization():
+            data = serializer.data
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
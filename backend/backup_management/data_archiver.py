@@ -1,140 +1,229 @@
 """
 데이터 아카이빙 및 삭제 로직
+
+보존 기간이 지난 데이터를 ID 순서로 일정 건수씩 읽어 gzip CSV 파일로 내보낸 뒤
+삭제한다. 배치마다 커밋하고 잠시 쉬어 SQLite 쓰기 잠금을 오래 잡지 않으며,
+내보낸 내용을 디스크에 기록(fsync)한 다음에만 해당 배치를 삭제한다.
+
+삭제하는 행은 연도별 아카이브 DB(cold_storage)로 옮겨 두므로 목록/내보내기
+API에서 과거 연도 데이터를 계속 조회할 수 있다.
 """
+import csv
+import io
+import gzip
+import os
+import time
 import logging
+from pathlib import Path
+from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
-from django.db import transaction
 from performance.models import PerformanceRecord
 from nonconformance.models import Nonconformance
 from customer_complaints.models import CustomerComplaint
 from audit.models import AuditLog
+from .cold_storage import move_to_archive
 
 logger = logging.getLogger(__name__)
 
+def get_archive_dir():
+    """아카이브 파일 디렉토리 경로"""
+    archive_dir = Path(getattr(settings, 'DATA_ARCHIVE_DIR', Path(settings.BACKUP_DIR) / 'archive'))
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    return archive_dir
 
-def archive_old_data():
+
+def get_archive_targets(now=None):
     """
-    오래된 데이터 삭제 작업
-    - 실적/부적합/고객불만: 7년 이상 된 데이터 삭제
-    - 감사 로그: 1년 이상 된 데이터 삭제
-    
+    아카이빙 대상 목록
+
     Returns:
-        dict: 삭제된 데이터 통계
+        list: [(통계 키, 모델, 보존 기간 경과 조건, 아카이브 DB 연도 기준 필드, 설명)]
     """
-    now = timezone.now()
+    now = now or timezone.now()
     seven_years_ago = now - timedelta(days=7*365)
     one_year_ago = now - timedelta(days=365)
-    
+
+    return [
+        ('performance_records', PerformanceRecord, {'created_at__lt': seven_years_ago}, 'date', '실적 데이터'),
+        ('nonconformances', Nonconformance, {'occurrence_date__lt': seven_years_ago.date()}, 'occurrence_date', '부적합 데이터'),
+        ('customer_complaints', CustomerComplaint, {'occurrence_date__lt': seven_years_ago.date()}, 'occurrence_date', '고객불만 데이터'),
+        ('audit_logs', AuditLog, {'created_at__lt': one_year_ago}, 'created_at', '감사 로그'),
+    ]
+
+
+class ArchiveWriter:
+    """gzip CSV 아카이브 파일 (배치마다 디스크에 기록)"""
+
+    def __init__(self, path, columns):
+        self.path = Path(path)
+        self._raw = open(self.path, 'wb')
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=6)
+        self._text = io.TextIOWrapper(self._gzip, encoding='utf-8', newline='')
+        self._writer = csv.writer(self._text)
+        self._writer.writerow(columns)
+
+    def write_batch(self, rows):
+        """행 기록 후 fsync (이후 중단되어도 여기까지는 해제 가능)"""
+        self._writer.writerows(rows)
+        self._text.flush()
+        self._gzip.flush()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+
+    def close(self):
+        self._text.close()
+        self._raw.close()
+        return self.path.stat().st_size
+
+
+def _row_year(value):
+    """아카이브 DB 연도 (DateTimeField는 현지 시각 기준)"""
+    if hasattr(value, 'hour') and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.year
+
+
+def archive_queryset(model, filters, archive_path, year_field, batch_size=None, batch_sleep=None):
+    """
+    조건에 맞는 행을 ID 구간 배치로 내보낸 뒤 연도별 아카이브 DB로 이동
+
+    Args:
+        model: 대상 모델
+        filters: 보존 기간 경과 조건 (filter 인자)
+        archive_path: 생성할 .csv.gz 경로 (대상 행이 없으면 만들지 않음)
+        year_field: 아카이브 DB 연도를 정할 날짜 필드
+        batch_size: 배치당 행 수
+        batch_sleep: 배치 사이 대기 시간(초), 다른 쓰기 요청에 잠금 양보
+
+    Returns:
+        dict: rows, batches, bytes, seconds, rows_per_sec, file
+    """
+    if batch_size is None:
+        batch_size = getattr(settings, 'ARCHIVE_BATCH_SIZE', 1000)
+    if batch_sleep is None:
+        batch_sleep = getattr(settings, 'ARCHIVE_BATCH_SLEEP', 0.05)
+
+    columns = [field.attname for field in model._meta.concrete_fields]
+    pk_name = model._meta.pk.attname
+    pk_index = columns.index(pk_name)
+    year_index = columns.index(model._meta.get_field(year_field).attname)
+    queryset = model.objects.filter(**filters).order_by(pk_name)
+
+    started = time.monotonic()
+    writer = None
+    last_pk = None
+    result = {'rows': 0, 'batches': 0, 'bytes': 0, 'file': None}
+
+    try:
+        while True:
+            batch_queryset = queryset if last_pk is None else queryset.filter(**{f'{pk_name}__gt': last_pk})
+            rows = list(batch_queryset.values_list(*columns)[:batch_size])
+            if not rows:
+                break
+
+            if writer is None:
+                writer = ArchiveWriter(archive_path, columns)
+            writer.write_batch(rows)
+
+            ids_by_year = {}
+            for row in rows:
+                ids_by_year.setdefault(_row_year(row[year_index]), []).append(row[pk_index])
+            move_to_archive(model, ids_by_year)
+
+            last_pk = rows[-1][pk_index]
+            result['rows'] += len(rows)
+            result['batches'] += 1
+
+            if len(rows) < batch_size:
+                break
+            if batch_sleep:
+                time.sleep(batch_sleep)
+    finally:
+        if writer is not None:
+            result['bytes'] = writer.close()
+            result['file'] = str(writer.path)
+
+    result['seconds'] = round(time.monotonic() - started, 3)
+    result['rows_per_sec'] = round(result['rows'] / result['seconds'], 1) if result['seconds'] else 0
+    return result
+
+
+def archive_old_data(batch_size=None, batch_sleep=None):
+    """
+    오래된 데이터 아카이빙 작업 (내보낸 뒤 삭제)
+    - 실적/부적합/고객불만: 7년 이상 된 데이터
+    - 감사 로그: 1년 이상 된 데이터
+
+    아카이브 파일: DATA_ARCHIVE_DIR/<테이블>_YYYYMMDD_HHMMSS.csv.gz
+    아카이브 DB: DATA_ARCHIVE_DIR/archive_YYYY.sqlite3 (cold_storage)
+
+    Returns:
+        dict: 삭제된 데이터 통계 (대상별 건수, archives: 대상별 파일/처리량)
+    """
     stats = {
         'performance_records': 0,
         'nonconformances': 0,
         'customer_complaints': 0,
         'audit_logs': 0,
+        'archives': {},
         'errors': []
     }
-    
+
     try:
-        with transaction.atomic():
-            # 1. 실적 데이터 삭제 (7년 이상)
-            try:
-                performance_count = PerformanceRecord.objects.filter(
-                    created_at__lt=seven_years_ago
-                ).count()
-                
-                if performance_count > 0:
-                    deleted = PerformanceRecord.objects.filter(
-                        created_at__lt=seven_years_ago
-                    ).delete()
-                    stats['performance_records'] = deleted[0]
-                    logger.info(f"실적 데이터 {deleted[0]}건 삭제 (7년 이상)")
-            except Exception as e:
-                error_msg = f"실적 데이터 삭제 실패: {str(e)}"
-                logger.error(error_msg)
-                stats['errors'].append(error_msg)
-            
-            # 2. 부적합 데이터 삭제 (7년 이상)
-            try:
-                nonconformance_count = Nonconformance.objects.filter(
-                    occurrence_date__lt=seven_years_ago.date()
-                ).count()
-                
-                if nonconformance_count > 0:
-                    deleted = Nonconformance.objects.filter(
-                        occurrence_date__lt=seven_years_ago.date()
-                    ).delete()
-                    stats['nonconformances'] = deleted[0]
-                    logger.info(f"부적합 데이터 {deleted[0]}건 삭제 (7년 이상)")
-            except Exception as e:
-                error_msg = f"부적합 데이터 삭제 실패: {str(e)}"
-                logger.error(error_msg)
-                stats['errors'].append(error_msg)
-            
-            # 3. 고객불만 데이터 삭제 (7년 이상)
-            try:
-                complaint_count = CustomerComplaint.objects.filter(
-                    occurrence_date__lt=seven_years_ago.date()
-                ).count()
-                
-                if complaint_count > 0:
-                    deleted = CustomerComplaint.objects.filter(
-                        occurrence_date__lt=seven_years_ago.date()
-                    ).delete()
-                    stats['customer_complaints'] = deleted[0]
-                    logger.info(f"고객불만 데이터 {deleted[0]}건 삭제 (7년 이상)")
-            except Exception as e:
-                error_msg = f"고객불만 데이터 삭제 실패: {str(e)}"
-                logger.error(error_msg)
-                stats['errors'].append(error_msg)
-            
-            # 4. 감사 로그 삭제 (1년 이상)
+        archive_dir = get_archive_dir()
+        timestamp = timezone.localtime().strftime('%Y%m%d_%H%M%S')
+
+        for key, model, filters, year_field, label in get_archive_targets():
             try:
-                audit_count = AuditLog.objects.filter(
-                    created_at__lt=one_year_ago
-                ).count()
-                
-                if audit_count > 0:
-                    deleted = AuditLog.objects.filter(
-                        created_at__lt=one_year_ago
-                    ).delete()
-                    stats['audit_logs'] = deleted[0]
-                    logger.info(f"감사 로그 {deleted[0]}건 삭제 (1년 이상)")
+                archive_path = archive_dir / f"{model._meta.db_table}_{timestamp}.csv.gz"
+                result = archive_queryset(model, filters, archive_path, year_field, batch_size, batch_sleep)
+                stats[key] = result['rows']
+                stats['archives'][key] = result
+
+                if result['rows'] > 0:
+                    logger.info(
+                        f"{label} {result['rows']}건 아카이빙 후 삭제 "
+                        f"({result['batches']}개 배치, {result['seconds']}초, "
+                        f"{result['rows_per_sec']}건/초, {result['bytes']} bytes → {archive_path.name})"
+                    )
             except Exception as e:
-                error_msg = f"감사 로그 삭제 실패: {str(e)}"
+                error_msg = f"{label} 아카이빙 실패: {str(e)}"
                 logger.error(error_msg)
                 stats['errors'].append(error_msg)
-            
-            # 삭제 작업 완료 후 감사 로그 기록
-            try:
-                total_deleted = (
-                    stats['performance_records'] + 
-                    stats['nonconformances'] + 
-                    stats['customer_complaints'] + 
-                    stats['audit_logs']
-                )
-                
-                details = (
-                    f"실적: {stats['performance_records']}건, "
-                    f"부적합: {stats['nonconformances']}건, "
-                    f"고객불만: {stats['customer_complaints']}건, "
-                    f"감사로그: {stats['audit_logs']}건"
-                )
-                
-                AuditLog.objects.create(
-                    user_id=None,  # 시스템 작업
-                    action='DELETE_OLD_DATA',
-                    target_id=total_deleted,
-                    details=details,
-                    ip_address='system'
-                )
-            except Exception as e:
-                logger.error(f"감사 로그 기록 실패: {str(e)}")
-    
+
+        # 삭제 작업 완료 후 감사 로그 기록
+        try:
+            total_deleted = (
+                stats['performance_records'] +
+                stats['nonconformances'] +
+                stats['customer_complaints'] +
+                stats['audit_logs']
+            )
+
+            details = (
+                f"실적: {stats['performance_records']}건, "
+                f"부적합: {stats['nonconformances']}건, "
+                f"고객불만: {stats['customer_complaints']}건, "
+                f"감사로그: {stats['audit_logs']}건 "
+                f"(아카이브: {', '.join(Path(a['file']).name for a in stats['archives'].values() if a['file']) or '없음'})"
+            )
+
+            AuditLog.objects.create(
+                user_id=None,  # 시스템 작업
+                action='DELETE_OLD_DATA',
+                target_id=total_deleted,
+                details=details,
+                ip_address='system'
+            )
+        except Exception as e:
+            logger.error(f"감사 로그 기록 실패: {str(e)}")
+
     except Exception as e:
         error_msg = f"데이터 아카이빙 중 오류 발생: {str(e)}"
         logger.error(error_msg)
         stats['errors'].append(error_msg)
-    
+
     return stats
 
 
@@ -0,0 +1,282 @@
+"""
+페이지 단위 증분 백업 및 시점 복원
+
+전체 백업 대신 직전 백업 이후 내용이 바뀐 SQLite 페이지만 저장한다.
+
+- 체인: 전체 스냅샷(순번 0) + 증분(순번 1, 2, ...)으로 구성된 디렉토리
+  (BACKUP_DIR/incremental/chain_YYYYMMDD_HHMMSS/, 같은 초에 또 만들면 _01, _02...)
+- 증분 파일(NNNNNN.pages.gz): [페이지 번호(4바이트) + 페이지 내용] 레코드를 gzip 압축
+- chain.json: 순번별 생성 일시, 페이지 크기/수, 변경 페이지 수, 체크섬
+- pages.hash: 마지막 상태의 페이지별 해시 (다음 증분에서 변경 페이지 판별)
+
+증분이 INCREMENTAL_FULL_EVERY개 쌓이거나 페이지 크기가 바뀌면 새 체인을
+전체 스냅샷으로 시작하고, 체인은 최근 INCREMENTAL_KEEP_CHAINS개만 유지한다.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import struct
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+from .backup_utils import (
+    get_backup_dir,
+    get_database_path,
+    copy_database,
+    file_sha256,
+)
+
+logger = logging.getLogger(__name__)
+
+# 페이지 해시 크기 (blake2b)
+PAGE_HASH_SIZE = 16
+
+# 증분 파일 레코드 헤더 (페이지 번호, 0부터 시작)
+RECORD_HEADER = struct.Struct('>I')
+
+CHAIN_MANIFEST = 'chain.json'
+PAGE_HASHES = 'pages.hash'
+
+
+def get_incremental_dir():
+    """증분 백업 디렉토리 경로"""
+    incremental_dir = Path(get_backup_dir()) / 'incremental'
+    incremental_dir.mkdir(parents=True, exist_ok=True)
+    return incremental_dir
+
+
+def read_page_size(db_file):
+    """SQLite 헤더의 페이지 크기 (오프셋 16, 2바이트, 1이면 65536)"""
+    with open(db_file, 'rb') as f:
+        header = f.read(100)
+    if not header.startswith(b'SQLite format 3'):
+        raise ValueError(f"유효한 SQLite3 파일이 아닙니다: {db_file}")
+    page_size = struct.unpack('>H', header[16:18])[0]
+    return 65536 if page_size == 1 else page_size
+
+
+def page_hashes(db_file, page_size):
+    """페이지별 blake2b 해시 배열 (페이지 수 × PAGE_HASH_SIZE, uint8)"""
+    hashes = []
+    with open(db_file, 'rb') as f:
+        for page in iter(lambda: f.read(page_size), b''):
+            hashes.append(hashlib.blake2b(page, digest_size=PAGE_HASH_SIZE).digest())
+    return np.frombuffer(b''.join(hashes), dtype=np.uint8).reshape(-1, PAGE_HASH_SIZE)
+
+
+def load_chain(chain_dir):
+    """체인 매니페스트 읽기"""
+    with open(Path(chain_dir) / CHAIN_MANIFEST, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_chain(chain_dir, chain):
+    """체인 매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+    path = Path(chain_dir) / CHAIN_MANIFEST
+    temp_path = path.with_name(f"temp_{path.name}")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(chain, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+
+
+def list_chains():
+    """체인 디렉토리 목록 (오래된 순, 매니페스트가 있는 것만)"""
+    return sorted(
+        path for path in get_incremental_dir().glob('chain_*')
+        if (path / CHAIN_MANIFEST).exists()
+    )
+
+
+def _new_chain_dir(incremental_dir, now):
+    """새 체인 디렉토리 생성 (같은 초에 이미 있으면 _01, _02...를 붙여 이름순 = 생성순 유지)"""
+    name = f"chain_{now.strftime('%Y%m%d_%H%M%S')}"
+    for suffix in range(100):
+        chain_dir = incremental_dir / (f"{name}_{suffix:02d}" if suffix else name)
+        try:
+            chain_dir.mkdir()
+            return chain_dir
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"증분 백업 체인 디렉토리를 만들 수 없습니다: {name}")
+
+
+def _write_pages(db_file, page_size, page_numbers, dest_path):
+    """지정한 페이지들을 증분 파일로 저장"""
+    with open(db_file, 'rb') as source, gzip.open(dest_path, 'wb', compresslevel=6) as dest:
+        for page_no in page_numbers:
+            source.seek(page_no * page_size)
+            dest.write(RECORD_HEADER.pack(page_no))
+            dest.write(source.read(page_size))
+
+
+def create_incremental_backup(force_full=False):
+    """
+    증분 백업 생성
+
+    운영 DB를 온라인 백업 API로 임시 스냅샷에 복사한 뒤 페이지 해시를 직전
+    상태와 비교하여 바뀐 페이지만 현재 체인에 추가한다.
+
+    Args:
+        force_full: True이면 새 체인(전체 스냅샷) 시작
+
+    Returns:
+        dict: 추가된 체인 항목 (chain, seq, changed_pages, page_count, size 등)
+    """
+    full_every = getattr(settings, 'INCREMENTAL_FULL_EVERY', 24)
+    incremental_dir = get_incremental_dir()
+    now = datetime.now()
+
+    snapshot = incremental_dir / f"temp_snapshot_{now.strftime('%Y%m%d_%H%M%S_%f')}.sqlite3"
+    try:
+        copy_database(get_database_path(), snapshot)
+        page_size = read_page_size(snapshot)
+        hashes = page_hashes(snapshot, page_size)
+
+        chains = list_chains()
+        chain_dir = chains[-1] if chains else None
+        chain = load_chain(chain_dir) if chain_dir else None
+
+        start_new = (
+            force_full
+            or chain is None
+            or chain['page_size'] != page_size
+            or len(chain['entries']) > full_every
+            or not (chain_dir / PAGE_HASHES).exists()
+        )
+
+        if start_new:
+            chain_dir = _new_chain_dir(incremental_dir, now)
+            chain = {'page_size': page_size, 'entries': []}
+            changed = np.arange(hashes.shape[0])
+        else:
+            previous = np.fromfile(chain_dir / PAGE_HASHES, dtype=np.uint8).reshape(-1, PAGE_HASH_SIZE)
+            common = min(previous.shape[0], hashes.shape[0])
+            # 공통 구간은 해시 비교, 늘어난 페이지는 모두 변경으로 간주
+            differs = np.any(previous[:common] != hashes[:common], axis=1)
+            changed = np.concatenate([
+                np.flatnonzero(differs),
+                np.arange(common, hashes.shape[0]),
+            ])
+
+        seq = len(chain['entries'])
+        file_name = f"{seq:06d}.pages.gz"
+        _write_pages(snapshot, page_size, changed.tolist(), chain_dir / file_name)
+
+        entry = {
+            'seq': seq,
+            'file': file_name,
+            'created_at': now.isoformat(timespec='seconds'),
+            'page_count': int(hashes.shape[0]),
+            'changed_pages': int(changed.size),
+            'size': (chain_dir / file_name).stat().st_size,
+            'sha256': file_sha256(chain_dir / file_name),
+            'db_sha256': file_sha256(snapshot),
+        }
+        chain['entries'].append(entry)
+        save_chain(chain_dir, chain)
+
+        temp_hashes = chain_dir / f"temp_{PAGE_HASHES}"
+        hashes.tofile(temp_hashes)
+        os.replace(temp_hashes, chain_dir / PAGE_HASHES)
+
+        logger.info(
+            f"증분 백업 생성: {chain_dir.name} #{seq} "
+            f"(변경 페이지 {entry['changed_pages']}/{entry['page_count']}, {entry['size']} bytes)"
+        )
+
+        delete_old_chains()
+        return {'chain': chain_dir.name, **entry}
+
+    finally:
+        snapshot.unlink(missing_ok=True)
+
+
+def delete_old_chains(keep_count=None):
+    """오래된 체인 삭제 (최신 keep_count개 유지)"""
+    if keep_count is None:
+        keep_count = getattr(settings, 'INCREMENTAL_KEEP_CHAINS', 7)
+
+    chains = list_chains()
+    for chain_dir in chains[:-keep_count] if keep_count > 0 else chains:
+        shutil.rmtree(chain_dir, ignore_errors=True)
+        logger.info(f"오래된 증분 백업 체인 삭제: {chain_dir.name}")
+
+
+def find_restore_point(target):
+    """
+    지정 시각 이전의 마지막 백업 시점 찾기
+
+    Returns:
+        tuple: (체인 디렉토리, 체인 매니페스트, 적용할 마지막 순번) 또는 None
+    """
+    for chain_dir in reversed(list_chains()):
+        chain = load_chain(chain_dir)
+        applicable = [
+            entry for entry in chain['entries']
+            if datetime.fromisoformat(entry['created_at']) <= target
+        ]
+        if applicable:
+            return chain_dir, chain, applicable[-1]['seq']
+    return None
+
+
+def restore_to_timestamp(target, output_path):
+    """
+    체인을 재생하여 지정 시각 시점의 DB 파일 생성
+
+    전체 스냅샷부터 target 이전의 마지막 증분까지 순서대로 페이지를 덮어쓰고,
+    마지막 증분 시점의 페이지 수로 파일 길이를 맞춘 뒤 DB 체크섬을 검증한다.
+
+    Args:
+        target: 복원 기준 시각 (datetime)
+        output_path: 생성할 DB 파일 경로
+
+    Returns:
+        dict: 적용한 체인 항목 (마지막 순번 기준)
+    """
+    restore_point = find_restore_point(target)
+    if restore_point is None:
+        raise ValueError(f"{target.isoformat(sep=' ')} 이전의 증분 백업이 없습니다.")
+
+    chain_dir, chain, last_seq = restore_point
+    page_size = chain['page_size']
+    output_path = Path(output_path)
+    temp_path = output_path.with_name(f"temp_{output_path.name}")
+
+    try:
+        with open(temp_path, 'wb') as dest:
+            for entry in chain['entries'][:last_seq + 1]:
+                pages_file = chain_dir / entry['file']
+                if file_sha256(pages_file) != entry['sha256']:
+                    raise ValueError(f"증분 파일 체크섬이 일치하지 않습니다: {chain_dir.name}/{entry['file']}")
+
+                with gzip.open(pages_file, 'rb') as source:
+                    while True:
+                        header = source.read(RECORD_HEADER.size)
+                        if not header:
+                            break
+                        page_no = RECORD_HEADER.unpack(header)[0]
+                        dest.seek(page_no * page_size)
+                        dest.write(source.read(page_size))
+
+            target_entry = chain['entries'][last_seq]
+            dest.truncate(target_entry['page_count'] * page_size)
+
+        if file_sha256(temp_path) != target_entry['db_sha256']:
+            raise ValueError("복원된 DB 체크섬이 백업 시점과 일치하지 않습니다.")
+
+        os.replace(temp_path, output_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+    logger.info(
+        f"증분 백업 복원: {chain_dir.name} #{last_seq} "
+        f"({target_entry['created_at']}) → {output_path}"
+    )
+    return {'chain': chain_dir.name, **target_entry}
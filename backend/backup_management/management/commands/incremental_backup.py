@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from backup_management.incremental import create_incremental_backup, list_chains, load_chain
+
+
+class Command(BaseCommand):
+    help = '마지막 백업 이후 바뀐 데이터베이스 페이지만 증분 백업합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='새 체인을 시작하여 전체 스냅샷 저장'
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='백업을 만들지 않고 체인별 복원 가능 시점만 출력'
+        )
+
+    def handle(self, *args, **options):
+        if options['list']:
+            chains = list_chains()
+            if not chains:
+                self.stdout.write('증분 백업 체인이 없습니다.')
+            for chain_dir in chains:
+                chain = load_chain(chain_dir)
+                self.stdout.write(f"{chain_dir.name} (페이지 크기 {chain['page_size']})")
+                for entry in chain['entries']:
+                    self.stdout.write(
+                        f"  #{entry['seq']:<4} {entry['created_at']}  "
+                        f"변경 페이지 {entry['changed_pages']}/{entry['page_count']}  {entry['size']} bytes"
+                    )
+            return
+
+        entry = create_incremental_backup(force_full=options['full'])
+        kind = '전체 스냅샷' if entry['seq'] == 0 else '증분'
+        self.stdout.write(self.style.SUCCESS(
+            f"{kind} 백업 완료: {entry['chain']} #{entry['seq']} "
+            f"(변경 페이지 {entry['changed_pages']}/{entry['page_count']}, {entry['size']} bytes)"
+        ))
@@ -0,0 +1,56 @@
+from datetime import datetime
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from backup_management.backup_utils import restore_backup, check_backup_integrity
+from backup_management.incremental import get_incremental_dir, restore_to_timestamp
+
+
+class Command(BaseCommand):
+    help = '증분 백업 체인을 재생하여 지정 시각 시점의 데이터베이스를 복원합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--to',
+            required=True,
+            help='복원 기준 시각 (예: "2026-10-19 14:30"), 이 시각 이전의 마지막 백업 시점으로 복원'
+        )
+        parser.add_argument(
+            '--output',
+            help='복원한 DB 파일 경로 (기본값: BACKUP_DIR/incremental/restored_<시각>.sqlite3)'
+        )
+        parser.add_argument(
+            '--apply',
+            action='store_true',
+            help='복원한 DB로 운영 데이터베이스 교체'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            target = datetime.fromisoformat(options['to'])
+        except ValueError:
+            raise CommandError('--to 형식이 올바르지 않습니다. (예: 2026-10-19 14:30)')
+
+        output = Path(options['output']) if options['output'] else (
+            get_incremental_dir() / f"restored_{target.strftime('%Y%m%d_%H%M%S')}.sqlite3"
+        )
+
+        try:
+            entry = restore_to_timestamp(target, output)
+        except (ValueError, OSError) as e:
+            raise CommandError(str(e))
+
+        is_valid, error_message = check_backup_integrity(output)
+        if not is_valid:
+            raise CommandError(f'복원한 DB 무결성 검사 실패: {error_message}')
+
+        self.stdout.write(
+            f"{entry['chain']} #{entry['seq']} ({entry['created_at']}) 시점으로 복원: {output}"
+        )
+
+        if options['apply']:
+            restore_backup(output)
+            self.stdout.write(self.style.SUCCESS('운영 데이터베이스를 복원 시점으로 교체했습니다.'))
+        else:
+            self.stdout.write(self.style.SUCCESS('복원 파일 생성 완료 (--apply로 운영 DB에 적용)'))
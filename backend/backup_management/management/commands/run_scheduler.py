@@ -0,0 +1,71 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand, CommandError
+
+from backup_management import scheduler
+from backup_management.scheduler import SchedulerLock
+from backup_management.sync_utils import sync_backup_records
+
+
+class Command(BaseCommand):
+    help = '백업/아카이빙 스케줄러를 실행합니다 (잠금을 얻은 한 프로세스만 작업 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-wait',
+            action='store_true',
+            help='다른 스케줄러가 실행 중이면 대기하지 않고 종료'
+        )
+        parser.add_argument(
+            '--retry-interval',
+            type=float,
+            default=30,
+            help='대기 중 잠금 재시도 간격 (초, 기본값: 30)'
+        )
+        parser.add_argument(
+            '--skip-sync',
+            action='store_true',
+            help='시작 시 백업 파일-레코드 동기화 생략'
+        )
+
+    def handle(self, *args, **options):
+        stop_event = threading.Event()
+
+        def request_stop(signum, frame):
+            stop_event.set()
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+
+        lock = SchedulerLock()
+        waiting = False
+        while not lock.acquire():
+            if options['no_wait']:
+                raise CommandError(f'다른 스케줄러가 실행 중입니다 (PID {lock.holder()}).')
+            if not waiting:
+                self.stdout.write(f'다른 스케줄러(PID {lock.holder()})가 실행 중입니다. 대기 모드로 전환합니다.')
+                waiting = True
+            if stop_event.wait(options['retry_interval']):
+                return
+
+        try:
+            if not options['skip_sync']:
+                stats = sync_backup_records()
+                self.stdout.write(
+                    f"백업 동기화 완료 - 삭제된 레코드: {stats['orphaned_records_deleted']}, "
+                    f"등록된 파일: {stats['orphaned_files_registered']}"
+                )
+
+            scheduler.start()
+            if scheduler.scheduler is None:
+                raise CommandError('스케줄러 시작에 실패했습니다. 로그를 확인하세요.')
+            self.stdout.write(self.style.SUCCESS('스케줄러 실행 중 (종료: Ctrl+C 또는 SIGTERM)'))
+
+            # Windows에서도 Ctrl+C를 받을 수 있도록 짧은 간격으로 대기
+            while not stop_event.wait(1):
+                pass
+        finally:
+            scheduler.stop()
+            lock.release()
+            self.stdout.write('스케줄러 종료')
@@ -0,0 +1,156 @@
+import sqlite3
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connections, models, router, transaction
+
+
+class Command(BaseCommand):
+    help = 'SQLite 데이터베이스의 전체 데이터를 PostgreSQL로 복사합니다 (COPY 일괄 적재)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            required=True,
+            help='원본 SQLite 파일 경로 (최신 마이그레이션까지 적용된 DB)'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='대상 PostgreSQL DB 별칭 (기본값: default, 먼저 migrate 실행 필요)'
+        )
+        parser.add_argument(
+            '--models',
+            nargs='+',
+            help='복사할 모델만 지정 (예: performance.PerformanceRecord), 기본값은 전체'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='원본에서 한 번에 읽을 행 수 (기본값: 5000)'
+        )
+
+    def handle(self, *args, **options):
+        using = options['database']
+        target = connections[using]
+        if target.vendor != 'postgresql':
+            raise CommandError(f"대상 DB({using})가 PostgreSQL이 아닙니다. DB_ENGINE=postgresql로 실행하세요.")
+
+        source_path = Path(options['source'])
+        if not source_path.exists():
+            raise CommandError(f"원본 SQLite 파일을 찾을 수 없습니다: {source_path}")
+
+        source = sqlite3.connect(f"file:{source_path}?mode=ro", uri=True)
+        try:
+            source_tables = {
+                row[0] for row in source.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            }
+            model_list = self.get_models(using, options['models'], source_tables)
+            self.check_target(target, model_list)
+
+            started = time.monotonic()
+            total = 0
+            with transaction.atomic(using=using):
+                with target.cursor() as cursor:
+                    # 외래 키는 DEFERRABLE INITIALLY DEFERRED이므로 커밋 시점에 한 번에 검사됨
+                    tables = ', '.join(target.ops.quote_name(model._meta.db_table) for model in model_list)
+                    cursor.execute(f'TRUNCATE {tables} RESTART IDENTITY')
+
+                    for model in model_list:
+                        count = self.copy_table(source, cursor, target, model, options['batch_size'])
+                        total += count
+                        self.stdout.write(f"  {model._meta.label}: {count}행")
+
+                    for sql in target.ops.sequence_reset_sql(no_style(), model_list):
+                        cursor.execute(sql)
+
+                self.verify_counts(source, target, model_list)
+        finally:
+            source.close()
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"복사 완료: {len(model_list)}개 테이블, {total}행 ({elapsed:.1f}초)"
+        ))
+
+    def get_models(self, using, labels, source_tables):
+        """복사할 모델 목록 (자동 생성된 다대다 연결 테이블 포함)"""
+        model_list = [
+            model for model in apps.get_models(include_auto_created=True)
+            if model._meta.managed and not model._meta.proxy
+            and router.allow_migrate_model(using, model)
+        ]
+        if labels:
+            wanted = {label.lower() for label in labels}
+            unknown = wanted - {model._meta.label_lower for model in model_list}
+            if unknown:
+                raise CommandError(f"알 수 없는 모델: {', '.join(sorted(unknown))}")
+            model_list = [model for model in model_list if model._meta.label_lower in wanted]
+
+        missing = [model._meta.db_table for model in model_list if model._meta.db_table not in source_tables]
+        if missing and labels:
+            raise CommandError(f"원본 SQLite에 테이블이 없습니다: {', '.join(missing)}")
+        for table in missing:
+            self.stdout.write(self.style.WARNING(f"  원본에 없는 테이블 건너뜀: {table}"))
+        return [model for model in model_list if model._meta.db_table in source_tables]
+
+    def check_target(self, target, model_list):
+        """대상 DB에 테이블이 모두 있는지 (migrate 선행 여부)"""
+        with target.cursor() as cursor:
+            existing = set(target.introspection.table_names(cursor))
+        missing = [model._meta.db_table for model in model_list if model._meta.db_table not in existing]
+        if missing:
+            raise CommandError(
+                f"대상 DB에 테이블이 없습니다: {', '.join(missing)} (먼저 manage.py migrate 실행)"
+            )
+
+    def copy_table(self, source, cursor, target, model, batch_size):
+        """원본 테이블을 읽어 COPY FROM STDIN으로 적재"""
+        fields = model._meta.local_concrete_fields
+        source_columns = {row[1] for row in source.execute(f'PRAGMA table_info("{model._meta.db_table}")')}
+        missing = [field.column for field in fields if field.column not in source_columns]
+        if missing:
+            raise CommandError(
+                f"원본 {model._meta.db_table}에 컬럼이 없습니다: {', '.join(missing)} "
+                "(원본 DB에 최신 마이그레이션을 먼저 적용하세요)"
+            )
+
+        # SQLite는 불리언을 0/1 정수로 저장
+        boolean_positions = [
+            index for index, field in enumerate(fields) if isinstance(field, models.BooleanField)
+        ]
+
+        select_columns = ', '.join(f'"{field.column}"' for field in fields)
+        copy_columns = ', '.join(target.ops.quote_name(field.column) for field in fields)
+        rows = source.execute(f'SELECT {select_columns} FROM "{model._meta.db_table}"')
+
+        count = 0
+        with cursor.copy(f'COPY {target.ops.quote_name(model._meta.db_table)} ({copy_columns}) FROM STDIN') as copy:
+            while True:
+                batch = rows.fetchmany(batch_size)
+                if not batch:
+                    break
+                for row in batch:
+                    if boolean_positions:
+                        row = list(row)
+                        for index in boolean_positions:
+                            if row[index] is not None:
+                                row[index] = bool(row[index])
+                    copy.write_row(row)
+                count += len(batch)
+        return count
+
+    def verify_counts(self, source, target, model_list):
+        """원본과 대상의 행 수 비교 (다르면 트랜잭션 롤백)"""
+        with target.cursor() as cursor:
+            for model in model_list:
+                table = model._meta.db_table
+                expected = source.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+                cursor.execute(f'SELECT COUNT(*) FROM {target.ops.quote_name(table)}')
+                actual = cursor.fetchone()[0]
+                if actual != expected:
+                    raise CommandError(f"{table} 행 수 불일치: 원본 {expected}, 대상 {actual}")
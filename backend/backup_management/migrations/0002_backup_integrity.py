@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backup_management', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backuprecord',
+            name='integrity_message',
+            field=models.TextField(blank=True, verbose_name='무결성 검사 메시지'),
+        ),
+        migrations.AddField(
+            model_name='backuprecord',
+            name='integrity_status',
+            field=models.CharField(choices=[('unchecked', '미검사'), ('pending', '검사 중'), ('ok', '정상'), ('failed', '손상')], default='unchecked', max_length=10, verbose_name='무결성 검사'),
+        ),
+        migrations.AddField(
+            model_name='backuprecord',
+            name='verified_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='검사 일시'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backup_management', '0002_backup_integrity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backuprecord',
+            name='checksum',
+            field=models.CharField(blank=True, max_length=64, verbose_name='체크섬'),
+        ),
+        migrations.AddField(
+            model_name='backuprecord',
+            name='original_size',
+            field=models.BigIntegerField(blank=True, null=True, verbose_name='원본 크기'),
+        ),
+    ]
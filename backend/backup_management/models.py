@@ -10,6 +10,13 @@ class BackupRecord(models.Model):
         ('manual', '수동'),
     ]
     
+    INTEGRITY_STATUS_CHOICES = [
+        ('unchecked', '미검사'),
+        ('pending', '검사 중'),
+        ('ok', '정상'),
+        ('failed', '손상'),
+    ]
+    
     # 백업 날짜
     backup_date = models.DateTimeField(auto_now_add=True, verbose_name='백업 일시')
     
@@ -26,6 +33,12 @@ class BackupRecord(models.Model):
     # 파일 경로 (상대 경로)
     file_path = models.CharField(max_length=500, verbose_name='파일 경로')
     
+    # 백업 파일 SHA-256 (압축 파일 기준, 압축 이전 백업은 빈 값)
+    checksum = models.CharField(max_length=64, blank=True, verbose_name='체크섬')
+    
+    # 압축 해제 크기 (바이트, 압축 이전 백업은 null)
+    original_size = models.BigIntegerField(null=True, blank=True, verbose_name='원본 크기')
+    
     # 생성자 (자동 백업의 경우 null)
     created_by = models.ForeignKey(
         User, 
@@ -39,6 +52,16 @@ class BackupRecord(models.Model):
     # 비고
     note = models.TextField(blank=True, verbose_name='비고')
     
+    # 무결성 검사 결과 (PRAGMA integrity_check, 백그라운드 실행)
+    integrity_status = models.CharField(
+        max_length=10,
+        choices=INTEGRITY_STATUS_CHOICES,
+        default='unchecked',
+        verbose_name='무결성 검사'
+    )
+    integrity_message = models.TextField(blank=True, verbose_name='무결성 검사 메시지')
+    verified_at = models.DateTimeField(null=True, blank=True, verbose_name='검사 일시')
+    
     class Meta:
         db_table = 'backup_records'
         verbose_name = '백업 이력'
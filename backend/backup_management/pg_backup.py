@@ -0,0 +1,180 @@
+"""
+PostgreSQL 백업/복원 (pg_dump / pg_restore)
+
+DB_ENGINE=postgresql이면 create_backup, check_backup_integrity, restore_backup이 이 모듈을
+사용한다. pg_dump 사용자 지정 형식(-Fc, 내부 압축)은 하나의 트랜잭션 스냅샷으로 덤프하므로
+서비스 중에도 일관된 백업이 만들어지고, 복원은 pg_restore --single-transaction으로 실행하여
+도중에 실패하면 운영 DB는 그대로 남는다.
+
+접속 정보는 libpq 환경 변수(PGHOST, PGPASSWORD 등)로 넘겨 프로세스 목록에 비밀번호가
+보이지 않게 한다. pg_dump/pg_restore가 PATH에 없으면 settings.PG_BIN_DIR을 지정한다.
+"""
+import logging
+import os
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# pg_dump 사용자 지정 형식 백업 파일 확장자
+PG_DUMP_SUFFIX = '.pgdump'
+
+# 사용자 지정 형식 파일 시그니처
+PG_DUMP_SIGNATURE = b'PGDMP'
+
+# settings.DATABASES 항목 → libpq 환경 변수
+LIBPQ_ENV = {
+    'HOST': 'PGHOST',
+    'PORT': 'PGPORT',
+    'USER': 'PGUSER',
+    'PASSWORD': 'PGPASSWORD',
+    'NAME': 'PGDATABASE',
+}
+
+
+def is_postgres(using='default'):
+    """해당 DB가 PostgreSQL인지"""
+    return settings.DATABASES[using]['ENGINE'] == 'django.db.backends.postgresql'
+
+
+def is_pg_dump(file_path):
+    """pg_dump 백업 파일 여부"""
+    return str(file_path).lower().endswith(PG_DUMP_SUFFIX)
+
+
+def pg_command(program, *args, using='default'):
+    """
+    PostgreSQL 클라이언트 명령과 실행 환경
+
+    Returns:
+        tuple: (명령 인자 목록, 환경 변수 dict)
+    """
+    db_settings = settings.DATABASES[using]
+    env = dict(os.environ)
+    for key, variable in LIBPQ_ENV.items():
+        if db_settings.get(key):
+            env[variable] = str(db_settings[key])
+
+    bin_dir = getattr(settings, 'PG_BIN_DIR', '')
+    executable = str(Path(bin_dir) / program) if bin_dir else program
+    return [executable, *args], env
+
+
+def run_pg_command(program, *args, using='default', timeout=None):
+    """PostgreSQL 클라이언트 명령 실행 (실패 시 RuntimeError에 stderr 포함)"""
+    command, env = pg_command(program, *args, using=using)
+    try:
+        result = subprocess.run(command, env=env, capture_output=True, text=True, timeout=timeout)
+    except FileNotFoundError:
+        raise RuntimeError(f"{program}을(를) 찾을 수 없습니다. PostgreSQL 클라이언트를 설치하거나 PG_BIN_DIR을 지정하세요.")
+    if result.returncode != 0:
+        raise RuntimeError(f"{program} 실패 (코드 {result.returncode}): {result.stderr.strip()[:2000]}")
+    return result.stdout
+
+
+def create_pg_backup(backup_type='manual', created_by=None):
+    """
+    pg_dump로 백업 파일 생성 (+ 매니페스트)
+
+    Returns:
+        tuple: (backup_file_path, file_size, manifest) - create_backup()과 같은 형식
+    """
+    from .backup_utils import file_sha256, get_backup_dir, write_manifest
+
+    backup_dir = Path(get_backup_dir())
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    backup_path = backup_dir / f"db_backup_{timestamp}{PG_DUMP_SUFFIX}"
+    temp_path = backup_dir / f"temp_{backup_path.name}"
+
+    started = time.monotonic()
+    try:
+        run_pg_command('pg_dump', '--format=custom', '--no-owner', '--no-privileges', f'--file={temp_path}')
+        sha256 = file_sha256(temp_path)
+        os.replace(temp_path, backup_path)
+    except Exception as e:
+        logger.error(f"pg_dump 백업 실패: {str(e)}")
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    file_size = backup_path.stat().st_size
+    manifest = {
+        'format': 'pg_dump',
+        'file_name': backup_path.name,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'backup_type': backup_type,
+        'created_by': getattr(created_by, 'username', None),
+        'sha256': sha256,
+        'size': file_size,
+        'server_version': connections['default'].pg_version,
+    }
+    write_manifest(backup_path, manifest)
+
+    from .catalog import backup_catalog
+    backup_catalog.record_added(backup_path, manifest)
+
+    logger.info(f"pg_dump 백업 완료: {backup_path} ({file_size} bytes, {time.monotonic() - started:.2f}초)")
+    return str(backup_path), file_size, manifest
+
+
+def check_pg_backup(backup_file_path, expected_sha256=None):
+    """
+    pg_dump 백업 무결성 검사 (체크섬 + pg_restore --list로 목차 읽기)
+
+    Returns:
+        tuple: (is_ok, message)
+    """
+    from .backup_utils import verify_checksum
+
+    is_valid, error_message = verify_checksum(backup_file_path, expected_sha256)
+    if not is_valid:
+        return False, error_message
+
+    with open(backup_file_path, 'rb') as f:
+        if f.read(len(PG_DUMP_SIGNATURE)) != PG_DUMP_SIGNATURE:
+            return False, "pg_dump 사용자 지정 형식 파일이 아닙니다."
+
+    try:
+        run_pg_command('pg_restore', '--list', str(backup_file_path))
+    except RuntimeError as e:
+        return False, str(e)
+    return True, 'ok'
+
+
+def restore_pg_backup(backup_file_path, expected_sha256=None):
+    """
+    pg_dump 백업으로 운영 DB 복원
+
+    기존 객체를 지우고(--clean --if-exists) 한 트랜잭션으로 복원한다. 복원 후 세대 번호를
+    올려 다른 워커가 연결과 캐시를 다시 만들게 한다.
+
+    Returns:
+        bool: 성공 여부
+    """
+    from .signals import notify_database_restored
+
+    is_ok, message = check_pg_backup(backup_file_path, expected_sha256)
+    if not is_ok:
+        raise ValueError(f"복원할 백업 검사 실패: {message}")
+
+    started = time.monotonic()
+    database = settings.DATABASES['default']['NAME']
+    try:
+        run_pg_command(
+            'pg_restore', '--clean', '--if-exists', '--no-owner', '--no-privileges',
+            '--single-transaction', '--exit-on-error', f'--dbname={database}', str(backup_file_path),
+        )
+    except RuntimeError as e:
+        logger.error(f"pg_restore 복원 실패 (운영 DB는 변경되지 않음): {str(e)}")
+        raise
+
+    generation = notify_database_restored()
+    logger.info(
+        f"데이터베이스 복원 완료: {backup_file_path} "
+        f"({time.monotonic() - started:.2f}초, 세대 {generation})"
+    )
+    return True
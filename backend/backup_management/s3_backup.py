@@ -2,12 +2,23 @@
 AWS S3 백업 유틸리티
 
 로컬 백업 파일을 S3 버킷에 업로드하고 관리합니다.
+
+- 업로드: 파트 크기를 넘는 파일은 멀티파트로 병렬 업로드, 중단되면 상태 파일의
+  UploadId로 이어서 업로드 (이미 올라간 파트는 list_parts로 확인)
+- 다운로드: 범위(Range) 요청으로 병렬 다운로드, 완료된 구간을 상태 파일에 기록하여
+  중단 후 이어받기 (ETag가 바뀌면 처음부터)
+- 삭제: list_objects_v2 페이지네이터로 조회 후 delete_objects로 1000건씩 일괄 삭제
 """
 
 import os
+import json
+import math
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
@@ -21,6 +32,18 @@ except ImportError:
     BOTO3_AVAILABLE = False
     logger.warning("boto3가 설치되어 있지 않습니다. S3 백업 기능이 비활성화됩니다.")
 
+# S3 멀티파트 업로드 최소 파트 크기 (마지막 파트 제외)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# delete_objects 1회 최대 키 수
+DELETE_BATCH_SIZE = 1000
+
+# 업로드 시 기본 객체 옵션
+UPLOAD_EXTRA_ARGS = {
+    'StorageClass': 'STANDARD_IA',  # 비용 절감을 위한 Infrequent Access
+    'ServerSideEncryption': 'AES256'  # 서버 측 암호화
+}
+
 
 def is_s3_configured():
     """S3 설정이 완료되었는지 확인"""
@@ -48,8 +71,256 @@ def get_s3_client():
         's3',
         aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
         aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_DEFAULT_REGION
+        region_name=settings.AWS_DEFAULT_REGION,
+        endpoint_url=getattr(settings, 'AWS_S3_ENDPOINT_URL', '') or None
+    )
+
+
+def get_transfer_state_dir():
+    """이어받기/이어올리기 상태 파일 디렉토리"""
+    from .backup_utils import get_backup_dir
+    
+    state_dir = Path(get_backup_dir()) / 's3_transfers'
+    state_dir.mkdir(parents=True, exist_ok=True)
+    return state_dir
+
+
+def _state_path(kind, bucket, key):
+    """전송 종류/버킷/키별 상태 파일 경로"""
+    digest = hashlib.sha1(f"{kind}:{bucket}/{key}".encode('utf-8')).hexdigest()[:16]
+    return get_transfer_state_dir() / f"{kind}_{digest}.json"
+
+
+def _load_state(path):
+    """상태 파일 읽기 (없거나 손상되었으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _save_state(path, state):
+    """상태 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+    temp_path = path.with_name(f"temp_{path.name}")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(temp_path, path)
+
+
+def _transfer_options(chunk_size=None, max_concurrency=None):
+    """파트 크기와 동시 전송 수 (인자가 없으면 설정값)"""
+    if chunk_size is None:
+        chunk_size = getattr(settings, 'AWS_S3_MULTIPART_CHUNK_SIZE', 8 * 1024 * 1024)
+    if max_concurrency is None:
+        max_concurrency = getattr(settings, 'AWS_S3_MAX_CONCURRENCY', 4)
+    return chunk_size, max(1, max_concurrency)
+
+
+def _uploaded_parts(s3_client, bucket, key, upload_id):
+    """이미 업로드된 파트 {파트 번호: (ETag, 크기)}"""
+    parts = {}
+    paginator = s3_client.get_paginator('list_parts')
+    for page in paginator.paginate(Bucket=bucket, Key=key, UploadId=upload_id):
+        for part in page.get('Parts', []):
+            parts[part['PartNumber']] = (part['ETag'], part['Size'])
+    return parts
+
+
+def multipart_upload(s3_client, file_path, bucket, key, chunk_size=None, max_concurrency=None, extra_args=None):
+    """
+    파일을 멀티파트로 병렬 업로드 (중단된 업로드는 이어서 진행)
+    
+    파트 크기 이하의 파일은 put_object 한 번으로 올린다. 상태 파일에는 UploadId와
+    원본 파일 정보만 저장하고, 완료된 파트는 매번 서버(list_parts)에서 확인한다.
+    실패 시 상태 파일을 남겨 두므로 같은 파일을 다시 올리면 남은 파트만 전송한다.
+    
+    Args:
+        s3_client: boto3 S3 클라이언트
+        file_path: 업로드할 로컬 파일 경로
+        bucket: 버킷 이름
+        key: 객체 키
+        chunk_size: 파트 크기 (바이트, 최소 5MB)
+        max_concurrency: 동시 업로드 파트 수
+        extra_args: create_multipart_upload/put_object 추가 인자
+    
+    Returns:
+        dict: {'parts': 전체 파트 수, 'uploaded_parts': 이번에 전송한 파트 수}
+    """
+    file_path = Path(file_path)
+    chunk_size, max_concurrency = _transfer_options(chunk_size, max_concurrency)
+    chunk_size = max(chunk_size, MIN_PART_SIZE)
+    extra_args = extra_args or {}
+    
+    stat = file_path.stat()
+    if stat.st_size <= chunk_size:
+        with open(file_path, 'rb') as f:
+            s3_client.put_object(Bucket=bucket, Key=key, Body=f, **extra_args)
+        return {'parts': 1, 'uploaded_parts': 1}
+    
+    part_count = math.ceil(stat.st_size / chunk_size)
+    source = {
+        'file': str(file_path.resolve()),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'chunk_size': chunk_size,
+    }
+    
+    state_path = _state_path('upload', bucket, key)
+    state = _load_state(state_path)
+    completed = {}
+    
+    if state is not None:
+        try:
+            if state.get('source') != source:
+                raise ValueError('원본 파일이 바뀜')
+            uploaded = _uploaded_parts(s3_client, bucket, key, state['upload_id'])
+            # 크기가 맞는 파트만 완료로 인정 (마지막 파트는 나머지 크기)
+            for number, (etag, size) in uploaded.items():
+                expected = min(chunk_size, stat.st_size - (number - 1) * chunk_size)
+                if number <= part_count and size == expected:
+                    completed[number] = etag
+            logger.info(f"S3 멀티파트 업로드 재개: {key} ({len(completed)}/{part_count} 파트 완료)")
+        except (ValueError, ClientError):
+            # 원본이 바뀌었거나 업로드가 이미 만료/취소된 경우 새로 시작
+            try:
+                s3_client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=state['upload_id'])
+            except ClientError:
+                pass
+            state = None
+            completed = {}
+    
+    if state is None:
+        upload_id = s3_client.create_multipart_upload(Bucket=bucket, Key=key, **extra_args)['UploadId']
+        state = {'upload_id': upload_id, 'source': source}
+        _save_state(state_path, state)
+    
+    upload_id = state['upload_id']
+    
+    def upload_part(number):
+        with open(file_path, 'rb') as f:
+            f.seek((number - 1) * chunk_size)
+            data = f.read(chunk_size)
+        response = s3_client.upload_part(
+            Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=data
+        )
+        return number, response['ETag']
+    
+    pending = [number for number in range(1, part_count + 1) if number not in completed]
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for number, etag in executor.map(upload_part, pending):
+            completed[number] = etag
+    
+    s3_client.complete_multipart_upload(
+        Bucket=bucket,
+        Key=key,
+        UploadId=upload_id,
+        MultipartUpload={
+            'Parts': [{'PartNumber': number, 'ETag': completed[number]} for number in sorted(completed)]
+        }
     )
+    state_path.unlink(missing_ok=True)
+    
+    return {'parts': part_count, 'uploaded_parts': len(pending)}
+
+
+def resumable_download(s3_client, bucket, key, local_path, chunk_size=None, max_concurrency=None):
+    """
+    객체를 범위 요청으로 병렬 다운로드 (중단된 다운로드는 이어받기)
+    
+    local_path + '.part' 파일에 구간별로 기록하고 완료 구간을 상태 파일에 저장한다.
+    모든 구간을 받으면 local_path로 이름을 바꾼다. 다운로드 도중 객체가 바뀌면
+    (IfMatch 실패) 예외가 발생하고, 다음 호출에서 새 ETag로 처음부터 받는다.
+    
+    Returns:
+        dict: {'chunks': 전체 구간 수, 'downloaded_chunks': 이번에 받은 구간 수, 'size': 객체 크기}
+    """
+    local_path = Path(local_path)
+    chunk_size, max_concurrency = _transfer_options(chunk_size, max_concurrency)
+    
+    head = s3_client.head_object(Bucket=bucket, Key=key)
+    size = head['ContentLength']
+    etag = head['ETag']
+    chunk_count = math.ceil(size / chunk_size)
+    
+    part_path = local_path.with_name(f"{local_path.name}.part")
+    state_path = _state_path('download', bucket, key)
+    target = {'file': str(local_path.resolve()), 'etag': etag, 'size': size, 'chunk_size': chunk_size}
+    
+    state = _load_state(state_path)
+    if (
+        state is not None
+        and state.get('target') == target
+        and part_path.exists()
+        and part_path.stat().st_size == size
+    ):
+        done = set(state['chunks'])
+        logger.info(f"S3 다운로드 재개: {key} ({len(done)}/{chunk_count} 구간 완료)")
+    else:
+        done = set()
+        with open(part_path, 'wb') as f:
+            f.truncate(size)
+        state = {'target': target, 'chunks': []}
+        _save_state(state_path, state)
+    
+    lock = threading.Lock()
+    
+    def fetch(index):
+        start = index * chunk_size
+        end = min(start + chunk_size, size) - 1
+        response = s3_client.get_object(
+            Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag
+        )
+        with open(part_path, 'r+b') as f:
+            f.seek(start)
+            for data in response['Body'].iter_chunks(1024 * 1024):
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        with lock:
+            done.add(index)
+            state['chunks'] = sorted(done)
+            _save_state(state_path, state)
+    
+    pending = [index for index in range(chunk_count) if index not in done]
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        list(executor.map(fetch, pending))
+    
+    os.replace(part_path, local_path)
+    state_path.unlink(missing_ok=True)
+    
+    return {'chunks': chunk_count, 'downloaded_chunks': len(pending), 'size': size}
+
+
+def iter_s3_objects(s3_client, bucket, prefix):
+    """접두사 아래 모든 객체 (1000건 제한 없이 페이지네이터로 조회)"""
+    paginator = s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        yield from page.get('Contents', [])
+
+
+def delete_s3_objects(s3_client, bucket, keys):
+    """
+    객체 일괄 삭제 (delete_objects 1회당 최대 1000건)
+    
+    Returns:
+        int: 삭제된 객체 수
+    """
+    keys = list(keys)
+    deleted_count = 0
+    
+    for start in range(0, len(keys), DELETE_BATCH_SIZE):
+        batch = keys[start:start + DELETE_BATCH_SIZE]
+        response = s3_client.delete_objects(
+            Bucket=bucket,
+            Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+        )
+        errors = response.get('Errors', [])
+        for error in errors:
+            logger.error(f"S3 삭제 실패: {error.get('Key')} ({error.get('Code')}: {error.get('Message')})")
+        deleted_count += len(batch) - len(errors)
+    
+    return deleted_count
 
 
 def upload_to_s3(file_path, s3_key=None):
@@ -81,17 +352,9 @@ def upload_to_s3(file_path, s3_key=None):
         
         logger.info(f"S3 업로드 시작: {file_path.name} -> s3://{bucket}/{s3_key}")
         
-        s3_client.upload_file(
-            str(file_path),
-            bucket,
-            s3_key,
-            ExtraArgs={
-                'StorageClass': 'STANDARD_IA',  # 비용 절감을 위한 Infrequent Access
-                'ServerSideEncryption': 'AES256'  # 서버 측 암호화
-            }
-        )
+        result = multipart_upload(s3_client, file_path, bucket, s3_key, extra_args=UPLOAD_EXTRA_ARGS)
         
-        logger.info(f"S3 업로드 완료: {s3_key}")
+        logger.info(f"S3 업로드 완료: {s3_key} (전송 파트 {result['uploaded_parts']}/{result['parts']})")
         return True
         
     except NoCredentialsError:
@@ -126,9 +389,12 @@ def download_from_s3(s3_key, local_path):
         
         logger.info(f"S3 다운로드 시작: s3://{bucket}/{s3_key} -> {local_path}")
         
-        s3_client.download_file(bucket, s3_key, str(local_path))
+        result = resumable_download(s3_client, bucket, s3_key, local_path)
         
-        logger.info(f"S3 다운로드 완료: {local_path}")
+        logger.info(
+            f"S3 다운로드 완료: {local_path} "
+            f"(전송 구간 {result['downloaded_chunks']}/{result['chunks']})"
+        )
         return True
         
     except ClientError as e:
@@ -157,21 +423,13 @@ def list_s3_backups(prefix='backups/'):
         s3_client = get_s3_client()
         bucket = settings.AWS_S3_BACKUP_BUCKET
         
-        response = s3_client.list_objects_v2(
-            Bucket=bucket,
-            Prefix=prefix
-        )
-        
-        if 'Contents' not in response:
-            return []
-        
         backups = [
             {
                 'Key': obj['Key'],
                 'Size': obj['Size'],
                 'LastModified': obj['LastModified']
             }
-            for obj in response['Contents']
+            for obj in iter_s3_objects(s3_client, bucket, prefix)
         ]
         
         return sorted(backups, key=lambda x: x['LastModified'], reverse=True)
@@ -202,16 +460,13 @@ def delete_old_s3_backups(days=30, prefix='backups/'):
     try:
         s3_client = get_s3_client()
         bucket = settings.AWS_S3_BACKUP_BUCKET
-        cutoff_date = datetime.now(datetime.timezone.utc) - timedelta(days=days)
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
         
-        backups = list_s3_backups(prefix)
-        deleted_count = 0
-        
-        for backup in backups:
-            if backup['LastModified'] < cutoff_date:
-                logger.info(f"오래된 백업 삭제: {backup['Key']}")
-                s3_client.delete_object(Bucket=bucket, Key=backup['Key'])
-                deleted_count += 1
+        old_keys = [
+            obj['Key'] for obj in iter_s3_objects(s3_client, bucket, prefix)
+            if obj['LastModified'] < cutoff_date
+        ]
+        deleted_count = delete_s3_objects(s3_client, bucket, old_keys)
         
         logger.info(f"총 {deleted_count}개의 오래된 백업 파일을 삭제했습니다.")
         return deleted_count
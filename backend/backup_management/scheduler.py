@@ -1,7 +1,12 @@
 """
 Django APScheduler를 사용한 백업 및 데이터 아카이빙 스케줄러
+
+`manage.py run_scheduler` 프로세스에서만 시작한다. 여러 서버/프로세스에서
+실행해도 SchedulerLock을 얻은 하나만 작업을 실행하고 나머지는 대기한다.
 """
+import os
 import logging
+from pathlib import Path
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from django.conf import settings
@@ -9,17 +14,84 @@ from django_apscheduler.jobstores import DjangoJobStore
 from django_apscheduler.models import DjangoJobExecution
 from django_apscheduler import util
 
+from .pg_backup import is_postgres
+
 logger = logging.getLogger(__name__)
 
+# 파일 잠금 (Windows에서는 msvcrt 사용)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
 # 스케줄러 인스턴스 (싱글톤)
 scheduler = None
 
 
+class SchedulerLock:
+    """
+    스케줄러 리더 선출용 파일 잠금
+    
+    잠금은 파일을 연 프로세스에 묶여 있어 프로세스가 비정상 종료되어도
+    OS가 자동으로 해제한다. 잠금 파일에는 보유 프로세스 PID를 기록한다.
+    """
+    
+    def __init__(self, path=None):
+        self.path = Path(path or settings.SCHEDULER_LOCK_FILE)
+        self._file = None
+    
+    def acquire(self):
+        """잠금 시도 (대기하지 않음), 성공 여부 반환"""
+        if self._file is not None:
+            return True
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.path, 'a+')
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            return False
+        
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(f"{os.getpid()}\n")
+        lock_file.flush()
+        self._file = lock_file
+        return True
+    
+    def release(self):
+        """잠금 해제"""
+        if self._file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+    
+    def holder(self):
+        """잠금 파일에 기록된 PID (없으면 None)"""
+        try:
+            return int(self.path.read_text().strip() or 0) or None
+        except (OSError, ValueError):
+            return None
+
+
 def create_weekly_backup():
     """
     매주 일요일 자정(월요일로 넘어가는 시점) 백업 작업
     """
-    from .backup_utils import create_backup, delete_old_backups
+    from .backup_utils import create_backup, delete_old_backups, start_integrity_check
     from .models import BackupRecord
     from audit.models import AuditLog
     
@@ -27,16 +99,20 @@ def create_weekly_backup():
         logger.info("자동 백업 작업 시작")
         
         # 백업 파일 생성
-        backup_path, file_size = create_backup(backup_type='auto', created_by=None)
+        backup_path, file_size, manifest = create_backup(backup_type='auto', created_by=None)
         
         # 백업 이력 저장
-        BackupRecord.objects.create(
+        backup_record = BackupRecord.objects.create(
             file_size=file_size,
             backup_type='auto',
             file_path=backup_path,
+            checksum=manifest['sha256'],
+            original_size=manifest.get('original_size'),
             created_by=None,
-            note='주간 자동 백업'
+            note='주간 자동 백업',
+            integrity_status='pending'
         )
+        start_integrity_check(backup_record)
         
         # 감사 로그 기록
         AuditLog.objects.create(
@@ -66,6 +142,23 @@ def create_weekly_backup():
             pass
 
 
+def create_incremental_backup_job():
+    """
+    매시 정각 증분 백업 작업 (바뀐 페이지만 저장)
+    """
+    from .incremental import create_incremental_backup
+    
+    try:
+        entry = create_incremental_backup()
+        logger.info(
+            f"증분 백업 작업 완료: {entry['chain']} #{entry['seq']} "
+            f"(변경 페이지 {entry['changed_pages']}/{entry['page_count']})"
+        )
+    
+    except Exception as e:
+        logger.error(f"증분 백업 작업 실패: {str(e)}")
+
+
 def archive_old_data_job():
     """
     매년 1월 1일 자정 데이터 정리 작업
@@ -120,22 +213,41 @@ def start():
         )
         logger.info("월간 백업 작업 스케줄 등록: 매월 1일 00:00")
         
-        # 매년 1월 1일 자정 - 데이터 아카이빙 작업
-        scheduler.add_job(
-            archive_old_data_job,
-            trigger=CronTrigger(
-                month=1,    # 1월
-                day=1,      # 1일
-                hour=0,     # 자정
-                minute=0,
-                timezone=settings.TIME_ZONE
-            ),
-            id='yearly_archive',
-            max_instances=1,
-            replace_existing=True,
-            name='연간 데이터 아카이빙'
-        )
-        logger.info("데이터 아카이빙 작업 스케줄 등록: 매년 1월 1일 00:00")
+        # 증분 백업(페이지 단위)과 아카이브 DB(ATTACH)는 SQLite 전용
+        # (PostgreSQL은 월간 pg_dump 백업만 실행)
+        if not is_postgres():
+            # 매시 정각 - 증분 백업 작업
+            scheduler.add_job(
+                create_incremental_backup_job,
+                trigger=CronTrigger(
+                    minute=0,
+                    timezone=settings.TIME_ZONE
+                ),
+                id='hourly_incremental_backup',
+                max_instances=1,
+                replace_existing=True,
+                name='시간별 증분 백업'
+            )
+            logger.info("증분 백업 작업 스케줄 등록: 매시 00분")
+            
+            # 매년 1월 1일 자정 - 데이터 아카이빙 작업
+            scheduler.add_job(
+                archive_old_data_job,
+                trigger=CronTrigger(
+                    month=1,    # 1월
+                    day=1,      # 1일
+                    hour=0,     # 자정
+                    minute=0,
+                    timezone=settings.TIME_ZONE
+                ),
+                id='yearly_archive',
+                max_instances=1,
+                replace_existing=True,
+                name='연간 데이터 아카이빙'
+            )
+            logger.info("데이터 아카이빙 작업 스케줄 등록: 매년 1월 1일 00:00")
+        else:
+            logger.info("PostgreSQL 사용: 증분 백업/데이터 아카이빙 작업은 등록하지 않음")
         
         # 매주 월요일 자정 - 오래된 작업 실행 기록 삭제
         scheduler.add_job(
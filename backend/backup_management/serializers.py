@@ -8,6 +8,7 @@ class BackupRecordSerializer(serializers.ModelSerializer):
     created_by_name = serializers.SerializerMethodField()
     file_size_display = serializers.SerializerMethodField()
     backup_type_display = serializers.CharField(source='get_backup_type_display', read_only=True)
+    integrity_status_display = serializers.CharField(source='get_integrity_status_display', read_only=True)
     
     class Meta:
         model = BackupRecord
@@ -19,11 +20,20 @@ class BackupRecordSerializer(serializers.ModelSerializer):
             'backup_type',
             'backup_type_display',
             'file_path',
+            'checksum',
+            'original_size',
             'created_by',
             'created_by_name',
             'note',
+            'integrity_status',
+            'integrity_status_display',
+            'integrity_message',
+            'verified_at',
+        ]
+        read_only_fields = [
+            'id', 'backup_date', 'file_size', 'file_path', 'checksum', 'original_size',
+            'integrity_status', 'integrity_message', 'verified_at',
         ]
-        read_only_fields = ['id', 'backup_date', 'file_size', 'file_path']
     
     def get_created_by_name(self, obj):
         """생성자 이름 반환"""
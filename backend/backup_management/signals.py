@@ -0,0 +1,136 @@
+"""
+DB 복원 세대(generation) 알림
+
+복원이 끝나면 운영 DB 옆 세대 파일(<db>.generation, PostgreSQL은 백업 디렉토리의
+db.generation)의 번호를 올린다. 각 프로세스는
+요청 시작과 DB 연결 생성 시 세대 파일을 stat()으로 확인하여 번호가 바뀌었으면
+
+- 열려 있는 DB 연결을 닫고 (다음 쿼리에서 새로 연결)
+- database_restored 신호로 DB 내용을 캐시한 모듈(유사 부적합 색인 등)을 초기화한다.
+
+복원한 프로세스뿐 아니라 다른 Uvicorn 워커와 스케줄러 프로세스도 같은 파일로 알 수 있다.
+"""
+import logging
+import os
+import threading
+from pathlib import Path
+
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import Signal
+
+logger = logging.getLogger(__name__)
+
+# 복원 후 프로세스별로 한 번 발생 (인자: generation)
+database_restored = Signal()
+
+
+def get_generation_path():
+    """세대 파일 경로 (SQLite는 DB 파일 옆, PostgreSQL은 백업 디렉토리, 그 밖에는 None)"""
+    from .backup_utils import get_backup_dir, get_database_path
+    from .pg_backup import is_postgres
+
+    if is_postgres():
+        return Path(get_backup_dir()) / 'db.generation'
+    try:
+        db_path = get_database_path()
+    except ValueError:
+        return None
+    return db_path.with_name(f"{db_path.name}.generation")
+
+
+def read_generation(path=None):
+    """현재 세대 번호 (파일이 없으면 0)"""
+    path = path or get_generation_path()
+    try:
+        return int(Path(path).read_text().strip() or 0)
+    except (OSError, ValueError, TypeError):
+        return 0
+
+
+def bump_generation():
+    """세대 번호를 1 올림 (임시 파일에 쓴 뒤 교체)"""
+    path = get_generation_path()
+    generation = read_generation(path) + 1
+    temp_path = path.with_name(f"temp_{path.name}")
+    temp_path.write_text(f"{generation}\n")
+    os.replace(temp_path, path)
+    return generation
+
+
+class GenerationWatcher:
+    """프로세스가 마지막으로 확인한 세대 (파일이 바뀌었을 때만 내용을 읽음)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stat_key = None
+        self.generation = None
+
+    def refresh(self):
+        """
+        세대 파일 확인
+
+        Returns:
+            tuple: (현재 세대, 이 프로세스에서 처음 확인한 뒤 바뀌었는지)
+        """
+        path = get_generation_path()
+        if path is None:
+            return 0, False
+        try:
+            stat = path.stat()
+            stat_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stat_key = None
+
+        with self._lock:
+            if stat_key == self._stat_key and self.generation is not None:
+                return self.generation, False
+            self._stat_key = stat_key
+            previous, self.generation = self.generation, read_generation(path) if stat_key else 0
+            return self.generation, previous is not None and previous != self.generation
+
+
+# 프로세스 전역
+generation_watcher = GenerationWatcher()
+
+
+def _restored(generation):
+    logger.info(f"DB 복원 감지 (세대 {generation}): 연결 재설정 및 캐시 초기화")
+    database_restored.send(sender=GenerationWatcher, generation=generation)
+
+
+def close_stale_connections(generation):
+    """현재 스레드에서 이전 세대에 연 DB 연결 닫기 (트랜잭션 중인 연결은 제외)"""
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is None or connection.in_atomic_block:
+            continue
+        if getattr(connection, 'restore_generation', None) != generation:
+            connection.close()
+
+
+def notify_database_restored():
+    """복원 완료 알림 (세대 번호를 올리고 현재 프로세스/스레드에 바로 반영)"""
+    generation = bump_generation()
+    generation_watcher.refresh()
+    close_stale_connections(generation)
+    _restored(generation)
+    return generation
+
+
+def _check_on_request(sender, **kwargs):
+    generation, changed = generation_watcher.refresh()
+    close_stale_connections(generation)
+    if changed:
+        _restored(generation)
+
+
+def _check_on_connect(sender, connection, **kwargs):
+    generation, changed = generation_watcher.refresh()
+    connection.restore_generation = generation
+    if changed:
+        _restored(generation)
+
+
+request_started.connect(_check_on_request, dispatch_uid='backup_generation_request')
+connection_created.connect(_check_on_connect, dispatch_uid='backup_generation_connect')
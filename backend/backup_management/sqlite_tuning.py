@@ -0,0 +1,58 @@
+"""
+SQLite 연결별 PRAGMA 적용
+
+cache_size, temp_store, mmap_size, busy_timeout 등은 연결마다 초기화되므로
+connection_created 신호에서 settings.SQLITE_PRAGMAS를 매번 적용한다.
+journal_mode(WAL)는 DB 파일에 유지되므로 현재 값과 다를 때만 바꾼다
+(enable_wal.py를 따로 실행하지 않아도 첫 연결에서 WAL로 전환).
+"""
+import logging
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# 값 검증: PRAGMA 문에 그대로 넣으므로 이름/값 형식을 제한
+ALLOWED_PRAGMAS = {
+    'journal_mode', 'synchronous', 'cache_size', 'temp_store', 'mmap_size',
+    'busy_timeout', 'foreign_keys', 'wal_autocheckpoint', 'journal_size_limit',
+}
+
+
+def pragma_statements(pragmas):
+    """PRAGMA 설정 dict → 실행할 문장 목록 (journal_mode 제외)"""
+    statements = []
+    for name, value in pragmas.items():
+        if name not in ALLOWED_PRAGMAS:
+            raise ValueError(f"지원하지 않는 SQLite PRAGMA: {name}")
+        if name == 'journal_mode':
+            continue
+        value = str(value)
+        if not value.lstrip('-').isalnum():
+            raise ValueError(f"잘못된 SQLite PRAGMA 값: {name}={value}")
+        statements.append(f'PRAGMA {name}={value}')
+    return statements
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """새 SQLite 연결에 PRAGMA 프로필 적용"""
+    if connection.vendor != 'sqlite':
+        return
+    pragmas = getattr(settings, 'SQLITE_PRAGMAS', None)
+    if not pragmas:
+        return
+
+    with connection.cursor() as cursor:
+        journal_mode = pragmas.get('journal_mode')
+        cursor.execute('PRAGMA query_only')
+        read_only = bool(cursor.fetchone()[0])
+        # 읽기 전용 연결(query_only)은 journal_mode를 바꿀 수 없으므로 쓰기 연결에서만 확인
+        if journal_mode and not read_only and not connection.is_in_memory_db():
+            cursor.execute('PRAGMA journal_mode')
+            current = cursor.fetchone()[0]
+            if current.lower() != str(journal_mode).lower():
+                cursor.execute(f'PRAGMA journal_mode={journal_mode}')
+                logger.info(f"SQLite journal_mode 변경: {current} → {cursor.fetchone()[0]}")
+
+        for statement in pragma_statements(pragmas):
+            cursor.execute(statement)
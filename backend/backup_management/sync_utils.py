@@ -7,12 +7,28 @@ from pathlib import Path
 from datetime import datetime
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Count, Q
 from .models import BackupRecord
-from .backup_utils import get_backup_dir, cleanup_temp_files
+from .backup_utils import get_backup_dir, cleanup_temp_files, get_manifest_path
+from .catalog import backup_catalog
 
 logger = logging.getLogger(__name__)
 
 
+def _is_orphaned_record(file_path, cataloged_paths, backup_dir):
+    """
+    파일 없는 레코드 여부
+
+    백업 디렉토리 안의 파일은 카탈로그로 판단하고, 다른 위치를 가리키는
+    레코드(BACKUP_DIR 변경 이전 등)만 파일 존재 여부를 직접 확인한다.
+    """
+    if file_path in cataloged_paths:
+        return False
+    if Path(file_path).parent == backup_dir:
+        return True
+    return not Path(file_path).exists()
+
+
 def sync_backup_records():
     """
     백업 디렉토리의 파일과 데이터베이스 레코드를 동기화합니다.
@@ -36,56 +52,49 @@ def sync_backup_records():
             logger.warning(f"백업 디렉토리가 존재하지 않습니다: {backup_dir}")
             return stats
         
+        entries = backup_catalog.entries()
+        cataloged_paths = backup_catalog.paths()
+        
         # 1. DB에는 있지만 파일이 없는 레코드 삭제
         logger.info("DB 레코드 검증 중...")
-        all_records = BackupRecord.objects.all()
+        existing_file_paths = set()
         
-        for record in all_records:
-            file_path = Path(record.file_path)
-            if not file_path.exists():
-                logger.warning(f"백업 파일이 존재하지 않아 레코드 삭제: {record.file_path}")
-                record.delete()
+        for record_id, file_path in BackupRecord.objects.values_list('id', 'file_path'):
+            if _is_orphaned_record(file_path, cataloged_paths, backup_dir):
+                logger.warning(f"백업 파일이 존재하지 않아 레코드 삭제: {file_path}")
+                BackupRecord.objects.filter(id=record_id).delete()
                 stats['orphaned_records_deleted'] += 1
+            else:
+                existing_file_paths.add(file_path)
         
         # 2. 파일은 있지만 DB에 없는 경우 레코드 생성
         logger.info("백업 파일 검증 중...")
-        existing_file_paths = set(
-            BackupRecord.objects.values_list('file_path', flat=True)
-        )
-        
-        # 백업 디렉토리의 모든 .sqlite3 파일 검색
-        backup_files = list(backup_dir.glob('*.sqlite3'))
         
-        for file_path in backup_files:
-            file_path_str = str(file_path)
-            
-            # 임시 파일은 무시
-            if 'temp' in file_path.name.lower() or 'tmp' in file_path.name.lower():
-                continue
+        # 카탈로그의 백업 파일 (.sqlite3, .sqlite3.gz, 임시 파일 제외)
+        for name, entry in entries.items():
+            file_path_str = str(backup_dir / name)
             
             # DB에 레코드가 없는 경우
             if file_path_str not in existing_file_paths:
                 try:
-                    file_size = file_path.stat().st_size
-                    
-                    # 파일명에서 백업 유형 추론
-                    # db_backup_YYYYMMDD_HHMMSS.sqlite3 형식 가정
-                    backup_type = 'auto'  # 기본값은 자동 백업으로 간주
-                    
+                    # 카탈로그에 기록된 매니페스트 정보로 유형/체크섬/원본 크기 복구
+                    # (매니페스트가 없으면 자동 백업으로 간주)
                     with transaction.atomic():
                         BackupRecord.objects.create(
-                            file_size=file_size,
-                            backup_type=backup_type,
+                            file_size=entry['size'],
+                            backup_type=entry['backup_type'],
                             file_path=file_path_str,
+                            checksum=entry['sha256'],
+                            original_size=entry['original_size'],
                             created_by=None,  # 알 수 없는 경우 None
                             note='시스템 동기화로 등록된 백업'
                         )
                     
-                    logger.info(f"레코드 없는 백업 파일 등록: {file_path.name}")
+                    logger.info(f"레코드 없는 백업 파일 등록: {name}")
                     stats['orphaned_files_registered'] += 1
                 
                 except Exception as e:
-                    error_msg = f"백업 파일 등록 실패 ({file_path.name}): {str(e)}"
+                    error_msg = f"백업 파일 등록 실패 ({name}): {str(e)}"
                     logger.error(error_msg)
                     stats['errors'].append(error_msg)
         
@@ -131,20 +140,16 @@ def cleanup_orphaned_files():
             BackupRecord.objects.values_list('file_path', flat=True)
         )
         
-        # 백업 디렉토리의 모든 .sqlite3 파일 검색
-        backup_files = list(backup_dir.glob('*.sqlite3'))
-        
-        for file_path in backup_files:
-            # 임시 파일은 무시
-            if 'temp' in file_path.name.lower() or 'tmp' in file_path.name.lower():
-                continue
-            
-            file_path_str = str(file_path)
+        # 카탈로그의 백업 파일 (임시 파일 제외)
+        for file_path_str in backup_catalog.paths():
+            file_path = Path(file_path_str)
             
-            # DB에 레코드가 없는 파일 삭제
+            # DB에 레코드가 없는 파일 삭제 (매니페스트 포함)
             if file_path_str not in registered_files:
                 try:
-                    file_path.unlink()
+                    file_path.unlink(missing_ok=True)
+                    get_manifest_path(file_path).unlink(missing_ok=True)
+                    backup_catalog.record_removed(file_path)
                     logger.info(f"레코드 없는 백업 파일 삭제: {file_path.name}")
                     deleted_count += 1
                 except Exception as e:
@@ -160,47 +165,36 @@ def get_backup_stats():
     """
     백업 통계 정보를 반환합니다.
     
+    파일 수/크기와 불일치 여부는 카탈로그 인벤토리로 계산하므로 백업 디렉토리가
+    바뀌지 않았으면 파일 시스템을 스캔하지 않습니다.
+    
     Returns:
         dict: 백업 통계
     """
     try:
         backup_dir = Path(get_backup_dir())
         
-        # DB 레코드 통계
-        total_records = BackupRecord.objects.count()
-        auto_backups = BackupRecord.objects.filter(backup_type='auto').count()
-        manual_backups = BackupRecord.objects.filter(backup_type='manual').count()
-        
-        # 파일 시스템 통계
-        total_files = 0
-        total_size = 0
+        # DB 레코드 통계 (쿼리 1회)
+        counts = BackupRecord.objects.aggregate(
+            total_records=Count('id'),
+            auto_backups=Count('id', filter=Q(backup_type='auto')),
+            manual_backups=Count('id', filter=Q(backup_type='manual')),
+        )
         
-        if backup_dir.exists():
-            backup_files = list(backup_dir.glob('*.sqlite3'))
-            total_files = len([f for f in backup_files if 'temp' not in f.name.lower()])
-            total_size = sum(f.stat().st_size for f in backup_files if 'temp' not in f.name.lower())
+        # 파일 시스템 통계 (카탈로그)
+        total_files, total_size = backup_catalog.totals()
+        cataloged_paths = backup_catalog.paths()
         
         # 불일치 확인
         registered_files = set(BackupRecord.objects.values_list('file_path', flat=True))
-        orphaned_records = 0
-        orphaned_files = 0
-        
-        # DB 레코드 검증
-        for record in BackupRecord.objects.all():
-            if not Path(record.file_path).exists():
-                orphaned_records += 1
-        
-        # 파일 시스템 검증
-        if backup_dir.exists():
-            for file_path in backup_dir.glob('*.sqlite3'):
-                if 'temp' not in file_path.name.lower():
-                    if str(file_path) not in registered_files:
-                        orphaned_files += 1
+        orphaned_records = sum(
+            1 for file_path in registered_files
+            if _is_orphaned_record(file_path, cataloged_paths, backup_dir)
+        )
+        orphaned_files = len(cataloged_paths - registered_files)
         
         return {
-            'total_records': total_records,
-            'auto_backups': auto_backups,
-            'manual_backups': manual_backups,
+            **counts,
             'total_files': total_files,
             'total_size': total_size,
             'orphaned_records': orphaned_records,  # 파일 없는 레코드
@@ -213,4 +207,3 @@ def get_backup_stats():
         return {
             'error': str(e)
         }
-
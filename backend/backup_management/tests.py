@@ -1,3 +1,1000 @@
-from django.test import TestCase
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from .models import BackupRecord
+from .backup_utils import (
+    copy_database, create_backup, verify_backup_record, validate_backup_file,
+    read_manifest, extracted_backup, compress_file, decompress_to_file, iter_file_chunks,
+)
+from .incremental import create_incremental_backup, restore_to_timestamp, list_chains, load_chain
+from . import s3_backup, scheduler
+from .scheduler import SchedulerLock
+from .data_archiver import archive_old_data
+from .cold_storage import ArchivedQuerySet, archive_years
+from .catalog import BackupCatalog, backup_catalog
+from .sync_utils import get_backup_stats, sync_backup_records
+
+try:
+    from moto import mock_aws
+    MOTO_AVAILABLE = True
+except ImportError:
+    MOTO_AVAILABLE = False
+
+
+class BackupTestMixin:
+    """임시 디렉토리에 WAL 모드 원본 DB 생성"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.db_path = self.temp_dir / 'source.sqlite3'
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)')
+        conn.executemany('INSERT INTO items (value) VALUES (?)', [('x' * 100,)] * 5000)
+        conn.commit()
+        # 체크포인트 없이 WAL에만 남아 있는 커밋
+        conn.execute('PRAGMA wal_autocheckpoint=0')
+        conn.execute("INSERT INTO items (value) VALUES ('wal-only')")
+        conn.commit()
+        self.source_conn = conn
+
+    def tearDown(self):
+        self.source_conn.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class OnlineBackupTest(BackupTestMixin, TestCase):
+    """sqlite3 backup API 기반 온라인 백업 테스트"""
+
+    def test_copy_includes_wal_and_stays_consistent_under_writes(self):
+        """WAL에만 있는 커밋 포함, 복사 중 쓰기가 있어도 시작 시점 스냅샷으로 완료"""
+        stop = threading.Event()
+
+        def writer():
+            conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=5)
+            while not stop.is_set():
+                conn.execute("INSERT INTO items (value) VALUES ('concurrent')")
+            conn.close()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            dest = self.temp_dir / 'copy.sqlite3'
+            copy_database(self.db_path, dest, step_pages=8, step_sleep=0.001)
+        finally:
+            stop.set()
+            thread.join()
+
+        conn = sqlite3.connect(dest)
+        try:
+            self.assertEqual(conn.execute('PRAGMA integrity_check').fetchone()[0], 'ok')
+            self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'delete')
+            self.assertEqual(
+                conn.execute("SELECT COUNT(*) FROM items WHERE value = 'wal-only'").fetchone()[0], 1
+            )
+        finally:
+            conn.close()
+
+    def test_create_backup_and_integrity_check(self):
+        """백업 생성 후 무결성 검사 결과 기록"""
+        backup_dir = self.temp_dir / 'backups'
+        with override_settings(BACKUP_DIR=backup_dir), \
+                mock.patch('backup_management.backup_utils.get_database_path', return_value=self.db_path):
+            backup_path, file_size, manifest = create_backup()
+
+        self.assertTrue(Path(backup_path).name.startswith('db_backup_'))
+        self.assertEqual(list(backup_dir.glob('temp_*')), [])
+
+        record = BackupRecord.objects.create(
+            file_size=file_size, backup_type='manual', file_path=backup_path,
+            checksum=manifest['sha256'], integrity_status='pending'
+        )
+        with override_settings(BACKUP_DIR=backup_dir), mock.patch('django.db.connection.close'):
+            self.assertEqual(verify_backup_record(record.id), 'ok')
+        record.refresh_from_db()
+        self.assertEqual(record.integrity_status, 'ok')
+        self.assertIsNotNone(record.verified_at)
+
+        # 압축 이전 형식(.sqlite3)의 손상된 백업
+        legacy_path = self.temp_dir / 'legacy.sqlite3'
+        copy_database(self.db_path, legacy_path)
+        with open(legacy_path, 'r+b') as f:
+            f.seek(4096 * 3)
+            f.write(b'\xff' * 4096)
+        record = BackupRecord.objects.create(
+            file_size=legacy_path.stat().st_size, backup_type='manual', file_path=str(legacy_path)
+        )
+        with mock.patch('django.db.connection.close'):
+            self.assertEqual(verify_backup_record(record.id), 'failed')
+        record.refresh_from_db()
+        self.assertEqual(record.integrity_status, 'failed')
+        self.assertNotEqual(record.integrity_message, '')
+
+
+class CompressedBackupTest(BackupTestMixin, TestCase):
+    """압축 백업 형식, 체크섬, 매니페스트 테스트"""
+
+    def create_backup(self):
+        self.backup_dir = self.temp_dir / 'backups'
+        with override_settings(BACKUP_DIR=self.backup_dir), \
+                mock.patch('backup_management.backup_utils.get_database_path', return_value=self.db_path):
+            return create_backup(backup_type='auto')
+
+    def test_archive_manifest_and_round_trip(self):
+        """gzip 압축 파일과 매니페스트 생성, 해제 시 원본과 동일"""
+        backup_path, file_size, manifest = self.create_backup()
+
+        self.assertTrue(backup_path.endswith('.sqlite3.gz'))
+        self.assertLess(file_size, manifest['original_size'])
+        self.assertEqual(read_manifest(backup_path), manifest)
+        self.assertEqual(manifest['size'], file_size)
+
+        with override_settings(BACKUP_DIR=self.backup_dir):
+            with extracted_backup(backup_path) as db_file:
+                conn = sqlite3.connect(db_file)
+                count = conn.execute('SELECT COUNT(*) FROM items').fetchone()[0]
+                conn.close()
+                temp_file = Path(db_file)
+        self.assertEqual(count, 5001)
+        self.assertFalse(temp_file.exists())
+
+    def test_validate_checksum(self):
+        """체크섬 불일치 검출"""
+        backup_path, _, manifest = self.create_backup()
+        self.assertEqual(validate_backup_file(backup_path), (True, None))
+
+        with open(backup_path, 'r+b') as f:
+            f.seek(-20, 2)
+            f.write(b'\x00' * 8)
+
+        is_valid, error_message = validate_backup_file(backup_path)
+        self.assertFalse(is_valid)
+        self.assertIn('체크섬', error_message)
+
+    def test_decompress_size_limit(self):
+        """압축 해제 크기 제한 (압축 폭탄 방지)"""
+        backup_path, _, manifest = self.create_backup()
+        dest = self.temp_dir / 'out.sqlite3'
+
+        with self.assertRaises(ValueError):
+            decompress_to_file(iter_file_chunks(backup_path), dest, max_size=1024)
+        self.assertFalse(dest.exists())
+
+        size = decompress_to_file(iter_file_chunks(backup_path), dest)
+        self.assertEqual(size, manifest['original_size'])
+
+
+class IncrementalBackupTest(BackupTestMixin, TestCase):
+    """페이지 단위 증분 백업 및 시점 복원 테스트"""
+
+    def backup_at(self, when, force_full=False, **kwargs):
+        """지정 시각에 증분 백업 생성"""
+        fake_datetime = mock.Mock(wraps=datetime)
+        fake_datetime.now.return_value = when
+        with override_settings(BACKUP_DIR=self.temp_dir / 'backups', **kwargs), \
+                mock.patch('backup_management.incremental.get_database_path', return_value=self.db_path), \
+                mock.patch('backup_management.incremental.datetime', fake_datetime):
+            return create_incremental_backup(force_full=force_full)
+
+    def restore_at(self, when):
+        """지정 시각 시점으로 복원한 DB의 items 건수"""
+        output = self.temp_dir / 'restored.sqlite3'
+        with override_settings(BACKUP_DIR=self.temp_dir / 'backups'):
+            entry = restore_to_timestamp(when, output)
+        conn = sqlite3.connect(output)
+        try:
+            self.assertEqual(conn.execute('PRAGMA integrity_check').fetchone()[0], 'ok')
+            return entry['seq'], conn.execute('SELECT COUNT(*) FROM items').fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_incremental_chain_and_point_in_time_restore(self):
+        """변경 페이지만 저장하고 각 시점의 상태로 복원"""
+        base = self.backup_at(datetime(2026, 1, 1, 0, 0))
+        self.assertEqual(base['seq'], 0)
+        self.assertEqual(base['changed_pages'], base['page_count'])
+
+        self.source_conn.execute("UPDATE items SET value = 'changed' WHERE id = 1")
+        self.source_conn.commit()
+        first = self.backup_at(datetime(2026, 1, 1, 1, 0))
+        self.assertEqual(first['seq'], 1)
+        self.assertLess(first['changed_pages'], base['page_count'] // 4)
+
+        self.source_conn.executemany('INSERT INTO items (value) VALUES (?)', [('y' * 100,)] * 2000)
+        self.source_conn.commit()
+        second = self.backup_at(datetime(2026, 1, 1, 2, 0))
+        self.assertGreater(second['page_count'], first['page_count'])
+
+        self.assertEqual(self.restore_at(datetime(2026, 1, 1, 0, 30)), (0, 5001))
+        self.assertEqual(self.restore_at(datetime(2026, 1, 1, 1, 59)), (1, 5001))
+        self.assertEqual(self.restore_at(datetime(2026, 1, 1, 3, 0)), (2, 7001))
+
+        with self.assertRaises(ValueError):
+            self.restore_at(datetime(2025, 12, 31))
+
+    def test_new_chain_after_full_every_and_retention(self):
+        """증분이 일정 수를 넘으면 새 체인 시작, 오래된 체인 삭제"""
+        for hour in range(5):
+            self.source_conn.execute(f"INSERT INTO items (value) VALUES ('h{hour}')")
+            self.source_conn.commit()
+            self.backup_at(
+                datetime(2026, 1, 1, hour, 0),
+                INCREMENTAL_FULL_EVERY=1, INCREMENTAL_KEEP_CHAINS=2,
+            )
+
+        with override_settings(BACKUP_DIR=self.temp_dir / 'backups'):
+            chains = list_chains()
+            self.assertEqual([chain.name for chain in chains], ['chain_20260101_020000', 'chain_20260101_040000'])
+            self.assertEqual(len(load_chain(chains[0])['entries']), 2)
+
+            # 증분 파일 손상 시 복원 거부
+            with open(chains[0] / '000001.pages.gz', 'ab') as f:
+                f.write(b'garbage')
+        with self.assertRaises(ValueError):
+            self.restore_at(datetime(2026, 1, 1, 3, 30))
+        self.assertEqual(self.restore_at(datetime(2026, 1, 1, 2, 30)), (0, 5004))
+
+    def test_forced_full_backups_in_same_second(self):
+        """같은 초에 전체 백업을 여러 번 해도 체인 디렉토리가 겹치지 않음 (이름순 = 생성순)"""
+        when = datetime(2026, 1, 1, 9, 0, 0)
+        entries = [self.backup_at(when, force_full=True) for _ in range(3)]
+
+        self.assertEqual(
+            [entry['chain'] for entry in entries],
+            ['chain_20260101_090000', 'chain_20260101_090000_01', 'chain_20260101_090000_02'],
+        )
+        with override_settings(BACKUP_DIR=self.temp_dir / 'backups'):
+            self.assertEqual([chain.name for chain in list_chains()], [entry['chain'] for entry in entries])
+
+
+@skipUnless(s3_backup.BOTO3_AVAILABLE and MOTO_AVAILABLE, 'boto3와 moto가 필요합니다')
+@override_settings(
+    AWS_S3_BACKUP_BUCKET='qms-backup-test',
+    AWS_ACCESS_KEY_ID='testing',
+    AWS_SECRET_ACCESS_KEY='testing',
+    AWS_DEFAULT_REGION='ap-northeast-2',
+    AWS_S3_ENDPOINT_URL='',
+    AWS_S3_MULTIPART_CHUNK_SIZE=s3_backup.MIN_PART_SIZE,
+    AWS_S3_MAX_CONCURRENCY=2,
+)
+class S3TransferTest(TestCase):
+    """S3 멀티파트 업로드/이어받기/일괄 삭제 테스트 (moto)"""
+
+    def setUp(self):
+        self.mock = mock_aws()
+        self.mock.start()
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.settings_override = override_settings(BACKUP_DIR=self.temp_dir / 'backups')
+        self.settings_override.enable()
+
+        self.client = s3_backup.get_s3_client()
+        self.client.create_bucket(
+            Bucket='qms-backup-test',
+            CreateBucketConfiguration={'LocationConstraint': 'ap-northeast-2'},
+        )
+        # 5MB 파트 2개 + 나머지 1개
+        self.source = self.temp_dir / 'db_backup_20260101_000000.sqlite3.gz'
+        self.source.write_bytes(os.urandom(s3_backup.MIN_PART_SIZE * 2 + 12345))
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.mock.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_multipart_upload_resumes_after_failure(self):
+        """중단된 멀티파트 업로드는 남은 파트만 다시 전송"""
+        original = self.client.upload_part
+
+        def fail_third_part(**kwargs):
+            if kwargs['PartNumber'] == 3:
+                raise RuntimeError('network down')
+            return original(**kwargs)
+
+        with mock.patch.object(self.client, 'upload_part', side_effect=fail_third_part):
+            with self.assertRaises(RuntimeError):
+                s3_backup.multipart_upload(self.client, self.source, 'qms-backup-test', 'backups/a.gz')
+
+        with mock.patch.object(self.client, 'upload_part', side_effect=original) as upload_part:
+            result = s3_backup.multipart_upload(self.client, self.source, 'qms-backup-test', 'backups/a.gz')
+        self.assertEqual(result, {'parts': 3, 'uploaded_parts': 1})
+        self.assertEqual([c.kwargs['PartNumber'] for c in upload_part.call_args_list], [3])
+
+        body = self.client.get_object(Bucket='qms-backup-test', Key='backups/a.gz')['Body'].read()
+        self.assertEqual(body, self.source.read_bytes())
+        self.assertEqual(list((self.temp_dir / 'backups' / 's3_transfers').iterdir()), [])
+
+    def test_download_resumes_after_failure(self):
+        """중단된 다운로드는 받지 못한 구간만 다시 요청"""
+        self.assertTrue(s3_backup.upload_to_s3(self.source, 'backups/b.gz'))
+        dest = self.temp_dir / 'restored.gz'
+        original = self.client.get_object
+
+        def fail_second_chunk(**kwargs):
+            if kwargs['Range'].startswith(f'bytes={s3_backup.MIN_PART_SIZE}-'):
+                raise RuntimeError('network down')
+            return original(**kwargs)
+
+        with mock.patch.object(self.client, 'get_object', side_effect=fail_second_chunk):
+            with self.assertRaises(RuntimeError):
+                s3_backup.resumable_download(self.client, 'qms-backup-test', 'backups/b.gz', dest)
+        self.assertFalse(dest.exists())
+
+        with mock.patch.object(self.client, 'get_object', side_effect=original) as get_object:
+            result = s3_backup.resumable_download(self.client, 'qms-backup-test', 'backups/b.gz', dest)
+        self.assertEqual(result['downloaded_chunks'], 1)
+        self.assertEqual(get_object.call_count, 1)
+        self.assertEqual(dest.read_bytes(), self.source.read_bytes())
+
+    def test_delete_old_backups_in_batches(self):
+        """오래된 백업은 delete_objects로 일괄 삭제"""
+        for index in range(1005):
+            self.client.put_object(Bucket='qms-backup-test', Key=f'backups/old_{index}.gz', Body=b'x')
+
+        with mock.patch.object(self.client, 'delete_objects', wraps=self.client.delete_objects) as delete_objects, \
+                mock.patch.object(s3_backup, 'get_s3_client', return_value=self.client):
+            self.assertEqual(s3_backup.delete_old_s3_backups(days=-1), 1005)
+        self.assertEqual(delete_objects.call_count, 2)
+        self.assertEqual(s3_backup.list_s3_backups(), [])
+
+
+class StreamingUploadTest(BackupTestMixin, TestCase):
+    """스트리밍 업로드 핸들러: 전송 중 검증, quick_check 후 복원"""
+
+    def setUp(self):
+        super().setUp()
+        from accounts.models import User
+        from rest_framework.test import APIClient
+
+        self.source_conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        self.backup_dir = self.temp_dir / 'backups'
+        self.backup_dir.mkdir()
+        user = User.objects.create(
+            username='uploader', name='업로드', department='품질', position='대리',
+            phone_number='010-0000-0000', role_level=1, status='active',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def upload(self, name, content, **extra):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        with override_settings(BACKUP_DIR=self.backup_dir):
+            return self.client.post(
+                '/api/backup/upload/',
+                {'file': SimpleUploadedFile(name, content), **extra},
+                format='multipart',
+            )
+
+    def staged_files(self):
+        return list(self.backup_dir.glob('temp_upload_*'))
+
+    def test_compressed_upload_is_hashed_and_checked_before_restore(self):
+        """압축 업로드를 해제하며 해시를 계산하고 quick_check 통과 후 복원"""
+        import gzip
+        import hashlib
+
+        raw = self.db_path.read_bytes()
+        content = gzip.compress(raw)
+        with mock.patch('backup_management.views.restore_backup') as restore:
+            response = self.upload('upload.sqlite3.gz', content, checksum=hashlib.sha256(content).hexdigest())
+
+        self.assertEqual(response.status_code, 200, response.data)
+        staged_path = restore.call_args.args[0]
+        self.assertEqual(staged_path.read_bytes(), raw)
+        record = BackupRecord.objects.get()
+        self.assertEqual(record.checksum, hashlib.sha256(raw).hexdigest())
+        self.assertEqual(record.file_size, len(raw))
+
+    def test_rejects_bad_header_and_checksum_without_leaving_files(self):
+        """시그니처/체크섬이 맞지 않으면 복원하지 않고 스테이징 파일 삭제"""
+        with mock.patch('backup_management.views.restore_backup') as restore:
+            response = self.upload('upload.sqlite3', b'not a database' * 1000)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('유효한 SQLite3', response.data['error'])
+
+            response = self.upload('upload.sqlite3', self.db_path.read_bytes(), checksum='0' * 64)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('체크섬', response.data['error'])
+
+            response = self.upload('notes.txt', b'SQLite format 3\x00')
+            self.assertEqual(response.status_code, 400)
+
+        restore.assert_not_called()
+        self.assertEqual(self.staged_files(), [])
+
+    def test_upload_rejected_on_postgres_before_reading_body(self):
+        """PostgreSQL이면 파일을 받기 전에 400, 백업 이력/감사 로그 없음"""
+        from audit.models import AuditLog
+
+        with mock.patch('backup_management.views.is_postgres', return_value=True), \
+                mock.patch('backup_management.views.restore_backup') as restore:
+            response = self.upload('upload.sqlite3', self.db_path.read_bytes())
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('PostgreSQL', response.data['error'])
+        restore.assert_not_called()
+        self.assertFalse(BackupRecord.objects.exists())
+        self.assertFalse(AuditLog.objects.filter(action='UPLOAD_BACKUP').exists())
+        self.assertEqual(self.staged_files(), [])
+
+    def test_size_limit_applies_while_decompressing(self):
+        """해제 크기가 한도를 넘으면 전송 도중 중단"""
+        import gzip
+
+        content = gzip.compress(b'SQLite format 3\x00' + b'\x00' * (4 * 1024 * 1024))
+        with mock.patch('backup_management.upload.MAX_BACKUP_SIZE', 1024 * 1024):
+            response = self.upload('bomb.sqlite3.gz', content)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('파일 크기', response.data['error'])
+        self.assertEqual(self.staged_files(), [])
+
+    def test_quick_check_reports_corruption(self):
+        """손상된 페이지는 quick_check에서 실패"""
+        from .backup_utils import quick_check
+
+        self.assertEqual(quick_check(self.db_path), (True, 'ok'))
+
+        corrupted = self.temp_dir / 'corrupted.sqlite3'
+        data = bytearray(self.db_path.read_bytes())
+        data[4096 * 3:4096 * 3 + 512] = os.urandom(512)
+        corrupted.write_bytes(bytes(data))
+        is_ok, message = quick_check(corrupted)
+        self.assertFalse(is_ok)
+        self.assertTrue(message)
+
+
+class StagedRestoreTest(BackupTestMixin, TestCase):
+    """운영 DB 옆에서 준비한 뒤 백업 API로 교체하는 무중단 복원 테스트"""
+
+    def make_backup(self, rows, page_size=8192):
+        backup_path = self.temp_dir / 'restore_me.sqlite3'
+        conn = sqlite3.connect(backup_path)
+        conn.execute(f'PRAGMA page_size={page_size}')
+        conn.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)')
+        conn.executemany('INSERT INTO items (value) VALUES (?)', [('restored',)] * rows)
+        conn.commit()
+        conn.close()
+        return backup_path
+
+    def test_restore_swaps_content_and_bumps_generation(self):
+        """다른 연결도 바로 복원된 내용을 보고, 세대 번호가 올라 신호가 발생"""
+        from .backup_utils import restore_backup
+        from .signals import GenerationWatcher, database_restored, read_generation
+
+        backup_path = self.make_backup(rows=3)
+        received = []
+        handler = lambda sender, generation, **kwargs: received.append(generation)
+        database_restored.connect(handler)
+        other_worker = GenerationWatcher()
+
+        with mock.patch('backup_management.backup_utils.get_database_path', return_value=self.db_path):
+            self.assertEqual(other_worker.refresh(), (0, False))
+            restore_backup(backup_path)
+            generation_after_restore = other_worker.refresh()
+        database_restored.disconnect(handler)
+
+        # 복원 전부터 열려 있던 연결
+        self.assertEqual(self.source_conn.execute('SELECT COUNT(*) FROM items').fetchone()[0], 3)
+        self.assertEqual(self.source_conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        self.assertEqual(self.source_conn.execute('PRAGMA page_size').fetchone()[0], 4096)
+        self.assertEqual(read_generation(self.temp_dir / 'source.sqlite3.generation'), 1)
+        self.assertEqual(received, [1])
+        self.assertEqual(generation_after_restore, (1, True))
+        self.assertFalse((self.temp_dir / 'source.sqlite3.restore_staging').exists())
+
+    def test_failed_preparation_leaves_live_database(self):
+        """준비 단계에서 실패하면 운영 DB와 세대 번호는 그대로"""
+        from .backup_utils import restore_backup
+
+        backup_path = self.make_backup(rows=3)
+        with mock.patch('backup_management.backup_utils.get_database_path', return_value=self.db_path), \
+                mock.patch('backup_management.backup_utils.quick_check', return_value=(False, 'broken')):
+            with self.assertRaises(ValueError):
+                restore_backup(backup_path)
+
+        self.assertEqual(self.source_conn.execute('SELECT COUNT(*) FROM items').fetchone()[0], 5001)
+        self.assertFalse((self.temp_dir / 'source.sqlite3.generation').exists())
+        self.assertFalse((self.temp_dir / 'source.sqlite3.restore_staging').exists())
+
+
+class SqliteTuningTest(TestCase):
+    """새 DB 연결마다 settings.SQLITE_PRAGMAS 적용"""
+
+    def test_pragmas_applied_on_new_connection(self):
+        from django.db import connections
+
+        pragmas = {'busy_timeout': 1234, 'cache_size': -4000, 'temp_store': 'memory', 'synchronous': 'normal'}
+        with override_settings(SQLITE_PRAGMAS=pragmas):
+            connection = connections.create_connection('default')
+            try:
+                with connection.cursor() as cursor:
+                    values = {}
+                    for name in pragmas:
+                        cursor.execute(f'PRAGMA {name}')
+                        values[name] = cursor.fetchone()[0]
+            finally:
+                connection.close()
+
+        self.assertEqual(values, {'busy_timeout': 1234, 'cache_size': -4000, 'temp_store': 2, 'synchronous': 1})
+
+    def test_rejects_unknown_pragmas(self):
+        from .sqlite_tuning import pragma_statements
+
+        self.assertEqual(pragma_statements({'journal_mode': 'wal', 'mmap_size': 0}), ['PRAGMA mmap_size=0'])
+        with self.assertRaises(ValueError):
+            pragma_statements({'writable_schema': 1})
+        with self.assertRaises(ValueError):
+            pragma_statements({'cache_size': '1; DROP TABLE users'})
+
+
+class ReadWriteRouterTest(TransactionTestCase):
+    """읽기 전용 연결 분리와 쓰기 후 읽기 고정"""
+
+    # TestCase는 테스트 전체를 트랜잭션으로 감싸 읽기도 항상 'default'로 가므로 사용하지 않음
+    databases = {'default', 'read'}
+
+    def setUp(self):
+        from backend.db_router import ReadWriteRouter, reset_sticky
+
+        reset_sticky()
+        self.addCleanup(reset_sticky)
+        self.router = ReadWriteRouter()
+        # 테스트 DB는 인메모리라 분리가 꺼져 있으므로 파일 DB처럼 동작하게 함
+        patcher = mock.patch('backend.db_router.read_split_enabled', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reads_stick_to_default_after_write(self):
+        self.assertEqual(self.router.db_for_read(BackupRecord), 'read')
+        self.assertEqual(self.router.db_for_write(BackupRecord), 'default')
+        self.assertEqual(self.router.db_for_read(BackupRecord), 'default')
+
+    def test_reads_inside_transaction_use_default(self):
+        from django.db import transaction
+
+        with transaction.atomic():
+            self.assertEqual(self.router.db_for_read(BackupRecord), 'default')
+
+    def test_middleware_resets_sticky_state(self):
+        from backend.db_router import ReadWriteRouterMiddleware, is_pinned
+
+        def view(request):
+            self.router.db_for_write(BackupRecord)
+            self.assertTrue(is_pinned())
+            return 'response'
+
+        self.router.db_for_write(BackupRecord)
+        self.assertEqual(ReadWriteRouterMiddleware(view)(None), 'response')
+        self.assertFalse(is_pinned())
+        self.assertEqual(self.router.db_for_read(BackupRecord), 'read')
+
+    def test_read_connection_rejects_writes(self):
+        from django.db import connections
+        from django.db.utils import OperationalError
+
+        connection = connections.create_connection('read')
+        try:
+            with self.assertRaises(OperationalError):
+                with connection.cursor() as cursor:
+                    cursor.execute('CREATE TABLE read_only_check (id INTEGER)')
+        finally:
+            connection.close()
+
+
+class PostgresSupportTest(TransactionTestCase):
+    """PostgreSQL 선택 지원 (pg_dump 백업, 전용 인덱스, SQLite 데이터 이전)"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+    def make_sqlite_source(self, *model_classes):
+        """최신 스키마로 모델 테이블을 만든 원본 SQLite 파일"""
+        from django.db import connections
+        from django.db.backends.sqlite3.base import DatabaseWrapper
+
+        path = self.temp_dir / 'source.sqlite3'
+        settings_dict = {
+            **connections['default'].settings_dict,
+            'ENGINE': 'django.db.backends.sqlite3', 'NAME': str(path), 'OPTIONS': {},
+        }
+        source = DatabaseWrapper(settings_dict, alias='sqlite_source')
+        try:
+            with source.schema_editor(atomic=False) as editor:
+                for model in model_classes:
+                    editor.create_model(model)
+        finally:
+            source.close()
+        return path
+
+    def test_pg_command_passes_credentials_in_environment(self):
+        from django.conf import settings
+        from .pg_backup import pg_command
+
+        database = {'ENGINE': 'django.db.backends.postgresql', 'NAME': 'qms', 'USER': 'qms',
+                    'PASSWORD': 'secret', 'HOST': 'db', 'PORT': 5433}
+        with mock.patch.dict(settings.DATABASES, {'pg': database}), override_settings(PG_BIN_DIR='/opt/pg/bin'):
+            command, env = pg_command('pg_dump', '--format=custom', using='pg')
+
+        self.assertEqual(command, ['/opt/pg/bin/pg_dump', '--format=custom'])
+        self.assertNotIn('secret', ' '.join(command))
+        self.assertEqual((env['PGPASSWORD'], env['PGHOST'], env['PGPORT']), ('secret', 'db', '5433'))
+
+    def test_restore_rejects_backup_of_other_engine(self):
+        from .backup_utils import restore_backup
+
+        dump_path = self.temp_dir / 'db_backup_20250101_000000.pgdump'
+        dump_path.write_bytes(b'PGDMP')
+        with self.assertRaises(ValueError):
+            restore_backup(str(dump_path))
+
+    @skipUnless(os.environ.get('DB_ENGINE', 'sqlite') == 'sqlite', 'SQLite 전용')
+    def test_postgres_operations_skipped_on_sqlite(self):
+        from django.db import connection
+
+        with connection.cursor() as cursor:
+            indexes = connection.introspection.get_constraints(cursor, 'performance_records')
+        self.assertNotIn('idx_perf_date_brin', indexes)
+        with self.assertRaises(CommandError):
+            call_command('sqlite_to_postgres', source=str(self.temp_dir / 'missing.sqlite3'))
+
+    @skipUnless(os.environ.get('DB_ENGINE') == 'postgresql', 'PostgreSQL 전용')
+    def test_postgres_indexes_created(self):
+        from django.db import connection
+
+        with connection.cursor() as cursor:
+            indexes = connection.introspection.get_constraints(cursor, 'performance_records')
+        self.assertEqual(indexes['idx_perf_date_brin']['type'], 'brin')
+        self.assertEqual(indexes['idx_perf_vendor_trgm']['type'], 'gin')
+
+    @skipUnless(os.environ.get('DB_ENGINE') == 'postgresql', 'PostgreSQL 전용')
+    def test_sqlite_to_postgres_copies_rows_and_resets_sequences(self):
+        from nonconformance.models import DefectType
+
+        source_path = self.make_sqlite_source(DefectType, BackupRecord)
+        conn = sqlite3.connect(source_path)
+        conn.execute("INSERT INTO defect_types (code, name) VALUES ('D1', '치수 불량')")
+        conn.executemany(
+            'INSERT INTO backup_records (id, backup_date, file_size, backup_type, file_path, checksum, '
+            "note, integrity_status, integrity_message) VALUES (?, '2025-01-01 00:00:00', 10, 'manual', ?, '', '', "
+            "'unchecked', '')",
+            [(1, 'a.sqlite3'), (7, 'b.sqlite3')],
+        )
+        conn.commit()
+        conn.close()
+
+        call_command(
+            'sqlite_to_postgres', source=str(source_path),
+            models=['nonconformance.DefectType', 'backup_management.BackupRecord'], stdout=open(os.devnull, 'w'),
+        )
+
+        self.assertEqual(DefectType.objects.get().name, '치수 불량')
+        self.assertEqual(BackupRecord.objects.count(), 2)
+        new_record = BackupRecord.objects.create(file_size=1, backup_type='manual', file_path='c.sqlite3')
+        self.assertEqual(new_record.pk, 8)
+
+    @skipUnless(
+        os.environ.get('DB_ENGINE') == 'postgresql' and shutil.which('pg_dump'), 'PostgreSQL 클라이언트 필요'
+    )
+    def test_pg_dump_backup_round_trip(self):
+        from .backup_utils import check_backup_integrity, restore_backup
+
+        BackupRecord.objects.create(file_size=1, backup_type='manual', file_path='before.sqlite3')
+        with override_settings(BACKUP_DIR=self.temp_dir):
+            backup_path, _, manifest = create_backup()
+            self.assertTrue(backup_path.endswith('.pgdump'))
+            self.assertEqual(manifest['format'], 'pg_dump')
+            self.assertEqual(check_backup_integrity(backup_path)[0], True)
+
+            BackupRecord.objects.all().delete()
+            restore_backup(backup_path)
+
+        self.assertTrue(BackupRecord.objects.filter(file_path='before.sqlite3').exists())
+
+    @skipUnless(os.environ.get('DB_ENGINE') == 'postgresql', 'PostgreSQL 전용')
+    def test_archive_requests_fall_back_to_live_table(self):
+        """PostgreSQL에서는 아카이브 파일이 남아 있어도 목록/내보내기가 운영 테이블만 조회"""
+        from datetime import date
+        from rest_framework.test import APIClient
+        from accounts.models import User
+        from performance.models import PerformanceRecord
+
+        user = User.objects.create(username='pg_archive', name='아카이브', role_level=1, status='active')
+        PerformanceRecord.objects.create(
+            type='inhouse', date=date(2018, 1, 1), vendor='ABC정밀', product_name='하우징',
+            control_no='C-1', quantity=10, producer='사내', created_by=user,
+        )
+        client = APIClient()
+        client.force_authenticate(user)
+
+        archive_dir = self.temp_dir / 'archive'
+        archive_dir.mkdir()
+        sqlite3.connect(archive_dir / 'archive_2018.sqlite3').close()
+        with override_settings(DATA_ARCHIVE_DIR=archive_dir):
+            self.assertEqual(archive_years(), [])
+            for params in ({'include_archive': 'true'}, {'archive_years': '2018'}):
+                response = client.get('/api/performance/list/', params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data['count'], 1)
+            response = client.get('/api/performance/export/', {'year': 2018, 'month': 1})
+            self.assertEqual(response.status_code, 200)
+
+    @skipUnless(
+        os.environ.get('DB_ENGINE') == 'postgresql' and shutil.which('pg_dump'), 'PostgreSQL 클라이언트 필요'
+    )
+    def test_pg_backup_records_from_view_and_weekly_job(self):
+        """pg_dump 매니페스트에는 original_size가 없어도 수동/자동 백업 이력이 저장됨"""
+        from accounts.models import User
+        from rest_framework.test import APIClient
+
+        user = User.objects.create(username='pg_backup', name='백업', role_level=1, status='active')
+        client = APIClient()
+        client.force_authenticate(user)
+
+        with override_settings(BACKUP_DIR=self.temp_dir), \
+                mock.patch('backup_management.views.start_integrity_check'), \
+                mock.patch('backup_management.backup_utils.start_integrity_check'):
+            response = client.post('/api/backup/download/')
+            self.assertEqual(response.status_code, 200)
+            scheduler.create_weekly_backup()
+
+        records = BackupRecord.objects.order_by('id')
+        self.assertEqual([record.backup_type for record in records], ['manual', 'auto'])
+        for record in records:
+            self.assertTrue(record.file_path.endswith('.pgdump'))
+            self.assertIsNone(record.original_size)
+
+
+class BackupCatalogTest(BackupTestMixin, TestCase):
+    """카탈로그 기반 백업 인벤토리 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.backup_dir = self.temp_dir / 'backups'
+        self.settings_override = override_settings(BACKUP_DIR=self.backup_dir)
+        self.settings_override.enable()
+        backup_catalog.reset()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        backup_catalog.reset()
+        super().tearDown()
+
+    def create_backup(self):
+        with mock.patch('backup_management.backup_utils.get_database_path', return_value=self.db_path):
+            backup_path, file_size, manifest = create_backup(backup_type='manual')
+        BackupRecord.objects.create(
+            file_size=file_size, backup_type='manual', file_path=backup_path, checksum=manifest['sha256']
+        )
+        return Path(backup_path), file_size
+
+    def test_stats_without_rescan_and_external_changes(self):
+        """디렉토리가 그대로면 스캔하지 않고, 외부 추가/삭제는 mtime 변경으로 반영"""
+        backup_path, file_size = self.create_backup()
+        stats = get_backup_stats()
+        self.assertEqual((stats['total_files'], stats['total_size']), (1, file_size))
+        self.assertTrue(stats['is_synced'])
+
+        with mock.patch('backup_management.catalog.iter_backup_files') as scan:
+            get_backup_stats()
+            get_backup_stats()
+        scan.assert_not_called()
+
+        # 카탈로그 밖에서 복사된 파일 → 레코드 없는 파일
+        shutil.copy(backup_path, self.backup_dir / 'db_backup_20200101_000000.sqlite3.gz')
+        stats = get_backup_stats()
+        self.assertEqual((stats['total_files'], stats['orphaned_files']), (2, 1))
+
+        # 외부에서 삭제된 파일 → 파일 없는 레코드, 동기화로 정리
+        backup_path.unlink()
+        stats = get_backup_stats()
+        self.assertEqual((stats['total_files'], stats['orphaned_records']), (1, 1))
+
+        sync_stats = sync_backup_records()
+        self.assertEqual(sync_stats['orphaned_records_deleted'], 1)
+        self.assertEqual(sync_stats['orphaned_files_registered'], 1)
+        self.assertTrue(get_backup_stats()['is_synced'])
+
+    def test_other_process_reads_appended_events(self):
+        """다른 프로세스의 인벤토리는 추가된 이벤트만 이어서 읽음"""
+        other = BackupCatalog()
+        self.assertEqual(other.totals(), (0, 0))
+
+        _, file_size = self.create_backup()
+        self.assertEqual(other.totals(), (1, file_size))
+
+        lines = (self.backup_dir / 'catalog.jsonl').read_text(encoding='utf-8').splitlines()
+        self.assertEqual(len(lines), 1)
+
+
+class SchedulerStartupTest(TestCase):
+    """스케줄러 리더 선출 및 앱 시작 시 부작용 없음 테스트"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.lock_path = self.temp_dir / 'scheduler.lock'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_app_ready_does_not_start_scheduler(self):
+        """앱 로드만으로는 스케줄러가 시작되지 않음"""
+        self.assertIsNone(scheduler.scheduler)
+
+    def test_only_one_lock_holder(self):
+        """잠금은 하나만 얻을 수 있고 해제 후 다른 인스턴스가 획득"""
+        leader = SchedulerLock(self.lock_path)
+        standby = SchedulerLock(self.lock_path)
+
+        self.assertTrue(leader.acquire())
+        self.assertFalse(standby.acquire())
+        self.assertEqual(standby.holder(), os.getpid())
+
+        leader.release()
+        self.assertTrue(standby.acquire())
+        standby.release()
+
+    def test_run_scheduler_no_wait_when_locked(self):
+        """--no-wait이면 다른 리더가 있을 때 바로 종료"""
+        leader = SchedulerLock(self.lock_path)
+        self.assertTrue(leader.acquire())
+        try:
+            with override_settings(SCHEDULER_LOCK_FILE=str(self.lock_path)), \
+                    mock.patch.object(scheduler, 'start') as start:
+                with self.assertRaises(CommandError):
+                    call_command('run_scheduler', '--no-wait', '--skip-sync')
+            start.assert_not_called()
+        finally:
+            leader.release()
+
+
+class DataArchiverTest(TransactionTestCase):
+    """보존 기간이 지난 데이터 내보내기 후 연도별 아카이브 DB로 이동 테스트 (ATTACH는 트랜잭션 밖에서만 가능)"""
+
+    def setUp(self):
+        from datetime import date, timedelta
+        from django.utils import timezone
+        from accounts.models import User
+        from performance.models import PerformanceRecord
+
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.user = user = User.objects.create(
+            username='archiver', name='아카이브', department='품질', position='대리',
+            phone_number='010-0000-0000', role_level=1, status='active',
+        )
+        for index in range(12):
+            PerformanceRecord.objects.create(
+                type='inhouse', date=date(2018, 1, 1), vendor='ABC정밀',
+                product_name='하우징', control_no=f'C-{index}', quantity=10 + index,
+                producer='사내', created_by=user,
+            )
+        PerformanceRecord.objects.filter(control_no__in=[f'C-{index}' for index in range(7)]).update(
+            created_at=timezone.now() - timedelta(days=8 * 365)
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_exports_then_deletes_in_batches(self):
+        """오래된 행만 CSV로 내보내고 배치 단위로 삭제"""
+        import csv
+        import gzip
+        from performance.models import PerformanceRecord
+        from audit.models import AuditLog
+
+        with override_settings(DATA_ARCHIVE_DIR=self.temp_dir / 'archive'):
+            stats = archive_old_data(batch_size=3, batch_sleep=0)
+
+        self.assertEqual(stats['errors'], [])
+        self.assertEqual(stats['performance_records'], 7)
+        archive = stats['archives']['performance_records']
+        self.assertEqual((archive['rows'], archive['batches']), (7, 3))
+        self.assertIsNone(stats['archives']['nonconformances']['file'])
+
+        with gzip.open(archive['file'], 'rt', encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(sorted(row['control_no'] for row in rows), sorted(f'C-{index}' for index in range(7)))
+        self.assertEqual(
+            sorted(PerformanceRecord.objects.values_list('control_no', flat=True)),
+            sorted(f'C-{index}' for index in range(7, 12)),
+        )
+        self.assertTrue(AuditLog.objects.filter(action='DELETE_OLD_DATA', target_id=7).exists())
+
+    def test_archived_rows_stay_queryable(self):
+        """아카이브 DB로 옮긴 행도 운영 DB 행과 함께 정렬/슬라이싱 조회"""
+        from performance.models import PerformanceRecord
+
+        with override_settings(DATA_ARCHIVE_DIR=self.temp_dir / 'archive'):
+            archive_old_data(batch_size=3, batch_sleep=0)
+            self.assertEqual(archive_years(), [2018])
+
+            records = ArchivedQuerySet(
+                PerformanceRecord.objects.select_related('created_by').order_by('-quantity')
+            )
+            self.assertEqual(records.count(), 12)
+            page = records[2:5]
+            self.assertEqual([record.quantity for record in page], [19, 18, 17])
+            self.assertEqual(page[0].created_by.name, '아카이브')
+            self.assertEqual(
+                ArchivedQuerySet(PerformanceRecord.objects.filter(control_no='C-3')).count(), 1
+            )
+
+    def test_archive_union_rewrites_only_outer_table(self):
+        """JOIN/서브쿼리/Exists가 있는 필터도 아카이브 행에 적용 (내부 쿼리는 운영 DB)"""
+        from django.db.models import Exists, OuterRef, Q, Subquery
+        from accounts.models import User
+        from performance.models import PerformanceRecord
+
+        with override_settings(DATA_ARCHIVE_DIR=self.temp_dir / 'archive'):
+            archive_old_data(batch_size=3, batch_sleep=0)
+
+            def count(queryset):
+                return ArchivedQuerySet(queryset).count()
+
+            # 내보내기 API 형태 (연/월 + select_related + 정렬)
+            export = ArchivedQuerySet(
+                PerformanceRecord.objects.filter(date__year=2018, date__month=1)
+                .select_related('created_by').order_by('date', 'created_at')
+            )
+            self.assertEqual(len(list(export)), 12)
+            # 목록 API 검색 형태 (OR 조건)
+            self.assertEqual(count(PerformanceRecord.objects.filter(
+                Q(vendor__icontains='ABC') | Q(control_no__icontains='C-1')
+            )), 12)
+            # 관계 모델 JOIN
+            self.assertEqual(count(PerformanceRecord.objects.filter(created_by__username='archiver')), 12)
+            # 관계 모델 Exists (OuterRef는 아카이브 행)
+            active_user = User.objects.filter(pk=OuterRef('created_by_id'), status='active')
+            self.assertEqual(count(PerformanceRecord.objects.filter(Exists(active_user))), 12)
+            # 같은 테이블 서브쿼리는 운영 DB만 대상
+            recent = PerformanceRecord.objects.filter(control_no__in=['C-2', 'C-9']).values('pk')
+            self.assertEqual(count(PerformanceRecord.objects.filter(pk__in=recent)), 1)
+            # SELECT 절의 같은 테이블 서브쿼리 (바깥 FROM보다 앞에 나옴)
+            first_of_vendor = PerformanceRecord.objects.filter(vendor=OuterRef('vendor')).order_by('pk')
+            annotated = ArchivedQuerySet(
+                PerformanceRecord.objects.annotate(first_id=Subquery(first_of_vendor.values('pk')[:1]))
+                .order_by('quantity')
+            )
+            rows = list(annotated)
+            self.assertEqual(len(rows), 12)
+            first_live_id = PerformanceRecord.objects.order_by('pk').values_list('pk', flat=True)[0]
+            self.assertEqual({row.first_id for row in rows}, {first_live_id})
+
+    def test_list_and_export_include_archive(self):
+        """목록 API는 include_archive 요청 시, 내보내기 API는 아카이브 연도이면 아카이브 DB 포함"""
+        from rest_framework.test import APIClient
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        with override_settings(DATA_ARCHIVE_DIR=self.temp_dir / 'archive'):
+            archive_old_data(batch_size=5, batch_sleep=0)
+
+            response = client.get('/api/performance/list/')
+            self.assertEqual(response.data['count'], 5)
+            response = client.get('/api/performance/list/', {'include_archive': 'true', 'ordering': 'quantity'})
+            self.assertEqual(response.data['count'], 12)
+            self.assertEqual(response.data['results'][0]['control_no'], 'C-0')
+
+            response = client.get('/api/performance/export/', {'year': 2018, 'month': 1})
+            self.assertEqual(response.status_code, 200)
+            lines = response.content.decode('utf-8-sig').strip().splitlines()
+            self.assertEqual(len(lines), 13)
+
+            # 운영 DB가 SQLite가 아니면 아카이브 파일이 있어도 운영 테이블만 조회
+            with mock.patch('backup_management.cold_storage.archives_supported', return_value=False):
+                self.assertEqual(archive_years(), [])
+                response = client.get('/api/performance/list/', {'include_archive': 'true'})
+                self.assertEqual(response.data['count'], 5)
@@ -0,0 +1,189 @@
+"""
+백업 파일 스트리밍 업로드
+
+Django 업로드 핸들러로 요청 본문을 읽는 대로 처리한다. 업로드 파일을 메모리나
+시스템 임시 파일에 먼저 받은 뒤 다시 복사/검증하지 않고, 청크마다 바로
+
+- 업로드 바이트의 SHA-256 계산
+- 압축 백업(.sqlite3.gz)은 스트리밍 해제
+- 첫 16바이트에서 SQLite 시그니처 확인 (아니면 즉시 중단)
+- 저장 크기가 MAX_BACKUP_SIZE를 넘으면 즉시 중단
+
+하면서 백업 디렉토리의 스테이징 파일(temp_upload_*)에 기록한다. 스테이징 파일은
+quick_check()를 통과한 뒤에만 복원에 사용한다.
+"""
+import hashlib
+import logging
+import os
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers, StopUpload
+
+from .backup_utils import ARCHIVE_SUFFIX, MAX_BACKUP_SIZE, STREAM_CHUNK_SIZE, get_backup_dir
+
+logger = logging.getLogger(__name__)
+
+SQLITE_HEADER = b'SQLite format 3\x00'
+
+# 압축되지 않는 데이터의 gzip 오버헤드와 multipart 경계 여유분
+UPLOAD_SIZE_SLACK = 1024 * 1024
+
+
+class StagedBackupUpload:
+    """업로드가 끝난 스테이징 파일 정보 (request.FILES에 들어감)"""
+
+    def __init__(self, name, path, size, sha256, upload_size, upload_sha256):
+        self.name = name                    # 업로드 파일 이름
+        self.path = Path(path)              # 스테이징된 SQLite 파일
+        self.size = size                    # 스테이징 파일 크기 (해제 후)
+        self.sha256 = sha256                # 스테이징 파일 SHA-256
+        self.upload_size = upload_size      # 전송된 바이트 수
+        self.upload_sha256 = upload_sha256  # 전송된 바이트 SHA-256
+
+
+class BackupUploadHandler(FileUploadHandler):
+    """
+    백업 업로드 필드('file')를 스트리밍으로 검증하며 저장하는 업로드 핸들러
+
+    검증에 실패하면 error에 사유를 남기고 StopUpload로 나머지 본문 처리를 중단한다.
+    Content-Length가 한도를 넘으면 본문을 읽지 않고 연결을 끊는다.
+    뷰에서 request.FILES를 읽기 전에 request.upload_handlers 맨 앞에 추가한다.
+    """
+
+    field_name = 'file'
+
+    def __init__(self, request=None, max_size=None):
+        super().__init__(request)
+        self.max_size = MAX_BACKUP_SIZE if max_size is None else max_size
+        self.error = None
+        self._too_large = False
+        self._active = False
+        self._dest = None
+        self._path = None
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # 여기서 예외를 던지면 파서가 처리하지 못하므로 new_file()에서 중단
+        if self.max_size and content_length and content_length > self.max_size + UPLOAD_SIZE_SLACK:
+            self._too_large = True
+        return None
+
+    def _reject(self, message, connection_reset=False):
+        self.error = message
+        self._discard()
+        raise StopUpload(connection_reset=connection_reset)
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        if self._too_large:
+            self._reject(f"파일 크기가 너무 큽니다 (최대 {self.max_size // (1024 * 1024)}MB).", connection_reset=True)
+        if field_name != self.field_name:
+            return
+
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+        name = Path(file_name or '').name
+        lowered = name.lower()
+        if not (lowered.endswith('.sqlite3') or lowered.endswith(ARCHIVE_SUFFIX)):
+            self._reject("SQLite3 파일(.sqlite3) 또는 압축 백업(.sqlite3.gz)만 업로드 가능합니다.")
+
+        self._active = True
+        self._decompressor = zlib.decompressobj(wbits=31) if lowered.endswith(ARCHIVE_SUFFIX) else None
+        self._upload_digest = hashlib.sha256()
+        self._digest = hashlib.sha256()
+        self._upload_size = 0
+        self._size = 0
+        self._header = b''
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        stem = name[:-3] if self._decompressor else name
+        self._path = Path(get_backup_dir()) / f"temp_upload_{timestamp}_{stem}"
+        self._dest = open(self._path, 'wb')
+        # 나머지 핸들러에는 이 파일을 넘기지 않음
+        raise StopFutureHandlers()
+
+    def _write(self, data):
+        """해제된(또는 원본) 데이터 기록: 시그니처와 크기 확인"""
+        if len(self._header) < len(SQLITE_HEADER):
+            self._header += data[:len(SQLITE_HEADER) - len(self._header)]
+            if not SQLITE_HEADER.startswith(self._header):
+                self._reject("유효한 SQLite3 파일이 아닙니다.")
+
+        self._size += len(data)
+        if self.max_size and self._size > self.max_size:
+            self._reject(f"파일 크기가 너무 큽니다 (최대 {self.max_size // (1024 * 1024)}MB).")
+
+        self._digest.update(data)
+        self._dest.write(data)
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self._active:
+            return raw_data
+
+        self._upload_digest.update(raw_data)
+        self._upload_size += len(raw_data)
+
+        if self._decompressor is None:
+            self._write(raw_data)
+            return None
+
+        if self._decompressor.eof:
+            return None
+        try:
+            # 압축 폭탄 대비: 한 번에 STREAM_CHUNK_SIZE까지만 해제
+            data = self._decompressor.decompress(raw_data, STREAM_CHUNK_SIZE)
+            while True:
+                if data:
+                    self._write(data)
+                if not self._decompressor.unconsumed_tail:
+                    break
+                data = self._decompressor.decompress(self._decompressor.unconsumed_tail, STREAM_CHUNK_SIZE)
+        except zlib.error as e:
+            self._reject(f"압축 파일을 해제할 수 없습니다: {str(e)}")
+        return None
+
+    def file_complete(self, file_size):
+        if not self._active:
+            return None
+        self._active = False
+
+        if self._decompressor is not None:
+            if not self._decompressor.eof:
+                self._reject("압축 파일을 해제할 수 없습니다: gzip 데이터가 완전하지 않습니다.")
+            tail = self._decompressor.flush()
+            if tail:
+                self._write(tail)
+        if len(self._header) < len(SQLITE_HEADER):
+            self._reject("유효한 SQLite3 파일이 아닙니다.")
+
+        self._dest.flush()
+        os.fsync(self._dest.fileno())
+        self._dest.close()
+        self._dest = None
+        path, self._path = self._path, None
+
+        return StagedBackupUpload(
+            name=Path(self.file_name or '').name,
+            path=path,
+            size=self._size,
+            sha256=self._digest.hexdigest(),
+            upload_size=self._upload_size,
+            upload_sha256=self._upload_digest.hexdigest(),
+        )
+
+    def _discard(self):
+        """작성 중인 스테이징 파일 삭제"""
+        self._active = False
+        if self._dest is not None:
+            self._dest.close()
+            self._dest = None
+        if self._path is not None:
+            self._path.unlink(missing_ok=True)
+            self._path = None
+
+    def upload_interrupted(self):
+        self._discard()
+
+    def upload_complete(self):
+        if self.error:
+            logger.warning(f"백업 업로드 거부: {self.error}")
+        return None
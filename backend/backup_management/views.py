@@ -8,18 +8,25 @@ from rest_framework import status, generics
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.http import FileResponse, HttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from django.conf import settings
 from .models import BackupRecord
 from .serializers import BackupRecordSerializer
 from .backup_utils import (
     create_backup, 
     restore_backup, 
-    validate_backup_file,
-    get_backup_dir
+    quick_check,
+    start_integrity_check,
+    is_archive,
+    get_manifest_path,
+    iter_file_chunks,
+    iter_decompressed,
 )
+from .pg_backup import is_pg_dump, is_postgres
+from .upload import BackupUploadHandler
 from .data_archiver import get_archivable_data_count
 from .sync_utils import sync_backup_records, cleanup_orphaned_files, get_backup_stats
+from .catalog import backup_catalog
 from audit.models import AuditLog
 
 logger = logging.getLogger(__name__)
@@ -40,6 +47,36 @@ def check_practitioner_permission(user):
     return hasattr(user, 'role_level') and user.role_level >= 1
 
 
+def backup_file_response(file_path, file_size, raw=False):
+    """
+    백업 파일 다운로드 응답 (청크 단위 스트리밍)
+    
+    압축 백업은 그대로 내려보내고, raw=True이면 압축을 풀면서 .sqlite3로 내려보낸다.
+    """
+    file_path = Path(file_path)
+    
+    if is_archive(file_path) and raw:
+        filename = file_path.name[:-3]
+        response = StreamingHttpResponse(
+            iter_decompressed(iter_file_chunks(file_path)),
+            content_type='application/x-sqlite3'
+        )
+    else:
+        filename = file_path.name
+        response = FileResponse(
+            open(file_path, 'rb'),
+            content_type=(
+                'application/gzip' if is_archive(file_path)
+                else 'application/octet-stream' if is_pg_dump(file_path)
+                else 'application/x-sqlite3'
+            )
+        )
+        response['Content-Length'] = file_size
+    
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def download_backup(request):
@@ -56,7 +93,7 @@ def download_backup(request):
     
     try:
         # 백업 파일 생성
-        backup_path, file_size = create_backup(
+        backup_path, file_size, manifest = create_backup(
             backup_type='manual', 
             created_by=request.user
         )
@@ -66,9 +103,13 @@ def download_backup(request):
             file_size=file_size,
             backup_type='manual',
             file_path=backup_path,
+            checksum=manifest['sha256'],
+            original_size=manifest.get('original_size'),
             created_by=request.user,
-            note='수동 백업'
+            note='수동 백업',
+            integrity_status='pending'
         )
+        start_integrity_check(backup_record)
         
         # 감사 로그 기록
         AuditLog.log_action(
@@ -80,12 +121,7 @@ def download_backup(request):
         )
         
         # 파일 다운로드
-        response = FileResponse(
-            open(backup_path, 'rb'),
-            content_type='application/x-sqlite3'
-        )
-        response['Content-Disposition'] = f'attachment; filename="{os.path.basename(backup_path)}"'
-        response['Content-Length'] = file_size
+        response = backup_file_response(backup_path, file_size)
         
         logger.info(f"백업 파일 다운로드 완료: {backup_path} (사용자: {request.user.username})")
         
@@ -105,6 +141,9 @@ def download_backup_file(request, backup_id):
     """
     기존 백업 파일 다운로드
     권한: 실무자 이상 (role_level >= 1)
+    
+    Query Parameters:
+        format (str): archive(기본값, 압축 파일 그대로) 또는 sqlite3(압축 해제하며 전송)
     """
     # 권한 체크
     if not check_practitioner_permission(request.user):
@@ -137,12 +176,11 @@ def download_backup_file(request, backup_id):
         )
         
         # 파일 다운로드
-        response = FileResponse(
-            open(file_path, 'rb'),
-            content_type='application/x-sqlite3'
+        response = backup_file_response(
+            file_path,
+            backup_record.file_size,
+            raw=request.GET.get('format') == 'sqlite3'
         )
-        response['Content-Disposition'] = f'attachment; filename="{file_path.name}"'
-        response['Content-Length'] = backup_record.file_size
         
         logger.info(f"기존 백업 파일 다운로드: {file_path.name} (사용자: {request.user.username})")
         
@@ -168,6 +206,15 @@ def upload_backup(request):
     백업 파일 업로드 및 복원
     권한: 실무자 이상 (role_level >= 1)
     
+    .sqlite3 파일 또는 압축 백업(.sqlite3.gz)을 받는다. BackupUploadHandler가 요청
+    본문을 읽는 대로 해시/크기/시그니처를 검사하며 스테이징 파일에 기록하고
+    (압축 파일은 스트리밍 해제), 잘못된 파일은 전송 도중 바로 거부한다.
+    스테이징 파일은 작업 스레드의 PRAGMA quick_check를 통과해야 복원한다.
+    
+    선택 파라미터 checksum: 전송한 파일의 SHA-256 (주면 비교)
+    
+    PostgreSQL 운영 DB에서는 지원하지 않는다 (본문을 읽기 전에 400).
+    
     ⚠️ 경고: 이 작업은 현재 데이터베이스를 완전히 대체합니다!
     """
     # 권한 체크
@@ -177,35 +224,54 @@ def upload_backup(request):
             status=status.HTTP_403_FORBIDDEN
         )
     
-    # 파일 업로드 확인
-    if 'file' not in request.FILES:
+    # 업로드 복원은 SQLite 백업 전용 (PostgreSQL은 .pgdump를 pg_restore로 복원)
+    if is_postgres():
+        return Response(
+            {'error': 'PostgreSQL 데이터베이스에서는 백업 파일 업로드 복원을 지원하지 않습니다. '
+                      '서버에서 pg_restore로 복원하세요.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    # 본문을 읽기 전에 스트리밍 업로드 핸들러 등록
+    upload_handler = BackupUploadHandler(request)
+    request.upload_handlers.insert(0, upload_handler)
+    
+    # request.FILES를 읽는 동안 업로드 검증 (실패 시 error에 사유)
+    has_file = 'file' in request.FILES
+    if upload_handler.error:
+        return Response(
+            {'error': upload_handler.error},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if not has_file:
         return Response(
             {'error': '업로드할 파일이 없습니다.'},
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    uploaded_file = request.FILES['file']
+    staged = request.FILES['file']
+    temp_path = staged.path
     
     try:
-        # 임시 파일 저장
-        backup_dir = get_backup_dir()
-        temp_path = Path(backup_dir) / f"temp_upload_{uploaded_file.name}"
-        
-        with open(temp_path, 'wb+') as destination:
-            for chunk in uploaded_file.chunks():
-                destination.write(chunk)
+        # 체크섬 확인 (클라이언트가 보낸 경우)
+        expected_sha256 = (request.data.get('checksum') or '').strip().lower()
+        if expected_sha256 and expected_sha256 != staged.upload_sha256:
+            temp_path.unlink(missing_ok=True)
+            return Response(
+                {'error': f'체크섬이 일치하지 않습니다 (기대값 {expected_sha256[:12]}…, 실제 {staged.upload_sha256[:12]}…).'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # 파일 유효성 검증
-        is_valid, error_message = validate_backup_file(temp_path)
-        if not is_valid:
-            temp_path.unlink()  # 임시 파일 삭제
+        # 구조 검사 (작업 스레드, 통과해야 복원 가능)
+        is_ok, message = quick_check(temp_path)
+        if not is_ok:
+            temp_path.unlink(missing_ok=True)
             return Response(
-                {'error': error_message},
+                {'error': f'백업 파일 검사 실패: {message}'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # 파일 크기 기록 (복원 전에)
-        file_size = temp_path.stat().st_size
+        file_size = staged.size
         
         # 백업 이력 저장 (복원 전에 - 복원 후에는 DB가 교체되므로)
         # 먼저 백업 레코드 생성
@@ -213,6 +279,8 @@ def upload_backup(request):
             file_size=file_size,
             backup_type='manual',
             file_path=str(temp_path),
+            checksum=staged.sha256,
+            original_size=file_size,
             created_by=request.user,
             note='수동 복원'
         )
@@ -222,7 +290,10 @@ def upload_backup(request):
             user=request.user,
             action='UPLOAD_BACKUP',
             target_id=backup_record.id,
-            details=f'백업 파일 업로드 및 복원: {uploaded_file.name} ({file_size} bytes)',
+            details=(
+                f'백업 파일 업로드 및 복원: {staged.name} '
+                f'({staged.upload_size} bytes 전송, {file_size} bytes, sha256 {staged.sha256[:12]})'
+            ),
             ip_address=get_client_ip(request)
         )
         
@@ -233,8 +304,9 @@ def upload_backup(request):
         
         return Response({
             'message': '백업 복원이 완료되었습니다.',
-            'file_name': uploaded_file.name,
-            'file_size': file_size
+            'file_name': staged.name,
+            'file_size': file_size,
+            'checksum': staged.upload_sha256
         })
     
     except Exception as e:
@@ -315,10 +387,12 @@ def delete_backup(request, backup_id):
         # 파일 경로
         file_path = Path(backup_record.file_path)
         
-        # 파일 삭제
+        # 파일 삭제 (매니페스트 포함)
         if file_path.exists():
             file_path.unlink()
             logger.info(f"백업 파일 삭제: {file_path} (사용자: {request.user.username})")
+        get_manifest_path(file_path).unlink(missing_ok=True)
+        backup_catalog.record_removed(file_path)
         
         # 레코드 삭제
         backup_record.delete()
@@ -0,0 +1,10 @@
+"""
+성능 측정 스크립트 모음
+
+backend 디렉토리에서 `python -m benchmarks.<모듈>` 형식으로 실행한다.
+
+- micro: 직렬화/대시보드 집계/CSV/백업 동기화 마이크로 벤치마크 (결과 JSON 저장, 비교)
+- load: 로컬 Uvicorn 대상 엔드투엔드 부하 테스트 (엔드포인트별 p50/p95/p99)
+- db_latency: SQLite 연결 설정별 요청 지연 시간
+- startup: Django 시작 시간
+"""
@@ -0,0 +1,120 @@
+"""
+SQLite 연결 설정별 요청 지연 시간 측정
+
+프로필마다 새 프로세스에서 Django를 띄워 같은 API 요청을 반복하고 지연 시간을
+비교한다. Uvicorn(ASGI)처럼 요청마다 새 스레드에서 처리하므로(연결도 매번 새로 생성)
+연결별 PRAGMA와 지속 연결 설정의 효과가 그대로 드러난다.
+
+    cd backend
+    DATABASE_NAME=/tmp/bench.sqlite3 uv run python -m benchmarks.db_latency --requests 50
+
+프로필:
+- baseline: PRAGMA 미적용 (SQLITE_TUNING=False), CONN_MAX_AGE=0
+- tuned: settings.SQLITE_PRAGMAS 적용, CONN_MAX_AGE=0
+- tuned_persistent: tuned + CONN_MAX_AGE=60, 같은 스레드에서 요청 (WSGI/스케줄러 프로세스)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+PROFILES = {
+    'baseline': {'SQLITE_TUNING': 'False', 'DB_CONN_MAX_AGE': '0'},
+    'tuned': {'SQLITE_TUNING': 'True', 'DB_CONN_MAX_AGE': '0'},
+    'tuned_persistent': {'SQLITE_TUNING': 'True', 'DB_CONN_MAX_AGE': '60', 'SAME_THREAD': '1'},
+}
+
+# 측정할 API (인증은 force_authenticate)
+PATHS = [
+    '/api/dashboard/kpis/',
+    '/api/performance/list/?ordering=-date',
+    '/api/nonconformance/?ordering=-occurrence_date',
+    '/api/dashboard/charts/pareto/',
+]
+
+# 자식 프로세스: 경로별 지연 시간(초) 목록을 JSON으로 출력
+CHILD_CODE = r'''
+import json, os, sys, threading, time
+import django
+django.setup()
+from rest_framework.test import APIClient
+from accounts.models import User
+
+paths, requests = json.loads(sys.argv[1]), int(sys.argv[2])
+same_thread = os.environ.get('SAME_THREAD') == '1'
+client = APIClient(HTTP_HOST='localhost')
+client.force_authenticate(User.objects.filter(status='active').order_by('-role_level').first())
+results = {}
+
+def run(path, timings):
+    started = time.perf_counter()
+    response = client.get(path)
+    timings.append(time.perf_counter() - started)
+    assert response.status_code == 200, (path, response.status_code)
+
+for path in paths:
+    timings = []
+    run(path, [])  # 워밍업
+    for _ in range(requests):
+        if same_thread:
+            run(path, timings)
+        else:
+            thread = threading.Thread(target=run, args=(path, timings))
+            thread.start()
+            thread.join()
+    results[path] = timings
+print(json.dumps(results))
+'''
+
+
+def measure(profile, requests):
+    env = {
+        **os.environ,
+        **PROFILES[profile],
+        'DJANGO_SETTINGS_MODULE': 'backend.settings',
+        'PYTHONWARNINGS': 'ignore',
+    }
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_CODE, json.dumps(PATHS), str(requests)],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite 연결 설정별 요청 지연 시간 측정')
+    parser.add_argument('--requests', type=int, default=50, help='경로별 요청 수 (기본값: 50)')
+    parser.add_argument('--profiles', default=','.join(PROFILES), help='측정할 프로필 (쉼표 구분)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    results = {}
+    for profile in args.profiles.split(','):
+        for path, timings in measure(profile, args.requests).items():
+            results.setdefault(path, {})[profile] = {
+                'median_ms': round(statistics.median(timings) * 1000, 2),
+                'p95_ms': round(percentile(timings, 0.95) * 1000, 2),
+            }
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    for path, profiles in results.items():
+        print(path)
+        for profile, result in profiles.items():
+            print(f"  {profile:<18}중앙값 {result['median_ms']:>9}ms   p95 {result['p95_ms']:>9}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+"""
+엔드투엔드 부하 테스트
+
+요청 묶음 파일(JSONL)의 API를 가중치대로 골라 여러 가상 사용자가 동시에 보내고
+엔드포인트별 응답 시간 p50/p95/p99를 출력한다. --url을 주지 않으면 빈 포트에
+Uvicorn을 직접 띄워 측정하고 끝나면 종료한다 (DATABASE_NAME 등 환경 변수는 그대로 전달).
+
+가상 사용자는 각자 keep-alive 연결 하나로 응답을 받자마자 다음 요청을 보낸다
+(대기 시간 없는 닫힌 루프). 같은 --seed면 사용자별 요청 순서가 같다.
+측정 프로세스도 CPU를 쓰므로 서버와 같은 머신에서는 코어 여유를 두고 비교한다.
+
+    cd backend
+    DATABASE_NAME=/tmp/bench.sqlite3 uv run python manage.py generate_sample_data --years 10 --records-per-day 4000
+    DATABASE_NAME=/tmp/bench.sqlite3 uv run python -m benchmarks.load --duration 60 --concurrency 16 --workers 4
+
+요청 묶음 파일 형식 (한 줄에 하나, method 기본값 GET, weight 기본값 1):
+
+    {"name": "dashboard_kpis", "path": "/api/dashboard/kpis/", "weight": 10}
+    {"name": "nc_create", "method": "POST", "path": "/api/nonconformance/create/", "body": {...}}
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from .db_latency import percentile
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_MIX = Path(__file__).resolve().parent / 'request_mix.jsonl'
+
+
+def load_mix(path):
+    """요청 묶음 파일 → [{name, method, path, body, weight}, ...]"""
+    entries = []
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            entry = json.loads(line)
+            if 'path' not in entry:
+                raise ValueError(f"{path}:{line_no}: path가 없습니다.")
+            entries.append({
+                'name': entry.get('name') or entry['path'],
+                'method': entry.get('method', 'GET').upper(),
+                'path': entry['path'],
+                'body': entry.get('body'),
+                'weight': float(entry.get('weight', 1)),
+            })
+    if not entries:
+        raise ValueError(f"{path}: 요청이 없습니다.")
+    return entries
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, workers):
+    """Uvicorn 실행 후 포트가 열릴 때까지 대기"""
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': 'backend.settings', 'PYTHONWARNINGS': 'ignore'}
+    server = subprocess.Popen(
+        [
+            sys.executable, '-m', 'uvicorn', 'backend.asgi:application',
+            '--host', '127.0.0.1', '--port', str(port), '--workers', str(workers),
+            '--log-level', 'warning', '--no-access-log',
+        ],
+        cwd=BACKEND_DIR, env=env,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Uvicorn이 종료되었습니다 (코드 {server.returncode})")
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError('Uvicorn이 60초 안에 시작되지 않았습니다.')
+
+
+def login(url, username, password):
+    """JWT 액세스 토큰 발급"""
+    parts = urlsplit(url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+    try:
+        conn.request(
+            'POST', '/api/login/', body=json.dumps({'username': username, 'password': password}),
+            headers={'Content-Type': 'application/json'},
+        )
+        response = conn.getresponse()
+        data = json.loads(response.read() or b'{}')
+    finally:
+        conn.close()
+    if response.status != 200 or 'token' not in data:
+        raise RuntimeError(f"로그인 실패 ({response.status}): {data}")
+    return data['token']
+
+
+class VirtualUser(threading.Thread):
+    """keep-alive 연결 하나로 요청을 연속해서 보내는 가상 사용자"""
+
+    def __init__(self, url, token, mix, seed, deadline, warmup_until, timeout):
+        super().__init__(daemon=True)
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
+        self.mix = mix
+        self.weights = [entry['weight'] for entry in mix]
+        self.rng = random.Random(seed)
+        self.deadline = deadline
+        self.warmup_until = warmup_until
+        self.timeout = timeout
+        # (이름, 상태 코드 또는 None, 응답 시간(초))
+        self.samples = []
+
+    def run(self):
+        conn = None
+        while time.monotonic() < self.deadline:
+            entry = self.rng.choices(self.mix, weights=self.weights)[0]
+            if conn is None:
+                conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            body = json.dumps(entry['body']) if entry['body'] is not None else None
+            started = time.monotonic()
+            try:
+                conn.request(entry['method'], entry['path'], body=body, headers=self.headers)
+                response = conn.getresponse()
+                response.read()
+                status = response.status
+                if response.will_close:
+                    conn.close()
+                    conn = None
+            except (OSError, http.client.HTTPException):
+                status = None
+                conn.close()
+                conn = None
+            if started >= self.warmup_until:
+                self.samples.append((entry['name'], status, time.monotonic() - started))
+        if conn is not None:
+            conn.close()
+
+
+def summarize(samples, duration):
+    """이름별 요청 수/오류 수/처리량/응답 시간 분포 (밀리초)"""
+    groups = {}
+    for name, status, elapsed in samples:
+        groups.setdefault(name, []).append((status, elapsed))
+
+    def stats(items):
+        timings = [elapsed * 1000 for _, elapsed in items]
+        return {
+            'requests': len(items),
+            'errors': sum(1 for status, _ in items if status is None or status >= 400),
+            'rps': round(len(items) / duration, 2),
+            'mean_ms': round(statistics.fmean(timings), 2),
+            'p50_ms': round(percentile(timings, 0.50), 2),
+            'p95_ms': round(percentile(timings, 0.95), 2),
+            'p99_ms': round(percentile(timings, 0.99), 2),
+            'max_ms': round(max(timings), 2),
+        }
+
+    endpoints = {name: stats(items) for name, items in sorted(groups.items())}
+    total = stats([(status, elapsed) for _, status, elapsed in samples]) if samples else None
+    return endpoints, total
+
+
+def run_load(url, token, mix, concurrency, duration, warmup, seed, timeout):
+    started = time.monotonic()
+    warmup_until = started + warmup
+    deadline = warmup_until + duration
+    users = [
+        VirtualUser(url, token, mix, seed + index, deadline, warmup_until, timeout)
+        for index in range(concurrency)
+    ]
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+    return [sample for user in users for sample in user.samples]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='엔드투엔드 부하 테스트 (엔드포인트별 p50/p95/p99)')
+    parser.add_argument('--mix', type=Path, default=DEFAULT_MIX, help='요청 묶음 JSONL 파일 (기본값: benchmarks/request_mix.jsonl)')
+    parser.add_argument('--url', help='측정할 서버 주소 (예: http://127.0.0.1:8000, 없으면 Uvicorn 직접 실행)')
+    parser.add_argument('--workers', type=int, default=1, help='직접 실행하는 Uvicorn 워커 수 (기본값: 1)')
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 가상 사용자 수 (기본값: 8)')
+    parser.add_argument('--duration', type=float, default=30, help='측정 시간(초, 기본값: 30)')
+    parser.add_argument('--warmup', type=float, default=5, help='측정 전 워밍업 시간(초, 기본값: 5)')
+    parser.add_argument('--timeout', type=float, default=60, help='요청 타임아웃(초, 기본값: 60)')
+    parser.add_argument('--seed', type=int, default=42, help='요청 순서 난수 시드 (기본값: 42)')
+    parser.add_argument('--username', default='admin', help='로그인 아이디 (기본값: admin)')
+    parser.add_argument('--password', default='admin1234', help='로그인 비밀번호 (기본값: admin1234)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    mix = load_mix(args.mix)
+    server = None
+    url = args.url
+    if not url:
+        port = free_port()
+        server = start_server(port, args.workers)
+        url = f'http://127.0.0.1:{port}'
+
+    try:
+        token = login(url, args.username, args.password)
+        samples = run_load(url, token, mix, args.concurrency, args.duration, args.warmup, args.seed, args.timeout)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    endpoints, total = summarize(samples, args.duration)
+    result = {
+        'url': url,
+        'workers': None if args.url else args.workers,
+        'concurrency': args.concurrency,
+        'duration_s': args.duration,
+        'seed': args.seed,
+        'total': total,
+        'endpoints': endpoints,
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+
+    print(f"{'엔드포인트':<34}{'요청':>7}{'오류':>6}{'req/s':>9}{'p50':>10}{'p95':>10}{'p99':>10}")
+    rows = list(endpoints.items()) + ([('전체', total)] if total else [])
+    for name, stats in rows:
+        print(
+            f"{name:<34}{stats['requests']:>7}{stats['errors']:>6}{stats['rps']:>9}"
+            f"{stats['p50_ms']:>8}ms{stats['p95_ms']:>8}ms{stats['p99_ms']:>8}ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
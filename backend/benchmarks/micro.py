@@ -0,0 +1,456 @@
+"""
+마이크로 벤치마크 (목록 직렬화, 대시보드 집계, CSV 가져오기/내보내기, 백업 동기화)
+
+새 SQLite DB에 generate_sample_data(시드 고정, 종료일 고정)로 항상 같은 데이터셋을
+만든 뒤 대상 함수마다 워밍업 1회 후 --repeat회 실행 시간을 잰다. 결과는
+benchmarks/results/<시각>-<커밋>.json으로 저장하고 --compare로 이전 결과와 비교한다.
+측정값은 머신마다 다르므로 같은 머신에서 만든 결과끼리만 비교한다.
+
+    cd backend
+    uv run python -m benchmarks.micro
+    uv run python -m benchmarks.micro --filter serializer --repeat 10
+    uv run python -m benchmarks.micro --compare benchmarks/results/20251015-101500-abc1234.json
+
+데이터셋 생성(약 20초)을 건너뛰려면 --db로 DB 파일을 지정한다 (없으면 만들고, 있으면 재사용).
+"""
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+# 고정 데이터셋: 2년, 평일 하루 실적 약 320건 → 실적 약 18만 건, 부적합 약 1만 건 (목록 직렬화 1만 행)
+DATASET = {
+    'years': 2,
+    'records_per_day': 320,
+    'users': 20,
+    'seed': 42,
+    'end_date': '2025-06-30',
+}
+
+# 대시보드 기준 연월 (데이터셋 마지막 달)
+YEAR, MONTH = 2025, 6
+
+# 목록 직렬화 행 수
+SERIALIZER_ROWS = 10000
+
+# CSV 가져오기 행 수 (업로드 API 상한)
+IMPORT_ROWS = 1000
+
+# 백업 동기화: 백업 디렉토리의 파일 수
+BACKUP_FILES = 300
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    벤치마크 등록
+
+    등록 함수는 준비 작업(측정 제외)을 한 뒤 측정할 함수를 반환한다.
+    """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def admin_request(method, path, data=None, **kwargs):
+    from rest_framework.test import APIRequestFactory, force_authenticate
+    from accounts.models import User
+
+    request = getattr(APIRequestFactory(), method)(path, data, **kwargs)
+    force_authenticate(request, User.objects.get(username='admin'))
+    return request
+
+
+def analysis_filters(date_from=date(YEAR, 1, 1), date_to=date(YEAR, MONTH, 30)):
+    return {'date_from': date_from, 'date_to': date_to, 'type': None, 'vendor': None, 'product_name': None}
+
+
+# ---------------------------------------------------------------------------
+# 목록 직렬화 (쿼리는 측정 제외, 직렬화만 측정)
+# ---------------------------------------------------------------------------
+
+@benchmark('serializer.performance_list')
+def bench_performance_serializer():
+    from performance.models import PerformanceRecord
+    from performance.serializers import PerformanceListSerializer
+
+    rows = list(PerformanceRecord.objects.select_related('created_by').order_by('id')[:SERIALIZER_ROWS])
+    return lambda: PerformanceListSerializer(rows, many=True).data
+
+
+@benchmark('serializer.nonconformance_list')
+def bench_nonconformance_serializer():
+    from nonconformance.models import Nonconformance
+    from nonconformance.serializers import NonconformanceListSerializer
+
+    rows = list(
+        Nonconformance.objects.select_related('created_by', 'defect_type_code', 'cause_code')
+        .order_by('id')[:SERIALIZER_ROWS]
+    )
+    return lambda: NonconformanceListSerializer(rows, many=True).data
+
+
+@benchmark('serializer.complaint_list')
+def bench_complaint_serializer():
+    from customer_complaints.models import CustomerComplaint
+    from customer_complaints.serializers import CustomerComplaintListSerializer
+
+    rows = list(
+        CustomerComplaint.objects.select_related('created_by', 'defect_type_code', 'cause_code')
+        .order_by('id')[:SERIALIZER_ROWS]
+    )
+    return lambda: CustomerComplaintListSerializer(rows, many=True).data
+
+
+def bench_values_serializer(values_serializer, queryset):
+    rows = list(values_serializer.project(queryset.order_by('id'))[:SERIALIZER_ROWS])
+    return lambda: values_serializer.to_representation(rows)
+
+
+@benchmark('serializer.performance_list_values')
+def bench_performance_values():
+    from performance.models import PerformanceRecord
+    from performance.serializers import PerformanceListValues
+
+    return bench_values_serializer(PerformanceListValues, PerformanceRecord.objects.all())
+
+
+@benchmark('serializer.nonconformance_list_values')
+def bench_nonconformance_values():
+    from nonconformance.models import Nonconformance
+    from nonconformance.serializers import NonconformanceListValues
+
+    return bench_values_serializer(NonconformanceListValues, Nonconformance.objects.all())
+
+
+@benchmark('serializer.complaint_list_values')
+def bench_complaint_values():
+    from customer_complaints.models import CustomerComplaint
+    from customer_complaints.serializers import CustomerComplaintListValues
+
+    return bench_values_serializer(CustomerComplaintListValues, CustomerComplaint.objects.all())
+
+
+# ---------------------------------------------------------------------------
+# 대시보드 집계
+# ---------------------------------------------------------------------------
+
+@benchmark('dashboard.kpis')
+def bench_dashboard_kpis():
+    from dashboard.views import dashboard_kpis
+
+    return lambda: dashboard_kpis(admin_request('get', '/api/dashboard/kpis/', {'year': YEAR, 'month': MONTH})).render()
+
+
+@benchmark('dashboard.monthly_trend')
+def bench_monthly_trend():
+    from dashboard.chart_views import _monthly_trend
+
+    return lambda: _monthly_trend('defect_rate', YEAR, MONTH)
+
+
+@benchmark('dashboard.pareto_rows')
+def bench_pareto_rows():
+    from dashboard.aggregations import pareto_rows
+    from dashboard.filters import apply_analysis_filters
+    from nonconformance.models import Nonconformance
+
+    filters = analysis_filters()
+    return lambda: pareto_rows(apply_analysis_filters(Nonconformance.objects.all(), filters), 'defect_type', 'amount')
+
+
+@benchmark('dashboard.league_rows')
+def bench_league_rows():
+    from dashboard.aggregations import league_rows
+
+    filters = analysis_filters()
+    return lambda: league_rows(filters, 'vendor', 'ppm')
+
+
+@benchmark('dashboard.time_series')
+def bench_time_series():
+    from dashboard.aggregations import time_series
+
+    filters = analysis_filters(date_from=date(YEAR - 1, 7, 1))
+    return lambda: time_series(filters, 'defect_rate', 'week')
+
+
+@benchmark('dashboard.spc_chart')
+def bench_spc_chart():
+    from dashboard.aggregations import spc_series
+    from dashboard.spc import spc_chart
+
+    filters = analysis_filters()
+    return lambda: spc_chart(*spc_series(filters, 'p', 'day')[:3], chart='p')
+
+
+# ---------------------------------------------------------------------------
+# CSV 내보내기/가져오기
+# ---------------------------------------------------------------------------
+
+def consume(response):
+    """스트리밍 응답 본문을 끝까지 생성"""
+    if getattr(response, 'streaming', False):
+        return sum(len(chunk) for chunk in response.streaming_content)
+    return len(response.content)
+
+
+@benchmark('csv.performance_export')
+def bench_performance_export():
+    from performance.views import performance_csv_export
+
+    return lambda: consume(performance_csv_export(
+        admin_request('get', '/api/performance/export/', {'year': YEAR, 'month': MONTH})
+    ))
+
+
+@benchmark('csv.nonconformance_export')
+def bench_nonconformance_export():
+    from nonconformance.views import nonconformance_csv_export
+
+    return lambda: consume(nonconformance_csv_export(
+        admin_request('get', '/api/nonconformance/export/', {'year': YEAR, 'month': MONTH})
+    ))
+
+
+@benchmark('csv.complaint_export')
+def bench_complaint_export():
+    from customer_complaints.views import customer_complaint_csv_export
+
+    return lambda: consume(customer_complaint_csv_export(
+        admin_request('get', '/api/customer-complaints/export/', {'year': YEAR, 'month': MONTH})
+    ))
+
+
+@benchmark('csv.performance_import')
+def bench_performance_import():
+    """1000행 CSV 전체 등록 (매번 롤백하여 데이터셋 유지)"""
+    import csv
+    import random
+
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from django.db import transaction
+    from performance.management.commands.generate_sample_data import (
+        PRODUCER_NAMES, PRODUCT_NAMES, VENDOR_NAMES,
+    )
+    from performance.views import performance_csv_upload
+
+    rng = random.Random(DATASET['seed'])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['type', 'date', 'vendor', 'product_name', 'control_no', 'quantity', 'producer'])
+    for index in range(IMPORT_ROWS):
+        writer.writerow([
+            rng.choice(['inhouse', 'incoming']), f'{YEAR}-{MONTH:02d}-{rng.randint(1, 28):02d}',
+            rng.choice(VENDOR_NAMES), rng.choice(PRODUCT_NAMES), f'BENCH-{index:05d}',
+            rng.randint(50, 5000), rng.choice(PRODUCER_NAMES),
+        ])
+    content = ('\ufeff' + buffer.getvalue()).encode('utf-8')
+
+    def run():
+        upload = SimpleUploadedFile('performance.csv', content, content_type='text/csv')
+        request = admin_request(
+            'post', '/api/performance/csv-upload/', {'file': upload, 'transaction': 'full'}, format='multipart'
+        )
+        with transaction.atomic():
+            response = performance_csv_upload(request)
+            transaction.set_rollback(True)
+        assert response.status_code in (200, 201), response.data
+        return response
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# 백업 동기화
+# ---------------------------------------------------------------------------
+
+@benchmark('backup.sync_backup_records')
+def bench_sync_backup_records():
+    """백업 파일과 레코드가 모두 일치하는 평상시 동기화 (스케줄러가 주기적으로 실행)"""
+    from django.conf import settings
+    from backup_management.catalog import backup_catalog
+    from backup_management.models import BackupRecord
+    from backup_management.sync_utils import sync_backup_records
+
+    backup_dir = Path(settings.BACKUP_DIR)
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    if not BackupRecord.objects.exists():
+        records = []
+        for index in range(BACKUP_FILES):
+            path = backup_dir / f'db_backup_20250101_{index:06d}.sqlite3.gz'
+            path.write_bytes(b'\0' * 1024)
+            records.append(BackupRecord(file_path=str(path), file_size=1024, backup_type='auto'))
+        BackupRecord.objects.bulk_create(records)
+    backup_catalog.reset()
+
+    def run():
+        stats = sync_backup_records()
+        assert not stats['errors'] and not stats['orphaned_records_deleted'], stats
+        return stats
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def prepare_database(db_path, backup_dir):
+    """DB 파일/백업 디렉토리를 설정하고 Django 초기화, DB가 새로 만들어졌으면 데이터셋 생성"""
+    os.environ['DATABASE_NAME'] = str(db_path)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    # 벤치마크 쿼리가 느린 쿼리 로그에 쌓이지 않도록
+    os.environ['SLOW_QUERY_MS'] = '1000000'
+    os.environ['SLOW_REQUEST_MS'] = '1000000'
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    import django
+    django.setup()
+
+    from django.conf import settings
+    from django.core.management import call_command
+
+    settings.BACKUP_DIR = Path(backup_dir)
+
+    created = not Path(db_path).exists()
+    call_command('migrate', verbosity=0)
+    from performance.models import PerformanceRecord
+    if created or not PerformanceRecord.objects.exists():
+        started = time.perf_counter()
+        call_command(
+            'generate_sample_data', years=DATASET['years'], records_per_day=DATASET['records_per_day'],
+            users=DATASET['users'], seed=DATASET['seed'], end_date=date.fromisoformat(DATASET['end_date']),
+            skip_vectors=True, stdout=io.StringIO(),
+        )
+        print(f"데이터셋 생성: {time.perf_counter() - started:.1f}초", file=sys.stderr)
+
+
+def dataset_counts():
+    from customer_complaints.models import CustomerComplaint
+    from nonconformance.models import Nonconformance
+    from performance.models import PerformanceRecord
+
+    return {
+        'performance_records': PerformanceRecord.objects.count(),
+        'nonconformances': Nonconformance.objects.count(),
+        'customer_complaints': CustomerComplaint.objects.count(),
+    }
+
+
+def measure(setup, repeat):
+    """워밍업 1회 후 repeat회 실행 시간 (밀리초)"""
+    func = setup()
+    func()
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        'repeat': repeat,
+        'min_ms': round(min(timings), 2),
+        'median_ms': round(statistics.median(timings), 2),
+        'mean_ms': round(statistics.fmean(timings), 2),
+        'max_ms': round(max(timings), 2),
+    }
+
+
+def git_revision():
+    """현재 커밋 (작업 트리가 바뀌었으면 -dirty)"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(['git', 'diff', '--quiet', 'HEAD'], cwd=BACKEND_DIR).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return f'{commit}-dirty' if dirty else commit
+
+
+def compare(previous, current, threshold):
+    """이전 결과 대비 중앙값 변화율 출력, 느려진 항목 수 반환"""
+    regressions = 0
+    print(f"\n비교 대상: {previous.get('commit')} ({previous.get('created_at')})")
+    for name, result in current['results'].items():
+        before = previous.get('results', {}).get(name)
+        if not before:
+            print(f"  {name:<34}{result['median_ms']:>10.2f}ms   (새 항목)")
+            continue
+        change = (result['median_ms'] - before['median_ms']) / before['median_ms'] * 100
+        mark = ''
+        if change >= threshold:
+            mark = '  ▲ 느려짐'
+            regressions += 1
+        elif change <= -threshold:
+            mark = '  ▼ 빨라짐'
+        print(f"  {name:<34}{before['median_ms']:>10.2f}ms → {result['median_ms']:>10.2f}ms  {change:+7.1f}%{mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='마이크로 벤치마크 (고정 데이터셋, 결과 JSON 저장)')
+    parser.add_argument('--repeat', type=int, default=5, help='항목별 반복 횟수 (기본값: 5)')
+    parser.add_argument('--filter', default='', help='이름에 이 문자열이 포함된 항목만 실행 (쉼표로 여러 개)')
+    parser.add_argument('--db', type=Path, help='데이터셋 DB 파일 (없으면 생성, 있으면 재사용 / 기본값: 임시 파일)')
+    parser.add_argument('--output', type=Path, help='결과 JSON 경로 (기본값: benchmarks/results/<시각>-<커밋>.json)')
+    parser.add_argument('--compare', type=Path, help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=10, help='느려짐/빨라짐 표시 기준 %% (기본값: 10)')
+    parser.add_argument('--list', action='store_true', help='항목 목록만 출력')
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(BENCHMARKS))
+        return
+
+    patterns = [pattern for pattern in args.filter.split(',') if pattern]
+    names = [name for name in BENCHMARKS if not patterns or any(pattern in name for pattern in patterns)]
+    if not names:
+        parser.error(f'일치하는 항목이 없습니다: {args.filter}')
+
+    with tempfile.TemporaryDirectory(prefix='qms-micro-') as temp_dir:
+        prepare_database(args.db or Path(temp_dir) / 'bench.sqlite3', Path(temp_dir) / 'backups')
+
+        current = {
+            'commit': git_revision(),
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'dataset': {**DATASET, **dataset_counts()},
+            'results': {},
+        }
+        for name in names:
+            current['results'][name] = measure(BENCHMARKS[name], args.repeat)
+            result = current['results'][name]
+            print(f"{name:<36}중앙값 {result['median_ms']:>10.2f}ms   최소 {result['min_ms']:>10.2f}ms")
+
+        from django.db import connections
+        connections.close_all()
+
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{current['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(current, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        previous = json.loads(args.compare.read_text(encoding='utf-8'))
+        compare(previous, current, args.threshold)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+애플리케이션 시작 시간 측정
+
+새 프로세스에서 django.setup()(모든 AppConfig.ready() 포함)과 ASGI 애플리케이션
+로드에 걸리는 시간을 반복 측정한다. 워커/관리 명령마다 매번 치르는 비용이다.
+
+    cd backend
+    uv run python -m benchmarks.startup --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# 측정 대상: 이름 → 자식 프로세스에서 실행할 코드 (소요 시간(초)을 출력)
+TARGETS = {
+    'django_setup': (
+        "import time; t = time.perf_counter(); import django; django.setup(); "
+        "print(time.perf_counter() - t)"
+    ),
+    'asgi_application': (
+        "import time; t = time.perf_counter(); from backend.asgi import application; "
+        "print(time.perf_counter() - t)"
+    ),
+}
+
+
+def measure(code, runs):
+    """자식 프로세스에서 runs회 실행한 소요 시간 목록 (초)"""
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': 'backend.settings', 'PYTHONWARNINGS': 'ignore'}
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Django 시작 시간 측정')
+    parser.add_argument('--runs', type=int, default=10, help='대상별 반복 횟수 (기본값: 10)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    results = {}
+    for name, code in TARGETS.items():
+        timings = measure(code, args.runs)
+        results[name] = {
+            'runs': args.runs,
+            'min_ms': round(min(timings) * 1000, 1),
+            'median_ms': round(statistics.median(timings) * 1000, 1),
+            'max_ms': round(max(timings) * 1000, 1),
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'대상':<20}{'최소(ms)':>10}{'중앙값(ms)':>12}{'최대(ms)':>10}")
+    for name, result in results.items():
+        print(f"{name:<20}{result['min_ms']:>10}{result['median_ms']:>12}{result['max_ms']:>10}")
+
+
+if __name__ == '__main__':
+    main()
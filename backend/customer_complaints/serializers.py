@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from backend.list_serializers import ValuesListSerializer
 from .models import CustomerComplaint
 from nonconformance.models import DefectType, DefectCause
 from audit.models import AuditLog
@@ -121,6 +122,12 @@ class CustomerComplaintListSerializer(serializers.ModelSerializer):
         ]
 
 
+class CustomerComplaintListValues(ValuesListSerializer):
+    """고객 불만 목록 빠른 직렬화 (CustomerComplaintListSerializer와 같은 출력)"""
+    
+    serializer_class = CustomerComplaintListSerializer
+
+
 class CustomerComplaintCreateSerializer(serializers.ModelSerializer):
     """고객 불만 생성 전용 시리얼라이저"""
     
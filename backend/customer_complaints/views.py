@@ -12,9 +12,12 @@ from .models import CustomerComplaint
 from .serializers import (
     CustomerComplaintSerializer,
     CustomerComplaintListSerializer,
+    CustomerComplaintListValues,
     CustomerComplaintCreateSerializer
 )
 from audit.models import AuditLog
+from backend.list_serializers import ValuesListMixin
+from backup_management.cold_storage import ArchiveListMixin, ArchivedQuerySet, archive_years
 
 
 def get_client_ip(request):
@@ -27,9 +30,10 @@ def get_client_ip(request):
     return ip
 
 
-class CustomerComplaintListView(generics.ListAPIView):
-    """고객 불만 목록 조회 API"""
+class CustomerComplaintListView(ArchiveListMixin, ValuesListMixin, generics.ListAPIView):
+    """고객 불만 목록 조회 API (include_archive=true 이면 아카이브 DB 포함)"""
     serializer_class = CustomerComplaintListSerializer
+    values_serializer_class = CustomerComplaintListValues
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['defect_type_code', 'cause_code']
@@ -338,6 +342,10 @@ def customer_complaint_csv_export(request):
         occurrence_date__month=month_int
     ).select_related('created_by', 'defect_type_code', 'cause_code').order_by('occurrence_date', 'created_at')
     
+    # 아카이브 DB로 옮겨진 연도는 함께 조회
+    if year_int in archive_years():
+        complaints = ArchivedQuerySet(complaints, [year_int])
+    
     if not complaints.exists():
         return Response(
             {'error': '해당 연월에 데이터가 없습니다.'},
@@ -0,0 +1,393 @@
+"""
+대시보드 분석용 집계 쿼리
+
+여러 차트 API에서 공통으로 사용하는 집계 로직을 모아둔다.
+"""
+from datetime import date, timedelta
+
+from django.db import connections
+from django.db.models import Count, Sum, F
+
+from performance.models import PerformanceRecord
+from nonconformance.models import Nonconformance, DefectCause
+from customer_complaints.models import CustomerComplaint
+from .filters import apply_analysis_filters
+from .parallel import run_concurrently
+
+
+# 파레토 분석 차원: (그룹 키 필드, 이름 필드)
+PARETO_DIMENSIONS = {
+    'defect_type': ('defect_type_code__code', 'defect_type_code__name'),
+    'cause': ('cause_code__code', 'cause_code__name'),
+    'category': ('cause_code__category', None),
+}
+
+# 파레토 분석 지표
+PARETO_METRICS = {
+    'count': lambda: Count('id'),
+    'qty': lambda: Sum('defect_qty'),
+    'amount': lambda: Sum('total_amount'),
+}
+
+
+def pareto_rows(queryset, dimension, metric):
+    """
+    부적합 쿼리셋을 차원별로 집계하고 누적값을 계산
+
+    그룹 집계는 ORM으로 만들고, 정렬 순서에 따른 누적합과 전체 합계는
+    윈도우 함수(SUM() OVER)로 감싸 한 번의 쿼리로 처리한다.
+
+    Args:
+        queryset: 필터가 적용된 Nonconformance 쿼리셋
+        dimension: 'defect_type', 'cause', 'category'
+        metric: 'count', 'qty', 'amount'
+
+    Returns:
+        list: [{'code', 'name', 'value', 'cumulative', 'total'}] (값 내림차순)
+    """
+    key_field, name_field = PARETO_DIMENSIONS[dimension]
+
+    grouped = queryset.annotate(
+        pareto_key=F(key_field),
+        pareto_name=F(name_field) if name_field else F(key_field),
+    ).values('pareto_key', 'pareto_name').annotate(
+        value=PARETO_METRICS[metric]()
+    ).order_by()
+
+    inner_sql, params = grouped.query.sql_with_params()
+
+    sql = (
+        'SELECT pareto_key, pareto_name, value, '
+        'SUM(value) OVER ('
+        'ORDER BY value DESC, pareto_key '
+        'ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW'
+        ') AS cumulative, '
+        'SUM(value) OVER () AS total '
+        f'FROM ({inner_sql}) pareto '
+        'ORDER BY value DESC, pareto_key'
+    )
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    category_names = dict(DefectCause.CATEGORY_CHOICES)
+
+    result = []
+    for code, name, value, cumulative, total in rows:
+        if dimension == 'category':
+            name = category_names.get(code, code)
+        result.append({
+            'code': code,
+            'name': name,
+            'value': value,
+            'cumulative': cumulative,
+            'total': total,
+        })
+
+    return result
+
+
+# 리그 테이블 그룹 기준 (부적합에는 생산처 컬럼이 없어 제외)
+LEAGUE_GROUP_FIELDS = ['vendor', 'product_name', 'control_no']
+
+# 리그 테이블 정렬 기준
+LEAGUE_ORDER_FIELDS = ['ppm', 'f_cost', 'defect_qty']
+
+
+def league_rows(filters, group_by, order_by='ppm', min_quantity=0):
+    """
+    업체/품명/관리번호별 불량률(ppm)과 F-COST 순위 집계
+
+    실적 수량과 부적합 수량/금액을 각각 한 번의 GROUP BY 쿼리로 동시에 집계한 뒤
+    메모리에서 병합한다.
+
+    Args:
+        filters: parse_analysis_filters() 결과
+        group_by: LEAGUE_GROUP_FIELDS 중 하나
+        order_by: LEAGUE_ORDER_FIELDS 중 하나 (내림차순)
+        min_quantity: 이 수량 미만인 그룹은 제외 (소량 실적의 ppm 왜곡 방지)
+
+    Returns:
+        list: 순위가 매겨진 그룹별 집계
+    """
+    performance = apply_analysis_filters(
+        PerformanceRecord.objects.all(), filters, date_field='date'
+    ).values(group_by).annotate(quantity=Sum('quantity')).order_by()
+
+    defects = apply_analysis_filters(
+        Nonconformance.objects.all(), filters
+    ).values(group_by).annotate(
+        defect_qty=Sum('defect_qty'),
+        f_cost=Sum('total_amount'),
+        ncr_count=Count('id'),
+    ).order_by()
+
+    # 두 원천 테이블 집계는 서로 독립적이므로 동시에 실행
+    results = run_concurrently({
+        'performance': lambda: list(performance),
+        'defects': lambda: list(defects),
+    })
+
+    merged = {}
+    for row in results['performance']:
+        merged[row[group_by]] = {
+            'key': row[group_by],
+            'quantity': row['quantity'] or 0,
+            'defect_qty': 0,
+            'f_cost': 0.0,
+            'ncr_count': 0,
+        }
+
+    for row in results['defects']:
+        entry = merged.setdefault(row[group_by], {
+            'key': row[group_by],
+            'quantity': 0,
+            'defect_qty': 0,
+            'f_cost': 0.0,
+            'ncr_count': 0,
+        })
+        entry['defect_qty'] = row['defect_qty'] or 0
+        entry['f_cost'] = float(row['f_cost'] or 0)
+        entry['ncr_count'] = row['ncr_count']
+
+    rows = []
+    for entry in merged.values():
+        if entry['key'] is None or entry['quantity'] < min_quantity:
+            continue
+        # 실적이 없는 그룹은 ppm을 계산할 수 없으므로 None
+        entry['ppm'] = (
+            round(entry['defect_qty'] / entry['quantity'] * 1_000_000, 1)
+            if entry['quantity'] > 0 else None
+        )
+        entry['f_cost'] = round(entry['f_cost'], 2)
+        rows.append(entry)
+
+    # 값 내림차순, ppm이 없는 그룹은 맨 뒤
+    rows.sort(key=lambda r: (r[order_by] is None, -(r[order_by] or 0), r['key']))
+
+    # 동일 값은 같은 순위 (1, 2, 2, 4)
+    previous = object()
+    for index, row in enumerate(rows, start=1):
+        if row[order_by] != previous:
+            rank = index
+            previous = row[order_by]
+        row['rank'] = rank
+
+    return rows
+
+
+# 시계열 집계 단위
+SERIES_BUCKETS = ['day', 'week', 'month', 'quarter', 'year']
+
+# SPC 집계 단위
+SPC_BUCKETS = ['day', 'week']
+
+
+def bucket_start(value, bucket):
+    """날짜가 속한 집계 구간의 시작일 (주 단위는 월요일 기준)"""
+    if bucket == 'week':
+        return value - timedelta(days=value.weekday())
+    if bucket == 'month':
+        return value.replace(day=1)
+    if bucket == 'quarter':
+        return date(value.year, (value.month - 1) // 3 * 3 + 1, 1)
+    if bucket == 'year':
+        return date(value.year, 1, 1)
+    return value
+
+
+def next_bucket(value, bucket):
+    """다음 집계 구간의 시작일 (date.max를 넘으면 None)"""
+    if bucket_start(value, bucket) == bucket_start(date.max, bucket):
+        return None
+    if bucket == 'day':
+        return value + timedelta(days=1)
+    if bucket == 'week':
+        return value + timedelta(days=7)
+    if bucket == 'year':
+        return date(value.year + 1, 1, 1)
+
+    months = 3 if bucket == 'quarter' else 1
+    month_index = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _bucket_index(value, bucket):
+    """집계 구간 일련번호 (연속한 구간은 1씩 차이)"""
+    if bucket == 'day':
+        return value.toordinal()
+    if bucket == 'week':
+        return bucket_start(value, bucket).toordinal() // 7
+    if bucket == 'year':
+        return value.year
+
+    month_index = value.year * 12 + value.month - 1
+    return month_index // 3 if bucket == 'quarter' else month_index
+
+
+def bucket_count(date_from, date_to, bucket):
+    """기간에 포함되는 집계 구간 수 (구간 목록을 만들지 않고 계산)"""
+    if date_from > date_to:
+        return 0
+    return _bucket_index(date_to, bucket) - _bucket_index(date_from, bucket) + 1
+
+
+def bucket_periods(date_from, date_to, bucket):
+    """기간에 포함되는 모든 집계 구간 시작일 (빈 구간 채우기용)"""
+    periods = []
+    period = bucket_start(date_from, bucket)
+    while period is not None and period <= date_to:
+        periods.append(period)
+        period = next_bucket(period, bucket)
+    return periods
+
+
+def bucket_label(period, bucket):
+    """집계 구간 표시 문자열"""
+    if bucket == 'week':
+        iso_year, iso_week, _ = period.isocalendar()
+        return f'{iso_year}-W{iso_week:02d}'
+    if bucket == 'month':
+        return f'{period.year}-{period.month:02d}'
+    if bucket == 'quarter':
+        return f'{period.year}-Q{(period.month - 1) // 3 + 1}'
+    if bucket == 'year':
+        return str(period.year)
+    return period.isoformat()
+
+
+# 시계열 지표
+SERIES_METRICS = ['defect_rate', 'f_cost', 'complaints', 'quantity']
+
+
+def bucket_totals(queryset, date_field, bucket, aggregate):
+    """
+    집계 구간별 합계 {구간 시작일: 합계}
+
+    SQLite에서 Trunc* 함수는 행마다 Python 함수로 실행되어 수백만 건에서
+    수 초가 걸린다. 날짜 컬럼 그대로 GROUP BY 하면 (날짜, ..., 수량) 커버링
+    인덱스만 읽으므로, 일자별로 한 번 집계한 뒤 구간 합산은 메모리에서 한다.
+    """
+    totals = {}
+    rows = queryset.values(date_field).annotate(total=aggregate).order_by()
+    for row in rows:
+        period = bucket_start(row[date_field], bucket)
+        totals[period] = totals.get(period, 0) + (row['total'] or 0)
+    return totals
+
+
+def time_series(filters, metric, bucket='month'):
+    """
+    지표별 시계열 집계
+
+    원천 테이블마다 일자별 GROUP BY 쿼리를 한 번씩만 (동시에) 실행하고,
+    구간 합산과 데이터가 없는 구간 채우기는 Python에서 한다.
+
+    Args:
+        filters: parse_analysis_filters() 결과
+        metric: SERIES_METRICS 중 하나
+        bucket: SERIES_BUCKETS 중 하나
+
+    Returns:
+        list: [{'period', 'label', 'value', ...}] (구간 시작일 오름차순)
+            defect_rate는 quantity, defect_qty를 함께 반환하며
+            생산 실적이 없는 구간의 value는 None
+    """
+    calls = {}
+
+    if metric in ('defect_rate', 'quantity'):
+        calls['quantity'] = lambda: bucket_totals(
+            apply_analysis_filters(PerformanceRecord.objects.all(), filters, date_field='date'),
+            'date', bucket, Sum('quantity'),
+        )
+
+    if metric == 'defect_rate':
+        calls['defect_qty'] = lambda: bucket_totals(
+            apply_analysis_filters(Nonconformance.objects.all(), filters),
+            'occurrence_date', bucket, Sum('defect_qty'),
+        )
+
+    if metric == 'f_cost':
+        calls['f_cost'] = lambda: bucket_totals(
+            apply_analysis_filters(Nonconformance.objects.all(), filters),
+            'occurrence_date', bucket, Sum('total_amount'),
+        )
+
+    if metric == 'complaints':
+        calls['complaints'] = lambda: bucket_totals(
+            apply_analysis_filters(CustomerComplaint.objects.all(), filters),
+            'occurrence_date', bucket, Count('id'),
+        )
+
+    # 불량률은 실적/부적합 두 테이블 집계를 동시에 실행
+    sources = run_concurrently(calls)
+
+    series = []
+    for period in bucket_periods(filters['date_from'], filters['date_to'], bucket):
+        row = {'period': period, 'label': bucket_label(period, bucket)}
+
+        if metric == 'defect_rate':
+            quantity = sources['quantity'].get(period, 0)
+            defect_qty = sources['defect_qty'].get(period, 0)
+            row['value'] = round(defect_qty / quantity * 100, 2) if quantity > 0 else None
+            row['quantity'] = quantity
+            row['defect_qty'] = defect_qty
+        elif metric == 'f_cost':
+            row['value'] = round(float(sources['f_cost'].get(period, 0)), 2)
+        else:
+            row['value'] = sources[metric].get(period, 0)
+
+        series.append(row)
+
+    return series
+
+
+def spc_series(filters, chart='p', bucket='day'):
+    """
+    관리도용 구간별 생산 수량과 불량 수량/건수 집계
+
+    실적 수량과 부적합 집계를 각각 한 번의 GROUP BY 쿼리로 (동시에) 가져와
+    생산 수량이 있는 구간만 날짜순으로 맞춘다.
+
+    Args:
+        filters: parse_analysis_filters() 결과
+        chart: 'p'(불량 수량) 또는 'u'(부적합 건수)
+        bucket: 'day' 또는 'week' (주 단위는 월요일 기준)
+
+    Returns:
+        tuple: (periods, counts, sizes, excluded) - excluded는 실적이 없는 구간의 불량 합계
+    """
+    results = run_concurrently({
+        'sizes': lambda: bucket_totals(
+            apply_analysis_filters(PerformanceRecord.objects.all(), filters, date_field='date'),
+            'date', bucket, Sum('quantity'),
+        ),
+        'counts': lambda: bucket_totals(
+            apply_analysis_filters(Nonconformance.objects.all(), filters),
+            'occurrence_date', bucket, Sum('defect_qty') if chart == 'p' else Count('id'),
+        ),
+    })
+    sizes_by_period, counts_by_period = results['sizes'], results['counts']
+
+    periods = sorted(period for period, size in sizes_by_period.items() if size > 0)
+    counts = [counts_by_period.get(period, 0) for period in periods]
+    sizes = [sizes_by_period[period] for period in periods]
+
+    # 생산 실적이 없는 날의 불량은 비율을 계산할 수 없어 관리도에서 제외
+    excluded = sum(
+        count for period, count in counts_by_period.items()
+        if sizes_by_period.get(period, 0) <= 0
+    )
+
+    return periods, counts, sizes, excluded
+
+
+def range_aggregate(queryset, date_field, date_from, date_to, **aggregates):
+    """
+    기간(종료일 포함) 집계
+
+    __year/__month 조건은 SQLite에서 행마다 날짜 추출 함수를 실행하므로 범위 조건으로
+    날짜(커버링) 인덱스만 읽는다.
+    """
+    return queryset.filter(**{f'{date_field}__range': (date_from, date_to)}).aggregate(**aggregates)
@@ -5,11 +5,66 @@ from rest_framework import status
 from django.db.models import Sum, Count
 from datetime import datetime, date, timedelta
 
-from performance.models import PerformanceRecord
 from nonconformance.models import Nonconformance
-from customer_complaints.models import CustomerComplaint
 from kpi_targets.models import KPITarget
 from schedules.models import Schedule
+from .filters import AnalysisFilterError, parse_analysis_filters, apply_analysis_filters
+from .aggregations import (
+    PARETO_DIMENSIONS, PARETO_METRICS, pareto_rows, SPC_BUCKETS, spc_series,
+    SERIES_BUCKETS, SERIES_METRICS, bucket_count, time_series,
+)
+from .spc import CHART_TYPES, WESTERN_ELECTRIC_RULES, spc_chart
+
+
+def _trailing_months(year, month, count=12):
+    """기준 연월까지의 최근 count개월 (연, 월) 목록 (오래된 순)"""
+    base = year * 12 + month - 1
+    return [((base - i) // 12, (base - i) % 12 + 1) for i in range(count - 1, -1, -1)]
+
+
+def _monthly_values(metric, year_from, year_to):
+    """연도 범위의 월별 지표 값 {(연, 월): 값} (월별 반복 조회 대신 그룹 쿼리 1회)"""
+    filters = {
+        'date_from': date(year_from, 1, 1),
+        'date_to': date(year_to, 12, 31),
+        'type': None,
+        'vendor': None,
+        'product_name': None,
+    }
+    return {
+        (row['period'].year, row['period'].month): row['value'] if row['value'] is not None else 0
+        for row in time_series(filters, metric, 'month')
+    }
+
+
+def _monthly_trend(metric, year, month):
+    """월별 추이 차트 데이터 (최근 12개월 + 각 연도 1월부터 해당 월까지의 데이터)"""
+    months = _trailing_months(year, month)
+    year_from, year_to = months[0][0], months[-1][0]
+    values = _monthly_values(metric, year_from, year_to)
+    
+    # 목표값 조회 (연도별 1건)
+    targets = {
+        target.year: float(target.target_value)
+        for target in KPITarget.objects.filter(year__range=(year_from, year_to), kpi_type=metric)
+    }
+    
+    trend_data = []
+    for target_year, target_month in months:
+        trend_data.append({
+            'year': target_year,
+            'month': target_month,
+            'label': f'{target_year}-{target_month:02d}',
+            'actual': values[(target_year, target_month)],
+            'target': targets.get(target_year),
+            # 해당 연도 1월부터 해당 월까지의 전체 데이터
+            'ytd_data': [
+                {'month': m, 'actual': values[(target_year, m)]}
+                for m in range(1, target_month + 1)
+            ],
+        })
+    
+    return trend_data
 
 
 @api_view(['GET'])
@@ -23,72 +78,7 @@ def defect_rate_trend(request):
     except ValueError:
         return Response({'error': '유효하지 않은 연도 또는 월입니다.'}, status=status.HTTP_400_BAD_REQUEST)
     
-    # 표시할 연도들 수집
-    years_in_range = set()
-    for i in range(11, -1, -1):
-        target_month = month - i
-        target_year = year
-        while target_month <= 0:
-            target_month += 12
-            target_year -= 1
-        years_in_range.add(target_year)
-    
-    # 각 연도의 1월부터 12월까지 데이터 수집
-    all_year_data = {}
-    for y in years_in_range:
-        all_year_data[y] = []
-        for m in range(1, 13):
-            perf = PerformanceRecord.objects.filter(
-                date__year=y, date__month=m
-            ).aggregate(total_quantity=Sum('quantity'))
-            
-            defects = Nonconformance.objects.filter(
-                occurrence_date__year=y, occurrence_date__month=m
-            ).aggregate(total_defect_qty=Sum('defect_qty'))
-            
-            quantity = perf['total_quantity'] or 0
-            defect_qty = defects['total_defect_qty'] or 0
-            defect_rate = (defect_qty / max(quantity, 1)) * 100 if quantity > 0 else 0
-            
-            all_year_data[y].append({
-                'month': m,
-                'actual': round(defect_rate, 2),
-            })
-    
-    # 최근 12개월 데이터 구성
-    trend_data = []
-    for i in range(11, -1, -1):
-        target_month = month - i
-        target_year = year
-        
-        while target_month <= 0:
-            target_month += 12
-            target_year -= 1
-        
-        while target_month > 12:
-            target_month -= 12
-            target_year += 1
-        
-        # 해당 월의 데이터
-        month_data = all_year_data[target_year][target_month - 1]
-        
-        # 목표값 조회
-        target = KPITarget.objects.filter(year=target_year, kpi_type='defect_rate').first()
-        target_value = float(target.target_value) if target else None
-        
-        # 해당 연도 1월부터 해당 월까지의 데이터
-        ytd_data = all_year_data[target_year][:target_month]
-        
-        trend_data.append({
-            'year': target_year,
-            'month': target_month,
-            'label': f'{target_year}-{target_month:02d}',
-            'actual': month_data['actual'],
-            'target': target_value,
-            'ytd_data': ytd_data,  # 1월부터 해당 월까지의 전체 데이터
-        })
-    
-    return Response({'data': trend_data}, status=status.HTTP_200_OK)
+    return Response({'data': _monthly_trend('defect_rate', year, month)}, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
@@ -186,48 +176,13 @@ def sparkline_data(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    sparkline = []
-    
-    for i in range(11, -1, -1):
-        target_month = month - i
-        target_year = year
-        
-        while target_month <= 0:
-            target_month += 12
-            target_year -= 1
-        
-        while target_month > 12:
-            target_month -= 12
-            target_year += 1
-        
-        if kpi_type == 'defect_rate':
-            perf = PerformanceRecord.objects.filter(
-                date__year=target_year, date__month=target_month
-            ).aggregate(total_quantity=Sum('quantity'))
-            
-            defects = Nonconformance.objects.filter(
-                occurrence_date__year=target_year, occurrence_date__month=target_month
-            ).aggregate(total_defect_qty=Sum('defect_qty'))
-            
-            quantity = perf['total_quantity'] or 0
-            defect_qty = defects['total_defect_qty'] or 0
-            value = (defect_qty / max(quantity, 1)) * 100 if quantity > 0 else 0
-            
-        elif kpi_type == 'f_cost':
-            f_cost = Nonconformance.objects.filter(
-                occurrence_date__year=target_year, occurrence_date__month=target_month
-            ).aggregate(total_amount=Sum('total_amount'))
-            value = float(f_cost['total_amount'] or 0)
-            
-        else:  # complaints
-            value = CustomerComplaint.objects.filter(
-                occurrence_date__year=target_year, occurrence_date__month=target_month
-            ).count()
-        
-        sparkline.append({
-            'month': f'{target_year}-{target_month:02d}',
-            'value': round(value, 2) if isinstance(value, float) else value,
-        })
+    months = _trailing_months(year, month)
+    values = _monthly_values(kpi_type, months[0][0], months[-1][0])
+    
+    sparkline = [
+        {'month': f'{target_year}-{target_month:02d}', 'value': values[(target_year, target_month)]}
+        for target_year, target_month in months
+    ]
     
     return Response({'kpi_type': kpi_type, 'data': sparkline}, status=status.HTTP_200_OK)
 
@@ -243,66 +198,7 @@ def f_cost_trend(request):
     except ValueError:
         return Response({'error': '유효하지 않은 연도 또는 월입니다.'}, status=status.HTTP_400_BAD_REQUEST)
     
-    # 표시할 연도들 수집
-    years_in_range = set()
-    for i in range(11, -1, -1):
-        target_month = month - i
-        target_year = year
-        while target_month <= 0:
-            target_month += 12
-            target_year -= 1
-        years_in_range.add(target_year)
-    
-    # 각 연도의 1월부터 12월까지 데이터 수집
-    all_year_data = {}
-    for y in years_in_range:
-        all_year_data[y] = []
-        for m in range(1, 13):
-            f_cost = Nonconformance.objects.filter(
-                occurrence_date__year=y, occurrence_date__month=m
-            ).aggregate(total_amount=Sum('total_amount'))
-            
-            actual_amount = float(f_cost['total_amount'] or 0)
-            
-            all_year_data[y].append({
-                'month': m,
-                'actual': round(actual_amount, 2),
-            })
-    
-    # 최근 12개월 데이터 구성
-    trend_data = []
-    for i in range(11, -1, -1):
-        target_month = month - i
-        target_year = year
-        
-        while target_month <= 0:
-            target_month += 12
-            target_year -= 1
-        
-        while target_month > 12:
-            target_month -= 12
-            target_year += 1
-        
-        # 해당 월의 데이터
-        month_data = all_year_data[target_year][target_month - 1]
-        
-        # 목표값 조회
-        target = KPITarget.objects.filter(year=target_year, kpi_type='f_cost').first()
-        target_value = float(target.target_value) if target else None
-        
-        # 해당 연도 1월부터 해당 월까지의 데이터
-        ytd_data = all_year_data[target_year][:target_month]
-        
-        trend_data.append({
-            'year': target_year,
-            'month': target_month,
-            'label': f'{target_year}-{target_month:02d}',
-            'actual': month_data['actual'],
-            'target': target_value,
-            'ytd_data': ytd_data,
-        })
-    
-    return Response({'data': trend_data}, status=status.HTTP_200_OK)
+    return Response({'data': _monthly_trend('f_cost', year, month)}, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
@@ -316,64 +212,7 @@ def complaints_trend(request):
     except ValueError:
         return Response({'error': '유효하지 않은 연도 또는 월입니다.'}, status=status.HTTP_400_BAD_REQUEST)
     
-    # 표시할 연도들 수집
-    years_in_range = set()
-    for i in range(11, -1, -1):
-        target_month = month - i
-        target_year = year
-        while target_month <= 0:
-            target_month += 12
-            target_year -= 1
-        years_in_range.add(target_year)
-    
-    # 각 연도의 1월부터 12월까지 데이터 수집
-    all_year_data = {}
-    for y in years_in_range:
-        all_year_data[y] = []
-        for m in range(1, 13):
-            count = CustomerComplaint.objects.filter(
-                occurrence_date__year=y, occurrence_date__month=m
-            ).count()
-            
-            all_year_data[y].append({
-                'month': m,
-                'actual': count,
-            })
-    
-    # 최근 12개월 데이터 구성
-    trend_data = []
-    for i in range(11, -1, -1):
-        target_month = month - i
-        target_year = year
-        
-        while target_month <= 0:
-            target_month += 12
-            target_year -= 1
-        
-        while target_month > 12:
-            target_month -= 12
-            target_year += 1
-        
-        # 해당 월의 데이터
-        month_data = all_year_data[target_year][target_month - 1]
-        
-        # 목표값 조회
-        target = KPITarget.objects.filter(year=target_year, kpi_type='complaints').first()
-        target_value = float(target.target_value) if target else None
-        
-        # 해당 연도 1월부터 해당 월까지의 데이터
-        ytd_data = all_year_data[target_year][:target_month]
-        
-        trend_data.append({
-            'year': target_year,
-            'month': target_month,
-            'label': f'{target_year}-{target_month:02d}',
-            'actual': month_data['actual'],
-            'target': target_value,
-            'ytd_data': ytd_data,
-        })
-    
-    return Response({'data': trend_data}, status=status.HTTP_200_OK)
+    return Response({'data': _monthly_trend('complaints', year, month)}, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
@@ -487,3 +326,168 @@ def defect_cause_ytd_distribution(request):
         })
     
     return Response({'year': year, 'month': month, 'metric': metric, 'data': result}, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def pareto_analysis(request):
+    """파레토 분석 (불량 유형/발생 원인/6M별 값, 비율, 누적 비율)
+    
+    Query Parameters:
+        dimension (str): defect_type, cause, category (기본값: defect_type)
+        metric (str): count, qty, amount (기본값: count)
+        date_from, date_to, type, vendor, product_name: 공통 분석 필터
+    """
+    
+    dimension = request.GET.get('dimension', 'defect_type')
+    metric = request.GET.get('metric', 'count')
+    
+    if dimension not in PARETO_DIMENSIONS:
+        return Response(
+            {'error': 'dimension은 defect_type, cause, category 중 하나여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    if metric not in PARETO_METRICS:
+        return Response(
+            {'error': 'metric은 count, qty, amount 중 하나여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        filters = parse_analysis_filters(request.GET)
+    except AnalysisFilterError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    queryset = apply_analysis_filters(Nonconformance.objects.all(), filters)
+    rows = pareto_rows(queryset, dimension, metric)
+    
+    total = float(rows[0]['total']) if rows else 0
+    
+    # 데이터 포맷팅
+    result = []
+    for row in rows:
+        value = float(row['value'])
+        cumulative = float(row['cumulative'])
+        share = (value / total) * 100 if total > 0 else 0
+        cumulative_share = (cumulative / total) * 100 if total > 0 else 0
+        result.append({
+            'code': row['code'],
+            'name': row['name'],
+            'value': round(value, 2) if metric == 'amount' else row['value'],
+            'share': round(share, 2),
+            'cumulative': round(cumulative, 2) if metric == 'amount' else row['cumulative'],
+            'cumulative_share': round(cumulative_share, 2),
+            # 누적 80%에 도달하기 전에 시작하는 항목 (Vital Few)
+            'vital_few': cumulative_share - share < 80,
+        })
+    
+    return Response({
+        'dimension': dimension,
+        'metric': metric,
+        'date_from': filters['date_from'].isoformat(),
+        'date_to': filters['date_to'].isoformat(),
+        'total': round(total, 2) if metric == 'amount' else int(total),
+        'data': result,
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def spc_control_chart(request):
+    """SPC 관리도 (p 관리도: 불량률, u 관리도: 단위당 부적합 건수)
+    
+    Query Parameters:
+        chart (str): p, u (기본값: p)
+        bucket (str): day, week (기본값: day)
+        date_from, date_to, type, vendor, product_name: 공통 분석 필터
+    """
+    
+    chart = request.GET.get('chart', 'p')
+    bucket = request.GET.get('bucket', 'day')
+    
+    if chart not in CHART_TYPES:
+        return Response(
+            {'error': 'chart는 p 또는 u여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    if bucket not in SPC_BUCKETS:
+        return Response(
+            {'error': 'bucket은 day 또는 week여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        filters = parse_analysis_filters(request.GET)
+    except AnalysisFilterError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    periods, counts, sizes, excluded = spc_series(filters, chart, bucket)
+    result = spc_chart(periods, counts, sizes, chart)
+    
+    return Response({
+        'chart': chart,
+        'bucket': bucket,
+        'date_from': filters['date_from'].isoformat(),
+        'date_to': filters['date_to'].isoformat(),
+        'center': result['center'],
+        'violation_count': result['violation_count'],
+        'excluded_count': excluded,
+        'rules': WESTERN_ELECTRIC_RULES,
+        'data': result['data'],
+    }, status=status.HTTP_200_OK)
+
+
+# 시계열 API 최대 구간 수 (일 단위 약 10년)
+SERIES_MAX_BUCKETS = 3700
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def time_series_data(request):
+    """지표별 시계열 데이터 (일/주/월/분기/연 단위, 빈 구간은 0으로 채움)
+    
+    Query Parameters:
+        metric (str): defect_rate, f_cost, complaints, quantity (기본값: defect_rate)
+        bucket (str): day, week, month, quarter, year (기본값: month)
+        date_from, date_to, type, vendor, product_name: 공통 분석 필터
+    """
+    
+    metric = request.GET.get('metric', 'defect_rate')
+    bucket = request.GET.get('bucket', 'month')
+    
+    if metric not in SERIES_METRICS:
+        return Response(
+            {'error': 'metric은 defect_rate, f_cost, complaints, quantity 중 하나여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    if bucket not in SERIES_BUCKETS:
+        return Response(
+            {'error': 'bucket은 day, week, month, quarter, year 중 하나여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        filters = parse_analysis_filters(request.GET)
+    except AnalysisFilterError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    if bucket_count(filters['date_from'], filters['date_to'], bucket) > SERIES_MAX_BUCKETS:
+        return Response(
+            {'error': f'조회 구간 수는 {SERIES_MAX_BUCKETS}개를 넘을 수 없습니다. 기간을 줄이거나 더 큰 단위를 선택하세요.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    series = time_series(filters, metric, bucket)
+    for row in series:
+        row['period'] = row['period'].isoformat()
+    
+    return Response({
+        'metric': metric,
+        'bucket': bucket,
+        'date_from': filters['date_from'].isoformat(),
+        'date_to': filters['date_to'].isoformat(),
+        'data': series,
+    }, status=status.HTTP_200_OK)
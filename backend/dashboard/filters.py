@@ -0,0 +1,83 @@
+"""
+대시보드 분석 API 공통 필터 파싱
+
+기간(date_from/date_to)과 유형/업체명/품명 필터를 한 곳에서 해석하여
+파레토, 리그 테이블 등 분석 API가 같은 규칙으로 조회하도록 한다.
+"""
+from datetime import date
+
+
+class AnalysisFilterError(ValueError):
+    """분석 필터 파라미터 오류 (400 응답으로 변환)"""
+
+
+def parse_date_param(value, name):
+    """YYYY-MM-DD 형식의 날짜 파라미터 파싱"""
+    try:
+        return date.fromisoformat(value.strip())
+    except ValueError:
+        raise AnalysisFilterError(f'{name}은(는) YYYY-MM-DD 형식이어야 합니다.')
+
+
+def parse_analysis_filters(params):
+    """
+    분석 API 공통 쿼리 파라미터 파싱
+
+    Query Parameters:
+        date_from (str): 시작일 (기본값: 올해 1월 1일)
+        date_to (str): 종료일 (기본값: 오늘)
+        type (str): 유형 (inhouse/incoming)
+        vendor (str): 업체명 (정확히 일치)
+        product_name (str): 품명 (정확히 일치)
+
+    Returns:
+        dict: 파싱된 필터
+    """
+    today = date.today()
+
+    date_from = params.get('date_from', '').strip()
+    date_to = params.get('date_to', '').strip()
+
+    filters = {
+        'date_from': parse_date_param(date_from, 'date_from') if date_from else date(today.year, 1, 1),
+        'date_to': parse_date_param(date_to, 'date_to') if date_to else today,
+        'type': params.get('type', '').strip() or None,
+        'vendor': params.get('vendor', '').strip() or None,
+        'product_name': params.get('product_name', '').strip() or None,
+    }
+
+    if filters['date_from'] > filters['date_to']:
+        raise AnalysisFilterError('date_from은 date_to보다 이후일 수 없습니다.')
+
+    if filters['type'] and filters['type'] not in ('inhouse', 'incoming'):
+        raise AnalysisFilterError('type은 inhouse 또는 incoming이어야 합니다.')
+
+    return filters
+
+
+def apply_analysis_filters(queryset, filters, date_field='occurrence_date'):
+    """
+    파싱된 필터를 쿼리셋에 적용
+
+    Args:
+        queryset: 대상 쿼리셋
+        filters: parse_analysis_filters() 결과
+        date_field: 기간 필터를 적용할 날짜 필드명
+    """
+    queryset = queryset.filter(**{
+        f'{date_field}__gte': filters['date_from'],
+        f'{date_field}__lte': filters['date_to'],
+    })
+
+    # 고객불만에는 유형 필드가 없으므로 필드가 있는 모델에만 적용
+    field_names = {field.name for field in queryset.model._meta.get_fields()}
+    if filters['type'] and 'type' in field_names:
+        queryset = queryset.filter(type=filters['type'])
+
+    if filters['vendor']:
+        queryset = queryset.filter(vendor=filters['vendor'])
+
+    if filters['product_name']:
+        queryset = queryset.filter(product_name=filters['product_name'])
+
+    return queryset
@@ -0,0 +1,85 @@
+"""
+대시보드 집계 쿼리 동시 실행
+
+API 하나가 서로 독립적인 원천 테이블 집계(실적, 부적합, 고객 불만, 목표 등)를 여러 번
+실행할 때, 요청 스레드에서 차례로 실행하지 않고 프로세스 공용 스레드 풀에서 동시에
+실행한다. 응답 시간은 가장 느린 쿼리 하나 수준으로 줄어든다.
+
+- 풀 크기는 settings.DASHBOARD_QUERY_WORKERS로 제한 (1 이하면 요청 스레드에서 차례로 실행)
+- 풀 스레드는 자신의 DB 연결을 계속 재사용한다 (스레드 수만큼만 연결이 생기므로 연결 풀과
+  같음). 작업마다 새로 연결하면 연결 비용이 쿼리 시간보다 커진다. DB 복원 후에는
+  요청 스레드와 마찬가지로 이전 세대 연결을 닫고, 오류로 못 쓰게 된 연결도 닫는다.
+- 풀 스레드 안에서 다시 호출하면(중첩) 풀이 가득 찼을 때 서로 기다리지 않도록 차례로 실행
+- 인메모리 SQLite(테스트)는 다른 스레드에서 아직 커밋되지 않은 데이터를 볼 수 없으므로
+  차례로 실행한다.
+"""
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from backup_management.signals import close_stale_connections, generation_watcher
+
+_executor = None
+_executor_lock = threading.Lock()
+_worker = threading.local()
+
+
+def _mark_worker():
+    _worker.active = True
+
+
+def get_executor():
+    """프로세스 공용 스레드 풀 (첫 사용 시 생성, 풀을 쓰지 않으면 None)"""
+    global _executor
+    workers = getattr(settings, 'DASHBOARD_QUERY_WORKERS', 0)
+    if workers <= 1:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix='dashboard-query', initializer=_mark_worker,
+            )
+        return _executor
+
+
+def _can_run_concurrently():
+    if getattr(_worker, 'active', False):
+        return False
+    connection = connections[DEFAULT_DB_ALIAS]
+    return not (connection.vendor == 'sqlite' and connection.is_in_memory_db())
+
+
+def _run_in_worker(func):
+    close_stale_connections(generation_watcher.refresh()[0])
+    try:
+        return func()
+    finally:
+        for connection in connections.all(initialized_only=True):
+            if connection.errors_occurred and not connection.is_usable():
+                connection.close()
+
+
+def run_concurrently(calls):
+    """
+    서로 독립적인 집계 함수를 동시에 실행
+
+    Args:
+        calls: {이름: 인자 없는 함수} - 각 함수는 쿼리셋을 평가한 결과를 반환해야 함
+            (지연 평가 쿼리셋을 그대로 반환하면 요청 스레드에서 실행됨)
+
+    Returns:
+        dict: {이름: 결과} - 하나라도 예외가 나면 그 예외를 다시 발생
+    """
+    executor = get_executor()
+    if executor is None or len(calls) <= 1 or not _can_run_concurrently():
+        return {name: func() for name, func in calls.items()}
+
+    # 라우터 상태 등 요청 컨텍스트를 작업 스레드로 전달
+    futures = {
+        name: executor.submit(contextvars.copy_context().run, _run_in_worker, func)
+        for name, func in calls.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
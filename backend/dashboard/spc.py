@@ -0,0 +1,129 @@
+"""
+통계적 공정 관리(SPC) 관리도 계산
+
+일/주 단위 불량 데이터로 p 관리도(불량률)와 u 관리도(단위당 결점수)의
+중심선과 가변 관리한계를 계산하고 Western Electric 규칙 위반을 판정한다.
+계산은 전체 시계열에 대해 NumPy 배열 연산으로 한 번에 수행한다.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+CHART_TYPES = ['p', 'u']
+
+# Western Electric 규칙 설명
+WESTERN_ELECTRIC_RULES = {
+    1: '관리한계(3σ) 이탈',
+    2: '연속 3점 중 2점이 같은 쪽 2σ 밖',
+    3: '연속 5점 중 4점이 같은 쪽 1σ 밖',
+    4: '연속 8점이 중심선 한쪽',
+}
+
+
+def control_limits(counts, sizes, chart='p'):
+    """
+    관리도 통계량과 가변 관리한계 계산
+
+    Args:
+        counts: 구간별 불량 수량(p) 또는 결점 수(u)
+        sizes: 구간별 검사(생산) 수량, 0보다 커야 함
+        chart: 'p' 또는 'u'
+
+    Returns:
+        dict: values, center, sigma, ucl, lcl (center 외에는 모두 배열)
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    sizes = np.asarray(sizes, dtype=np.float64)
+
+    values = counts / sizes
+    center = counts.sum() / sizes.sum() if sizes.size else 0.0
+
+    if chart == 'p':
+        sigma = np.sqrt(center * (1 - center) / sizes) if center < 1 else np.zeros_like(sizes)
+    else:
+        sigma = np.sqrt(center / sizes)
+
+    return {
+        'values': values,
+        'center': center,
+        'sigma': sigma,
+        'ucl': center + 3 * sigma,
+        'lcl': np.maximum(center - 3 * sigma, 0),
+    }
+
+
+def _window_flags(beyond, window, required):
+    """연속 window개 중 required개 이상이 조건을 만족하고 마지막 점도 조건을 만족하면 그 점을 표시"""
+    flags = np.zeros(beyond.size, dtype=bool)
+    if beyond.size >= window:
+        hits = sliding_window_view(beyond, window).sum(axis=1) >= required
+        flags[window - 1:] = hits & beyond[window - 1:]
+    return flags
+
+
+def western_electric_violations(values, center, sigma):
+    """
+    Western Electric 규칙 위반 판정
+
+    Args:
+        values: 구간별 통계량 배열
+        center: 중심선
+        sigma: 구간별 표준편차 배열 (가변 관리한계)
+
+    Returns:
+        dict: {규칙 번호: 위반 여부 bool 배열}
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where(sigma > 0, (values - center) / sigma, 0.0)
+
+    above = z > 0
+    below = z < 0
+
+    return {
+        1: np.abs(z) > 3,
+        2: _window_flags(z > 2, 3, 2) | _window_flags(z < -2, 3, 2),
+        3: _window_flags(z > 1, 5, 4) | _window_flags(z < -1, 5, 4),
+        4: _window_flags(above, 8, 8) | _window_flags(below, 8, 8),
+    }
+
+
+def spc_chart(periods, counts, sizes, chart='p'):
+    """
+    구간별 데이터로 관리도 응답 데이터 구성
+
+    Args:
+        periods: 구간 시작일 리스트
+        counts: 구간별 불량 수량/결점 수
+        sizes: 구간별 생산 수량 (0인 구간은 호출 전에 제외)
+        chart: 'p' 또는 'u'
+
+    Returns:
+        dict: center, data(구간별 값/한계/위반 규칙), violation_count
+    """
+    limits = control_limits(counts, sizes, chart)
+    violations = western_electric_violations(limits['values'], limits['center'], limits['sigma'])
+
+    # 구간별 위반 규칙 목록
+    rule_matrix = np.column_stack([violations[rule] for rule in sorted(violations)]) if len(periods) else None
+
+    values = limits['values'].round(6).tolist()
+    ucl = limits['ucl'].round(6).tolist()
+    lcl = limits['lcl'].round(6).tolist()
+
+    data = []
+    for index, period in enumerate(periods):
+        data.append({
+            'period': period.isoformat(),
+            'n': int(sizes[index]),
+            'count': int(counts[index]),
+            'value': values[index],
+            'ucl': ucl[index],
+            'lcl': lcl[index],
+            'violations': [rule for rule, hit in zip(sorted(violations), rule_matrix[index]) if hit],
+        })
+
+    return {
+        'center': round(float(limits['center']), 6),
+        'data': data,
+        'violation_count': int(rule_matrix.any(axis=1).sum()) if rule_matrix is not None else 0,
+    }
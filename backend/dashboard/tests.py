@@ -1,3 +1,351 @@
-from django.test import TestCase
+import threading
+from datetime import date
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from accounts.models import User
+from performance.models import PerformanceRecord
+from nonconformance.models import Nonconformance, DefectType, DefectCause
+from kpi_targets.models import KPITarget
+from . import parallel
+from .aggregations import SERIES_BUCKETS, bucket_count, bucket_periods
+
+
+class DashboardAPITestMixin:
+    """대시보드 API 테스트 공통 데이터"""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username='testuser',
+            name='테스트',
+            department='품질팀',
+            position='대리',
+            phone_number='010-1234-5678',
+            role_level=1,
+            status='active'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.d01 = DefectType.objects.create(code='D01', name='파손')
+        self.d02 = DefectType.objects.create(code='D02', name='치수')
+        self.d03 = DefectType.objects.create(code='D03', name='외관')
+        self.material = DefectCause.objects.create(code='M1.1', category='Material', name='원자재 불량')
+        self.machine = DefectCause.objects.create(code='M2.1', category='Machine', name='설비 고장')
+
+    def create_nc(self, defect_type, cause, occurrence_date=date(2025, 3, 10), defect_qty=1,
+                  vendor='ABC정밀', product_name='하우징', nc_type='inhouse'):
+        return Nonconformance.objects.create(
+            type=nc_type,
+            occurrence_date=occurrence_date,
+            ncr_no=f'NCR-{Nonconformance.objects.count() + 1:03d}',
+            vendor=vendor,
+            product_name=product_name,
+            defect_qty=defect_qty,
+            unit_price=Decimal('100'),
+            weight_factor=Decimal('1'),
+            defect_type_code=defect_type,
+            cause_code=cause,
+            created_by=self.user,
+        )
+
+
+class ParetoAnalysisAPITest(DashboardAPITestMixin, APITestCase):
+    """파레토 분석 API 테스트"""
+
+    url = '/api/dashboard/charts/pareto/'
+
+    def setUp(self):
+        super().setUp()
+        for _ in range(6):
+            self.create_nc(self.d02, self.material)
+        for _ in range(3):
+            self.create_nc(self.d01, self.machine)
+        self.create_nc(self.d03, self.machine, vendor='XYZ가공')
+        # 기간 밖 데이터
+        self.create_nc(self.d03, self.machine, occurrence_date=date(2024, 3, 10))
+
+    def test_pareto_cumulative_share(self):
+        """값 내림차순 정렬과 누적 비율 계산"""
+        response = self.client.get(self.url, {'date_from': '2025-01-01', 'date_to': '2025-12-31'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.data['data']
+        self.assertEqual(response.data['total'], 10)
+        self.assertEqual([row['code'] for row in data], ['D02', 'D01', 'D03'])
+        self.assertEqual([row['cumulative'] for row in data], [6, 9, 10])
+        self.assertEqual([row['cumulative_share'] for row in data], [60.0, 90.0, 100.0])
+        self.assertEqual([row['vital_few'] for row in data], [True, True, False])
+
+    def test_pareto_category_with_filter(self):
+        """6M 분류 차원과 업체 필터"""
+        response = self.client.get(self.url, {
+            'dimension': 'category',
+            'metric': 'amount',
+            'date_from': '2025-01-01',
+            'date_to': '2025-12-31',
+            'vendor': 'ABC정밀',
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.data['data']
+        self.assertEqual([row['code'] for row in data], ['Material', 'Machine'])
+        self.assertEqual(data[0]['name'], 'Material(소재)')
+        self.assertEqual(data[0]['value'], 600.0)
+        self.assertEqual(response.data['total'], 900.0)
+
+    def test_pareto_invalid_params(self):
+        """잘못된 파라미터 검증"""
+        response = self.client.get(self.url, {'dimension': 'unknown'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {'date_from': '2025-13-01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class DefectRateLeagueAPITest(DashboardAPITestMixin, APITestCase):
+    """업체별 불량률 순위 API 테스트"""
+
+    url = '/api/dashboard/league/'
+
+    def setUp(self):
+        super().setUp()
+        for vendor, quantity in [('ABC정밀', 10000), ('XYZ가공', 2000)]:
+            PerformanceRecord.objects.create(
+                type='inhouse', date=date(2025, 3, 10), vendor=vendor,
+                product_name='하우징', control_no='C-1', quantity=quantity,
+                producer='사내', created_by=self.user,
+            )
+        self.create_nc(self.d01, self.material, vendor='ABC정밀', defect_qty=10)
+        self.create_nc(self.d01, self.material, vendor='XYZ가공', defect_qty=10)
+        self.create_nc(self.d01, self.material, vendor='무실적', defect_qty=1)
+
+    def test_league_ppm_rank(self):
+        """ppm 내림차순 순위와 실적 없는 업체 처리"""
+        response = self.client.get(self.url, {'date_from': '2025-01-01', 'date_to': '2025-12-31'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.data['data']
+        self.assertEqual([row['key'] for row in data], ['XYZ가공', 'ABC정밀', '무실적'])
+        self.assertEqual([row['ppm'] for row in data], [5000.0, 1000.0, None])
+        self.assertEqual([row['rank'] for row in data], [1, 2, 3])
+        self.assertEqual(data[0]['f_cost'], 1000.0)
+
+    def test_league_min_quantity(self):
+        """최소 실적 수량 필터"""
+        response = self.client.get(self.url, {
+            'date_from': '2025-01-01', 'date_to': '2025-12-31', 'min_quantity': 5000,
+        })
+        self.assertEqual([row['key'] for row in response.data['data']], ['ABC정밀'])
+
+    def test_league_rejects_negative_parameters(self):
+        """음수 limit/min_quantity는 400 (limit 음수가 뒤쪽 행을 잘라내지 않도록)"""
+        for params in ({'limit': -1}, {'min_quantity': -10}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('error', response.data)
+
+
+class SPCControlChartAPITest(DashboardAPITestMixin, APITestCase):
+    """SPC 관리도 API 테스트"""
+
+    url = '/api/dashboard/charts/spc/'
+
+    def setUp(self):
+        super().setUp()
+        # 10일간 매일 1000개 생산, 마지막 날만 불량 급증
+        for day in range(1, 11):
+            PerformanceRecord.objects.create(
+                type='inhouse', date=date(2025, 3, day), vendor='ABC정밀',
+                product_name='하우징', control_no='C-1', quantity=1000,
+                producer='사내', created_by=self.user,
+            )
+            self.create_nc(self.d01, self.material, occurrence_date=date(2025, 3, day),
+                           defect_qty=50 if day == 10 else 5)
+        # 생산 실적이 없는 날의 불량
+        self.create_nc(self.d01, self.material, occurrence_date=date(2025, 3, 20), defect_qty=3)
+
+    def test_p_chart_limits_and_violation(self):
+        """중심선, 관리한계와 3σ 이탈 판정"""
+        response = self.client.get(self.url, {'date_from': '2025-03-01', 'date_to': '2025-03-31'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.data['data']
+        self.assertEqual(len(data), 10)
+        self.assertEqual(response.data['center'], 0.0095)
+        self.assertEqual(response.data['excluded_count'], 3)
+        self.assertAlmostEqual(data[0]['ucl'], 0.0095 + 3 * (0.0095 * 0.9905 / 1000) ** 0.5, places=6)
+        self.assertEqual(data[-1]['violations'], [1])
+        # 1~9일은 모두 중심선 아래 1σ 밖 (규칙 3: 5일째부터, 규칙 4: 8일째부터)
+        self.assertEqual(data[4]['violations'], [3])
+        self.assertEqual(data[8]['violations'], [3, 4])
+        self.assertEqual(response.data['violation_count'], 6)
+
+    def test_u_chart_weekly(self):
+        """주 단위 u 관리도 (월요일 기준 구간)"""
+        response = self.client.get(self.url, {
+            'chart': 'u', 'bucket': 'week', 'date_from': '2025-03-01', 'date_to': '2025-03-31',
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.data['data']
+        self.assertEqual([row['period'] for row in data], ['2025-02-24', '2025-03-03', '2025-03-10'])
+        self.assertEqual([row['n'] for row in data], [2000, 7000, 1000])
+        self.assertEqual([row['count'] for row in data], [2, 7, 1])
+
+    def test_spc_invalid_params(self):
+        """잘못된 파라미터 검증"""
+        response = self.client.get(self.url, {'chart': 'x'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {'bucket': 'month'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TimeSeriesAPITest(DashboardAPITestMixin, APITestCase):
+    """지표별 시계열 API 테스트"""
+
+    url = '/api/dashboard/series/'
+
+    def setUp(self):
+        super().setUp()
+        for record_date, quantity in [(date(2025, 1, 15), 1000), (date(2025, 3, 31), 1000), (date(2025, 4, 1), 500)]:
+            PerformanceRecord.objects.create(
+                type='inhouse', date=record_date, vendor='ABC정밀',
+                product_name='하우징', control_no='C-1', quantity=quantity,
+                producer='사내', created_by=self.user,
+            )
+        self.create_nc(self.d01, self.material, occurrence_date=date(2025, 1, 20), defect_qty=10)
+        self.create_nc(self.d01, self.material, occurrence_date=date(2025, 4, 2), defect_qty=5)
+
+    def test_monthly_defect_rate_with_gap_filling(self):
+        """월 단위 불량율과 빈 구간 채우기"""
+        response = self.client.get(self.url, {'date_from': '2025-01-01', 'date_to': '2025-04-30'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.data['data']
+        self.assertEqual([row['label'] for row in data], ['2025-01', '2025-02', '2025-03', '2025-04'])
+        self.assertEqual([row['value'] for row in data], [1.0, None, 0.0, 1.0])
+        self.assertEqual(data[0]['quantity'], 1000)
+        self.assertEqual(data[1]['defect_qty'], 0)
+
+    def test_quarterly_quantity_and_f_cost(self):
+        """분기 단위 생산수량과 F-COST"""
+        params = {'bucket': 'quarter', 'date_from': '2025-01-01', 'date_to': '2025-06-30'}
+
+        response = self.client.get(self.url, {**params, 'metric': 'quantity'})
+        self.assertEqual([row['label'] for row in response.data['data']], ['2025-Q1', '2025-Q2'])
+        self.assertEqual([row['value'] for row in response.data['data']], [2000, 500])
+
+        response = self.client.get(self.url, {**params, 'metric': 'f_cost'})
+        self.assertEqual([row['value'] for row in response.data['data']], [1000.0, 500.0])
+
+    def test_series_invalid_params(self):
+        """잘못된 파라미터와 구간 수 제한"""
+        response = self.client.get(self.url, {'bucket': 'hour'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {'bucket': 'day', 'date_from': '2000-01-01', 'date_to': '2025-12-31'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # 구간 목록을 만들기 전에 구간 수로 거부
+        with mock.patch('dashboard.aggregations.bucket_periods') as periods:
+            response = self.client.get(self.url, {'bucket': 'day', 'date_from': '0001-01-01', 'date_to': '9999-12-31'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        periods.assert_not_called()
+
+    def test_series_last_bucket_before_date_max(self):
+        """date.max가 포함된 마지막 구간에서 다음 구간을 계산하지 않음"""
+        for bucket, labels in [('day', ['9999-12-30', '9999-12-31']), ('week', ['9999-W52']),
+                               ('month', ['9999-12']), ('quarter', ['9999-Q4']), ('year', ['9999'])]:
+            response = self.client.get(self.url, {'bucket': bucket, 'date_from': '9999-12-30', 'date_to': '9999-12-31'})
+            self.assertEqual(response.status_code, status.HTTP_200_OK, bucket)
+            self.assertEqual([row['label'] for row in response.data['data']], labels, bucket)
+
+    def test_bucket_count_matches_periods(self):
+        """bucket_count는 bucket_periods 길이와 같음"""
+        ranges = [(date(2024, 12, 30), date(2025, 1, 5)), (date(2025, 1, 1), date(2026, 3, 31)),
+                  (date(2023, 11, 15), date(2025, 2, 1)), (date(1, 1, 1), date(1, 1, 20))]
+        for bucket in SERIES_BUCKETS:
+            for date_from, date_to in ranges:
+                self.assertEqual(bucket_count(date_from, date_to, bucket),
+                                 len(bucket_periods(date_from, date_to, bucket)), (bucket, date_from))
+
+
+class DashboardKPIAPITest(DashboardAPITestMixin, APITestCase):
+    """KPI 통합 API (당월/전월/누적)"""
+
+    url = '/api/dashboard/kpis/'
+
+    def setUp(self):
+        super().setUp()
+        for record_date, quantity in [(date(2025, 1, 31), 1000), (date(2025, 2, 1), 2000),
+                                      (date(2025, 3, 31), 4000), (date(2024, 3, 10), 9000)]:
+            PerformanceRecord.objects.create(
+                type='inhouse', date=record_date, vendor='ABC정밀',
+                product_name='하우징', control_no='C-1', quantity=quantity,
+                producer='사내', created_by=self.user,
+            )
+        self.create_nc(self.d01, self.material, occurrence_date=date(2025, 2, 28), defect_qty=20)
+        self.create_nc(self.d01, self.material, occurrence_date=date(2025, 3, 1), defect_qty=8)
+        KPITarget.objects.create(year=2025, kpi_type='defect_rate', target_value=Decimal('0.5'),
+                                 unit='%', created_by=self.user)
+
+    def test_monthly_prev_and_ytd(self):
+        response = self.client.get(self.url, {'year': 2025, 'month': 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        kpis = response.data['kpis']
+        self.assertEqual(kpis['defect_rate']['monthly'], {'actual_percent': 0.2, 'prev_percent': 1.0})
+        self.assertEqual(kpis['defect_rate']['ytd'], {'actual_percent': 0.4, 'annual_target_percent': 0.5})
+        self.assertEqual(kpis['f_cost']['monthly'], {'actual': 800.0, 'prev': 2000.0})
+        self.assertEqual(kpis['f_cost']['ytd']['annual_target'], 0)
+        self.assertEqual(kpis['complaints']['monthly'], {'actual': 0, 'prev': 0})
+
+    def test_january_compares_with_previous_december(self):
+        response = self.client.get(self.url, {'year': 2025, 'month': 1})
+        self.assertEqual(response.data['kpis']['defect_rate']['monthly'], {'actual_percent': 0, 'prev_percent': 0})
+
+        response = self.client.get(self.url, {'year': 2025, 'month': 13})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class RunConcurrentlyTest(SimpleTestCase):
+    """독립 집계 함수 동시 실행"""
+
+    def setUp(self):
+        patcher = mock.patch.object(parallel, '_executor', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_runs_calls_on_pool_threads(self):
+        # 두 작업이 서로를 기다리므로 동시에 실행되어야 끝남
+        barrier = threading.Barrier(2, timeout=5)
+
+        def call(value):
+            barrier.wait()
+            return value, threading.current_thread().name
+
+        with override_settings(DASHBOARD_QUERY_WORKERS=2), \
+                mock.patch.object(parallel, '_can_run_concurrently', return_value=True):
+            results = parallel.run_concurrently({'a': lambda: call(1), 'b': lambda: call(2)})
+
+        self.assertEqual([results['a'][0], results['b'][0]], [1, 2])
+        self.assertTrue(all(name.startswith('dashboard-query') for _, name in results.values()))
+
+    def test_errors_propagate_and_single_worker_runs_inline(self):
+        def fail():
+            raise ValueError('집계 실패')
+
+        with override_settings(DASHBOARD_QUERY_WORKERS=2), \
+                mock.patch.object(parallel, '_can_run_concurrently', return_value=True):
+            with self.assertRaises(ValueError):
+                parallel.run_concurrently({'ok': lambda: 1, 'fail': fail})
+
+        with override_settings(DASHBOARD_QUERY_WORKERS=1):
+            results = parallel.run_concurrently({'a': lambda: threading.current_thread().name})
+        self.assertEqual(results['a'], threading.current_thread().name)
@@ -6,6 +6,9 @@ urlpatterns = [
     # 메인 KPI 데이터
     path('kpis/', views.dashboard_kpis, name='dashboard-kpis'),
     
+    # 업체/품명별 불량률 순위
+    path('league/', views.defect_rate_league, name='dashboard-league'),
+    
     # 차트 데이터
     path('charts/defect-rate-trend/', chart_views.defect_rate_trend, name='chart-defect-rate-trend'),
     path('charts/f-cost-trend/', chart_views.f_cost_trend, name='chart-f-cost-trend'),
@@ -14,6 +17,11 @@ urlpatterns = [
     path('charts/defect-cause-distribution/', chart_views.defect_cause_distribution, name='chart-defect-cause-distribution'),
     path('charts/defect-type-ytd-distribution/', chart_views.defect_type_ytd_distribution, name='chart-defect-type-ytd-distribution'),
     path('charts/defect-cause-ytd-distribution/', chart_views.defect_cause_ytd_distribution, name='chart-defect-cause-ytd-distribution'),
+    path('charts/pareto/', chart_views.pareto_analysis, name='chart-pareto'),
+    path('charts/spc/', chart_views.spc_control_chart, name='chart-spc'),
+    
+    # 지표별 시계열 (일/주/월/분기/연)
+    path('series/', chart_views.time_series_data, name='dashboard-series'),
     
     # 스파크라인 데이터
     path('sparkline/', chart_views.sparkline_data, name='sparkline-data'),
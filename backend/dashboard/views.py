@@ -3,7 +3,9 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from django.db.models import Sum, Count
+import calendar
 from datetime import datetime, date
+from functools import partial
 from decimal import Decimal
 
 from performance.models import PerformanceRecord
@@ -12,6 +14,17 @@ from customer_complaints.models import CustomerComplaint
 from kpi_targets.models import KPITarget
 from schedules.models import Schedule
 from accounts.authentication import CustomJWTAuthentication
+from .filters import AnalysisFilterError, parse_analysis_filters
+from .aggregations import LEAGUE_GROUP_FIELDS, LEAGUE_ORDER_FIELDS, league_rows, range_aggregate
+from .parallel import run_concurrently
+
+# 대시보드 KPI 종류 (KPITarget.kpi_type)
+KPI_TYPES = ['defect_rate', 'f_cost', 'complaints']
+
+
+def _month_range(year, month):
+    """해당 월의 (첫날, 마지막 날)"""
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
 
 
 @api_view(['GET'])
@@ -33,81 +46,65 @@ def dashboard_kpis(request):
     prev_month = month - 1 if month > 1 else 12
     prev_year = year if month > 1 else year - 1
     
-    # 1. 불량율 계산
-    monthly_perf = PerformanceRecord.objects.filter(
-        date__year=year, date__month=month
-    ).aggregate(total_quantity=Sum('quantity'))
-    
-    monthly_defects = Nonconformance.objects.filter(
-        occurrence_date__year=year, occurrence_date__month=month
-    ).aggregate(total_defect_qty=Sum('defect_qty'))
-    
-    prev_monthly_perf = PerformanceRecord.objects.filter(
-        date__year=prev_year, date__month=prev_month
-    ).aggregate(total_quantity=Sum('quantity'))
-    
-    prev_monthly_defects = Nonconformance.objects.filter(
-        occurrence_date__year=prev_year, occurrence_date__month=prev_month
-    ).aggregate(total_defect_qty=Sum('defect_qty'))
-    
-    ytd_perf = PerformanceRecord.objects.filter(
-        date__year=year, date__month__lte=month
-    ).aggregate(total_quantity=Sum('quantity'))
+    try:
+        periods = {
+            'monthly': _month_range(year, month),
+            'prev': _month_range(prev_year, prev_month),
+            'ytd': (date(year, 1, 1), _month_range(year, month)[1]),
+        }
+    except ValueError:
+        return Response({'error': '유효하지 않은 연도 또는 월입니다.'}, status=status.HTTP_400_BAD_REQUEST)
     
-    ytd_defects = Nonconformance.objects.filter(
-        occurrence_date__year=year, occurrence_date__month__lte=month
-    ).aggregate(total_defect_qty=Sum('defect_qty'))
+    # 원천 테이블 × 기간(당월/전월/누적) 집계와 목표 조회는 서로 독립적이므로 동시에 실행
+    sources = {
+        'performance': (PerformanceRecord, 'date', lambda: {'quantity': Sum('quantity')}),
+        'nonconformance': (Nonconformance, 'occurrence_date', lambda: {
+            'defect_qty': Sum('defect_qty'), 'f_cost': Sum('total_amount'),
+        }),
+        'complaints': (CustomerComplaint, 'occurrence_date', lambda: {'count': Count('id')}),
+    }
+    calls = {
+        (source, period): partial(
+            range_aggregate, model.objects.all(), date_field, *periods[period], **aggregates()
+        )
+        for source, (model, date_field, aggregates) in sources.items()
+        for period in periods
+    }
+    calls['targets'] = lambda: {
+        target.kpi_type: target.target_value
+        for target in KPITarget.objects.filter(year=year, kpi_type__in=KPI_TYPES)
+    }
+    results = run_concurrently(calls)
+    targets = results['targets']
     
-    current_quantity = monthly_perf['total_quantity'] or 0
-    current_defects = monthly_defects['total_defect_qty'] or 0
+    # 1. 불량율 계산
+    current_quantity = results['performance', 'monthly']['quantity'] or 0
+    current_defects = results['nonconformance', 'monthly']['defect_qty'] or 0
     current_defect_rate = (current_defects / max(current_quantity, 1)) * 100 if current_quantity > 0 else 0
     
-    prev_quantity = prev_monthly_perf['total_quantity'] or 0
-    prev_defects = prev_monthly_defects['total_defect_qty'] or 0
+    prev_quantity = results['performance', 'prev']['quantity'] or 0
+    prev_defects = results['nonconformance', 'prev']['defect_qty'] or 0
     prev_defect_rate = (prev_defects / max(prev_quantity, 1)) * 100 if prev_quantity > 0 else 0
     
-    ytd_quantity = ytd_perf['total_quantity'] or 0
-    ytd_defects_qty = ytd_defects['total_defect_qty'] or 0
+    ytd_quantity = results['performance', 'ytd']['quantity'] or 0
+    ytd_defects_qty = results['nonconformance', 'ytd']['defect_qty'] or 0
     ytd_defect_rate = (ytd_defects_qty / max(ytd_quantity, 1)) * 100 if ytd_quantity > 0 else 0
     
-    defect_rate_target = KPITarget.objects.filter(year=year, kpi_type='defect_rate').first()
-    annual_target_defect_rate = float(defect_rate_target.target_value) if defect_rate_target else 0
+    annual_target_defect_rate = float(targets.get('defect_rate', 0))
     
     # 2. F-COST 계산
-    monthly_f_cost = Nonconformance.objects.filter(
-        occurrence_date__year=year, occurrence_date__month=month
-    ).aggregate(total_amount=Sum('total_amount'))
+    current_f_cost = float(results['nonconformance', 'monthly']['f_cost'] or 0)
+    prev_f_cost = float(results['nonconformance', 'prev']['f_cost'] or 0)
+    ytd_f_cost_value = float(results['nonconformance', 'ytd']['f_cost'] or 0)
     
-    prev_monthly_f_cost = Nonconformance.objects.filter(
-        occurrence_date__year=prev_year, occurrence_date__month=prev_month
-    ).aggregate(total_amount=Sum('total_amount'))
-    
-    ytd_f_cost = Nonconformance.objects.filter(
-        occurrence_date__year=year, occurrence_date__month__lte=month
-    ).aggregate(total_amount=Sum('total_amount'))
-    
-    current_f_cost = float(monthly_f_cost['total_amount'] or 0)
-    prev_f_cost = float(prev_monthly_f_cost['total_amount'] or 0)
-    ytd_f_cost_value = float(ytd_f_cost['total_amount'] or 0)
-    
-    f_cost_target = KPITarget.objects.filter(year=year, kpi_type='f_cost').first()
-    annual_target_f_cost = float(f_cost_target.target_value) if f_cost_target else 0
+    annual_target_f_cost = float(targets.get('f_cost', 0))
     
     # 3. 고객 불만 건수 계산
-    monthly_complaints = CustomerComplaint.objects.filter(
-        occurrence_date__year=year, occurrence_date__month=month
-    ).count()
-    
-    prev_monthly_complaints = CustomerComplaint.objects.filter(
-        occurrence_date__year=prev_year, occurrence_date__month=prev_month
-    ).count()
+    monthly_complaints = results['complaints', 'monthly']['count']
+    prev_monthly_complaints = results['complaints', 'prev']['count']
+    ytd_complaints = results['complaints', 'ytd']['count']
     
-    ytd_complaints = CustomerComplaint.objects.filter(
-        occurrence_date__year=year, occurrence_date__month__lte=month
-    ).count()
-    
-    complaints_target = KPITarget.objects.filter(year=year, kpi_type='complaints').first()
-    annual_target_complaints = int(complaints_target.target_value) if complaints_target else 0
+    annual_target_complaints = int(targets.get('complaints', 0))
     
     # 응답 데이터 구성
     response_data = {
@@ -148,3 +145,60 @@ def dashboard_kpis(request):
     }
     
     return Response(response_data, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def defect_rate_league(request):
+    """업체/품명별 불량률(ppm) 및 F-COST 순위표
+    
+    Query Parameters:
+        group_by (str): vendor, product_name, control_no (기본값: vendor)
+        order_by (str): ppm, f_cost, defect_qty (기본값: ppm)
+        min_quantity (int): 최소 실적 수량 (기본값: 0)
+        limit (int): 최대 반환 개수 (기본값: 50, 최대 500)
+        date_from, date_to, type, vendor, product_name: 공통 분석 필터
+    """
+    
+    group_by = request.GET.get('group_by', 'vendor')
+    order_by = request.GET.get('order_by', 'ppm')
+    
+    if group_by not in LEAGUE_GROUP_FIELDS:
+        return Response(
+            {'error': f'group_by는 {", ".join(LEAGUE_GROUP_FIELDS)} 중 하나여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    if order_by not in LEAGUE_ORDER_FIELDS:
+        return Response(
+            {'error': f'order_by는 {", ".join(LEAGUE_ORDER_FIELDS)} 중 하나여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        min_quantity = int(request.GET.get('min_quantity', 0))
+        limit = min(int(request.GET.get('limit', 50)), 500)
+    except ValueError:
+        return Response({'error': '유효하지 않은 파라미터입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    if min_quantity < 0 or limit < 0:
+        return Response(
+            {'error': 'min_quantity와 limit은 0 이상이어야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        filters = parse_analysis_filters(request.GET)
+    except AnalysisFilterError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    rows = league_rows(filters, group_by, order_by=order_by, min_quantity=min_quantity)
+    
+    return Response({
+        'group_by': group_by,
+        'order_by': order_by,
+        'date_from': filters['date_from'].isoformat(),
+        'date_to': filters['date_to'].isoformat(),
+        'count': len(rows),
+        'data': rows[:limit],
+    }, status=status.HTTP_200_OK)
@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class MonitoringConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'monitoring'
+    verbose_name = '모니터링'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .timing import install_query_recorder
+
+        # 새 DB 연결마다 쿼리 계측 래퍼 설치 (요청 처리 중일 때만 기록)
+        connection_created.connect(install_query_recorder, dispatch_uid='monitoring_query_recorder')
@@ -0,0 +1,152 @@
+"""
+Prometheus 메트릭 (GET /metrics)
+
+요청/쿼리 메트릭은 prometheus_client 카운터/히스토그램에 기록한다. 환경 변수
+PROMETHEUS_MULTIPROC_DIR이 지정되어 있으면 prometheus_client가 값을 그 디렉토리의
+프로세스별 mmap 파일에 쓰고, /metrics는 모든 파일을 합산하므로 어느 Uvicorn 워커가
+스크랩 요청을 받아도 전체 워커의 합계가 나온다 (디렉토리는 서버 시작 시 비워야 함).
+
+백업 파일 크기와 스케줄러 작업 실행 시간은 별도 프로세스(run_scheduler)에서 만들어지므로
+스크랩할 때 백업 카탈로그와 작업 실행 기록(DjangoJobExecution)에서 읽는다.
+"""
+import logging
+import os
+from datetime import datetime
+
+from django.conf import settings
+from prometheus_client import (
+    REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from .timing import LATENCY_BUCKETS_MS
+
+logger = logging.getLogger(__name__)
+
+http_requests = Counter(
+    'qms_http_requests_total', 'HTTP 요청 수', ['method', 'route', 'status']
+)
+http_request_duration = Histogram(
+    'qms_http_request_duration_seconds', 'HTTP 요청 처리 시간', ['method', 'route'],
+    buckets=[bound / 1000 for bound in LATENCY_BUCKETS_MS],
+)
+db_queries = Counter(
+    'qms_db_queries_total', '요청 처리 중 실행한 DB 쿼리 수', ['method', 'route']
+)
+db_query_seconds = Counter(
+    'qms_db_query_seconds_total', '요청 처리 중 DB 쿼리 실행 시간 합계', ['method', 'route']
+)
+sqlite_lock_wait = Histogram(
+    'qms_sqlite_lock_wait_seconds', 'SQLite 쓰기 트랜잭션 시작(BEGIN IMMEDIATE) 잠금 대기 시간',
+    buckets=(0.001, 0.005, 0.025, 0.1, 0.5, 1, 2.5, 5, 10),
+)
+sqlite_busy_errors = Counter(
+    'qms_sqlite_busy_errors_total', 'SQLite database is locked 오류 수'
+)
+
+
+def observe_request(method, route, status_code, stats):
+    """요청 하나의 메트릭 기록 (RequestTimingMiddleware에서 호출)"""
+    http_requests.labels(method, route, str(status_code)).inc()
+    http_request_duration.labels(method, route).observe(stats.total_time)
+    if stats.query_count:
+        db_queries.labels(method, route).inc(stats.query_count)
+        db_query_seconds.labels(method, route).inc(stats.db_time)
+
+
+def observe_query(connection, sql, duration, error=None):
+    """쿼리 하나의 SQLite 잠금 관련 메트릭 기록 (요청 밖의 쿼리 포함)"""
+    if connection.vendor != 'sqlite':
+        return
+    if error is not None and 'locked' in str(error):
+        sqlite_busy_errors.inc()
+    if sql.startswith('BEGIN'):
+        sqlite_lock_wait.observe(duration)
+
+
+class ApplicationStateCollector:
+    """스크랩 시점에 읽는 백업/스케줄러 상태"""
+
+    def collect(self):
+        yield from self.collect_backups()
+        yield from self.collect_scheduler_jobs()
+
+    def collect_backups(self):
+        from backup_management.catalog import backup_catalog
+
+        try:
+            entries = backup_catalog.entries()
+        except Exception as e:
+            logger.warning(f"백업 메트릭 수집 실패: {str(e)}")
+            return
+
+        files = GaugeMetricFamily('qms_backup_files', '백업 파일 수')
+        files.add_metric([], len(entries))
+        total = GaugeMetricFamily('qms_backup_size_bytes', '백업 파일 총 크기')
+        total.add_metric([], sum(entry['size'] for entry in entries.values()))
+        yield files
+        yield total
+
+        if entries:
+            latest = max(entries.values(), key=lambda entry: entry['created_at'])
+            size = GaugeMetricFamily('qms_backup_last_size_bytes', '가장 최근 백업 파일 크기', labels=['backup_type'])
+            size.add_metric([latest['backup_type']], latest['size'])
+            created = GaugeMetricFamily('qms_backup_last_timestamp_seconds', '가장 최근 백업 생성 시각')
+            created.add_metric([], datetime.fromisoformat(latest['created_at']).timestamp())
+            yield size
+            yield created
+
+    def collect_scheduler_jobs(self):
+        from django_apscheduler.models import DjangoJobExecution
+
+        try:
+            executions = list(
+                DjangoJobExecution.objects
+                .exclude(duration=None)
+                .order_by('job_id', '-run_time')
+                .values('job_id', 'status', 'run_time', 'duration')
+            )
+        except Exception as e:
+            logger.warning(f"스케줄러 메트릭 수집 실패: {str(e)}")
+            return
+
+        duration = GaugeMetricFamily(
+            'qms_scheduler_job_last_duration_seconds', '스케줄러 작업 최근 실행 시간', labels=['job']
+        )
+        success = GaugeMetricFamily(
+            'qms_scheduler_job_last_success', '스케줄러 작업 최근 실행 성공 여부 (1/0)', labels=['job']
+        )
+        last_run = GaugeMetricFamily(
+            'qms_scheduler_job_last_run_timestamp_seconds', '스케줄러 작업 최근 실행 시각', labels=['job']
+        )
+        seen = set()
+        for execution in executions:
+            job = execution['job_id']
+            if job in seen:
+                continue
+            seen.add(job)
+            duration.add_metric([job], float(execution['duration']))
+            success.add_metric([job], 1 if execution['status'] == DjangoJobExecution.SUCCESS else 0)
+            last_run.add_metric([job], execution['run_time'].timestamp())
+        yield duration
+        yield success
+        yield last_run
+
+
+def render_metrics():
+    """/metrics 응답 본문 (텍스트 형식)"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    state_registry = CollectorRegistry(auto_describe=False)
+    state_registry.register(ApplicationStateCollector())
+    return generate_latest(registry) + generate_latest(state_registry)
+
+
+def is_local_scrape(request):
+    """허용된 로컬 주소에서 직접 온 요청인지 (Nginx를 거친 요청은 거부)"""
+    if request.META.get('HTTP_X_FORWARDED_FOR') or request.META.get('HTTP_X_REAL_IP'):
+        return False
+    return request.META.get('REMOTE_ADDR') in getattr(settings, 'METRICS_ALLOWED_IPS', ['127.0.0.1', '::1'])
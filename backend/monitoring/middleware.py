@@ -0,0 +1,93 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .metrics import observe_request
+from .timing import RequestStats, current_request_stats, endpoint_stats
+
+logger = logging.getLogger(__name__)
+
+
+def route_name(request):
+    """집계 키: URL 패턴 ('api/performance/<int:pk>/', 경로의 ID는 묶임)"""
+    match = getattr(request, 'resolver_match', None)
+    return match.route if match else '<unmatched>'
+
+
+def view_path(view_func):
+    """뷰 이름: 'performance.views.performance_list' (DRF 클래스 뷰/뷰셋은 클래스 경로)"""
+    view = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None) or view_func
+    return f"{view.__module__}.{view.__name__}"
+
+
+class RequestTimingMiddleware:
+    """
+    요청별 쿼리 수/DB 시간/직렬화 시간/JSON 인코딩 시간/Python 시간 계측
+
+    - 응답에 Server-Timing 헤더 추가 (브라우저 개발자 도구 Network 탭에서 확인)
+    - SLOW_REQUEST_MS 이상 걸린 요청은 반복 쿼리 상위 목록과 함께 경고 로그
+    - 엔드포인트별 응답 시간 히스토그램 갱신 (GET /api/monitoring/endpoints/)
+    - Prometheus 요청/쿼리 메트릭 기록 (GET /metrics)
+
+    스트리밍 응답(CSV 내보내기 등)은 본문 전송 전까지의 시간만 잰다.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_TIMING', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            stats.finish()
+            current_request_stats.reset(token)
+
+        if getattr(settings, 'SERVER_TIMING_HEADER', True):
+            response['Server-Timing'] = stats.server_timing()
+
+        total_ms = stats.total_time * 1000
+        route = route_name(request)
+        endpoint_stats.observe(f"{request.method} {route}", total_ms, stats.query_count)
+        observe_request(request.method, route, response.status_code, stats)
+
+        if total_ms >= getattr(settings, 'SLOW_REQUEST_MS', 1000):
+            self.log_slow_request(request, response, stats)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """느린 쿼리 로그에 남길 호출 뷰 정보"""
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.view = view_path(view_func)
+            stats.view_kwargs = {key: str(value) for key, value in view_kwargs.items()}
+            stats.request_line = f"{request.method} {request.get_full_path()}"
+        return None
+
+    def process_template_response(self, request, response):
+        """DRF Response 렌더링(JSON 인코딩) 시간 측정"""
+        stats = current_request_stats.get()
+        if stats is not None:
+            started = time.perf_counter()
+
+            def record_render(rendered):
+                stats.add_encode(time.perf_counter() - started)
+
+            response.add_post_render_callback(record_render)
+        return response
+
+    def log_slow_request(self, request, response, stats):
+        lines = [
+            f"느린 요청: {request.method} {request.get_full_path()} → {response.status_code} "
+            f"{stats.total_time * 1000:.0f}ms (쿼리 {stats.query_count}개, DB {stats.db_time * 1000:.0f}ms, "
+            f"직렬화 {stats.serialize_time * 1000:.0f}ms, 인코딩 {stats.encode_time * 1000:.0f}ms, "
+            f"Python {stats.app_time * 1000:.0f}ms)"
+        ]
+        for sql, count, duration in stats.top_repeated():
+            lines.append(f"  {count}회 {duration * 1000:.0f}ms: {sql[:300]}")
+        logger.warning('\n'.join(lines))
@@ -0,0 +1,250 @@
+"""
+느린 쿼리 로그
+
+SLOW_QUERY_MS 이상 걸린 쿼리를 실행 계획(SQLite EXPLAIN QUERY PLAN / PostgreSQL EXPLAIN),
+호출한 뷰와 요청 경로, 쿼리 파라미터와 함께 SLOW_QUERY_LOG_DIR의 날짜별 JSONL 파일에 기록한다.
+
+- 파일은 하루 단위로 바뀌고 SLOW_QUERY_LOG_DAYS일이 지난 파일은 삭제한다. 이름을 바꾸는
+  회전 방식이 아니므로 여러 워커 프로세스가 같은 파일에 추가해도 서로 충돌하지 않는다.
+- 하루 파일이 SLOW_QUERY_LOG_MAX_BYTES를 넘으면 그날은 더 기록하지 않는다.
+- 실행 계획은 같은 형태(정규화 SQL)의 쿼리마다 EXPLAIN_INTERVAL초에 한 번만 조회하고
+  그 사이에는 프로세스에 보관한 계획을 재사용한다.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from django.conf import settings
+
+from .timing import current_request_stats, fingerprint
+
+logger = logging.getLogger(__name__)
+
+LOG_PREFIX = 'slow_queries-'
+
+# 같은 정규화 SQL의 실행 계획 재조회 간격(초)
+EXPLAIN_INTERVAL = 300
+
+# 보관할 실행 계획 수 상한 (넘으면 비움)
+MAX_CACHED_PLANS = 1000
+
+# 실행 계획을 조회할 문장 (EXPLAIN은 쿼리를 실행하지 않음)
+EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')
+
+# 기록할 파라미터 문자열 길이 상한
+MAX_PARAM_LENGTH = 200
+
+_lock = threading.Lock()
+_plans = {}
+_cleaned_on = None
+
+
+def get_log_dir():
+    return Path(getattr(settings, 'SLOW_QUERY_LOG_DIR', settings.BASE_DIR / 'logs'))
+
+
+def log_path(day):
+    return get_log_dir() / f"{LOG_PREFIX}{day:%Y%m%d}.jsonl"
+
+
+def explain(connection, sql, params, many):
+    """
+    실행 계획 조회 (실행 래퍼를 거치지 않는 커서 사용)
+
+    Returns:
+        list: 계획 줄 목록 (SQLite는 부모-자식 관계를 들여쓰기로 표시)
+    """
+    if many:
+        params = next(iter(params), None) if params else None
+    # PostgreSQL은 트랜잭션 안의 오류가 트랜잭션 전체를 중단시키므로 세이브포인트로 격리
+    use_savepoint = connection.vendor == 'postgresql' and not connection.get_autocommit()
+    cursor = connection.create_cursor()
+    try:
+        if use_savepoint:
+            cursor.execute('SAVEPOINT slow_query_explain')
+        try:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+            rows = cursor.fetchall()
+        except Exception:
+            if use_savepoint:
+                cursor.execute('ROLLBACK TO SAVEPOINT slow_query_explain')
+            raise
+        if use_savepoint:
+            cursor.execute('RELEASE SAVEPOINT slow_query_explain')
+    finally:
+        cursor.close()
+
+    if connection.vendor != 'sqlite':
+        return [row[0] for row in rows]
+
+    # SQLite: (id, parent, notused, detail)
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append(f"{'  ' * depth[node_id]}{detail}")
+    return lines
+
+
+def get_plan(connection, sql, params, many, key):
+    """정규화 SQL별로 EXPLAIN_INTERVAL 동안 재사용하는 실행 계획"""
+    if not sql.lstrip()[:6].upper().startswith(EXPLAINABLE):
+        return None
+
+    now = time.monotonic()
+    cached = _plans.get((connection.alias, key))
+    if cached and now - cached[0] < EXPLAIN_INTERVAL:
+        return cached[1]
+
+    try:
+        plan = explain(connection, sql, params, many)
+    except Exception as e:
+        plan = [f"EXPLAIN 실패: {str(e)}"]
+    if len(_plans) >= MAX_CACHED_PLANS:
+        _plans.clear()
+    _plans[(connection.alias, key)] = (now, plan)
+    return plan
+
+
+def is_full_scan(plan):
+    """실행 계획에 인덱스 없는 전체 테이블 스캔이 있는지"""
+    for line in plan or ():
+        line = line.strip()
+        if line.startswith('SCAN ') and ' USING ' not in line:
+            return True
+        if 'Seq Scan' in line:
+            return True
+    return False
+
+
+def _format_params(params, many):
+    if params is None:
+        return None
+    if many:
+        params = next(iter(params), None)
+        if params is None:
+            return None
+    if isinstance(params, dict):
+        return {key: repr(value)[:MAX_PARAM_LENGTH] for key, value in params.items()}
+    return [repr(value)[:MAX_PARAM_LENGTH] for value in params]
+
+
+def _cleanup(today):
+    """보관 기간이 지난 로그 파일 삭제 (하루 한 번)"""
+    global _cleaned_on
+    if _cleaned_on == today:
+        return
+    _cleaned_on = today
+    oldest = today - timedelta(days=getattr(settings, 'SLOW_QUERY_LOG_DAYS', 14) - 1)
+    for path in get_log_dir().glob(f"{LOG_PREFIX}*.jsonl"):
+        try:
+            if datetime.strptime(path.stem[len(LOG_PREFIX):], '%Y%m%d').date() < oldest:
+                path.unlink(missing_ok=True)
+        except (ValueError, OSError):
+            continue
+
+
+def write_record(record, today=None):
+    """오늘 로그 파일에 한 줄 추가"""
+    today = today or date.today()
+    line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+    with _lock:
+        get_log_dir().mkdir(parents=True, exist_ok=True)
+        _cleanup(today)
+        path = log_path(today)
+        try:
+            if path.stat().st_size >= getattr(settings, 'SLOW_QUERY_LOG_MAX_BYTES', 20 * 1024 * 1024):
+                return False
+        except FileNotFoundError:
+            pass
+        # O_APPEND로 한 번에 써서 다른 프로세스가 쓴 줄과 섞이지 않게 함
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode('utf-8'))
+        finally:
+            os.close(fd)
+    return True
+
+
+def record_slow_query(connection, sql, params, many, duration):
+    """느린 쿼리 하나 기록 (실행 래퍼에서 호출, 실패해도 쿼리에는 영향 없음)"""
+    try:
+        key = fingerprint(sql)
+        plan = get_plan(connection, sql, params, many, key)
+        stats = current_request_stats.get()
+        record = {
+            'time': datetime.now().isoformat(timespec='milliseconds'),
+            'duration_ms': round(duration * 1000, 1),
+            'database': connection.alias,
+            'fingerprint': key,
+            'sql': sql,
+            'params': _format_params(params, many),
+            'many': many,
+            'plan': plan,
+            'full_scan': is_full_scan(plan),
+            'view': stats.view if stats else None,
+            'view_kwargs': stats.view_kwargs if stats else None,
+            'request': stats.request_line if stats else None,
+        }
+        write_record(record)
+        logger.warning(
+            f"느린 쿼리 {record['duration_ms']:.0f}ms ({record['view'] or '요청 밖'}): {key[:200]}"
+        )
+    except Exception as e:
+        logger.error(f"느린 쿼리 기록 실패: {str(e)}")
+
+
+def read_records(days=1, today=None):
+    """최근 days일 로그 레코드 (오래된 것부터)"""
+    today = today or date.today()
+    records = []
+    for offset in range(days - 1, -1, -1):
+        path = log_path(today - timedelta(days=offset))
+        if not path.exists():
+            continue
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # 다른 프로세스가 쓰는 중인 마지막 줄
+                    continue
+    return records
+
+
+def aggregate(records):
+    """
+    정규화 SQL별 집계 (총 시간 내림차순)
+
+    Returns:
+        list: fingerprint, count, total_ms, mean_ms, max_ms, last_seen, full_scan, views, plan, example_sql
+    """
+    groups = defaultdict(list)
+    for record in records:
+        groups[record['fingerprint']].append(record)
+
+    rows = []
+    for key, items in groups.items():
+        durations = [item['duration_ms'] for item in items]
+        latest = items[-1]
+        slowest = max(items, key=lambda item: item['duration_ms'])
+        rows.append({
+            'fingerprint': key,
+            'count': len(items),
+            'total_ms': round(sum(durations), 1),
+            'mean_ms': round(sum(durations) / len(durations), 1),
+            'max_ms': max(durations),
+            'last_seen': latest['time'],
+            'full_scan': latest['full_scan'],
+            'views': sorted({item['view'] for item in items if item['view']}),
+            'plan': latest['plan'],
+            'example_sql': slowest['sql'],
+            'example_params': slowest['params'],
+        })
+    rows.sort(key=lambda row: row['total_ms'], reverse=True)
+    return rows
@@ -0,0 +1,242 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.db import OperationalError, connection
+from django.http import HttpResponse
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from accounts.models import User
+from . import slow_queries
+from .timing import RollingHistogram, endpoint_stats, fingerprint, record_query
+
+
+class RequestTimingMiddlewareTest(APITestCase):
+    """요청별 쿼리/시간 계측과 엔드포인트 통계"""
+
+    def setUp(self):
+        endpoint_stats.clear()
+        self.addCleanup(endpoint_stats.clear)
+        self.user = User.objects.create(
+            username='admin', name='관리자', department='품질팀', position='과장',
+            phone_number='010-0000-0000', role_level=2, status='active'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_server_timing_header_counts_queries(self):
+        response = self.client.get('/api/performance/list/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        timing = dict(
+            part.split(';', 1) for part in response['Server-Timing'].split(', ')
+        )
+        self.assertEqual(set(timing), {'db', 'serialize', 'encode', 'app', 'total'})
+        self.assertRegex(timing['db'], r'desc="DB \([1-9]\d* queries\)"')
+
+    def test_serialize_excludes_queries_inside_measured_block(self):
+        """직렬화 구간 안에서 실행된 쿼리 시간은 DB 시간에만 들어감"""
+        from .timing import RequestStats, current_request_stats, measure_serialization
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        try:
+            with mock.patch('monitoring.timing.time.perf_counter', side_effect=[10.0, 10.5]):
+                with measure_serialization():
+                    stats.add_query('SELECT 1', 0.3)
+        finally:
+            current_request_stats.reset(token)
+        self.assertAlmostEqual(stats.serialize_time, 0.2)
+        self.assertAlmostEqual(stats.db_time, 0.3)
+
+    def test_slow_request_logs_repeated_queries(self):
+        for i in range(3):
+            User.objects.create(
+                username=f'user{i}', name=f'사용자{i}', department='품질팀', position='사원',
+                phone_number='010-0000-0000', role_level=0, status='active'
+            )
+
+        def view(request):
+            # N+1 형태: 같은 쿼리를 사용자마다 반복
+            for user in User.objects.all():
+                User.objects.filter(pk=user.pk).exists()
+            return HttpResponse()
+
+        from .middleware import RequestTimingMiddleware
+
+        request = mock.Mock(method='GET', resolver_match=None, get_full_path=lambda: '/api/test/')
+        with override_settings(SLOW_REQUEST_MS=0), self.assertLogs('monitoring.middleware', 'WARNING') as logs:
+            RequestTimingMiddleware(view)(request)
+
+        self.assertIn('쿼리 5개', logs.output[0])
+        self.assertIn('4회', logs.output[0])
+
+    def test_endpoint_stats_admin_only(self):
+        self.client.get('/api/performance/list/')
+        self.client.get('/api/performance/list/')
+
+        response = self.client.get('/api/monitoring/endpoints/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = {row['endpoint']: row for row in response.data['endpoints']}
+        self.assertEqual(rows['GET api/performance/list/']['count'], 2)
+
+        self.user.role_level = 1
+        self.user.save()
+        response = self.client.get('/api/monitoring/endpoints/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class MetricsEndpointTest(APITestCase):
+    """Prometheus /metrics 엔드포인트"""
+
+    def test_metrics_include_requests_and_backups(self):
+        from backup_management.catalog import backup_catalog
+
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        (temp_dir / 'db_backup_20250101_000000.sqlite3').write_bytes(b'x' * 100)
+        self.client.get('/api/performance/list/')
+
+        with override_settings(BACKUP_DIR=temp_dir):
+            response = self.client.get('/metrics')
+            backup_catalog.reset()
+
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn('qms_http_requests_total{method="GET",route="api/performance/list/",status="401"}', body)
+        self.assertIn('qms_backup_size_bytes 100.0', body)
+
+    def test_metrics_only_for_local_scrapers(self):
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='10.0.0.5').status_code, 403)
+        # Nginx를 거친 요청 (REMOTE_ADDR은 127.0.0.1)
+        self.assertEqual(self.client.get('/metrics', HTTP_X_FORWARDED_FOR='10.0.0.5').status_code, 403)
+
+    def test_sqlite_busy_errors_counted(self):
+        from prometheus_client import REGISTRY
+
+        def locked(sql, params, many, context):
+            raise OperationalError('database is locked')
+
+        before = REGISTRY.get_sample_value('qms_sqlite_busy_errors_total') or 0
+        with self.assertRaises(OperationalError):
+            record_query(locked, 'BEGIN IMMEDIATE', None, False, {'connection': connection})
+        self.assertEqual(REGISTRY.get_sample_value('qms_sqlite_busy_errors_total'), before + 1)
+
+    def test_multiprocess_values_are_aggregated(self):
+        """워커 프로세스 두 개가 기록한 값을 합산"""
+        from prometheus_client import CollectorRegistry, multiprocess
+
+        metrics_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, metrics_dir, ignore_errors=True)
+        code = (
+            'import django; django.setup()\n'
+            'from monitoring.metrics import http_requests\n'
+            'http_requests.labels("GET", "api/test/", "200").inc(3)\n'
+        )
+        env = {**os.environ, 'PROMETHEUS_MULTIPROC_DIR': metrics_dir, 'DJANGO_SETTINGS_MODULE': 'backend.settings'}
+        for _ in range(2):
+            subprocess.run([sys.executable, '-c', code], cwd=settings.BASE_DIR, env=env, check=True)
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry, path=metrics_dir)
+        self.assertEqual(
+            registry.get_sample_value(
+                'qms_http_requests_total', {'method': 'GET', 'route': 'api/test/', 'status': '200'}
+            ),
+            6,
+        )
+
+
+class SlowQueryLogTest(APITestCase):
+    """느린 쿼리 로그 (실행 계획, 호출 뷰, 정규화 SQL 집계)"""
+
+    def setUp(self):
+        self.log_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.log_dir, ignore_errors=True)
+        slow_queries._plans.clear()
+        self.user = User.objects.create(
+            username='admin', name='관리자', department='품질팀', position='과장',
+            phone_number='010-0000-0000', role_level=2, status='active'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_records_plan_and_calling_view(self):
+        # 모든 쿼리를 느린 쿼리로 기록
+        with override_settings(SLOW_QUERY_MS=0.001, SLOW_QUERY_LOG_DIR=self.log_dir), \
+                self.assertLogs('monitoring.slow_queries', 'WARNING'):
+            self.client.get('/api/performance/list/', {'search': 'ABC'})
+            records = [
+                record for record in slow_queries.read_records()
+                if 'performance_records' in record['sql']
+            ]
+            response = self.client.get('/api/monitoring/slow-queries/')
+
+        self.assertTrue(records)
+        record = records[0]
+        self.assertEqual(record['view'], 'performance.views.PerformanceListView')
+        self.assertTrue(record['request'].startswith('GET /api/performance/list/?search=ABC'))
+        self.assertIn("'%ABC%'", record['params'])
+        self.assertTrue(record['plan'])
+        # 업체명 부분 일치 검색은 인덱스를 쓸 수 없음
+        self.assertTrue(record['full_scan'])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row = next(row for row in response.data['queries'] if row['fingerprint'] == record['fingerprint'])
+        self.assertIn('performance.views.PerformanceListView', row['views'])
+
+    def test_explain_uses_sqlite_query_plan(self):
+        plan = slow_queries.explain(
+            connection, 'SELECT * FROM performance_records WHERE id = %s', [1], False
+        )
+        self.assertIn('SEARCH performance_records USING INTEGER PRIMARY KEY', plan[0])
+        self.assertFalse(slow_queries.is_full_scan(plan))
+        self.assertTrue(slow_queries.is_full_scan(['SCAN performance_records']))
+
+    def test_daily_files_expire_and_are_capped(self):
+        with override_settings(SLOW_QUERY_LOG_DIR=self.log_dir, SLOW_QUERY_LOG_DAYS=14, SLOW_QUERY_LOG_MAX_BYTES=200):
+            old_path = slow_queries.log_path(date(2025, 1, 1))
+            old_path.write_text('{}\n')
+
+            self.assertTrue(slow_queries.write_record({'sql': 'x' * 300}, today=date(2025, 1, 20)))
+            self.assertFalse(old_path.exists())
+            # 하루 파일 크기 상한을 넘으면 기록하지 않음
+            self.assertFalse(slow_queries.write_record({'sql': 'y'}, today=date(2025, 1, 20)))
+
+    def test_requires_admin(self):
+        self.user.role_level = 1
+        self.user.save()
+        response = self.client.get('/api/monitoring/slow-queries/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TimingUtilsTest(SimpleTestCase):
+    """SQL 정규화와 이동 히스토그램"""
+
+    def test_fingerprint_groups_literals_and_in_lists(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'a''b'  AND n > 10"),
+            'SELECT * FROM t WHERE id IN (...) AND name = ? AND n > ?',
+        )
+        self.assertEqual(fingerprint('SELECT "U0"."id" FROM t1 U0'), 'SELECT "U0"."id" FROM t1 U0')
+
+    def test_rolling_histogram_drops_old_slots(self):
+        histogram = RollingHistogram(window_seconds=120, slot_seconds=60)
+        for duration in (3, 40, 40, 700):
+            histogram.observe(duration, query_count=2, now=0)
+        histogram.observe(20000, now=60)
+
+        summary = histogram.snapshot(now=60)
+        self.assertEqual(summary['count'], 5)
+        self.assertEqual(summary['p50_ms'], 50)
+        self.assertEqual(summary['p99_ms'], 20000)
+        self.assertEqual(summary['buckets']['+Inf'], 1)
+
+        # 2분 뒤에는 첫 칸이 빠짐
+        self.assertEqual(histogram.snapshot(now=150)['count'], 1)
@@ -0,0 +1,305 @@
+"""
+요청별 쿼리/시간 계측
+
+RequestTimingMiddleware가 요청마다 RequestStats를 컨텍스트 변수에 넣고, 모든 DB 연결에
+설치된 실행 래퍼(record_query)가 쿼리 수와 DB 시간을 더한다. 컨텍스트 변수를 쓰므로
+대시보드 집계처럼 스레드 풀에서 실행된 쿼리도(contextvars.copy_context) 같은 요청에 집계된다.
+DB 시간은 쿼리 실행(execute) 시간이며, 결과 행을 가져오는(fetch) 시간은 Python 시간에 포함된다.
+
+직렬화(serialize)는 measure_serialization()으로 감싼 구간(목록 API의 행 → dict 변환)만
+재며, 그 밖의 시리얼라이저 변환 시간은 Python(app) 시간에 들어간다. encode는 DRF Response의
+JSON 인코딩(render) 시간이다.
+
+엔드포인트(URL 패턴)별 응답 시간은 최근 REQUEST_STATS_WINDOW초 동안의 히스토그램으로
+프로세스 메모리에 보관한다 (워커 프로세스마다 따로 집계).
+"""
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import OperationalError
+
+# 처리 중인 요청의 계측 정보 (요청 밖에서는 None)
+current_request_stats = ContextVar('current_request_stats', default=None)
+
+# 히스토그램 버킷 상한(ms)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# 보관할 엔드포인트 수 상한 (URL 패턴 단위라 보통 수백 개 이하)
+MAX_ENDPOINTS = 1000
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_LIST = re.compile(r'\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))+\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fingerprint(sql):
+    """
+    SQL 정규화 (같은 형태의 쿼리를 하나로 묶기 위함)
+
+    문자열/숫자 리터럴은 ?로, IN 목록은 (...)로 바꾸고 공백을 하나로 줄인다.
+    """
+    sql = _STRING_LITERAL.sub('?', sql)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = _PLACEHOLDER_LIST.sub('(...)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+class RequestStats:
+    """요청 하나의 쿼리 수, DB 시간, 직렬화 시간, JSON 인코딩 시간"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished = None
+        self.query_count = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.encode_time = 0.0
+        # 호출한 뷰 정보 (느린 쿼리 로그용, process_view에서 설정)
+        self.view = None
+        self.view_kwargs = None
+        self.request_line = None
+        # 원본 SQL별 (실행 횟수, 누적 시간) - 정규화는 보고할 때만
+        self.sql_count = Counter()
+        self.sql_time = Counter()
+        self._lock = threading.Lock()
+
+    def add_query(self, sql, duration):
+        with self._lock:
+            self.query_count += 1
+            self.db_time += duration
+            self.sql_count[sql] += 1
+            self.sql_time[sql] += duration
+
+    def add_serialize(self, duration):
+        self.serialize_time += duration
+
+    def add_encode(self, duration):
+        self.encode_time += duration
+
+    def finish(self):
+        self.finished = time.perf_counter()
+
+    @property
+    def total_time(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def app_time(self):
+        """DB/직렬화/인코딩을 뺀 Python 처리 시간"""
+        return max(self.total_time - self.db_time - self.serialize_time - self.encode_time, 0.0)
+
+    def top_repeated(self, limit=5):
+        """
+        반복 실행된 쿼리 (N+1 의심)
+
+        Returns:
+            list: [(정규화 SQL, 실행 횟수, 누적 시간(초))], 2회 이상만, 횟수 내림차순
+        """
+        with self._lock:
+            items = list(self.sql_count.items())
+            times = dict(self.sql_time)
+
+        grouped_count = Counter()
+        grouped_time = Counter()
+        for sql, count in items:
+            key = fingerprint(sql)
+            grouped_count[key] += count
+            grouped_time[key] += times[sql]
+        return [
+            (sql, count, grouped_time[sql])
+            for sql, count in grouped_count.most_common(limit) if count > 1
+        ]
+
+    def server_timing(self):
+        """Server-Timing 헤더 값 (ms)"""
+        return ', '.join([
+            f'db;dur={self.db_time * 1000:.1f};desc="DB ({self.query_count} queries)"',
+            f'serialize;dur={self.serialize_time * 1000:.1f};desc="Serialization"',
+            f'encode;dur={self.encode_time * 1000:.1f};desc="JSON encoding"',
+            f'app;dur={self.app_time * 1000:.1f};desc="Python"',
+            f'total;dur={self.total_time * 1000:.1f}',
+        ])
+
+
+@contextmanager
+def measure_serialization():
+    """
+    감싼 구간을 현재 요청의 직렬화 시간으로 기록
+
+    구간 안에서 실행된 쿼리 시간은 DB 시간에만 넣고 직렬화 시간에서는 뺀다.
+    """
+    stats = current_request_stats.get()
+    if stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    db_before = stats.db_time
+    try:
+        yield
+    finally:
+        stats.add_serialize(time.perf_counter() - started - (stats.db_time - db_before))
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    DB 실행 래퍼
+
+    요청 처리 중이면 쿼리 시간을 기록하고, SQLite 잠금 대기/오류는 항상 메트릭에 기록한다.
+    SLOW_QUERY_MS 이상 걸린 쿼리는 실행 계획과 함께 느린 쿼리 로그에 남긴다.
+    """
+    from .metrics import observe_query
+
+    stats = current_request_stats.get()
+    error = None
+    started = time.perf_counter()
+    try:
+        result = execute(sql, params, many, context)
+    except OperationalError as e:
+        error = e
+        raise
+    finally:
+        duration = time.perf_counter() - started
+        if stats is not None:
+            stats.add_query(sql, duration)
+        observe_query(context['connection'], sql, duration, error)
+
+    slow_query_ms = getattr(settings, 'SLOW_QUERY_MS', 0)
+    if slow_query_ms and duration * 1000 >= slow_query_ms:
+        from .slow_queries import record_slow_query
+        record_slow_query(context['connection'], sql, params, many, duration)
+    return result
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created 신호: 새 연결에 실행 래퍼 설치"""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class RollingHistogram:
+    """
+    최근 window_seconds초 동안의 응답 시간 히스토그램
+
+    slot_seconds 단위 칸에 나눠 쌓고 오래된 칸은 버린다.
+    """
+
+    def __init__(self, window_seconds=900, slot_seconds=60):
+        self.slot_seconds = slot_seconds
+        self.max_slots = max(1, window_seconds // slot_seconds)
+        # (칸 번호, 버킷별 개수, 합계 ms, 최대 ms, 쿼리 수 합계)
+        self.slots = deque()
+        self._lock = threading.Lock()
+
+    def _current_slot(self, now):
+        index = int(now // self.slot_seconds)
+        if not self.slots or self.slots[-1][0] != index:
+            self.slots.append([index, [0] * (len(LATENCY_BUCKETS_MS) + 1), 0.0, 0.0, 0])
+        while self.slots[0][0] <= index - self.max_slots:
+            self.slots.popleft()
+        return self.slots[-1]
+
+    def observe(self, duration_ms, query_count=0, now=None):
+        now = time.time() if now is None else now
+        position = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                position = i
+                break
+        with self._lock:
+            slot = self._current_slot(now)
+            slot[1][position] += 1
+            slot[2] += duration_ms
+            slot[3] = max(slot[3], duration_ms)
+            slot[4] += query_count
+
+    def snapshot(self, now=None):
+        """
+        Returns:
+            dict: count, mean_ms, max_ms, p50_ms/p95_ms/p99_ms (버킷 상한 기준), mean_queries, buckets
+        """
+        now = time.time() if now is None else now
+        oldest = int(now // self.slot_seconds) - self.max_slots
+        buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        total_ms = max_ms = 0.0
+        queries = 0
+        with self._lock:
+            for index, counts, slot_total, slot_max, slot_queries in self.slots:
+                if index <= oldest:
+                    continue
+                for i, count in enumerate(counts):
+                    buckets[i] += count
+                total_ms += slot_total
+                max_ms = max(max_ms, slot_max)
+                queries += slot_queries
+
+        count = sum(buckets)
+
+        def percentile(q):
+            if not count:
+                return None
+            target = q * count
+            cumulative = 0
+            for i, bucket_count in enumerate(buckets):
+                cumulative += bucket_count
+                if cumulative >= target:
+                    # 마지막(상한 초과) 버킷은 관측 최댓값, 그 밖에는 최댓값을 넘지 않는 버킷 상한
+                    return min(LATENCY_BUCKETS_MS[i], max_ms) if i < len(LATENCY_BUCKETS_MS) else max_ms
+            return max_ms
+
+        return {
+            'count': count,
+            'mean_ms': round(total_ms / count, 1) if count else None,
+            'max_ms': round(max_ms, 1),
+            'p50_ms': percentile(0.5),
+            'p95_ms': percentile(0.95),
+            'p99_ms': percentile(0.99),
+            'mean_queries': round(queries / count, 1) if count else None,
+            'buckets': dict(zip([str(bound) for bound in LATENCY_BUCKETS_MS] + ['+Inf'], buckets)),
+        }
+
+
+class EndpointStats:
+    """엔드포인트별 RollingHistogram 모음 (프로세스 단위)"""
+
+    def __init__(self):
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint, duration_ms, query_count=0):
+        histogram = self.histograms.get(endpoint)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.get(endpoint)
+                if histogram is None:
+                    if len(self.histograms) >= MAX_ENDPOINTS:
+                        endpoint = '<other>'
+                        histogram = self.histograms.get(endpoint)
+                    if histogram is None:
+                        histogram = RollingHistogram(getattr(settings, 'REQUEST_STATS_WINDOW', 900))
+                        self.histograms[endpoint] = histogram
+        histogram.observe(duration_ms, query_count)
+
+    def snapshot(self):
+        """엔드포인트별 요약 (요청 수 내림차순, 기간 내 요청이 없는 항목 제외)"""
+        with self._lock:
+            items = list(self.histograms.items())
+        rows = []
+        for endpoint, histogram in items:
+            summary = histogram.snapshot()
+            if summary['count']:
+                rows.append({'endpoint': endpoint, **summary})
+        rows.sort(key=lambda row: row['count'], reverse=True)
+        return rows
+
+    def clear(self):
+        with self._lock:
+            self.histograms.clear()
+
+
+endpoint_stats = EndpointStats()
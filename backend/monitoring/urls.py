@@ -0,0 +1,8 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('endpoints/', views.endpoint_stats_view, name='monitoring-endpoints'),
+    path('slow-queries/', views.slow_queries_view, name='monitoring-slow-queries'),
+    path('slow-queries/recent/', views.recent_slow_queries_view, name='monitoring-slow-queries-recent'),
+]
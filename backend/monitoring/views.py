@@ -0,0 +1,110 @@
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import CONTENT_TYPE_LATEST
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from . import slow_queries
+from .metrics import is_local_scrape, render_metrics
+from .timing import endpoint_stats
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def endpoint_stats_view(request):
+    """
+    엔드포인트별 응답 시간 요약 (이 워커 프로세스 기준)
+    
+    GET /api/monitoring/endpoints/
+    
+    권한: 관리자 (role_level >= 2)
+    """
+    if request.user.role_level < 2:
+        return Response({'error': '관리자만 조회할 수 있습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+    return Response({
+        'pid': os.getpid(),
+        'window_seconds': getattr(settings, 'REQUEST_STATS_WINDOW', 900),
+        'endpoints': endpoint_stats.snapshot(),
+    })
+
+
+def _parse_positive_int(value, default, maximum):
+    """쿼리 파라미터 정수 (1 ~ maximum), 잘못된 값이면 ValueError"""
+    if value in (None, ''):
+        return default
+    number = int(value)
+    if number < 1:
+        raise ValueError(value)
+    return min(number, maximum)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def slow_queries_view(request):
+    """
+    느린 쿼리 집계 (정규화 SQL별, 총 시간 내림차순, 모든 워커 프로세스)
+    
+    GET /api/monitoring/slow-queries/?days=1&full_scan=true&limit=50
+    
+    권한: 관리자 (role_level >= 2)
+    """
+    if request.user.role_level < 2:
+        return Response({'error': '관리자만 조회할 수 있습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+    try:
+        days = _parse_positive_int(request.query_params.get('days'), 1, settings.SLOW_QUERY_LOG_DAYS)
+        limit = _parse_positive_int(request.query_params.get('limit'), 50, 500)
+    except ValueError:
+        return Response({'error': 'days와 limit은 1 이상의 정수여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    records = slow_queries.read_records(days)
+    rows = slow_queries.aggregate(records)
+    if request.query_params.get('full_scan') == 'true':
+        rows = [row for row in rows if row['full_scan']]
+
+    return Response({
+        'threshold_ms': settings.SLOW_QUERY_MS,
+        'days': days,
+        'total_records': len(records),
+        'queries': rows[:limit],
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def recent_slow_queries_view(request):
+    """
+    최근 느린 쿼리 기록 (최신순, 실행 계획/호출 뷰/파라미터 포함)
+    
+    GET /api/monitoring/slow-queries/recent/?limit=100
+    
+    권한: 관리자 (role_level >= 2)
+    """
+    if request.user.role_level < 2:
+        return Response({'error': '관리자만 조회할 수 있습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+    try:
+        limit = _parse_positive_int(request.query_params.get('limit'), 100, 1000)
+    except ValueError:
+        return Response({'error': 'limit은 1 이상의 정수여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    records = slow_queries.read_records(1)
+    return Response({'results': records[::-1][:limit]})
+
+
+def metrics_view(request):
+    """
+    Prometheus 메트릭 (텍스트 형식)
+    
+    GET /metrics
+    
+    권한: 로컬 스크래퍼 전용 (METRICS_ALLOWED_IPS, Nginx를 거친 요청은 거부)
+    """
+    if not is_local_scrape(request):
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
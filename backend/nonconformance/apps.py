@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class NonconformanceConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'nonconformance'
-    verbose_name = '부적합 관리'
\ No newline at end of file
+    verbose_name = '부적합 관리'
+
+    def ready(self):
+        from . import signals  # noqa: F401
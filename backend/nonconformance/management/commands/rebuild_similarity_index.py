@@ -0,0 +1,76 @@
+from django.core.management.base import BaseCommand
+
+from nonconformance.models import Nonconformance, NonconformanceTextVector
+from nonconformance.similarity import (
+    TEXT_FIELDS, nonconformance_text, text_hash, vectorize, pack_vector,
+)
+
+
+class Command(BaseCommand):
+    help = '유사 부적합 검색용 텍스트 벡터를 생성/갱신합니다 (bulk_create 등으로 시그널 없이 저장된 데이터 포함)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='원문이 바뀌지 않은 벡터도 모두 다시 계산'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 저장할 벡터 수 (기본값: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        force = options['force']
+        batch_size = options['batch_size']
+
+        existing = {} if force else dict(
+            NonconformanceTextVector.objects.values_list('nonconformance_id', 'text_hash')
+        )
+        if force:
+            NonconformanceTextVector.objects.all().delete()
+
+        created = updated = skipped = 0
+        to_create, to_update = [], []
+
+        def flush():
+            if to_create:
+                NonconformanceTextVector.objects.bulk_create(to_create)
+                to_create.clear()
+            for vector in to_update:
+                # bulk_update는 auto_now를 갱신하지 않으므로 개별 저장
+                vector.save(update_fields=['text_hash', 'vector', 'updated_at'])
+            to_update.clear()
+
+        queryset = Nonconformance.objects.only('id', *TEXT_FIELDS).order_by('id')
+        for nonconformance in queryset.iterator(chunk_size=batch_size):
+            text = nonconformance_text(nonconformance)
+            digest = text_hash(text)
+
+            current = existing.get(nonconformance.pk)
+            if current == digest:
+                skipped += 1
+                continue
+
+            vector = NonconformanceTextVector(
+                nonconformance_id=nonconformance.pk,
+                text_hash=digest,
+                vector=pack_vector(*vectorize(text)),
+            )
+            if current is None:
+                to_create.append(vector)
+                created += 1
+            else:
+                to_update.append(vector)
+                updated += 1
+
+            if len(to_create) + len(to_update) >= batch_size:
+                flush()
+
+        flush()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'유사 부적합 벡터 갱신 완료: 생성 {created}건, 갱신 {updated}건, 변경 없음 {skipped}건'
+        ))
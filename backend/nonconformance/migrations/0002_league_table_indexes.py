@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_alter_user_status'),
+        ('nonconformance', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='nonconformance',
+            index=models.Index(fields=['occurrence_date', 'vendor', 'defect_qty', 'total_amount'], name='idx_nc_date_vendor_qty'),
+        ),
+        migrations.AddIndex(
+            model_name='nonconformance',
+            index=models.Index(fields=['occurrence_date', 'product_name', 'defect_qty', 'total_amount'], name='idx_nc_date_product_qty'),
+        ),
+    ]
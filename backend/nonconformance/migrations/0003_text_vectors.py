@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nonconformance', '0002_league_table_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NonconformanceTextVector',
+            fields=[
+                ('nonconformance', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='text_vector', serialize=False, to='nonconformance.nonconformance', verbose_name='부적합')),
+                ('text_hash', models.CharField(max_length=40, verbose_name='원문 해시')),
+                ('vector', models.BinaryField(verbose_name='벡터')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '부적합 텍스트 벡터',
+                'verbose_name_plural': '부적합 텍스트 벡터 목록',
+                'db_table': 'nonconformance_text_vectors',
+            },
+        ),
+    ]
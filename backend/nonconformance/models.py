@@ -69,6 +69,8 @@ class Nonconformance(models.Model):
         ('SUN', '일요일'),
     ]
     
+    WEEKDAY_KOREAN = dict(WEEKDAY_CHOICES)
+    
     # Primary Key
     id = models.BigAutoField(primary_key=True)
     
@@ -196,6 +198,15 @@ class Nonconformance(models.Model):
             models.Index(fields=['control_no'], name='idx_nc_control_no'),
             models.Index(fields=['defect_type_code'], name='idx_nc_defect_type'),
             models.Index(fields=['cause_code'], name='idx_nc_cause_code'),
+            # 업체/품명별 집계용 커버링 인덱스
+            models.Index(
+                fields=['occurrence_date', 'vendor', 'defect_qty', 'total_amount'],
+                name='idx_nc_date_vendor_qty'
+            ),
+            models.Index(
+                fields=['occurrence_date', 'product_name', 'defect_qty', 'total_amount'],
+                name='idx_nc_date_product_qty'
+            ),
         ]
     
     def __str__(self):
@@ -219,19 +230,40 @@ class Nonconformance(models.Model):
     
     def get_weekday_display_korean(self):
         """한글 요일 표시"""
-        weekday_map = {
-            'MON': '월요일',
-            'TUE': '화요일',
-            'WED': '수요일',
-            'THU': '목요일',
-            'FRI': '금요일',
-            'SAT': '토요일',
-            'SUN': '일요일',
-        }
-        return weekday_map.get(self.weekday_code, '')
+        return self.WEEKDAY_KOREAN.get(self.weekday_code, '')
     
     def get_6m_category_display(self):
         """6M 분류 표시"""
         if self.cause_code:
             return self.cause_code.get_category_display()
-        return ''
\ No newline at end of file
+        return ''
+
+
+class NonconformanceTextVector(models.Model):
+    """유사 부적합 검색용 텍스트 벡터 (5Why/최종불량원인/비고의 문자 n-gram)"""
+    
+    # 부적합 (1:1, 부적합 삭제 시 함께 삭제)
+    nonconformance = models.OneToOneField(
+        Nonconformance,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='text_vector',
+        verbose_name='부적합'
+    )
+    
+    # 원문 해시 (텍스트가 바뀌지 않은 저장은 벡터 재계산 생략)
+    text_hash = models.CharField(max_length=40, verbose_name='원문 해시')
+    
+    # n-gram 해시(uint32)와 가중치(float32)를 이어 붙인 바이트열
+    vector = models.BinaryField(verbose_name='벡터')
+    
+    # 다른 프로세스의 메모리 인덱스 동기화 기준
+    updated_at = models.DateTimeField(auto_now=True, db_index=True, verbose_name='수정일시')
+    
+    class Meta:
+        db_table = 'nonconformance_text_vectors'
+        verbose_name = '부적합 텍스트 벡터'
+        verbose_name_plural = '부적합 텍스트 벡터 목록'
+    
+    def __str__(self):
+        return f"{self.nonconformance_id} 텍스트 벡터"
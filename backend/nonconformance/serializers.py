@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from backend.list_serializers import ValuesListSerializer
 from .models import Nonconformance, DefectType, DefectCause
 from audit.models import AuditLog
 from decimal import Decimal
@@ -155,6 +156,15 @@ class NonconformanceListSerializer(serializers.ModelSerializer):
         ]
 
 
+class NonconformanceListValues(ValuesListSerializer):
+    """부적합 목록 빠른 직렬화 (NonconformanceListSerializer와 같은 출력)"""
+    
+    serializer_class = NonconformanceListSerializer
+    sources = {
+        'weekday': ('weekday_code', lambda code: Nonconformance.WEEKDAY_KOREAN.get(code, '')),
+    }
+
+
 class NonconformanceCreateSerializer(serializers.ModelSerializer):
     """부적합 생성 전용 시리얼라이저"""
     
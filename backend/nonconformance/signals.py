@@ -0,0 +1,37 @@
+"""
+부적합 저장/삭제 시 유사 부적합 검색 벡터 갱신, DB 복원 시 색인 초기화
+"""
+import logging
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from backup_management.signals import database_restored
+from .models import Nonconformance
+from .similarity import update_text_vector, similarity_index
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Nonconformance)
+def update_similarity_vector(sender, instance, raw=False, **kwargs):
+    """저장된 부적합의 텍스트 벡터 갱신 (원문이 바뀐 경우에만)"""
+    if raw:
+        return
+    try:
+        update_text_vector(instance)
+    except Exception as e:
+        # 벡터 갱신 실패가 부적합 저장을 막지 않도록 로그만 남김 (rebuild_similarity_index로 복구)
+        logger.error(f"유사 부적합 벡터 갱신 실패 (ID: {instance.pk}): {str(e)}")
+
+
+@receiver(post_delete, sender=Nonconformance)
+def discard_similarity_vector(sender, instance, **kwargs):
+    """삭제된 부적합을 메모리 색인에서 제거 (DB 벡터는 CASCADE로 삭제)"""
+    similarity_index.discard(instance.pk)
+
+
+@receiver(database_restored)
+def reset_similarity_index(sender, **kwargs):
+    """DB 복원 후 메모리 색인 초기화 (다음 검색 시 전체 재구성)"""
+    similarity_index.reset()
@@ -0,0 +1,281 @@
+"""
+유사 부적합(NCR) 검색
+
+5Why, 최종불량원인, 비고 텍스트를 문자 2/3-gram으로 나누어 해시한 벡터로
+저장하고, 프로세스 메모리에 역색인을 두어 코사인 유사도 상위 k건을 찾는다.
+외부 서비스 없이 서버 안에서만 동작한다.
+
+가중치는 SMART lnc.ltc 방식을 사용한다.
+- 문서(저장): 로그 TF, IDF 없음, 길이 정규화 → 다른 문서가 추가되어도 바뀌지 않음
+- 질의(검색 시): 로그 TF × IDF, 길이 정규화 → IDF는 현재 색인 기준으로 계산
+따라서 부적합 저장 시 해당 건의 벡터만 다시 계산하면 된다.
+"""
+import hashlib
+import logging
+import threading
+import zlib
+from collections import Counter
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 유사도 계산 대상 필드
+TEXT_FIELDS = ['why1', 'why2', 'why3', 'why4', 'why5', 'root_cause', 'note']
+
+# 문자 n-gram 길이
+NGRAM_SIZES = (2, 3)
+
+
+def nonconformance_text(nonconformance):
+    """유사도 계산용 원문 (대상 필드를 이어 붙이고 소문자/공백 정규화)"""
+    parts = [getattr(nonconformance, field) or '' for field in TEXT_FIELDS]
+    return ' '.join(' '.join(parts).lower().split())
+
+
+def text_hash(text):
+    """원문 변경 여부 확인용 해시"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def vectorize(text):
+    """
+    원문을 길이 정규화된 로그 TF 벡터로 변환
+
+    Returns:
+        tuple: (n-gram 해시 배열 uint32, 가중치 배열 float32), 해시 오름차순
+    """
+    counts = Counter()
+    # 필드 경계와 단어 경계를 n-gram에 포함시키기 위해 앞뒤 공백 추가
+    padded = f' {text} '
+    for size in NGRAM_SIZES:
+        for start in range(len(padded) - size + 1):
+            gram = padded[start:start + size]
+            if gram.strip():
+                counts[zlib.crc32(gram.encode('utf-8'))] += 1
+
+    if not counts:
+        return np.empty(0, dtype=np.uint32), np.empty(0, dtype=np.float32)
+
+    features = np.fromiter(counts.keys(), dtype=np.uint32, count=len(counts))
+    weights = 1 + np.log(np.fromiter(counts.values(), dtype=np.float64, count=len(counts)))
+    weights /= np.linalg.norm(weights)
+
+    order = np.argsort(features)
+    return features[order], weights[order].astype(np.float32)
+
+
+def pack_vector(features, weights):
+    """벡터를 BinaryField 저장용 바이트열로 변환"""
+    return features.astype('<u4').tobytes() + weights.astype('<f4').tobytes()
+
+
+def unpack_vector(data):
+    """pack_vector()의 역변환"""
+    data = bytes(data)
+    size = len(data) // 8
+    features = np.frombuffer(data, dtype='<u4', count=size)
+    weights = np.frombuffer(data, dtype='<f4', count=size, offset=size * 4)
+    return features, weights
+
+
+def update_text_vector(nonconformance):
+    """
+    부적합 저장 후 텍스트 벡터 갱신 (원문이 바뀐 경우에만 재계산)
+
+    Returns:
+        bool: 벡터를 새로 저장했는지 여부
+    """
+    from .models import NonconformanceTextVector
+
+    text = nonconformance_text(nonconformance)
+    digest = text_hash(text)
+
+    current = NonconformanceTextVector.objects.filter(
+        nonconformance_id=nonconformance.pk
+    ).values_list('text_hash', flat=True).first()
+    if current == digest:
+        return False
+
+    features, weights = vectorize(text)
+    NonconformanceTextVector.objects.update_or_create(
+        nonconformance_id=nonconformance.pk,
+        defaults={'text_hash': digest, 'vector': pack_vector(features, weights)},
+    )
+    return True
+
+
+class SimilarityIndex:
+    """
+    프로세스별 메모리 역색인
+
+    n-gram 해시마다 (문서 위치 배열, 가중치 배열)을 보관한다. 최초 검색 시
+    전체 벡터를 읽어 한 번에 구성하고, 이후에는 검색할 때마다 마지막 동기화
+    이후 수정된 벡터만 읽어 반영한다 (다른 워커 프로세스에서 저장된 건 포함).
+    """
+
+    # 삭제로 생긴 빈 자리가 이 비율을 넘으면 다음 검색 때 전체 재구성
+    REBUILD_RATIO = 0.3
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """색인 초기화 (다음 검색 시 전체 재구성)"""
+        self._loaded = False
+        self._ids = []          # 위치 → 부적합 ID
+        self._positions = {}    # 부적합 ID → 위치
+        self._features = {}     # 부적합 ID → (n-gram 해시 배열, 가중치 배열)
+        self._postings = {}     # n-gram 해시 → (위치 배열, 가중치 배열)
+        self._synced_at = None
+
+    def __len__(self):
+        return len(self._features)
+
+    def _load(self):
+        """전체 벡터로 역색인 구성"""
+        from .models import NonconformanceTextVector
+
+        self.reset()
+        rows = NonconformanceTextVector.objects.values_list(
+            'nonconformance_id', 'vector', 'updated_at'
+        ).iterator(chunk_size=2000)
+
+        all_features, all_positions, all_weights = [], [], []
+        for ncr_id, vector, updated_at in rows:
+            features, weights = unpack_vector(vector)
+            position = len(self._ids)
+            self._ids.append(ncr_id)
+            self._positions[ncr_id] = position
+            self._features[ncr_id] = (features, weights)
+            all_features.append(features)
+            all_positions.append(np.full(features.size, position, dtype=np.int32))
+            all_weights.append(weights)
+            if self._synced_at is None or updated_at > self._synced_at:
+                self._synced_at = updated_at
+
+        if all_features:
+            features = np.concatenate(all_features)
+            positions = np.concatenate(all_positions)
+            weights = np.concatenate(all_weights)
+
+            # n-gram 해시 기준으로 정렬한 뒤 구간별 뷰로 나누어 보관
+            order = np.argsort(features, kind='stable')
+            features, positions, weights = features[order], positions[order], weights[order]
+            keys, starts = np.unique(features, return_index=True)
+            ends = np.append(starts[1:], features.size)
+            for key, start, end in zip(keys.tolist(), starts.tolist(), ends.tolist()):
+                self._postings[key] = (positions[start:end], weights[start:end])
+
+        self._loaded = True
+        logger.info(f"유사 부적합 색인 구성: {len(self._features)}건, n-gram {len(self._postings)}종")
+
+    def _remove(self, ncr_id):
+        """색인에서 문서 제거 (위치는 비워둠)"""
+        vector = self._features.pop(ncr_id, None)
+        if vector is None:
+            return
+        features = vector[0]
+        position = self._positions[ncr_id]
+        for key in features.tolist():
+            positions, weights = self._postings[key]
+            keep = positions != position
+            if keep.all():
+                continue
+            if keep.any():
+                self._postings[key] = (positions[keep], weights[keep])
+            else:
+                del self._postings[key]
+
+    def _add(self, ncr_id, features, weights):
+        """색인에 문서 추가 (기존 문서면 같은 위치에 교체)"""
+        self._remove(ncr_id)
+        position = self._positions.get(ncr_id)
+        if position is None:
+            position = len(self._ids)
+            self._ids.append(ncr_id)
+            self._positions[ncr_id] = position
+
+        self._features[ncr_id] = (features, weights)
+        for key, weight in zip(features.tolist(), weights.tolist()):
+            posting = self._postings.get(key)
+            if posting is None:
+                self._postings[key] = (
+                    np.array([position], dtype=np.int32),
+                    np.array([weight], dtype=np.float32),
+                )
+            else:
+                self._postings[key] = (
+                    np.append(posting[0], np.int32(position)),
+                    np.append(posting[1], np.float32(weight)),
+                )
+
+    def _sync(self):
+        """최초 1회 전체 구성, 이후에는 변경분만 반영"""
+        from .models import NonconformanceTextVector
+
+        holes = len(self._ids) - len(self._features)
+        if not self._loaded or (self._ids and holes / len(self._ids) > self.REBUILD_RATIO):
+            self._load()
+            return
+
+        queryset = NonconformanceTextVector.objects.all()
+        if self._synced_at is not None:
+            # 같은 시각 저장분을 놓치지 않도록 경계 포함 (재적용은 무해)
+            queryset = queryset.filter(updated_at__gte=self._synced_at)
+
+        for ncr_id, vector, updated_at in queryset.values_list('nonconformance_id', 'vector', 'updated_at'):
+            features, weights = unpack_vector(vector)
+            self._add(ncr_id, features, weights)
+            if self._synced_at is None or updated_at > self._synced_at:
+                self._synced_at = updated_at
+
+    def discard(self, ncr_id):
+        """삭제된 부적합을 색인에서 제거"""
+        with self._lock:
+            if self._loaded:
+                self._remove(ncr_id)
+
+    def similar(self, ncr_id, limit=10):
+        """
+        유사 부적합 상위 limit건
+
+        Returns:
+            list: [(부적합 ID, 유사도)] (유사도 내림차순, 자기 자신 제외)
+        """
+        with self._lock:
+            self._sync()
+
+            vector = self._features.get(ncr_id)
+            if vector is None or vector[0].size == 0:
+                return []
+            query_features, own_weights = vector
+
+            total = len(self._features)
+            scores = np.zeros(len(self._ids), dtype=np.float32)
+
+            # 질의 가중치: 로그 TF(저장된 정규화 가중치의 상수배) × IDF
+            position = self._positions[ncr_id]
+            postings = [self._postings[key] for key in query_features.tolist()]
+            document_freqs = np.fromiter(
+                (positions.size for positions, _ in postings), dtype=np.float32, count=len(postings)
+            )
+            query_weights = own_weights * (np.log((total + 1) / (document_freqs + 1)) + 1)
+            query_weights /= np.linalg.norm(query_weights)
+
+            # 같은 n-gram 안에서 위치는 중복되지 않으므로 인덱스 덧셈으로 누적
+            for (positions, weights), query_weight in zip(postings, query_weights.tolist()):
+                scores[positions] += weights * query_weight
+
+            scores[position] = 0
+            candidates = np.flatnonzero(scores > 0)
+            if candidates.size > limit:
+                candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+            candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+            return [(self._ids[index], float(scores[index])) for index in candidates.tolist()]
+
+
+# 프로세스 전역 색인
+similarity_index = SimilarityIndex()
@@ -1,3 +1,95 @@
-from django.test import TestCase
+from datetime import date
+from decimal import Decimal
+from io import StringIO
 
-# Create your tests here.
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from accounts.models import User
+from .models import Nonconformance, NonconformanceTextVector, DefectType, DefectCause
+from .similarity import similarity_index, unpack_vector
+
+
+class SimilarNonconformanceAPITest(APITestCase):
+    """유사 부적합 검색 API 테스트"""
+
+    def setUp(self):
+        similarity_index.reset()
+
+        self.user = User.objects.create(
+            username='testuser',
+            name='테스트',
+            department='품질팀',
+            position='대리',
+            phone_number='010-1234-5678',
+            role_level=1,
+            status='active'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.defect_type = DefectType.objects.create(code='D01', name='파손')
+        self.cause = DefectCause.objects.create(code='M2.1', category='Machine', name='설비 고장')
+
+        self.base = self.create_nc(why1='공구 마모로 치수 초과', root_cause='엔드밀 교체 주기 초과')
+        self.close = self.create_nc(why1='공구 마모로 치수 불량', root_cause='엔드밀 교체 주기 미준수')
+        self.far = self.create_nc(why1='포장 중 낙하', root_cause='운반 대차 고정 미흡')
+        self.empty = self.create_nc()
+
+    def create_nc(self, **texts):
+        return Nonconformance.objects.create(
+            type='inhouse',
+            occurrence_date=date(2025, 3, 10),
+            ncr_no=f'NCR-{Nonconformance.objects.count() + 1:03d}',
+            vendor='ABC정밀',
+            product_name='하우징',
+            defect_qty=1,
+            unit_price=Decimal('100'),
+            weight_factor=Decimal('1'),
+            defect_type_code=self.defect_type,
+            cause_code=self.cause,
+            created_by=self.user,
+            **texts,
+        )
+
+    def similar_ids(self, nonconformance):
+        response = self.client.get(f'/api/nonconformance/{nonconformance.id}/similar/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row['id'] for row in response.data['results']]
+
+    def test_vector_saved_on_create_and_text_change(self):
+        """저장 시 벡터 생성, 원문이 바뀐 경우에만 재계산"""
+        vector = NonconformanceTextVector.objects.get(nonconformance=self.base)
+        features, weights = unpack_vector(vector.vector)
+        self.assertEqual(len(features), len(weights))
+        self.assertAlmostEqual(float((weights ** 2).sum()), 1.0, places=5)
+
+        self.base.defect_qty = 2
+        self.base.save()
+        self.assertEqual(NonconformanceTextVector.objects.get(nonconformance=self.base).text_hash, vector.text_hash)
+
+        self.base.note = '추가 메모'
+        self.base.save()
+        self.assertNotEqual(NonconformanceTextVector.objects.get(nonconformance=self.base).text_hash, vector.text_hash)
+
+    def test_similar_ranking_and_incremental_update(self):
+        """유사도 순위와 저장/삭제 반영"""
+        self.assertEqual(self.similar_ids(self.base)[0], self.close.id)
+        self.assertNotIn(self.base.id, self.similar_ids(self.base))
+        self.assertEqual(self.similar_ids(self.empty), [])
+
+        # 색인 구성 이후 저장된 건도 다음 검색에 반영
+        newer = self.create_nc(why1='공구 마모로 치수 초과', root_cause='엔드밀 교체 주기 초과')
+        self.assertEqual(self.similar_ids(self.base)[0], newer.id)
+
+        newer.delete()
+        self.assertEqual(self.similar_ids(self.base)[0], self.close.id)
+
+    def test_rebuild_command(self):
+        """시그널 없이 저장된 데이터의 벡터 생성"""
+        NonconformanceTextVector.objects.all().delete()
+        similarity_index.reset()
+
+        call_command('rebuild_similarity_index', stdout=StringIO())
+        self.assertEqual(NonconformanceTextVector.objects.count(), 4)
+        self.assertEqual(self.similar_ids(self.base)[0], self.close.id)
@@ -9,6 +9,9 @@ urlpatterns = [
     path('<int:id>/update/', views.NonconformanceUpdateView.as_view(), name='nonconformance-update'),
     path('<int:id>/delete/', views.NonconformanceDeleteView.as_view(), name='nonconformance-delete'),
     
+    # 유사 부적합 검색
+    path('<int:id>/similar/', views.similar_nonconformances, name='nonconformance-similar'),
+    
     # 코드 테이블 조회
     path('defect-types/', views.defect_types_list, name='defect-types-list'),
     path('defect-causes/', views.defect_causes_list, name='defect-causes-list'),
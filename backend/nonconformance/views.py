@@ -10,14 +10,18 @@ from rest_framework.filters import SearchFilter, OrderingFilter
 from django.shortcuts import get_object_or_404
 
 from .models import Nonconformance, DefectType, DefectCause
+from .similarity import similarity_index
 from .serializers import (
     NonconformanceSerializer,
     NonconformanceListSerializer,
+    NonconformanceListValues,
     NonconformanceCreateSerializer,
     DefectTypeSerializer,
     DefectCauseSerializer
 )
 from audit.models import AuditLog
+from backend.list_serializers import ValuesListMixin
+from backup_management.cold_storage import ArchiveListMixin, ArchivedQuerySet, archive_years
 
 
 def get_client_ip(request):
@@ -30,9 +34,10 @@ def get_client_ip(request):
     return ip
 
 
-class NonconformanceListView(generics.ListAPIView):
-    """부적합 목록 조회 API"""
+class NonconformanceListView(ArchiveListMixin, ValuesListMixin, generics.ListAPIView):
+    """부적합 목록 조회 API (include_archive=true 이면 아카이브 DB 포함)"""
     serializer_class = NonconformanceListSerializer
+    values_serializer_class = NonconformanceListValues
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['type', 'defect_type_code', 'cause_code', 'weekday_code', 'detection_stage']
@@ -240,6 +245,60 @@ class NonconformanceDeleteView(generics.DestroyAPIView):
             )
 
 
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def similar_nonconformances(request, id):
+    """유사 부적합 조회 API (5Why/최종불량원인/비고 텍스트 유사도 상위 k건)
+    
+    Query Parameters:
+        limit (int): 조회 건수 (기본값: 10, 최대: 50)
+    """
+    nonconformance = get_object_or_404(Nonconformance, id=id)
+    
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 50)
+    except ValueError:
+        return Response(
+            {'error': 'limit은 숫자여야 합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    # 다른 프로세스에서 삭제된 건이 색인에 남아 있을 수 있어 여유분을 조회
+    matches = similarity_index.similar(nonconformance.id, limit + 5)
+    
+    records = Nonconformance.objects.select_related(
+        'defect_type_code', 'cause_code'
+    ).in_bulk([ncr_id for ncr_id, _ in matches])
+    
+    results = []
+    for ncr_id, score in matches:
+        nc = records.get(ncr_id)
+        if nc is None:
+            similarity_index.discard(ncr_id)
+            continue
+        results.append({
+            'id': nc.id,
+            'ncr_no': nc.ncr_no,
+            'occurrence_date': nc.occurrence_date.isoformat(),
+            'vendor': nc.vendor,
+            'product_name': nc.product_name,
+            'defect_type_code': nc.defect_type_code.code,
+            'defect_type_name': nc.defect_type_code.name,
+            'cause_code': nc.cause_code.code,
+            'cause_name': nc.cause_code.name,
+            'root_cause': nc.root_cause,
+            'score': round(score, 4),
+        })
+        if len(results) >= limit:
+            break
+    
+    return Response({
+        'id': nonconformance.id,
+        'count': len(results),
+        'results': results,
+    }, status=status.HTTP_200_OK)
+
+
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def defect_types_list(request):
@@ -1035,6 +1094,10 @@ def nonconformance_csv_export(request):
         occurrence_date__month=month_int
     ).select_related('created_by', 'defect_type_code', 'cause_code').order_by('occurrence_date', 'created_at')
     
+    # 아카이브 DB로 옮겨진 연도는 함께 조회
+    if year_int in archive_years():
+        nonconformances = ArchivedQuerySet(nonconformances, [year_int])
+    
     if not nonconformances.exists():
         return Response(
             {'error': '해당 연월에 데이터가 없습니다.'},
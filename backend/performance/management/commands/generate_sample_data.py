@@ -1,60 +1,291 @@
 """
 샘플 데이터 생성 명령어
-2024년 6월 ~ 2025년 10월 15일까지의 실적, 부적합, 고객 불만 데이터 생성
+종료일(기본값: 오늘)로부터 --years년 동안의 실적, 부적합, 고객 불만 데이터를 생성
+
+- 같은 --seed면 같은 데이터(업체/품명/수량/불량 내역 등)가 만들어진다. ULID는 레코드 날짜를
+  시각으로 하고 난수 부분만 매번 달라지므로 같은 DB에 여러 번 실행해도 충돌하지 않는다.
+- 레코드는 모델 인스턴스 없이 값 튜플로 만들어 executemany로 저장한다. bulk_create는 값마다
+  필드 변환/SQL 조립을 거쳐 초당 수천 건에 그치므로 수천만 건을 만들 수 없다.
+  save()와 시그널을 거치지 않으므로 save()가 하던 계산(ULID, 요일, 합계)과 작성/수정 시각은
+  여기서 직접 채우고, 부적합 유사 검색 벡터는 마지막에 rebuild_similarity_index로 만든다.
+
+    # 기본값: 1.5년, 평일 하루 실적 약 10건 (약 4천 건)
+    uv run python manage.py generate_sample_data
+
+    # 부하 테스트용: 10년, 평일 하루 실적 약 4000건 (약 1200만 건)
+    uv run python manage.py generate_sample_data --years 10 --records-per-day 4000 --users 50
 """
-from django.core.management.base import BaseCommand
-from datetime import datetime, timedelta
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 import random
+import time as clock
 
 from accounts.models import User
 from performance.models import PerformanceRecord, Vendor, Producer
 from nonconformance.models import Nonconformance, DefectType, DefectCause
 from customer_complaints.models import CustomerComplaint
 
+WEEKDAY_CODES = ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN']
+
+# 실적 1건당 부적합/고객 불만 발생 확률 (기본 규모에서 하루 약 0.6건 / 0.3건)
+NONCONFORMANCE_RATE = 0.06
+COMPLAINT_RATE = 0.03
+
+VENDOR_NAMES = [
+    '삼성전자', 'LG전자', '현대자동차', 'SK하이닉스', '포스코',
+    '한화', 'GS칼텍스', '롯데케미칼', '효성', '두산중공업',
+    'CJ제일제당', '아모레퍼시픽', 'LG화학', '한국타이어', '넥센',
+]
+
+PRODUCER_NAMES = [
+    '본사 1공장', '본사 2공장', '천안공장', '평택공장', '울산공장',
+    '창원공장', '구미공장', '광주공장', '아산공장', '포항공장',
+]
+
+DEFECT_TYPES = [
+    ('D001', '치수불량'),
+    ('D002', '외관불량'),
+    ('D003', '기능불량'),
+    ('D004', '포장불량'),
+    ('D005', '수량오류'),
+    ('D006', '납기지연'),
+    ('D007', '서류오류'),
+    ('D008', '기타'),
+]
+
+# 발생 원인 (6M)
+DEFECT_CAUSES = [
+    ('C001', 'Material', '불량 원재료'),
+    ('C002', 'Material', '재료 사양 미달'),
+    ('C003', 'Machine', '설비 고장'),
+    ('C004', 'Machine', '금형/치구 불량'),
+    ('C005', 'Machine', '설비 노후화'),
+    ('C006', 'Man', '작업자 실수'),
+    ('C007', 'Man', '숙련도 부족'),
+    ('C008', 'Man', '표준 미준수'),
+    ('C009', 'Method', '작업방법 부적절'),
+    ('C010', 'Method', '공정관리 미흡'),
+    ('C011', 'Measurement', '측정기 오류'),
+    ('C012', 'Measurement', '측정방법 부적절'),
+    ('C013', 'Environment', '작업환경 불량'),
+    ('C014', 'Environment', '온습도 관리 미흡'),
+    ('C015', 'Other', '기타'),
+]
+
+PRODUCT_NAMES = [
+    'A100 부품', 'B200 모듈', 'C300 어셈블리', 'D400 패널',
+    'E500 커넥터', 'F600 케이블', 'G700 하우징', 'H800 브라켓',
+    'I900 센서', 'J1000 컨트롤러', 'K1100 디스플레이', 'L1200 배터리',
+]
+
+# 부적합/고객 불만은 앞쪽 품명에서만 발생
+DEFECT_PRODUCT_NAMES = PRODUCT_NAMES[:8]
+
+TYPES = ['inhouse', 'incoming']
+DETECTION_STAGES = ['입고검사', '공정검사', '출하검사', '최종검사', '조립공정', '가공공정']
+PROCESSES = ['제조1팀', '제조2팀', '조립팀', '검사팀', '포장팀', '출하팀']
+OPERATORS = ['김철수', '이영희', '박민수', '정수진', '최동욱', '강미영', '조성호', '한지혜']
+CONTROL_NUMBERS = range(1000, 10000)
+QUANTITIES = range(50, 5001)
+WORK_SECONDS = range(8 * 3600, 18 * 3600)
+WEIGHT_FACTORS = [Decimal('0.3'), Decimal('0.5'), Decimal('0.7'), Decimal('1.0')]
+
+WHYS = [
+    '작업자가 표준을 확인하지 않음',
+    '설비 점검이 누락됨',
+    '재료 입고검사가 부실함',
+    '측정기 교정이 만료됨',
+    '작업환경 온도가 기준을 벗어남',
+    '작업방법이 변경되었으나 교육이 없었음',
+    '금형 마모가 심각함',
+    '작업자 숙련도가 부족함',
+]
+
+ROOT_CAUSES = [
+    '표준작업지도서 미비치',
+    '설비 예방보전 계획 미수립',
+    '수입검사 기준 미흡',
+    '측정기 교정 관리 미흡',
+    '작업환경 모니터링 부족',
+    '변경관리 프로세스 미준수',
+    '금형 교체 주기 관리 미흡',
+    '신규 작업자 교육훈련 부족',
+]
+
+COMPLAINT_TEMPLATES = [
+    '제품 사용 중 {}이(가) 발생하였습니다.',
+    '납품된 제품에서 {}이(가) 발견되었습니다.',
+    '고객이 {}을(를) 보고하였습니다.',
+    '설치 과정에서 {}이(가) 확인되었습니다.',
+    'A/S 요청 시 {}이(가) 접수되었습니다.',
+]
+
+COMPLAINT_ISSUES = [
+    '외관 흠집', '치수 오차', '기능 오작동', '소음 발생',
+    '누수 현상', '조립 불량', '포장 파손', '수량 부족',
+    '납기 지연', '도색 불량', '용접 불량', '부품 누락',
+]
+
+ACTION_TEMPLATES = [
+    '전수 검사 후 {}개 교체 완료',
+    '불량품 회수 및 {}개 재납품 완료',
+    '원인 분석 후 공정 개선 조치 완료',
+    '고객사 방문하여 현장 조치 완료',
+    '재발방지 대책 수립 및 이행 중',
+]
+
+# ULID 문자열 인코딩 (Crockford Base32, 10비트씩 두 글자)
+_BASE32 = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+_BASE32_PAIRS = [_BASE32[i >> 5] + _BASE32[i & 31] for i in range(1024)]
+
+
+def make_ulid(timestamp_ms, randomness):
+    """ULID 문자열 (ulid.new()와 같은 형식, 호출 비용 약 1/3)"""
+    value = (timestamp_ms << 80) | randomness
+    return ''.join([_BASE32_PAIRS[(value >> shift) & 1023] for shift in range(120, -10, -10)])
+
+
+# 저장할 필드 (build_* 튜플 순서, id 제외 전체 — 빠진 NOT NULL 필드는 INSERT 오류로 드러남)
+PERFORMANCE_FIELDS = [
+    'record_uid', 'type', 'date', 'vendor', 'product_name', 'control_no', 'quantity',
+    'producer', 'weekday_code', 'created_by', 'created_at', 'updated_at',
+]
+NONCONFORMANCE_FIELDS = [
+    'ncr_uid', 'type', 'occurrence_date', 'ncr_no', 'vendor', 'product_name', 'control_no',
+    'defect_qty', 'unit_price', 'weight_factor', 'total_amount', 'detection_stage',
+    'defect_type_code', 'cause_code', 'why1', 'why2', 'why3', 'why4', 'why5', 'root_cause',
+    'operators', 'process_name', 'weekday_code', 'note', 'created_by', 'created_at', 'updated_at',
+]
+COMPLAINT_FIELDS = [
+    'ccr_uid', 'occurrence_date', 'ccr_no', 'vendor', 'product_name', 'defect_qty', 'unit_price',
+    'total_amount', 'complaint_content', 'action_content', 'action_completed',
+    'defect_type_code', 'cause_code', 'created_by', 'created_at', 'updated_at',
+]
+
+
+class TableWriter:
+    """모델 테이블에 값 튜플을 executemany로 추가"""
+
+    def __init__(self, model, fields):
+        quote = connection.ops.quote_name
+        columns = ', '.join(quote(model._meta.get_field(name).column) for name in fields)
+        placeholders = ', '.join(['%s'] * len(fields))
+        self.sql = f"INSERT INTO {quote(model._meta.db_table)} ({columns}) VALUES ({placeholders})"
+        self.rows = []
+        self.count = 0
+
+    def flush(self, cursor):
+        if self.rows:
+            cursor.executemany(self.sql, self.rows)
+            self.count += len(self.rows)
+            self.rows.clear()
+
 
 class Command(BaseCommand):
-    help = '샘플 데이터 생성 (2024년 6월 ~ 2025년 10월 15일)'
+    help = '샘플 데이터 생성 (시드 고정, 일괄 저장)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--years',
+            type=float,
+            default=1.5,
+            help='생성 기간 (년, 기본값: 1.5)'
+        )
+        parser.add_argument(
+            '--end-date',
+            type=date.fromisoformat,
+            default=None,
+            help='마지막 날짜 (YYYY-MM-DD, 기본값: 오늘)'
+        )
+        parser.add_argument(
+            '--records-per-day',
+            type=int,
+            default=10,
+            help='평일 하루 평균 실적 건수 (주말은 1/4, 기본값: 10)'
+        )
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=5,
+            help='작성자로 사용할 일반 사용자 수 (admin 제외, 기본값: 5)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='난수 시드 (기본값: 42)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=20000,
+            help='한 트랜잭션에 저장할 레코드 수 (기본값: 20000)'
+        )
+        parser.add_argument(
+            '--skip-vectors',
+            action='store_true',
+            help='유사 부적합 벡터 생성 생략 (나중에 rebuild_similarity_index 실행)'
+        )
 
     def handle(self, *args, **options):
+        if options['years'] <= 0 or options['records_per_day'] < 1:
+            raise CommandError('--years와 --records-per-day는 0보다 커야 합니다.')
+
         self.stdout.write("=" * 60)
         self.stdout.write("샘플 데이터 생성 시작")
         self.stdout.write("=" * 60)
-        
+
         # 날짜 범위 설정
-        start_date = datetime(2024, 6, 1).date()
-        end_date = datetime(2025, 10, 15).date()
-        
+        end_date = options['end_date'] or date.today()
+        start_date = end_date - timedelta(days=max(1, round(options['years'] * 365.25)) - 1)
+
         self.stdout.write(f"\n기간: {start_date} ~ {end_date}")
-        self.stdout.write(f"총 {(end_date - start_date).days + 1}일")
-        
+        self.stdout.write(f"총 {(end_date - start_date).days + 1}일, 평일 하루 실적 약 {options['records_per_day']}건")
+        self.stdout.write(f"시드: {options['seed']}")
+
+        self.rng = random.Random(options['seed'])
+        # ULID 난수 부분은 시드와 무관 (재실행 시 UNIQUE 충돌 방지)
+        self.uid_rng = random.Random()
+        self.batch_size = options['batch_size']
+
         # 기본 데이터 생성
-        user = self.create_base_data()
-        
+        users = self.create_base_data(options['users'])
+
         # 샘플 데이터 생성
-        perf_count = self.generate_performance_records(user, start_date, end_date)
-        nc_count = self.generate_nonconformance_records(user, start_date, end_date)
-        ccr_count = self.generate_customer_complaints(user, start_date, end_date)
-        
+        started = clock.perf_counter()
+        perf_count, nc_count, ccr_count = self.generate_records(
+            users, start_date, end_date, options['records_per_day']
+        )
+        elapsed = clock.perf_counter() - started
+        total = perf_count + nc_count + ccr_count
+
+        if nc_count and not options['skip_vectors']:
+            self.stdout.write("\n유사 부적합 벡터 생성 중...")
+            call_command('rebuild_similarity_index', stdout=self.stdout)
+
         self.stdout.write("\n" + "=" * 60)
         self.stdout.write(self.style.SUCCESS("샘플 데이터 생성 완료!"))
         self.stdout.write("=" * 60)
         self.stdout.write(f"실적 데이터: {perf_count}건")
         self.stdout.write(f"부적합 데이터: {nc_count}건")
         self.stdout.write(f"고객 불만 데이터: {ccr_count}건")
-        self.stdout.write(f"총 {perf_count + nc_count + ccr_count}건")
+        self.stdout.write(f"총 {total}건 ({elapsed:.1f}초, 초당 {total / max(elapsed, 0.001):,.0f}건)")
         self.stdout.write("=" * 60)
 
-    def create_base_data(self):
+    def create_base_data(self, user_count):
         """기본 마스터 데이터 생성"""
-        self.stdout.write("기본 마스터 데이터 생성 중...")
-        
+        self.stdout.write("\n기본 마스터 데이터 생성 중...")
+
         # 사용자 생성 (없으면)
         try:
-            user = User.objects.get(username='admin')
+            admin = User.objects.get(username='admin')
             self.stdout.write("[OK] 기존 사용자 사용: admin")
         except User.DoesNotExist:
-            user = User.objects.create(
+            admin = User.objects.create(
                 username='admin',
                 name='관리자',
                 department='품질관리팀',
@@ -63,300 +294,242 @@ class Command(BaseCommand):
                 role_level=2,  # 관리자
                 status='active',
             )
-            user.set_password('admin1234')
-            user.save()
+            admin.set_password('admin1234')
+            admin.save()
             self.stdout.write("[OK] 사용자 생성: admin")
-        
-        # 업체명 데이터
-        vendor_names = [
-            '삼성전자', 'LG전자', '현대자동차', 'SK하이닉스', '포스코',
-            '한화', 'GS칼텍스', '롯데케미칼', '효성', '두산중공업',
-            'CJ제일제당', '아모레퍼시픽', 'LG화학', '한국타이어', '넥센',
-        ]
-        
-        for vendor_name in vendor_names:
+
+        # 작성자용 일반 사용자 (비밀번호 해시는 한 번만 계산)
+        usernames = [f'user{i:03d}' for i in range(1, user_count + 1)]
+        existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+        template = User()
+        if len(existing) < len(usernames):
+            template.set_password('user1234')
+        User.objects.bulk_create([
+            User(
+                username=username,
+                password_hash=template.password_hash,
+                name=f'작업자{username[4:]}',
+                department=PROCESSES[index % len(PROCESSES)],
+                position='사원',
+                phone_number='010-0000-0000',
+                role_level=1,
+                status='active',
+            )
+            for index, username in enumerate(usernames) if username not in existing
+        ])
+        users = [admin, *User.objects.filter(username__in=usernames).order_by('username')]
+        self.stdout.write(f"[OK] 사용자 {len(users)}명 (신규 {len(usernames) - len(existing)}명, 비밀번호 user1234)")
+
+        for vendor_name in VENDOR_NAMES:
             Vendor.objects.get_or_create(
                 name=vendor_name,
-                defaults={'created_by': user}
+                defaults={'created_by': admin}
             )
-        self.stdout.write(f"[OK] 업체명 {len(vendor_names)}개 생성")
-        
-        # 생산처 데이터
-        producer_names = [
-            '본사 1공장', '본사 2공장', '천안공장', '평택공장', '울산공장',
-            '창원공장', '구미공장', '광주공장', '아산공장', '포항공장',
-        ]
-        
-        for producer_name in producer_names:
+        self.stdout.write(f"[OK] 업체명 {len(VENDOR_NAMES)}개 생성")
+
+        for producer_name in PRODUCER_NAMES:
             Producer.objects.get_or_create(
                 name=producer_name,
-                defaults={'created_by': user}
+                defaults={'created_by': admin}
             )
-        self.stdout.write(f"[OK] 생산처 {len(producer_names)}개 생성")
-        
-        # 불량 유형 데이터
-        defect_types = [
-            ('D001', '치수불량'),
-            ('D002', '외관불량'),
-            ('D003', '기능불량'),
-            ('D004', '포장불량'),
-            ('D005', '수량오류'),
-            ('D006', '납기지연'),
-            ('D007', '서류오류'),
-            ('D008', '기타'),
-        ]
-        
-        for code, name in defect_types:
+        self.stdout.write(f"[OK] 생산처 {len(PRODUCER_NAMES)}개 생성")
+
+        for code, name in DEFECT_TYPES:
             DefectType.objects.get_or_create(
                 code=code,
                 defaults={'name': name}
             )
-        self.stdout.write(f"[OK] 불량 유형 {len(defect_types)}개 생성")
-        
-        # 발생 원인 데이터 (6M)
-        defect_causes = [
-            ('C001', 'Material', '불량 원재료'),
-            ('C002', 'Material', '재료 사양 미달'),
-            ('C003', 'Machine', '설비 고장'),
-            ('C004', 'Machine', '금형/치구 불량'),
-            ('C005', 'Machine', '설비 노후화'),
-            ('C006', 'Man', '작업자 실수'),
-            ('C007', 'Man', '숙련도 부족'),
-            ('C008', 'Man', '표준 미준수'),
-            ('C009', 'Method', '작업방법 부적절'),
-            ('C010', 'Method', '공정관리 미흡'),
-            ('C011', 'Measurement', '측정기 오류'),
-            ('C012', 'Measurement', '측정방법 부적절'),
-            ('C013', 'Environment', '작업환경 불량'),
-            ('C014', 'Environment', '온습도 관리 미흡'),
-            ('C015', 'Other', '기타'),
-        ]
-        
-        for code, category, name in defect_causes:
+        self.stdout.write(f"[OK] 불량 유형 {len(DEFECT_TYPES)}개 생성")
+
+        for code, category, name in DEFECT_CAUSES:
             DefectCause.objects.get_or_create(
                 code=code,
                 defaults={'category': category, 'name': name}
             )
-        self.stdout.write(f"[OK] 발생 원인 {len(defect_causes)}개 생성")
-        
-        return user
-
-    def generate_performance_records(self, user, start_date, end_date):
-        """실적 데이터 생성"""
-        self.stdout.write("\n실적 데이터 생성 중...")
-        
-        vendors = list(Vendor.objects.all())
-        producers = list(Producer.objects.all())
-        
-        product_names = [
-            'A100 부품', 'B200 모듈', 'C300 어셈블리', 'D400 패널',
-            'E500 커넥터', 'F600 케이블', 'G700 하우징', 'H800 브라켓',
-            'I900 센서', 'J1000 컨트롤러', 'K1100 디스플레이', 'L1200 배터리',
-        ]
-        
-        types = ['inhouse', 'incoming']
-        
-        current_date = start_date
-        record_count = 0
-        
-        while current_date <= end_date:
-            # 평일에는 5-15개, 주말에는 0-5개 생성
-            weekday = current_date.weekday()
-            if weekday < 5:  # 평일
-                daily_count = random.randint(5, 15)
-            else:  # 주말
-                daily_count = random.randint(0, 5)
-            
-            for _ in range(daily_count):
-                PerformanceRecord.objects.create(
-                    type=random.choice(types),
-                    date=current_date,
-                    vendor=random.choice(vendors).name,
-                    product_name=random.choice(product_names),
-                    control_no=f'CTRL-{current_date.strftime("%Y%m%d")}-{random.randint(1000, 9999)}',
-                    quantity=random.randint(50, 5000),
-                    producer=random.choice(producers).name,
-                    created_by=user,
-                )
-                record_count += 1
-            
-            current_date += timedelta(days=1)
-        
-        self.stdout.write(f"[OK] 실적 데이터 {record_count}개 생성 완료")
-        return record_count
-
-    def generate_nonconformance_records(self, user, start_date, end_date):
-        """부적합 데이터 생성"""
-        self.stdout.write("\n부적합 데이터 생성 중...")
-        
-        vendors = list(Vendor.objects.all())
-        defect_types = list(DefectType.objects.all())
-        defect_causes = list(DefectCause.objects.all())
-        
-        product_names = [
-            'A100 부품', 'B200 모듈', 'C300 어셈블리', 'D400 패널',
-            'E500 커넥터', 'F600 케이블', 'G700 하우징', 'H800 브라켓',
-        ]
-        
-        types = ['inhouse', 'incoming']
-        detection_stages = ['입고검사', '공정검사', '출하검사', '최종검사', '조립공정', '가공공정']
-        processes = ['제조1팀', '제조2팀', '조립팀', '검사팀', '포장팀', '출하팀']
-        operators = ['김철수', '이영희', '박민수', '정수진', '최동욱', '강미영', '조성호', '한지혜']
-        
-        whys = [
-            '작업자가 표준을 확인하지 않음',
-            '설비 점검이 누락됨',
-            '재료 입고검사가 부실함',
-            '측정기 교정이 만료됨',
-            '작업환경 온도가 기준을 벗어남',
-            '작업방법이 변경되었으나 교육이 없었음',
-            '금형 마모가 심각함',
-            '작업자 숙련도가 부족함',
-        ]
-        
-        root_causes = [
-            '표준작업지도서 미비치',
-            '설비 예방보전 계획 미수립',
-            '수입검사 기준 미흡',
-            '측정기 교정 관리 미흡',
-            '작업환경 모니터링 부족',
-            '변경관리 프로세스 미준수',
-            '금형 교체 주기 관리 미흡',
-            '신규 작업자 교육훈련 부족',
-        ]
-        
+        self.stdout.write(f"[OK] 발생 원인 {len(DEFECT_CAUSES)}개 생성")
+
+        return users
+
+    def generate_records(self, users, start_date, end_date, records_per_day):
+        """
+        날짜 순으로 실적/부적합/고객 불만 생성
+
+        부적합과 고객 불만은 그날 실적 건수에 비례하여 발생하고,
+        batch_size만큼 모이면 한 트랜잭션으로 저장한다.
+        """
+        self.stdout.write("\n실적/부적합/고객 불만 데이터 생성 중...")
+        rng = self.rng
+
+        self.vendors = VENDOR_NAMES
+        self.producers = PRODUCER_NAMES
+        self.defect_type_ids = list(
+            DefectType.objects.filter(code__in=[code for code, _ in DEFECT_TYPES])
+            .order_by('code').values_list('pk', flat=True)
+        )
+        self.defect_cause_ids = list(
+            DefectCause.objects.filter(code__in=[code for code, _, _ in DEFECT_CAUSES])
+            .order_by('code').values_list('pk', flat=True)
+        )
+        self.user_ids = [user.pk for user in users]
+        self.ops = connection.ops
+
+        writers = {
+            PerformanceRecord: TableWriter(PerformanceRecord, PERFORMANCE_FIELDS),
+            Nonconformance: TableWriter(Nonconformance, NONCONFORMANCE_FIELDS),
+            CustomerComplaint: TableWriter(CustomerComplaint, COMPLAINT_FIELDS),
+        }
+        weekday_range = (records_per_day // 2, records_per_day + records_per_day // 2)
+        weekend_range = (0, max(1, records_per_day // 2))
+        current_tz = timezone.get_current_timezone()
+        month_counters = {}
+
         current_date = start_date
-        record_count = 0
-        ncr_counter = 1
-        
         while current_date <= end_date:
-            # 주 1-3개 정도 생성 (랜덤하게)
-            if random.random() < 0.3:  # 30% 확률로 발생
-                daily_count = random.randint(1, 3)
-                
-                for _ in range(daily_count):
-                    type_choice = random.choice(types)
-                    ncr_no = f'NCR-{current_date.strftime("%Y%m")}-{ncr_counter:04d}'
-                    ncr_counter += 1
-                    
-                    defect_qty = random.randint(1, 100)
-                    unit_price = Decimal(random.randint(1000, 50000))
-                    weight_factor = Decimal(random.choice(['0.3', '0.5', '0.7', '1.0']))
-                    
-                    # 5Why 생성 (랜덤하게 3-5개)
-                    num_whys = random.randint(3, 5)
-                    selected_whys = random.sample(whys, num_whys)
-                    
-                    Nonconformance.objects.create(
-                        type=type_choice,
-                        occurrence_date=current_date,
-                        ncr_no=ncr_no,
-                        vendor=random.choice(vendors).name,
-                        product_name=random.choice(product_names),
-                        control_no=f'CTRL-{current_date.strftime("%Y%m%d")}-{random.randint(1000, 9999)}',
-                        defect_qty=defect_qty,
-                        unit_price=unit_price,
-                        weight_factor=weight_factor,
-                        detection_stage=random.choice(detection_stages),
-                        defect_type_code=random.choice(defect_types),
-                        cause_code=random.choice(defect_causes),
-                        why1=selected_whys[0] if len(selected_whys) > 0 else None,
-                        why2=selected_whys[1] if len(selected_whys) > 1 else None,
-                        why3=selected_whys[2] if len(selected_whys) > 2 else None,
-                        why4=selected_whys[3] if len(selected_whys) > 3 else None,
-                        why5=selected_whys[4] if len(selected_whys) > 4 else None,
-                        root_cause=random.choice(root_causes),
-                        operators=random.sample(operators, random.randint(1, 3)),
-                        process_name=random.choice(processes),
-                        note=f'{random.choice(["긴급", "중요", "일반"])} 처리 필요' if random.random() < 0.5 else None,
-                        created_by=user,
-                    )
-                    record_count += 1
-            
+            day_start = datetime.combine(current_date, time(), current_tz)
+            weekday_code = WEEKDAY_CODES[current_date.weekday()]
+            month = current_date.strftime('%Y%m')
+            if month not in month_counters:
+                if month_counters:
+                    self.report_progress(writers, current_date)
+                month_counters = {month: [0, 0]}
+
+            # 평일에는 records_per_day ± 50%, 주말에는 0 ~ 절반
+            daily_count = rng.randint(*(weekday_range if current_date.weekday() < 5 else weekend_range))
+            writers[PerformanceRecord].rows.extend(
+                self.build_performance_rows(current_date, weekday_code, day_start, daily_count)
+            )
+
+            rows = writers[Nonconformance].rows
+            for _ in range(rng.binomialvariate(daily_count, NONCONFORMANCE_RATE) if daily_count else 0):
+                month_counters[month][0] += 1
+                rows.append(self.build_nonconformance(current_date, weekday_code, day_start, month_counters[month][0]))
+
+            rows = writers[CustomerComplaint].rows
+            for _ in range(rng.binomialvariate(daily_count, COMPLAINT_RATE) if daily_count else 0):
+                month_counters[month][1] += 1
+                rows.append(self.build_complaint(current_date, day_start, month_counters[month][1]))
+
+            if sum(len(writer.rows) for writer in writers.values()) >= self.batch_size:
+                self.flush(writers)
             current_date += timedelta(days=1)
-        
-        self.stdout.write(f"[OK] 부적합 데이터 {record_count}개 생성 완료")
-        return record_count
-
-    def generate_customer_complaints(self, user, start_date, end_date):
-        """고객 불만 데이터 생성"""
-        self.stdout.write("\n고객 불만 데이터 생성 중...")
-        
-        vendors = list(Vendor.objects.all())
-        defect_types = list(DefectType.objects.all())
-        defect_causes = list(DefectCause.objects.all())
-        
-        product_names = [
-            'A100 부품', 'B200 모듈', 'C300 어셈블리', 'D400 패널',
-            'E500 커넥터', 'F600 케이블', 'G700 하우징', 'H800 브라켓',
-        ]
-        
-        complaint_templates = [
-            '제품 사용 중 {}이(가) 발생하였습니다.',
-            '납품된 제품에서 {}이(가) 발견되었습니다.',
-            '고객이 {}을(를) 보고하였습니다.',
-            '설치 과정에서 {}이(가) 확인되었습니다.',
-            'A/S 요청 시 {}이(가) 접수되었습니다.',
-        ]
-        
-        complaint_issues = [
-            '외관 흠집', '치수 오차', '기능 오작동', '소음 발생',
-            '누수 현상', '조립 불량', '포장 파손', '수량 부족',
-            '납기 지연', '도색 불량', '용접 불량', '부품 누락',
-        ]
-        
-        action_templates = [
-            '전수 검사 후 {}개 교체 완료',
-            '불량품 회수 및 {}개 재납품 완료',
-            '원인 분석 후 공정 개선 조치 완료',
-            '고객사 방문하여 현장 조치 완료',
-            '재발방지 대책 수립 및 이행 중',
+
+        self.flush(writers)
+        self.report_progress(writers, end_date + timedelta(days=1))
+        return writers[PerformanceRecord].count, writers[Nonconformance].count, writers[CustomerComplaint].count
+
+    def flush(self, writers):
+        """모인 레코드를 한 트랜잭션으로 저장"""
+        with transaction.atomic(), connection.cursor() as cursor:
+            for writer in writers.values():
+                writer.flush(cursor)
+
+    def report_progress(self, writers, next_date):
+        """월별 진행 상황 (저장 대기 중인 레코드 포함)"""
+        generated = [writer.count + len(writer.rows) for writer in writers.values()]
+        self.stdout.write(
+            f"  ~{next_date - timedelta(days=1):%Y-%m}: 실적 {generated[0]:,}건, "
+            f"부적합 {generated[1]:,}건, 고객 불만 {generated[2]:,}건"
+        )
+
+    def created_times(self, day_start, count):
+        """
+        작성 시각 count개 (그날 08~18시, 오름차순) → [(DB 저장 값, ULID), ...]
+
+        ULID 시각을 작성 시각과 맞추어 record_uid 순서가 작성 순서와 같게 한다.
+        """
+        adapt = self.ops.adapt_datetimefield_value
+        uid_bits = self.uid_rng.getrandbits
+        start_ms = int(day_start.timestamp() * 1000)
+        times = []
+        for seconds in sorted(self.rng.choices(WORK_SECONDS, k=count)):
+            times.append((
+                adapt(day_start + timedelta(seconds=seconds)),
+                make_ulid(start_ms + seconds * 1000, uid_bits(80)),
+            ))
+        return times
+
+    def build_performance_rows(self, current_date, weekday_code, day_start, count):
+        """하루치 실적 값 튜플 (필드별로 난수를 한 번에 뽑음)"""
+        choices = self.rng.choices
+        prefix = f'CTRL-{current_date:%Y%m%d}-'
+        return [
+            (uid, type_, current_date, vendor, product_name, prefix + str(number), quantity,
+             producer, weekday_code, user_id, created_at, created_at)
+            for (created_at, uid), type_, vendor, product_name, number, quantity, producer, user_id in zip(
+                self.created_times(day_start, count),
+                choices(TYPES, k=count),
+                choices(self.vendors, k=count),
+                choices(PRODUCT_NAMES, k=count),
+                choices(CONTROL_NUMBERS, k=count),
+                choices(QUANTITIES, k=count),
+                choices(self.producers, k=count),
+                choices(self.user_ids, k=count),
+            )
         ]
-        
-        current_date = start_date
-        record_count = 0
-        ccr_counter = 1
-        
-        while current_date <= end_date:
-            # 주 0-2개 정도 생성 (부적합보다 적게)
-            if random.random() < 0.2:  # 20% 확률로 발생
-                daily_count = random.randint(1, 2)
-                
-                for _ in range(daily_count):
-                    ccr_no = f'CCR-{current_date.strftime("%Y%m")}-{ccr_counter:04d}'
-                    ccr_counter += 1
-                    
-                    defect_qty = random.randint(1, 50)
-                    unit_price = Decimal(random.randint(5000, 100000))
-                    
-                    complaint_content = random.choice(complaint_templates).format(
-                        random.choice(complaint_issues)
-                    )
-                    
-                    # 70% 확률로 조치 내용 작성
-                    action_content = None
-                    if random.random() < 0.7:
-                        action_content = random.choice(action_templates).format(
-                            random.randint(1, defect_qty)
-                        )
-                    
-                    CustomerComplaint.objects.create(
-                        occurrence_date=current_date,
-                        ccr_no=ccr_no,
-                        vendor=random.choice(vendors).name,
-                        product_name=random.choice(product_names),
-                        defect_qty=defect_qty,
-                        unit_price=unit_price,
-                        complaint_content=complaint_content,
-                        action_content=action_content,
-                        defect_type_code=random.choice(defect_types),
-                        cause_code=random.choice(defect_causes),
-                        created_by=user,
-                    )
-                    record_count += 1
-            
-            current_date += timedelta(days=1)
-        
-        self.stdout.write(f"[OK] 고객 불만 데이터 {record_count}개 생성 완료")
-        return record_count
 
+    def build_nonconformance(self, current_date, weekday_code, day_start, number):
+        rng = self.rng
+        (created_at, uid), = self.created_times(day_start, 1)
+        defect_qty = rng.randint(1, 100)
+        unit_price = Decimal(rng.randint(1000, 50000))
+        weight_factor = rng.choice(WEIGHT_FACTORS)
+
+        # 5Why 생성 (랜덤하게 3-5개)
+        selected_whys = rng.sample(WHYS, rng.randint(3, 5)) + [None, None]
+
+        return (
+            uid,
+            rng.choice(TYPES),
+            current_date,
+            f'NCR-{current_date:%Y%m}-{number:04d}',
+            rng.choice(self.vendors),
+            rng.choice(DEFECT_PRODUCT_NAMES),
+            f'CTRL-{current_date:%Y%m%d}-{rng.randint(1000, 9999)}',
+            defect_qty,
+            unit_price,
+            weight_factor,
+            defect_qty * unit_price * weight_factor,
+            rng.choice(DETECTION_STAGES),
+            rng.choice(self.defect_type_ids),
+            rng.choice(self.defect_cause_ids),
+            *selected_whys[:5],
+            rng.choice(ROOT_CAUSES),
+            self.ops.adapt_json_value(rng.sample(OPERATORS, rng.randint(1, 3)), None),
+            rng.choice(PROCESSES),
+            weekday_code,
+            f'{rng.choice(["긴급", "중요", "일반"])} 처리 필요' if rng.random() < 0.5 else None,
+            rng.choice(self.user_ids),
+            created_at,
+            created_at,
+        )
+
+    def build_complaint(self, current_date, day_start, number):
+        rng = self.rng
+        (created_at, uid), = self.created_times(day_start, 1)
+        defect_qty = rng.randint(1, 50)
+        unit_price = Decimal(rng.randint(5000, 100000))
+        complaint_content = rng.choice(COMPLAINT_TEMPLATES).format(rng.choice(COMPLAINT_ISSUES))
+
+        # 70% 확률로 조치 내용 작성
+        action_content = None
+        if rng.random() < 0.7:
+            action_content = rng.choice(ACTION_TEMPLATES).format(rng.randint(1, defect_qty))
+
+        return (
+            uid,
+            current_date,
+            f'CCR-{current_date:%Y%m}-{number:04d}',
+            rng.choice(self.vendors),
+            rng.choice(DEFECT_PRODUCT_NAMES),
+            defect_qty,
+            unit_price,
+            defect_qty * unit_price,
+            complaint_content,
+            action_content,
+            False,
+            rng.choice(self.defect_type_ids),
+            rng.choice(self.defect_cause_ids),
+            rng.choice(self.user_ids),
+            created_at,
+            created_at,
+        )
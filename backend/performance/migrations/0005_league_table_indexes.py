@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_alter_user_status'),
+        ('performance', '0004_alter_performancerecord_type'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='performancerecord',
+            index=models.Index(fields=['date'], name='idx_perf_date'),
+        ),
+        migrations.AddIndex(
+            model_name='performancerecord',
+            index=models.Index(fields=['type', 'date'], name='idx_perf_type_date'),
+        ),
+        migrations.AddIndex(
+            model_name='performancerecord',
+            index=models.Index(fields=['date', 'vendor', 'quantity'], name='idx_perf_date_vendor_qty'),
+        ),
+        migrations.AddIndex(
+            model_name='performancerecord',
+            index=models.Index(fields=['date', 'product_name', 'quantity'], name='idx_perf_date_product_qty'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-19 12:00
+
+from django.db import migrations
+
+from backend.postgres import PostgresRunSQL, brin_index_sql, create_trigram_extension, trigram_index_sql
+
+
+class Migration(migrations.Migration):
+    """PostgreSQL 전용 인덱스 (SQLite에서는 아무것도 하지 않음)"""
+
+    dependencies = [
+        ('performance', '0005_league_table_indexes'),
+    ]
+
+    operations = [
+        create_trigram_extension(),
+        # 기간 조회 (날짜 순으로 쌓이는 데이터)
+        PostgresRunSQL(*brin_index_sql('performance_records', 'date', 'idx_perf_date_brin')),
+        # 업체명/품명 부분 일치 검색
+        PostgresRunSQL(*trigram_index_sql('performance_records', 'vendor', 'idx_perf_vendor_trgm')),
+        PostgresRunSQL(*trigram_index_sql('performance_records', 'product_name', 'idx_perf_product_trgm')),
+    ]
@@ -55,6 +55,12 @@ class PerformanceRecord(models.Model):
         ('SUN', '일요일'),
     ]
     
+    # 목록 화면용 한 글자 요일
+    WEEKDAY_KOREAN = {
+        'MON': '월', 'TUE': '화', 'WED': '수', 'THU': '목',
+        'FRI': '금', 'SAT': '토', 'SUN': '일'
+    }
+    
     # Primary Key
     id = models.BigAutoField(primary_key=True)
     
@@ -97,6 +103,13 @@ class PerformanceRecord(models.Model):
         ordering = ['-created_at']
         verbose_name = '실적 기록'
         verbose_name_plural = '실적 기록들'
+        indexes = [
+            models.Index(fields=['date'], name='idx_perf_date'),
+            models.Index(fields=['type', 'date'], name='idx_perf_type_date'),
+            # 업체/품명별 집계용 커버링 인덱스 (기간 조회 시 테이블 접근 없이 합계 계산)
+            models.Index(fields=['date', 'vendor', 'quantity'], name='idx_perf_date_vendor_qty'),
+            models.Index(fields=['date', 'product_name', 'quantity'], name='idx_perf_date_product_qty'),
+        ]
     
     def save(self, *args, **kwargs):
         # ULID 생성 (최초 생성 시에만)
@@ -114,11 +127,7 @@ class PerformanceRecord(models.Model):
     
     def get_weekday_display_korean(self):
         """한글 요일 반환"""
-        weekday_korean = {
-            'MON': '월', 'TUE': '화', 'WED': '수', 'THU': '목',
-            'FRI': '금', 'SAT': '토', 'SUN': '일'
-        }
-        return weekday_korean.get(self.weekday_code, '')
+        return self.WEEKDAY_KOREAN.get(self.weekday_code, '')
     
     def get_type_display(self):
         """실적 유형 표시"""
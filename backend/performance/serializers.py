@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from backend.list_serializers import ValuesListSerializer
 from .models import PerformanceRecord, Vendor, Producer
 from audit.models import AuditLog
 
@@ -155,3 +156,12 @@ class PerformanceListSerializer(serializers.ModelSerializer):
             'product_name', 'control_no', 'quantity', 'producer',
             'weekday_code', 'weekday', 'created_by_name', 'created_at'
         ]
+
+
+class PerformanceListValues(ValuesListSerializer):
+    """실적 목록 빠른 직렬화 (PerformanceListSerializer와 같은 출력)"""
+    
+    serializer_class = PerformanceListSerializer
+    sources = {
+        'weekday': ('weekday_code', lambda code: PerformanceRecord.WEEKDAY_KOREAN.get(code, '')),
+    }
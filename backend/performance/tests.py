@@ -1,3 +1,123 @@
+from datetime import date
+from io import StringIO
+
+import ulid
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from customer_complaints.models import CustomerComplaint
+from customer_complaints.serializers import CustomerComplaintListSerializer, CustomerComplaintListValues
+from nonconformance.models import Nonconformance, NonconformanceTextVector
+from nonconformance.serializers import NonconformanceListSerializer, NonconformanceListValues
+from performance.management.commands.generate_sample_data import make_ulid
+from performance.models import PerformanceRecord
+from performance.serializers import PerformanceListSerializer, PerformanceListValues
+
+
+class GenerateSampleDataTest(TestCase):
+    """샘플 데이터 생성 명령어 테스트"""
+
+    def generate(self, seed=7):
+        call_command(
+            'generate_sample_data', years=0.25, records_per_day=20, users=3,
+            seed=seed, end_date=date(2025, 3, 31), stdout=StringIO(),
+        )
+
+    def test_fills_fields_computed_by_save(self):
+        """save()를 거치지 않아도 ULID/요일/합계/작성 시각이 모델 저장과 같게 채워짐"""
+        self.generate()
+
+        records = list(PerformanceRecord.objects.all())
+        self.assertGreater(len(records), 500)
+        self.assertEqual(min(record.date for record in records), date(2024, 12, 31))  # 0.25년 = 91일
+        self.assertEqual(max(record.date for record in records), date(2025, 3, 31))
+        for record in records[:200]:
+            self.assertEqual(record.weekday_code, ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN'][record.date.weekday()])
+            self.assertEqual(timezone.localtime(record.created_at).date(), record.date)
+            # ULID 시각 = 작성 시각
+            self.assertEqual(ulid.parse(record.record_uid).timestamp().datetime, record.created_at)
+
+        nonconformances = list(Nonconformance.objects.all())
+        self.assertTrue(nonconformances)
+        for nc in nonconformances:
+            self.assertEqual(nc.total_amount, nc.defect_qty * nc.unit_price * nc.weight_factor)
+            self.assertIsInstance(nc.operators, list)
+        self.assertEqual(NonconformanceTextVector.objects.count(), len(nonconformances))
+
+        for ccr in CustomerComplaint.objects.all():
+            self.assertEqual(ccr.total_amount, ccr.defect_qty * ccr.unit_price)
+
+    def test_same_seed_generates_same_data(self):
+        """같은 시드면 같은 데이터 (ULID 난수 부분만 다름), 재실행해도 UNIQUE 충돌 없음"""
+        fields = ('date', 'vendor', 'product_name', 'control_no', 'quantity', 'created_at')
+        self.generate()
+        first = list(PerformanceRecord.objects.order_by('id').values_list(*fields))
+        PerformanceRecord.objects.all().delete()
+
+        self.generate()
+        self.assertEqual(list(PerformanceRecord.objects.order_by('id').values_list(*fields)), first)
+
+        # 같은 DB에 다시 실행해도 ULID가 겹치지 않음
+        self.generate()
+        self.assertEqual(PerformanceRecord.objects.count(), 2 * len(first))
+
+        PerformanceRecord.objects.all().delete()
+        self.generate(seed=8)
+        self.assertNotEqual(list(PerformanceRecord.objects.order_by('id').values_list(*fields)), first)
+
+    def test_make_ulid_matches_library_encoding(self):
+        value = ulid.new()
+        self.assertEqual(make_ulid(value.timestamp().int, value.randomness().int), str(value))
+
+
+class ListValuesSerializerTest(APITestCase):
+    """목록 빠른 직렬화가 ModelSerializer와 같은 JSON을 내는지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command(
+            'generate_sample_data', years=0.1, records_per_day=30, users=2,
+            seed=3, end_date=date(2025, 3, 31), skip_vectors=True, stdout=StringIO(),
+        )
+        # 비어 있는 선택 항목(None)도 포함
+        Nonconformance.objects.filter(pk=Nonconformance.objects.order_by('id').first().pk).update(
+            why1=None, root_cause=None, note=None, process_name=None, detection_stage=None,
+        )
+
+    def assertSameJSON(self, values_serializer, serializer_class, queryset):
+        queryset = queryset.order_by('-created_at', 'id')
+        expected = serializer_class(queryset, many=True).data
+        actual = values_serializer.to_representation(values_serializer.project(queryset))
+        self.assertTrue(expected)
+        self.assertEqual(JSONRenderer().render(actual), JSONRenderer().render(expected))
+
+    def test_same_json_as_model_serializer(self):
+        self.assertSameJSON(PerformanceListValues, PerformanceListSerializer, PerformanceRecord.objects.all())
+        self.assertSameJSON(NonconformanceListValues, NonconformanceListSerializer, Nonconformance.objects.all())
+        self.assertSameJSON(
+            CustomerComplaintListValues, CustomerComplaintListSerializer, CustomerComplaint.objects.all()
+        )
+
+        # 활성 시간대가 바뀌어도 같음 (UTC는 'Z' 표기)
+        with timezone.override('UTC'):
+            self.assertSameJSON(PerformanceListValues, PerformanceListSerializer, PerformanceRecord.objects.all())
+
+    def test_list_api_uses_values_path(self):
+        """필터/정렬/페이지네이션은 그대로, 조회는 values_list 한 번"""
+        self.client.force_authenticate(user=User.objects.get(username='admin'))
+        queryset = PerformanceRecord.objects.filter(type='inhouse').order_by('-quantity', '-created_at')
 
-# Create your tests here.
+        with self.assertNumQueries(2):  # COUNT + 페이지 조회
+            response = self.client.get('/api/performance/list/', {
+                'type': 'inhouse', 'ordering': '-quantity,-created_at', 'page': 2,
+            })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], queryset.count())
+        self.assertEqual(
+            JSONRenderer().render(response.data['results']),
+            JSONRenderer().render(PerformanceListSerializer(queryset[20:40], many=True).data),
+        )
@@ -11,12 +11,15 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from accounts.models import User
 from audit.models import AuditLog
+from backend.list_serializers import ValuesListMixin
+from backup_management.cold_storage import ArchiveListMixin, ArchivedQuerySet, archive_years
 from .models import PerformanceRecord, Vendor, Producer
 from .serializers import (
     PerformanceRecordSerializer,
     PerformanceCreateSerializer,
     PerformanceBulkCreateSerializer,
     PerformanceListSerializer,
+    PerformanceListValues,
     VendorSerializer,
     ProducerSerializer
 )
@@ -470,6 +473,10 @@ def performance_csv_export(request):
         date__month=month_int
     ).order_by('date', 'created_at')
     
+    # 아카이브 DB로 옮겨진 연도는 함께 조회
+    if year_int in archive_years():
+        performances = ArchivedQuerySet(performances, [year_int])
+    
     if not performances.exists():
         return Response(
             {'error': '해당 연월에 데이터가 없습니다.'},
@@ -520,9 +527,10 @@ def performance_csv_export(request):
     return response
 
 
-class PerformanceListView(generics.ListAPIView):
-    """실적 목록 조회 API"""
+class PerformanceListView(ArchiveListMixin, ValuesListMixin, generics.ListAPIView):
+    """실적 목록 조회 API (include_archive=true 이면 아카이브 DB 포함)"""
     serializer_class = PerformanceListSerializer
+    values_serializer_class = PerformanceListValues
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['type', 'producer', 'weekday_code']
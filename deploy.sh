@@ -217,10 +217,10 @@ echo "     sudo nginx -t"
 echo "     sudo systemctl reload nginx"
 echo ""
 echo "  3. Systemd 서비스 등록 (관리자 권한 필요):"
-echo "     sudo cp systemd/qms-backend.service /etc/systemd/system/"
+echo "     sudo cp systemd/qms-backend.service systemd/qms-scheduler.service /etc/systemd/system/"
 echo "     sudo systemctl daemon-reload"
-echo "     sudo systemctl enable qms-backend"
-echo "     sudo systemctl start qms-backend"
+echo "     sudo systemctl enable qms-backend qms-scheduler"
+echo "     sudo systemctl start qms-backend qms-scheduler"
 echo ""
 echo "  4. SSL 인증서 설정 (Let's Encrypt):"
 echo "     sudo apt install -y certbot python3-certbot-nginx"
@@ -26,6 +26,9 @@ echo.
 REM Uvicorn 백엔드 시작 (ASGI)
 start "QMS Backend" cmd /k "cd backend && uv run uvicorn backend.asgi:application --host 127.0.0.1 --port 8000 --workers 4 --log-level info"
 
+REM 백업/아카이빙 스케줄러 시작 (별도 프로세스)
+start "QMS Scheduler" cmd /k "cd backend && uv run python manage.py run_scheduler"
+
 REM 백엔드가 시작될 때까지 대기
 timeout /t 5 /nobreak > nul
 
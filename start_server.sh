@@ -24,6 +24,10 @@ else
         echo "Systemd 서비스로 시작합니다..."
         sudo systemctl start qms-backend
         echo -e "${GREEN}QMS Backend 서비스가 시작되었습니다.${NC}"
+        if [ -f /etc/systemd/system/qms-scheduler.service ]; then
+            sudo systemctl start qms-scheduler
+            echo -e "${GREEN}QMS Scheduler 서비스가 시작되었습니다.${NC}"
+        fi
         echo ""
         echo "서비스 상태 확인:"
         sudo systemctl status qms-backend --no-pager
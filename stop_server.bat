@@ -22,6 +22,9 @@ for /f "tokens=5" %%a in ('netstat -aon ^| find ":3000" ^| find "LISTENING"') do
     taskkill /F /PID %%a >nul 2>&1
 )
 
+REM 스케줄러 종료 (start_server.bat에서 연 창)
+taskkill /F /T /FI "WINDOWTITLE eq QMS Scheduler*" >nul 2>&1
+
 echo.
 echo 서버가 중지되었습니다.
 echo.
@@ -18,6 +18,10 @@ if systemctl is-active --quiet qms-backend; then
     echo "QMS Backend 서비스 중지 중..."
     sudo systemctl stop qms-backend
     echo -e "${GREEN}QMS Backend 서비스가 중지되었습니다.${NC}"
+    if systemctl is-active --quiet qms-scheduler; then
+        sudo systemctl stop qms-scheduler
+        echo -e "${GREEN}QMS Scheduler 서비스가 중지되었습니다.${NC}"
+    fi
 else
     echo -e "${RED}QMS Backend 서비스가 실행 중이지 않습니다.${NC}"
     
@@ -165,6 +165,12 @@ else
     sudo systemctl start qms-backend
 fi
 
+# Scheduler 재시작 (등록된 경우)
+if [ -f /etc/systemd/system/qms-scheduler.service ]; then
+    echo "Scheduler 서비스 재시작 중..."
+    sudo systemctl restart qms-scheduler
+fi
+
 # Nginx 재시작
 echo "Nginx 재시작 중..."
 sudo systemctl reload nginx